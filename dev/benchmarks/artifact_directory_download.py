@@ -0,0 +1,104 @@
+"""
+Counts the list requests made to download a directory of artifacts from S3.
+
+A directory of ``--num-dirs`` subdirectories holding ``--files-per-dir`` files each is uploaded
+to an in-process S3 stand-in provided by moto, then downloaded with ``S3ArtifactRepository`` and
+``OptimizedS3ArtifactRepository`` (which uses the multipart download logic of
+``CloudArtifactRepository``) in two modes:
+
+- ``per-level``: each directory level is listed with ``list_artifacts``, and the size of each file
+  is looked up by listing its directory again, which is what ``download_artifacts`` used to do.
+- ``recursive``: the directory is listed once with ``list_artifacts_recursive``, and the listed
+  sizes are passed to the download of each file.
+
+Usage:
+    python dev/benchmarks/artifact_directory_download.py --num-dirs 20 --files-per-dir 100
+"""
+
+import argparse
+import os
+import tempfile
+import time
+from contextlib import ExitStack
+from unittest import mock
+
+import boto3
+import moto
+from botocore.client import BaseClient
+
+from mlflow.store.artifact.artifact_repo import ArtifactRepository
+from mlflow.store.artifact.optimized_s3_artifact_repo import OptimizedS3ArtifactRepository
+from mlflow.store.artifact.s3_artifact_repo import S3ArtifactRepository
+
+BUCKET = "benchmark"
+
+
+def create_files(root, num_dirs, files_per_dir):
+    for i in range(num_dirs):
+        os.makedirs(os.path.join(root, f"dir_{i}"))
+        for j in range(files_per_dir):
+            with open(os.path.join(root, f"dir_{i}", f"file_{j}.txt"), "w") as f:
+                f.write(f"{i}-{j}")
+
+
+def measure(repo, recursive):
+    num_list_requests = 0
+    make_api_call = BaseClient._make_api_call
+
+    def counting_make_api_call(client, operation_name, api_params):
+        nonlocal num_list_requests
+        if operation_name == "ListObjectsV2":
+            num_list_requests += 1
+        return make_api_call(client, operation_name, api_params)
+
+    # The S3 client is cached for a few minutes only, so requests are counted for any client
+    patches = [mock.patch.object(BaseClient, "_make_api_call", counting_make_api_call)]
+    if not recursive:
+        patches += [
+            mock.patch.object(
+                type(repo), "list_artifacts_recursive", ArtifactRepository.list_artifacts_recursive
+            ),
+            mock.patch.object(
+                type(repo), "_download_file_with_size", ArtifactRepository._download_file_with_size
+            ),
+        ]
+    with ExitStack() as stack, tempfile.TemporaryDirectory() as dst:
+        for patch in patches:
+            stack.enter_context(patch)
+        start = time.perf_counter()
+        repo.download_artifacts("", dst)
+        elapsed = time.perf_counter() - start
+    return num_list_requests, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--num-dirs", type=int, default=20)
+    parser.add_argument("--files-per-dir", type=int, default=100)
+    args = parser.parse_args()
+
+    os.environ.setdefault("AWS_ACCESS_KEY_ID", "testing")
+    os.environ.setdefault("AWS_SECRET_ACCESS_KEY", "testing")
+    os.environ.setdefault("AWS_DEFAULT_REGION", "us-east-1")
+
+    with moto.mock_s3(), tempfile.TemporaryDirectory() as src:
+        boto3.client("s3").create_bucket(Bucket=BUCKET)
+        create_files(src, args.num_dirs, args.files_per_dir)
+        artifact_uri = f"s3://{BUCKET}/artifacts"
+        S3ArtifactRepository(artifact_uri).log_artifacts(src)
+
+        num_files = args.num_dirs * args.files_per_dir
+        print(f"Downloading {num_files} files in {args.num_dirs} directories")
+        print(f"{'repository':<32} {'mode':<10} {'list requests':>14} {'seconds':>8}")
+        for repo_class in [S3ArtifactRepository, OptimizedS3ArtifactRepository]:
+            repo = repo_class(artifact_uri)
+            for recursive in (False, True):
+                num_list_requests, elapsed = measure(repo, recursive)
+                mode = "recursive" if recursive else "per-level"
+                print(
+                    f"{repo_class.__name__:<32} {mode:<10} {num_list_requests:>14} {elapsed:>8.2f}"
+                )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""
+Measures how long model checkpointing stalls a CPU training loop that logs a checkpoint to MLflow
+after every epoch, with synchronous and asynchronous checkpoint upload.
+
+Each epoch runs ``--steps`` CPU-bound training steps, then saves a ``--checkpoint-mb`` MB
+checkpoint through ``MlflowModelCheckpointCallbackBase`` to a run whose artifacts are stored in a
+local directory, or under ``--artifact-uri``. The time the training loop is stalled by each
+checkpoint is reported, and the uploads are waited for at the end of training. Checkpoints are
+saved the way the framework callbacks save them, so the benchmark doesn't depend on a deep learning
+framework.
+
+Usage:
+    python dev/benchmarks/checkpoint_upload.py --epochs 10 --checkpoint-mb 256 --keep-last-n 2
+"""
+
+import argparse
+import os
+import statistics
+import tempfile
+import time
+
+import numpy as np
+
+import mlflow
+from mlflow.utils.checkpoint_utils import MlflowModelCheckpointCallbackBase
+
+
+class Callback(MlflowModelCheckpointCallbackBase):
+    def __init__(self, checkpoint_mb, **kwargs):
+        super().__init__(
+            checkpoint_file_suffix=".pth",
+            monitor="loss",
+            mode="min",
+            save_best_only=False,
+            save_weights_only=False,
+            save_freq="epoch",
+            **kwargs,
+        )
+        self.checkpoint = os.urandom(checkpoint_mb * 1024 * 1024)
+
+    def save_checkpoint(self, filepath):
+        with open(filepath, "wb") as f:
+            f.write(self.checkpoint)
+
+
+def train_step(weights, inputs):
+    return np.tanh(inputs @ weights).mean()
+
+
+def train(callback, args):
+    rng = np.random.default_rng(0)
+    weights = rng.standard_normal((512, 512))
+    inputs = rng.standard_normal((512, 512))
+    stalls = []
+    start = time.perf_counter()
+    for epoch in range(args.epochs):
+        loss = sum(train_step(weights, inputs) for _ in range(args.steps))
+        checkpoint_start = time.perf_counter()
+        callback.check_and_save_checkpoint_if_needed(
+            current_epoch=epoch, global_step=epoch * args.steps, metric_dict={"loss": loss}
+        )
+        stalls.append(time.perf_counter() - checkpoint_start)
+    training_time = time.perf_counter() - start
+    callback.wait_for_pending_uploads()
+    return stalls, training_time, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--artifact-uri", default=None, help="Defaults to a temporary directory")
+    parser.add_argument("--epochs", type=int, default=10)
+    parser.add_argument("--steps", type=int, default=50, help="Training steps per epoch")
+    parser.add_argument("--checkpoint-mb", type=int, default=256)
+    parser.add_argument("--max-pending-uploads", type=int, default=1)
+    parser.add_argument("--keep-last-n", type=int, default=None)
+    args = parser.parse_args()
+
+    print(
+        f"{'upload':>6} {'stall p50 (s)':>14} {'training (s)':>13} {'total (s)':>10} {'speedup':>8}"
+    )
+    baseline = None
+    for async_upload in [False, True]:
+        with tempfile.TemporaryDirectory() as tmp:
+            mlflow.set_tracking_uri(os.path.join(tmp, "mlruns"))
+            experiment_id = mlflow.create_experiment(
+                "checkpoint-upload", artifact_location=args.artifact_uri
+            )
+            callback = Callback(
+                args.checkpoint_mb,
+                async_upload=async_upload,
+                max_pending_uploads=args.max_pending_uploads,
+                keep_last_n=args.keep_last_n,
+            )
+            with mlflow.start_run(experiment_id=experiment_id):
+                stalls, training_time, total_time = train(callback, args)
+
+        baseline = baseline or training_time
+        mode = "async" if async_upload else "sync"
+        print(
+            f"{mode:>6} {statistics.median(stalls):>14.2f} {training_time:>13.2f} "
+            f"{total_time:>10.2f} {baseline / training_time:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
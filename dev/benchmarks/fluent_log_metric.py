@@ -0,0 +1,115 @@
+"""
+Measures the throughput of ``mlflow.log_metric`` against a local tracking server.
+
+A tracking server backed by a SQLite database is started on a free port, and a training loop
+logging one metric per step is timed with the run context cache enabled, and with the cache
+invalidated before every lookup, which reproduces fetching the run on every call. The number of
+``get_run`` requests is reported for both modes.
+
+Usage:
+    python dev/benchmarks/fluent_log_metric.py --steps 500
+"""
+
+import argparse
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from contextlib import contextmanager, nullcontext
+from unittest import mock
+
+import requests
+
+import mlflow
+from mlflow import MlflowClient
+from mlflow.tracking import fluent
+
+
+def get_free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@contextmanager
+def tracking_server(root: str):
+    port = get_free_port()
+    proc = subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "mlflow",
+            "server",
+            "--host",
+            "127.0.0.1",
+            "--port",
+            str(port),
+            "--backend-store-uri",
+            f"sqlite:///{root}/mlflow.db",
+            "--default-artifact-root",
+            f"{root}/artifacts",
+        ],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    url = f"http://127.0.0.1:{port}"
+    try:
+        for _ in range(300):
+            try:
+                if requests.get(f"{url}/health", timeout=1).ok:
+                    break
+            except requests.RequestException:
+                pass
+            time.sleep(0.1)
+        else:
+            raise RuntimeError("Tracking server did not start")
+        yield url
+    finally:
+        proc.terminate()
+        proc.wait()
+
+
+@contextmanager
+def run_context_cache_disabled():
+    get_run_context = fluent._get_run_context
+
+    def uncached_get_run_context(run_id):
+        fluent._run_context_cache.invalidate(run_id)
+        return get_run_context(run_id)
+
+    with mock.patch.object(fluent, "_get_run_context", side_effect=uncached_get_run_context):
+        yield
+
+
+def measure(steps: int, cache: bool):
+    with mock.patch.object(
+        MlflowClient, "get_run", autospec=True, side_effect=MlflowClient.get_run
+    ) as mock_get_run:
+        with mlflow.start_run():
+            context = nullcontext() if cache else run_context_cache_disabled()
+            with context:
+                start = time.perf_counter()
+                for step in range(steps):
+                    mlflow.log_metric("loss", 1.0 / (step + 1), step=step)
+                elapsed = time.perf_counter() - start
+    return steps / elapsed, mock_get_run.call_count
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--steps", type=int, default=500)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as root, tracking_server(root) as url:
+        mlflow.set_tracking_uri(url)
+        mlflow.set_experiment("log-metric-benchmark")
+        print(f"{'mode':<10} {'calls/sec':>10} {'get_run calls':>14}")
+        for cache in (False, True):
+            throughput, num_get_run = measure(args.steps, cache)
+            mode = "cached" if cache else "uncached"
+            print(f"{mode:<10} {throughput:>10.1f} {num_get_run:>14}")
+
+
+if __name__ == "__main__":
+    main()
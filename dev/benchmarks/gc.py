@@ -0,0 +1,103 @@
+"""
+Measures the time ``mlflow gc`` takes to permanently delete runs from a SQLite backend store with a
+local-filesystem artifact root.
+
+``--runs`` deleted runs, each with ``--metrics`` metrics, ``--params`` params and ``--artifacts``
+artifact files, are created for every mode and permanently deleted by:
+
+- ``per-run``: the loop of ``mlflow gc`` before batching, which gets each run, deletes its
+  artifacts and hard-deletes it in its own transaction.
+- ``batched``: ``mlflow gc`` with ``--batch-size`` and ``--max-workers``.
+
+Usage:
+    python dev/benchmarks/gc.py --runs 2000 --batch-size 500 --max-workers 8
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+from click.testing import CliRunner
+
+from mlflow.cli import gc
+from mlflow.entities import Metric, Param
+from mlflow.store.artifact.artifact_repository_registry import get_artifact_repository
+from mlflow.store.tracking.sqlalchemy_store import SqlAlchemyStore
+from mlflow.utils.file_utils import local_file_uri_to_path
+
+
+def populate(store, num_runs, num_metrics, num_params, num_artifacts):
+    for i in range(num_runs):
+        run = store.create_run("0", "user", i, [], f"run-{i}")
+        run_id = run.info.run_id
+        store.log_batch(
+            run_id,
+            metrics=[Metric(f"m{j}", j, 0, 0) for j in range(num_metrics)],
+            params=[Param(f"p{j}", str(j)) for j in range(num_params)],
+            tags=[],
+        )
+        artifact_dir = local_file_uri_to_path(run.info.artifact_uri)
+        os.makedirs(artifact_dir)
+        for j in range(num_artifacts):
+            with open(os.path.join(artifact_dir, f"{j}.txt"), "w") as f:
+                f.write("artifact")
+        store.delete_run(run_id)
+
+
+def gc_per_run(store, db_uri, args):
+    for run_id in store._get_deleted_runs():
+        run = store.get_run(run_id)
+        get_artifact_repository(run.info.artifact_uri).delete_artifacts()
+        store._hard_delete_run(run_id)
+
+
+def gc_batched(store, db_uri, args):
+    result = CliRunner().invoke(
+        gc,
+        [
+            "--backend-store-uri",
+            db_uri,
+            "--batch-size",
+            str(args.batch_size),
+            "--max-workers",
+            str(args.max_workers),
+        ],
+        catch_exceptions=False,
+    )
+    assert result.exit_code == 0, result.output
+
+
+MODES = {"per-run": gc_per_run, "batched": gc_batched}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--runs", type=int, default=2000)
+    parser.add_argument("--metrics", type=int, default=10)
+    parser.add_argument("--params", type=int, default=10)
+    parser.add_argument("--artifacts", type=int, default=3)
+    parser.add_argument("--batch-size", type=int, default=500)
+    parser.add_argument("--max-workers", type=int, default=8)
+    args = parser.parse_args()
+
+    print(f"{'mode':>8} {'time (s)':>9} {'runs/s':>8} {'speedup':>8}")
+    baseline = None
+    for mode, run_gc in MODES.items():
+        with tempfile.TemporaryDirectory() as root:
+            db_uri = f"sqlite:///{os.path.join(root, 'mlflow.db')}"
+            store = SqlAlchemyStore(db_uri, os.path.join(root, "artifacts"))
+            populate(store, args.runs, args.metrics, args.params, args.artifacts)
+
+            start = time.perf_counter()
+            run_gc(store, db_uri, args)
+            elapsed = time.perf_counter() - start
+            assert store._get_deleted_runs() == []
+            store._dispose_engine()
+
+        baseline = baseline or elapsed
+        print(f"{mode:>8} {elapsed:>9.2f} {args.runs / elapsed:>8.1f} {baseline / elapsed:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
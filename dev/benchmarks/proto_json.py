@@ -0,0 +1,180 @@
+"""
+Measures the time the tracking server takes to serialize large ``SearchRuns`` responses to JSON
+with ``message_to_json`` and to parse them back with ``parse_dict``, compared to the previous
+implementation, which post-processed the output of ``MessageToJson`` to emit int64 fields as JSON
+numbers.
+
+The response contains ``--runs`` runs, each with ``--metrics`` metrics, ``--params`` params and
+``--tags`` tags. The outputs of both implementations are checked to be the same JSON value.
+
+Usage:
+    python dev/benchmarks/proto_json.py --runs 1000 --metrics 50 --params 50 --tags 20
+"""
+
+import argparse
+import json
+import time
+from functools import partial
+
+from google.protobuf.descriptor import FieldDescriptor
+from google.protobuf.json_format import MessageToJson, ParseDict
+
+from mlflow.entities import Metric, Param, Run, RunData, RunInfo, RunTag
+from mlflow.protos.service_pb2 import SearchRuns
+from mlflow.utils.proto_json_utils import (
+    _stringify_all_experiment_ids,
+    message_to_json,
+    parse_dict,
+)
+
+_PROTOBUF_INT64_FIELDS = [
+    FieldDescriptor.TYPE_INT64,
+    FieldDescriptor.TYPE_UINT64,
+    FieldDescriptor.TYPE_FIXED64,
+    FieldDescriptor.TYPE_SFIXED64,
+    FieldDescriptor.TYPE_SINT64,
+]
+
+
+def _mark_int64_fields_for_proto_maps(proto_map, value_field_type):
+    json_dict = {}
+    for key, value in proto_map.items():
+        if value_field_type == FieldDescriptor.TYPE_MESSAGE:
+            json_dict[key] = _mark_int64_fields(value)
+        elif value_field_type in _PROTOBUF_INT64_FIELDS:
+            json_dict[key] = int(value)
+        elif isinstance(key, int):
+            json_dict[key] = value
+    return json_dict
+
+
+def _mark_int64_fields(proto_message):
+    json_dict = {}
+    for field, value in proto_message.ListFields():
+        if (
+            field.type == FieldDescriptor.TYPE_MESSAGE
+            and field.message_type.has_options
+            and field.message_type.GetOptions().map_entry
+        ):
+            json_dict[field.name] = _mark_int64_fields_for_proto_maps(
+                value, field.message_type.fields_by_name["value"].type
+            )
+            continue
+        if field.type == FieldDescriptor.TYPE_MESSAGE:
+            ftype = partial(_mark_int64_fields)
+        elif field.type in _PROTOBUF_INT64_FIELDS:
+            ftype = int
+        else:
+            continue
+        json_dict[field.name] = (
+            [ftype(v) for v in value]
+            if field.label == FieldDescriptor.LABEL_REPEATED
+            else ftype(value)
+        )
+    return json_dict
+
+
+def _merge_json_dicts(from_dict, to_dict):
+    for key, value in from_dict.items():
+        if isinstance(key, int) and str(key) in to_dict:
+            to_dict[key] = to_dict[str(key)]
+            del to_dict[str(key)]
+        if key not in to_dict:
+            continue
+        if isinstance(value, dict):
+            _merge_json_dicts(from_dict[key], to_dict[key])
+        elif isinstance(value, list):
+            for i, v in enumerate(value):
+                if isinstance(v, dict):
+                    _merge_json_dicts(v, to_dict[key][i])
+                else:
+                    to_dict[key][i] = v
+        else:
+            to_dict[key] = from_dict[key]
+    return to_dict
+
+
+def legacy_message_to_json(message):
+    json_dict_with_int64_as_str = json.loads(
+        MessageToJson(message, preserving_proto_field_name=True)
+    )
+    json_dict_with_int64_fields_only = _mark_int64_fields(message)
+    json_dict_with_int64_as_numbers = _merge_json_dicts(
+        json_dict_with_int64_fields_only, json_dict_with_int64_as_str
+    )
+    return json.dumps(json_dict_with_int64_as_numbers, indent=2)
+
+
+def legacy_parse_dict(js_dict, message):
+    _stringify_all_experiment_ids(js_dict)
+    ParseDict(js_dict=js_dict, message=message, ignore_unknown_fields=True)
+
+
+def make_response(args):
+    response = SearchRuns.Response(next_page_token="token")
+    for i in range(args.runs):
+        info = RunInfo(
+            run_id=f"{i:032x}",
+            experiment_id="0",
+            user_id="user",
+            status="FINISHED",
+            start_time=1700000000000 + i,
+            end_time=1700000001000 + i,
+            lifecycle_stage="active",
+            artifact_uri=f"s3://bucket/0/{i:032x}/artifacts",
+            run_name=f"run-{i}",
+        )
+        data = RunData(
+            metrics=[
+                Metric(f"metric_{j}", j / 7, 1700000000000 + j, j) for j in range(args.metrics)
+            ],
+            params=[Param(f"param_{j}", str(j)) for j in range(args.params)],
+            tags=[RunTag(f"tag_{j}", f"value_{j}") for j in range(args.tags)],
+        )
+        response.runs.append(Run(info, data).to_proto())
+    return response
+
+
+def measure(func, repeat):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        times.append(time.perf_counter() - start)
+    return min(times), result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--runs", type=int, default=1000)
+    parser.add_argument("--metrics", type=int, default=50)
+    parser.add_argument("--params", type=int, default=50)
+    parser.add_argument("--tags", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    response = make_response(args)
+    legacy_serialize, legacy_json = measure(lambda: legacy_message_to_json(response), args.repeat)
+    serialize, new_json = measure(lambda: message_to_json(response), args.repeat)
+    assert json.loads(legacy_json) == json.loads(new_json)
+
+    def parse(parse_func):
+        message = SearchRuns.Response()
+        parse_func(json.loads(new_json), message)
+        return message
+
+    legacy_parse, legacy_message = measure(lambda: parse(legacy_parse_dict), args.repeat)
+    parse_time, new_message = measure(lambda: parse(parse_dict), args.repeat)
+    assert legacy_message == new_message == response
+
+    print(f"{'operation':>15} {'legacy (s)':>11} {'new (s)':>8} {'speedup':>8}")
+    for name, legacy, new in [
+        ("message_to_json", legacy_serialize, serialize),
+        ("parse_dict", legacy_parse, parse_time),
+    ]:
+        print(f"{name:>15} {legacy:>11.3f} {new:>8.3f} {legacy / new:>7.1f}x")
+    print(f"JSON size: {len(legacy_json) / 1e6:.1f} MB -> {len(new_json) / 1e6:.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+"""
+Measures the throughput of ``S3ArtifactRepository.log_artifacts`` for various file counts and sizes.
+
+By default, uploads go to an in-process S3 stand-in provided by moto, and every request is delayed
+by ``--latency-ms`` to simulate the round trip to a remote object store. To benchmark against a
+real S3-compatible server (e.g. MinIO or ``moto_server``), pass ``--endpoint-url`` and make sure
+the bucket passed with ``--bucket`` exists.
+
+For each scenario, a directory of files is uploaded with:
+
+- ``sequential``: one ``upload_file`` call after the other with the default boto3 transfer
+  configuration, which is what ``log_artifacts`` used to do.
+- ``parallel``: ``log_artifacts``, which uploads small files concurrently and large files in parts.
+
+Usage:
+    python dev/benchmarks/s3_log_artifacts.py --latency-ms 20
+"""
+
+import argparse
+import os
+import posixpath
+import tempfile
+import time
+from contextlib import nullcontext
+
+import boto3
+
+from mlflow.store.artifact.s3_artifact_repo import S3ArtifactRepository
+
+SCENARIOS = [
+    (100, 4 * 1024),
+    (1000, 4 * 1024),
+    (20, 1024**2),
+    (2, 64 * 1024**2),
+]
+
+
+def format_size(num_bytes):
+    if num_bytes >= 1024**2:
+        return f"{num_bytes // 1024**2} MB"
+    return f"{num_bytes // 1024} KB"
+
+
+def create_files(root, count, size):
+    for i in range(count):
+        with open(os.path.join(root, f"file_{i}.bin"), "wb") as f:
+            f.write(os.urandom(size))
+
+
+def upload_sequentially(repo, local_dir, artifact_path):
+    bucket, dest_path = repo.parse_s3_compliant_uri(repo.artifact_uri)
+    s3_client = repo._get_s3_client()
+    for name in os.listdir(local_dir):
+        local_file = os.path.join(local_dir, name)
+        s3_client.upload_file(
+            Filename=local_file,
+            Bucket=bucket,
+            Key=posixpath.join(dest_path, artifact_path, name),
+            ExtraArgs=repo._get_upload_extra_args(local_file),
+        )
+
+
+def upload_in_parallel(repo, local_dir, artifact_path):
+    repo.log_artifacts(local_dir, artifact_path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--endpoint-url", help="URL of an S3-compatible server to upload to")
+    parser.add_argument("--bucket", default="benchmark")
+    parser.add_argument("--latency-ms", type=float, default=20.0)
+    args = parser.parse_args()
+
+    if args.endpoint_url:
+        os.environ["MLFLOW_S3_ENDPOINT_URL"] = args.endpoint_url
+        context = nullcontext()
+    else:
+        import moto
+
+        os.environ.setdefault("AWS_ACCESS_KEY_ID", "testing")
+        os.environ.setdefault("AWS_SECRET_ACCESS_KEY", "testing")
+        os.environ.setdefault("AWS_DEFAULT_REGION", "us-east-1")
+        context = moto.mock_s3()
+
+    with context:
+        if not args.endpoint_url:
+            boto3.client("s3").create_bucket(Bucket=args.bucket)
+        repo = S3ArtifactRepository(f"s3://{args.bucket}/artifacts")
+        if args.latency_ms and not args.endpoint_url:
+            repo._get_s3_client().meta.events.register(
+                "before-sign.s3", lambda **kwargs: time.sleep(args.latency_ms / 1000)
+            )
+
+        print(
+            f"{'files':>6} {'size':>7} {'sequential (MB/s)':>18} {'parallel (MB/s)':>16} "
+            f"{'speedup':>8}"
+        )
+        for count, size in SCENARIOS:
+            with tempfile.TemporaryDirectory() as local_dir:
+                create_files(local_dir, count, size)
+                timings = {}
+                for mode, upload in [
+                    ("sequential", upload_sequentially),
+                    ("parallel", upload_in_parallel),
+                ]:
+                    start = time.perf_counter()
+                    upload(repo, local_dir, f"{mode}/{count}x{size}")
+                    timings[mode] = time.perf_counter() - start
+
+            total_mb = count * size / 1024**2
+            sequential, parallel = timings["sequential"], timings["parallel"]
+            print(
+                f"{count:>6} {format_size(size):>7} {total_mb / sequential:>18.1f} "
+                f"{total_mb / parallel:>16.1f} {sequential / parallel:>7.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
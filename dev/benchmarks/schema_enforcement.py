@@ -0,0 +1,129 @@
+"""
+Measures the cost of enforcing a model signature on column-based inputs.
+
+For a set of representative signatures, a pandas DataFrame of ``--rows`` rows is enforced with:
+
+- ``per-value``: the interpreted enforcement, which calls ``_enforce_type`` for every value of
+  array, object and map columns.
+- ``compiled``: ``_enforce_schema`` with the plan compiled once by ``_CompiledSchema``, like
+  ``PyFuncModel.predict`` does.
+
+Usage:
+    python dev/benchmarks/schema_enforcement.py --rows 1000 --repeat 5
+"""
+
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from mlflow.models.utils import (
+    _CompiledSchema,
+    _enforce_mlflow_datatype,
+    _enforce_schema,
+    _enforce_type,
+)
+from mlflow.types import ColSpec, DataType, Schema
+from mlflow.types.schema import Array, Map, Object, Property
+
+
+def scalars(rows):
+    schema = Schema([ColSpec(DataType.double, f"x{i}") for i in range(10)])
+    data = pd.DataFrame({f"x{i}": np.random.rand(rows) for i in range(10)})
+    return schema, data
+
+
+def embeddings(rows):
+    schema = Schema([ColSpec(Array(DataType.double), "embedding")])
+    data = pd.DataFrame({"embedding": [np.random.rand(128).tolist() for _ in range(rows)]})
+    return schema, data
+
+
+def tokens(rows):
+    schema = Schema([ColSpec(Array(DataType.string), "tokens")])
+    data = pd.DataFrame({"tokens": [[f"token{i}" for i in range(32)] for _ in range(rows)]})
+    return schema, data
+
+
+def chat_messages(rows):
+    message = Object([Property("role", DataType.string), Property("content", DataType.string)])
+    schema = Schema(
+        [
+            ColSpec(Array(message), "messages"),
+            ColSpec(DataType.double, "temperature"),
+            ColSpec(Map(DataType.long), "options", required=False),
+        ]
+    )
+    data = pd.DataFrame(
+        {
+            "messages": [
+                [{"role": "user", "content": "hello"}, {"role": "assistant", "content": "hi"}]
+                for _ in range(rows)
+            ],
+            "temperature": np.random.rand(rows),
+            "options": [{"max_tokens": 128, "top_k": 5} for _ in range(rows)],
+        }
+    )
+    return schema, data
+
+
+SIGNATURES = {
+    "10 doubles": scalars,
+    "array<double>[128]": embeddings,
+    "array<string>[32]": tokens,
+    "chat messages": chat_messages,
+}
+
+
+def enforce_per_value(data, schema):
+    enforced = {}
+    for spec in schema.inputs:
+        values = data[spec.name]
+        if isinstance(spec.type, DataType):
+            enforced[spec.name] = _enforce_mlflow_datatype(spec.name, values, spec.type)
+        else:
+            enforced[spec.name] = pd.Series(
+                [_enforce_type(v, spec.type, spec.required) for v in values], name=spec.name
+            )
+    return pd.DataFrame(enforced)
+
+
+def measure(fn, make_data, repeat):
+    timings = []
+    for _ in range(repeat):
+        # Enforcement modifies objects in place, so each repetition gets fresh data
+        data = make_data()
+        start = time.perf_counter()
+        fn(data)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--rows", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'signature':<20} {'per-value (ms)':>15} {'compiled (ms)':>14} {'speedup':>8}")
+    for name, make in SIGNATURES.items():
+        schema, _ = make(args.rows)
+        compiled = _CompiledSchema(schema)
+
+        def make_data():
+            return make(args.rows)[1]
+
+        per_value = measure(lambda data: enforce_per_value(data, schema), make_data, args.repeat)
+        fast = measure(
+            lambda data: _enforce_schema(data, schema, compiled_schema=compiled),
+            make_data,
+            args.repeat,
+        )
+        print(
+            f"{name:<20} {per_value * 1000:>15.1f} {fast * 1000:>14.1f} {per_value / fast:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""
+Compares the JSON and Apache Arrow IPC payload formats of the pyfunc scoring server.
+
+Each measurement covers the full codec round trip of an ``/invocations`` call with an identity
+model: client-side request encoding, server-side input parsing, server-side prediction encoding
+and client-side response decoding. Model inference and HTTP transport are excluded so that the
+numbers isolate the cost of the payload format.
+
+Usage:
+    python dev/benchmarks/scoring_server_arrow.py --rows 100 10000 100000 --repeat 5
+"""
+
+import argparse
+import io
+import time
+
+import numpy as np
+import pandas as pd
+
+from mlflow.deployments import PredictionsResponse
+from mlflow.models import Model
+from mlflow.pyfunc import scoring_server
+from mlflow.pyfunc.scoring_server.client import _dump_arrow_input, _load_arrow_predictions
+from mlflow.utils.proto_json_utils import dump_input_data
+
+
+def make_dataframe(column_type: str, num_rows: int, num_columns: int = 10) -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    if column_type == "float":
+        columns = {f"f{i}": rng.random(num_rows) for i in range(num_columns)}
+    elif column_type == "int":
+        columns = {f"i{i}": rng.integers(0, 1_000_000, num_rows) for i in range(num_columns)}
+    elif column_type == "string":
+        columns = {
+            f"s{i}": rng.integers(0, 1_000_000, num_rows).astype(str) for i in range(num_columns)
+        }
+    elif column_type == "mixed":
+        columns = {}
+        for i in range(num_columns):
+            if i % 3 == 0:
+                columns[f"f{i}"] = rng.random(num_rows)
+            elif i % 3 == 1:
+                columns[f"i{i}"] = rng.integers(0, 1_000_000, num_rows)
+            else:
+                columns[f"s{i}"] = rng.integers(0, 1_000_000, num_rows).astype(str)
+    else:
+        raise ValueError(f"Unknown column type: {column_type}")
+    return pd.DataFrame(columns)
+
+
+def json_round_trip(df: pd.DataFrame, metadata: Model) -> pd.DataFrame:
+    request = dump_input_data(df)
+    parsed = scoring_server._parse_json_data(request, metadata, input_schema=None)
+    output = io.StringIO()
+    scoring_server.predictions_to_json(parsed.data, output)
+    return PredictionsResponse.from_json(output.getvalue()).get_predictions()
+
+
+def arrow_round_trip(df: pd.DataFrame, metadata: Model) -> pd.DataFrame:
+    request = _dump_arrow_input(df)
+    data, _ = scoring_server.parse_arrow_input(request)
+    response = scoring_server.predictions_to_arrow(data)
+    return _load_arrow_predictions(response).get_predictions()
+
+
+def best_time(fn, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--rows", type=int, nargs="+", default=[100, 10_000, 100_000])
+    parser.add_argument("--column-types", nargs="+", default=["float", "int", "string", "mixed"])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    metadata = Model()
+    print(f"{'columns':<8} {'rows':>8} {'json (ms)':>10} {'arrow (ms)':>11} {'speedup':>8}")
+    for column_type in args.column_types:
+        for num_rows in args.rows:
+            df = make_dataframe(column_type, num_rows)
+            # Sanity check that both formats produce the same predictions
+            pd.testing.assert_frame_equal(
+                json_round_trip(df, metadata), arrow_round_trip(df, metadata), check_dtype=False
+            )
+            json_time = best_time(lambda: json_round_trip(df, metadata), args.repeat)
+            arrow_time = best_time(lambda: arrow_round_trip(df, metadata), args.repeat)
+            print(
+                f"{column_type:<8} {num_rows:>8} {json_time * 1000:>10.2f} "
+                f"{arrow_time * 1000:>11.2f} {json_time / arrow_time:>7.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
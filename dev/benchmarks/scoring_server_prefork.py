@@ -0,0 +1,124 @@
+"""
+Compares the memory footprint and start-up time of the pyfunc scoring server with
+``uvicorn --workers`` and with the pre-fork mode (``MLFLOW_SCORING_SERVER_PREFORK``).
+
+The served model holds a large array of weights. For each worker count, the server is started
+through ``mlflow.pyfunc.scoring_server.get_cmd`` and the benchmark records the time until
+``/ping`` succeeds and the total proportional set size (PSS) of the server process tree once its
+memory usage has settled. PSS splits shared pages between the processes sharing them, so it
+reflects the memory actually saved by copy-on-write sharing. Falls back to RSS on platforms
+without PSS.
+
+Usage:
+    python dev/benchmarks/scoring_server_prefork.py --workers 1 2 4 8 --model-size-mb 500
+"""
+
+import argparse
+import os
+import signal
+import subprocess
+import tempfile
+import time
+
+import numpy as np
+import psutil
+import requests
+
+import mlflow
+from mlflow.pyfunc import PythonModel, scoring_server
+
+
+class WeightsModel(PythonModel):
+    def load_context(self, context):
+        self.weights = np.load(context.artifacts["weights"])
+
+    def predict(self, context, model_input, params=None):
+        return model_input * float(self.weights[0])
+
+
+def save_model(path: str, size_mb: int) -> str:
+    weights_path = os.path.join(path, "weights.npy")
+    np.save(weights_path, np.ones(size_mb * 1024 * 1024 // 8))
+    model_path = os.path.join(path, "model")
+    mlflow.pyfunc.save_model(
+        model_path, python_model=WeightsModel(), artifacts={"weights": weights_path}
+    )
+    return model_path
+
+
+def memory_of_tree(pid: int) -> int:
+    processes = [psutil.Process(pid)]
+    processes += processes[0].children(recursive=True)
+    total = 0
+    for process in processes:
+        try:
+            info = process.memory_full_info()
+        except psutil.Error:
+            continue
+        total += getattr(info, "pss", info.rss)
+    return total
+
+
+def wait_until_settled(pid: int, interval: float = 0.5, samples: int = 4) -> int:
+    history = []
+    while True:
+        history.append(memory_of_tree(pid))
+        recent = history[-samples:]
+        if len(recent) == samples and max(recent) - min(recent) < 0.01 * max(recent):
+            return recent[-1]
+        time.sleep(interval)
+
+
+def measure(model_path: str, workers: int, prefork: bool, port: int):
+    env_var = "MLFLOW_SCORING_SERVER_PREFORK"
+    previous = os.environ.get(env_var)
+    os.environ[env_var] = str(prefork).lower()
+    try:
+        command, env = scoring_server.get_cmd(model_path, port=port, nworkers=workers)
+    finally:
+        if previous is None:
+            os.environ.pop(env_var)
+        else:
+            os.environ[env_var] = previous
+
+    start = time.perf_counter()
+    # Run the server in place of the shell, like `mlflow models serve` does, so that waiting for
+    # the process waits for the server to release the port.
+    proc = subprocess.Popen(f"exec {command}", shell=True, env=env, start_new_session=True)
+    try:
+        while True:
+            try:
+                if requests.get(f"http://127.0.0.1:{port}/ping", timeout=1).status_code == 200:
+                    break
+            except requests.RequestException:
+                pass
+            if proc.poll() is not None:
+                raise RuntimeError(f"Server exited with code {proc.returncode}")
+            time.sleep(0.05)
+        startup_time = time.perf_counter() - start
+        memory = wait_until_settled(proc.pid)
+    finally:
+        os.killpg(proc.pid, signal.SIGTERM)
+        proc.wait()
+    return startup_time, memory
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--model-size-mb", type=int, default=500)
+    parser.add_argument("--port", type=int, default=5123)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        model_path = save_model(tmp, args.model_size_mb)
+        print(f"{'mode':<8} {'workers':>8} {'startup (s)':>12} {'memory (MB)':>12}")
+        for workers in args.workers:
+            for prefork in (False, True):
+                startup_time, memory = measure(model_path, workers, prefork, args.port)
+                mode = "prefork" if prefork else "uvicorn"
+                print(f"{mode:<8} {workers:>8} {startup_time:>12.2f} {memory / 2**20:>12.0f}")
+
+
+if __name__ == "__main__":
+    main()
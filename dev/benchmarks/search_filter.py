@@ -0,0 +1,112 @@
+"""
+Measures the cost of filtering and sorting runs in memory, like ``FileStore.search_runs`` does.
+
+``--runs`` runs with a few metrics, params and tags are filtered and sorted ``--repeat`` times,
+which simulates the UI polling the runs of an experiment with the same search, in two modes:
+
+- ``per-run``: the filter string is parsed on every search, and each parsed clause is validated,
+  dispatched on its entity type and has its value converted for every run. Sort values are looked
+  up by dispatching on the order_by entity type for every run. This is what ``SearchUtils.filter``
+  and ``SearchUtils.sort`` used to do.
+- ``compiled``: ``SearchUtils.filter`` and ``SearchUtils.sort``, which reuse the cached parsed
+  filter and order_by, and compile them once per search into predicates and sort value getters.
+
+Usage:
+    python dev/benchmarks/search_filter.py --runs 10000 --repeat 10
+"""
+
+import argparse
+import time
+
+from mlflow.entities import LifecycleStage, Metric, Param, Run, RunData, RunInfo, RunStatus, RunTag
+from mlflow.utils.search_utils import SearchUtils
+
+FILTERS = [
+    "metrics.loss < 0.5",
+    "params.model = 'resnet' AND tags.team LIKE 'vision%'",
+    "metrics.loss < 0.5 AND metrics.accuracy >= 0.8 AND params.lr != '0.1' "
+    "AND attributes.status = 'FINISHED'",
+]
+ORDER_BY = ["metrics.accuracy DESC", "params.model"]
+
+
+def create_runs(count):
+    return [
+        Run(
+            run_info=RunInfo(
+                run_id=f"run-{i}",
+                experiment_id="0",
+                user_id="user",
+                status=RunStatus.to_string(RunStatus.FINISHED if i % 4 else RunStatus.FAILED),
+                start_time=i,
+                end_time=i + 1,
+                lifecycle_stage=LifecycleStage.ACTIVE,
+            ),
+            run_data=RunData(
+                metrics=[
+                    Metric("loss", (i % 100) / 100, 0, 0),
+                    Metric("accuracy", (i % 37) / 37, 0, 0),
+                ],
+                params=[Param("model", ["resnet", "vit"][i % 2]), Param("lr", str(i % 3 / 10))],
+                tags=[RunTag("team", ["vision-a", "vision-b", "nlp"][i % 3])],
+            ),
+        )
+        for i in range(count)
+    ]
+
+
+def search_per_run(runs, filter_string):
+    parsed = SearchUtils._parse_search_filter.__wrapped__(SearchUtils, filter_string)
+    filtered = [run for run in runs if all(SearchUtils._compile_run_clause(s)(run) for s in parsed)]
+    filtered = sorted(filtered, key=lambda run: (-run.info.start_time, run.info.run_id))
+    for order_by_clause in reversed(ORDER_BY):
+        token_value, ascending = SearchUtils._parse_order_by_string.__wrapped__(
+            SearchUtils, order_by_clause
+        )
+        identifier = SearchUtils._get_identifier(
+            token_value.strip(), SearchUtils.VALID_ORDER_BY_ATTRIBUTE_KEYS
+        )
+        key_type, key = identifier["type"], identifier["key"]
+        filtered = sorted(
+            filtered,
+            key=lambda run: SearchUtils._get_run_sort_key(
+                SearchUtils._get_sort_value_getter(key_type, key)(run), ascending
+            ),
+            reverse=not ascending,
+        )
+    return filtered
+
+
+def search_compiled(runs, filter_string):
+    return SearchUtils.sort(SearchUtils.filter(runs, filter_string), ORDER_BY)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--runs", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    runs = create_runs(args.runs)
+    print(
+        f"{'clauses':>7} {'matches':>8} {'per-run (ms)':>13} {'compiled (ms)':>14} {'speedup':>8}"
+    )
+    for filter_string in FILTERS:
+        timings = {}
+        for mode, search in [("per-run", search_per_run), ("compiled", search_compiled)]:
+            start = time.perf_counter()
+            for _ in range(args.repeat):
+                result = search(runs, filter_string)
+            timings[mode] = (time.perf_counter() - start) / args.repeat * 1000
+
+        assert search_per_run(runs, filter_string) == result
+        num_clauses = len(SearchUtils.parse_search_filter(filter_string))
+        per_run, compiled = timings["per-run"], timings["compiled"]
+        print(
+            f"{num_clauses:>7} {len(result):>8} {per_run:>13.1f} {compiled:>14.1f} "
+            f"{per_run / compiled:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
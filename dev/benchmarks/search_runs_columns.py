@@ -0,0 +1,101 @@
+"""
+Measures the cost of searching runs with many params when only a few columns are displayed, like
+the runs table of the UI does.
+
+``--runs`` runs with ``--params`` params, ``--metrics`` metrics and a few tags are created in a
+tracking store, and the runs are searched ``--repeat`` times with the ``columns`` of the search set
+to:
+
+- ``all``: ``None``, which loads every metric, param, and tag of the runs.
+- ``5 columns``: two metrics, two params, and a tag.
+- ``info only``: ``[]``, which loads none of them.
+
+The number of metric, param, and tag rows loaded for the returned runs is reported along with the
+latency of the search.
+
+Usage:
+    python dev/benchmarks/search_runs_columns.py --runs 1000 --params 1000 --metrics 50
+    python dev/benchmarks/search_runs_columns.py --store file --runs 100 --params 100
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+from mlflow.entities import Metric, Param, RunTag, ViewType
+from mlflow.utils.time import get_current_time_millis
+
+COLUMNS = {
+    "all": None,
+    "5 columns": ["metrics.m0", "metrics.m1", "params.p0", "params.p1", "tags.team"],
+    "info only": [],
+}
+MAX_ENTITIES_PER_BATCH = 100
+
+
+def create_store(store_type, root):
+    if store_type == "sqlite":
+        from mlflow.store.tracking.sqlalchemy_store import SqlAlchemyStore
+
+        return SqlAlchemyStore(
+            f"sqlite:///{os.path.join(root, 'mlflow.db')}", os.path.join(root, "artifacts")
+        )
+    from mlflow.store.tracking.file_store import FileStore
+
+    return FileStore(os.path.join(root, "mlruns"))
+
+
+def populate(store, num_runs, num_params, num_metrics):
+    experiment_id = store.create_experiment("benchmark")
+    timestamp = get_current_time_millis()
+    for i in range(num_runs):
+        run_id = store.create_run(experiment_id, "user", timestamp + i, [], f"run-{i}").info.run_id
+        params = [Param(f"p{j}", str(i * j)) for j in range(num_params)]
+        metrics = [Metric(f"m{j}", i * j, timestamp, 0) for j in range(num_metrics)]
+        tags = [RunTag("team", ["a", "b"][i % 2]), RunTag("owner", "user")]
+        for start in range(0, max(num_params, num_metrics, len(tags)), MAX_ENTITIES_PER_BATCH):
+            store.log_batch(
+                run_id,
+                metrics=metrics[start : start + MAX_ENTITIES_PER_BATCH],
+                params=params[start : start + MAX_ENTITIES_PER_BATCH],
+                tags=tags if start == 0 else [],
+            )
+    return experiment_id
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--store", choices=["sqlite", "file"], default="sqlite")
+    parser.add_argument("--runs", type=int, default=1000)
+    parser.add_argument("--params", type=int, default=1000)
+    parser.add_argument("--metrics", type=int, default=50)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as root:
+        store = create_store(args.store, root)
+        start = time.perf_counter()
+        experiment_id = populate(store, args.runs, args.params, args.metrics)
+        print(f"Created {args.runs} runs in {time.perf_counter() - start:.1f} s")
+
+        print(f"{'columns':>10} {'rows loaded':>12} {'latency (ms)':>13} {'speedup':>8}")
+        baseline = None
+        for name, columns in COLUMNS.items():
+            start = time.perf_counter()
+            for _ in range(args.repeat):
+                runs = store.search_runs(
+                    [experiment_id],
+                    "tags.team = 'a'",
+                    ViewType.ACTIVE_ONLY,
+                    max_results=args.runs,
+                    columns=columns,
+                )
+            latency = (time.perf_counter() - start) / args.repeat * 1000
+            baseline = baseline or latency
+            rows = sum(len(r.data.metrics) + len(r.data.params) + len(r.data.tags) for r in runs)
+            print(f"{name:>10} {rows:>12} {latency:>13.1f} {baseline / latency:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
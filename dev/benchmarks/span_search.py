@@ -0,0 +1,100 @@
+"""
+Measures the latency of searching traces by span with the span index of the SQL tracking store,
+compared to downloading every trace and filtering its spans on the client.
+
+``--traces`` agent traces are logged to a SQLite tracking store in a temporary directory. Each
+trace has a root span and ``--spans`` child spans, one of them a "retriever" span. One trace in
+``--slow-every`` has a retriever span that took more than 2 seconds. Both approaches search for
+these traces with ``span.name = 'retriever' AND span.duration_ms > 2000``.
+
+Usage:
+    python dev/benchmarks/span_search.py --traces 1000 10000 --spans 5 --slow-every 100
+"""
+
+import argparse
+import logging
+import os
+import tempfile
+import time
+
+import mlflow
+from mlflow.entities import SpanType
+
+FILTER_STRING = "span.name = 'retriever' AND span.duration_ms > 2000"
+
+
+def log_traces(client, experiment_id, num_traces, args):
+    for i in range(num_traces):
+        root = client.start_trace("agent", experiment_id=experiment_id, start_time_ns=0)
+        for j in range(args.spans):
+            name, span_type = ("retriever", SpanType.RETRIEVER) if j == 0 else ("llm", SpanType.LLM)
+            # Fake the timing of the spans rather than sleeping
+            duration_ms = 3000 if j == 0 and i % args.slow_every == 0 else 500
+            span = client.start_span(
+                name,
+                trace_id=root.trace_id,
+                parent_id=root.span_id,
+                span_type=span_type,
+                inputs={"query": f"question {i}"},
+                start_time_ns=0,
+            )
+            client.end_span(root.trace_id, span.span_id, end_time_ns=duration_ms * 1_000_000)
+        client.end_trace(root.trace_id, end_time_ns=5_000_000_000)
+
+
+def search_on_client(client, experiment_id):
+    def matches(span):
+        duration_ms = (span.end_time_ns - span.start_time_ns) // 1_000_000
+        return span.name == "retriever" and duration_ms > 2000
+
+    traces, page_token = [], None
+    while True:
+        page = client.search_traces([experiment_id], max_results=500, page_token=page_token)
+        traces.extend(t for t in page if any(matches(span) for span in t.data.spans))
+        if not (page_token := page.token):
+            return traces
+
+
+def search_on_server(client, experiment_id):
+    traces, page_token = [], None
+    while True:
+        page = client.search_traces(
+            [experiment_id], filter_string=FILTER_STRING, max_results=500, page_token=page_token
+        )
+        traces.extend(page)
+        if not (page_token := page.token):
+            return traces
+
+
+def measure(search, client, experiment_id):
+    start = time.perf_counter()
+    traces = search(client, experiment_id)
+    return time.perf_counter() - start, len(traces)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--traces", type=int, nargs="+", default=[1000, 10000])
+    parser.add_argument("--spans", type=int, default=5, help="Child spans per trace")
+    parser.add_argument("--slow-every", type=int, default=100)
+    args = parser.parse_args()
+
+    logging.getLogger("mlflow").setLevel(logging.ERROR)
+
+    print(f"{'traces':>7} {'matches':>8} {'client-side (s)':>16} {'span index (s)':>15}")
+    for num_traces in args.traces:
+        with tempfile.TemporaryDirectory() as tmp:
+            mlflow.set_tracking_uri(f"sqlite:///{os.path.join(tmp, 'mlflow.db')}")
+            client = mlflow.MlflowClient()
+            experiment_id = client.create_experiment(
+                "span_search", artifact_location=os.path.join(tmp, "artifacts")
+            )
+            log_traces(client, experiment_id, num_traces, args)
+            client_time, client_matches = measure(search_on_client, client, experiment_id)
+            server_time, server_matches = measure(search_on_server, client, experiment_id)
+            assert client_matches == server_matches
+        print(f"{num_traces:>7} {server_matches:>8} {client_time:>16.2f} {server_time:>15.3f}")
+
+
+if __name__ == "__main__":
+    main()
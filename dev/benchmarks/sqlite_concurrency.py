@@ -0,0 +1,147 @@
+"""
+Measures the throughput of a SQLite tracking store under concurrent writes and searches, like the
+workers of a single-node tracking server serve them.
+
+``--processes`` processes, each running ``--threads`` threads, log batches of metrics to their own
+runs and search the runs of the experiment for ``--duration`` seconds, in two modes:
+
+- ``default``: the pragmas are set for every session, and concurrent writers poll SQLite for its
+  rollback journal write lock.
+- ``performance``: ``MLFLOW_SQLALCHEMYSTORE_SQLITE_PERFORMANCE_MODE``, which enables write-ahead
+  logging, sets the pragmas once per connection and queues the write transactions of each process.
+
+Usage:
+    python dev/benchmarks/sqlite_concurrency.py --processes 4 --threads 4 --duration 10
+"""
+
+import argparse
+import multiprocessing
+import os
+import statistics
+import tempfile
+import threading
+import time
+import uuid
+
+from mlflow.entities import Metric
+
+MODES = {"default": "false", "performance": "true"}
+
+
+def create_store(db_uri, artifact_uri):
+    from mlflow.store.tracking.sqlalchemy_store import SqlAlchemyStore
+
+    return SqlAlchemyStore(db_uri, artifact_uri)
+
+
+def run_worker(mode, db_uri, artifact_uri, experiment_id, threads, duration, search_ratio, queue):
+    os.environ["MLFLOW_SQLALCHEMYSTORE_SQLITE_PERFORMANCE_MODE"] = MODES[mode]
+    store = create_store(db_uri, artifact_uri)
+    deadline = time.monotonic() + duration
+    results = []
+
+    def run_thread():
+        run_id = store.create_run(
+            experiment_id, "user", 0, [], f"run-{uuid.uuid4().hex}"
+        ).info.run_id
+        latencies = {"log_batch": [], "search_runs": []}
+        errors = 0
+        step = 0
+        while time.monotonic() < deadline:
+            step += 1
+            start = time.perf_counter()
+            try:
+                if step % search_ratio == 0:
+                    operation = "search_runs"
+                    store.search_runs([experiment_id], "metrics.loss < 0.5", 1, max_results=100)
+                else:
+                    operation = "log_batch"
+                    metrics = [Metric(f"m{i}", step / (i + 1), 0, step) for i in range(10)]
+                    store.log_batch(run_id, metrics=metrics, params=[], tags=[])
+            except Exception as e:
+                if "database is locked" not in str(e):
+                    raise
+                errors += 1
+                continue
+            latencies[operation].append(time.perf_counter() - start)
+        results.append((latencies, errors))
+
+    workers = [threading.Thread(target=run_thread) for _ in range(threads)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    store._dispose_engine()
+    queue.put(results)
+
+
+def run_mode(mode, args):
+    with tempfile.TemporaryDirectory() as tmp:
+        db_uri = f"sqlite:///{os.path.join(tmp, 'mlflow.db')}"
+        artifact_uri = os.path.join(tmp, "artifacts")
+        os.environ["MLFLOW_SQLALCHEMYSTORE_SQLITE_PERFORMANCE_MODE"] = MODES[mode]
+        store = create_store(db_uri, artifact_uri)
+        experiment_id = store.create_experiment("benchmark")
+        store._dispose_engine()
+
+        ctx = multiprocessing.get_context("spawn")
+        queue = ctx.Queue()
+        processes = [
+            ctx.Process(
+                target=run_worker,
+                args=(
+                    mode,
+                    db_uri,
+                    artifact_uri,
+                    experiment_id,
+                    args.threads,
+                    args.duration,
+                    args.search_ratio,
+                    queue,
+                ),
+            )
+            for _ in range(args.processes)
+        ]
+        for process in processes:
+            process.start()
+        results = [result for _ in processes for result in queue.get()]
+        for process in processes:
+            process.join()
+
+    latencies = {
+        operation: [latency for thread, _ in results for latency in thread[operation]]
+        for operation in ["log_batch", "search_runs"]
+    }
+    errors = sum(errors for _, errors in results)
+    return latencies, errors
+
+
+def percentile(values, q):
+    return statistics.quantiles(values, n=100)[q - 1] * 1000 if len(values) > 1 else float("nan")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--processes", type=int, default=4)
+    parser.add_argument("--threads", type=int, default=4)
+    parser.add_argument("--duration", type=float, default=10)
+    parser.add_argument(
+        "--search-ratio", type=int, default=5, help="Run one search every N operations"
+    )
+    args = parser.parse_args()
+
+    print(
+        f"{'mode':>11} {'operation':>11} {'ops/s':>8} {'p50 (ms)':>9} {'p99 (ms)':>9} "
+        f"{'locked errors':>14}"
+    )
+    for mode in MODES:
+        latencies, errors = run_mode(mode, args)
+        for operation, values in latencies.items():
+            print(
+                f"{mode:>11} {operation:>11} {len(values) / args.duration:>8.1f} "
+                f"{percentile(values, 50):>9.1f} {percentile(values, 99):>9.1f} {errors:>14}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""
+Measures the CPU overhead of system metrics logging for a process with many concurrent runs, like a
+threaded hyperparameter sweep, with the shared sampler compared to a sampling thread per run.
+
+``--runs`` runs are monitored for ``--duration`` seconds with a ``--sampling-interval`` second
+sampling interval, while the main thread sleeps, so the CPU time used by the process is the
+overhead of system metrics logging. The runs are logged to a file store in a temporary directory.
+GPU monitors are disabled so that only the CPU, memory, disk and network stats are sampled.
+
+Usage:
+    python dev/benchmarks/system_metrics.py --runs 1 10 100 --duration 10 --sampling-interval 0.5
+"""
+
+import argparse
+import logging
+import os
+import tempfile
+import threading
+import time
+
+import mlflow
+from mlflow.system_metrics.metrics.cpu_monitor import CPUMonitor
+from mlflow.system_metrics.metrics.disk_monitor import DiskMonitor
+from mlflow.system_metrics.metrics.network_monitor import NetworkMonitor
+from mlflow.system_metrics.system_metrics_monitor import SystemMetricsMonitor
+from mlflow.system_metrics.system_metrics_sampler import SystemMetricsSampler
+from mlflow.utils.autologging_utils import BatchMetricsLogger
+
+
+class PerRunMonitor:
+    """
+    Samples system stats in a thread per run, like `SystemMetricsMonitor` did before the sampler
+    was shared.
+    """
+
+    def __init__(self, run_id, sampling_interval):
+        self.monitors = [CPUMonitor(), DiskMonitor(), NetworkMonitor()]
+        self.sampling_interval = sampling_interval
+        self.run_id = run_id
+        self.mlflow_logger = BatchMetricsLogger(run_id)
+        self.shutdown_event = threading.Event()
+        self.thread = threading.Thread(target=self.monitor, daemon=True)
+        self.step = 0
+
+    def start(self):
+        self.thread.start()
+
+    def monitor(self):
+        while not self.shutdown_event.is_set():
+            for monitor in self.monitors:
+                monitor.collect_metrics()
+            self.shutdown_event.wait(self.sampling_interval)
+            if mlflow.get_run(self.run_id).info.status != "RUNNING":
+                return
+            metrics = {}
+            for monitor in self.monitors:
+                metrics.update(monitor.aggregate_metrics())
+                monitor.clear_metrics()
+            self.mlflow_logger.record_metrics(
+                {f"system/{k}": v for k, v in metrics.items()}, self.step
+            )
+            self.step += 1
+
+    def finish(self):
+        self.shutdown_event.set()
+        self.thread.join()
+        self.mlflow_logger.flush()
+
+
+def measure(monitor_cls, num_runs, args):
+    client = mlflow.MlflowClient()
+    run_ids = [client.create_run("0").info.run_id for _ in range(num_runs)]
+    monitors = [monitor_cls(run_id, sampling_interval=args.sampling_interval) for run_id in run_ids]
+    start_cpu = time.process_time()
+    for monitor in monitors:
+        monitor.start()
+    time.sleep(args.duration)
+    for monitor in monitors:
+        monitor.finish()
+    cpu_time = time.process_time() - start_cpu
+    logged = sum(
+        len(client.get_metric_history(run_id, "system/cpu_utilization_percentage"))
+        for run_id in run_ids
+    )
+    return cpu_time / args.duration * 100, logged
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--runs", type=int, nargs="+", default=[1, 10, 100])
+    parser.add_argument("--duration", type=float, default=10, help="Seconds per measurement")
+    parser.add_argument("--sampling-interval", type=float, default=0.5)
+    args = parser.parse_args()
+
+    SystemMetricsSampler._initialize_gpu_monitor = lambda self: None
+    logging.getLogger("mlflow.system_metrics").setLevel(logging.WARNING)
+
+    print(
+        f"{'runs':>5} {'per-run CPU (%)':>16} {'shared CPU (%)':>15} "
+        f"{'per-run samples':>16} {'shared samples':>15}"
+    )
+    for num_runs in args.runs:
+        with tempfile.TemporaryDirectory() as tmp:
+            mlflow.set_tracking_uri(os.path.join(tmp, "mlruns"))
+            per_run, per_run_logged = measure(PerRunMonitor, num_runs, args)
+            shared, shared_logged = measure(SystemMetricsMonitor, num_runs, args)
+        print(
+            f"{num_runs:>5} {per_run:>16.1f} {shared:>15.1f} "
+            f"{per_run_logged:>16} {shared_logged:>15}"
+        )
+
+
+if __name__ == "__main__":
+    main()
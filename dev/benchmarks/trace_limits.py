@@ -0,0 +1,100 @@
+"""
+Measures the memory used by the trace of a runaway agent loop, which starts many spans with large
+inputs, without and with the per-trace span and size limits.
+
+The agent makes ``--steps`` tool calls, each traced as a span whose inputs are the ``--context-kb``
+KB conversation context. The peak memory allocated while the trace is recorded and the size of
+the trace in JSON are measured for each configuration of ``MLFLOW_TRACE_MAX_SPANS``,
+``MLFLOW_TRACE_MAX_SPAN_ATTRIBUTE_SIZE_BYTES`` and ``MLFLOW_TRACE_MAX_SIZE_BYTES``. The traces
+are logged to a file store in a temporary directory.
+
+Usage:
+    python dev/benchmarks/trace_limits.py --steps 1000 --context-kb 256
+"""
+
+import argparse
+import gc
+import logging
+import os
+import tempfile
+import time
+import tracemalloc
+
+import mlflow
+from mlflow.tracing.constant import TraceMetadataKey
+
+CONFIGURATIONS = {
+    "no limits": {},
+    "max spans": {"MLFLOW_TRACE_MAX_SPANS": "100"},
+    "max attribute size": {"MLFLOW_TRACE_MAX_SPAN_ATTRIBUTE_SIZE_BYTES": str(16 * 1024)},
+    "max trace size": {"MLFLOW_TRACE_MAX_SIZE_BYTES": str(10 * 1024 * 1024)},
+    "all limits": {
+        "MLFLOW_TRACE_MAX_SPANS": "100",
+        "MLFLOW_TRACE_MAX_SPAN_ATTRIBUTE_SIZE_BYTES": str(16 * 1024),
+        "MLFLOW_TRACE_MAX_SIZE_BYTES": str(10 * 1024 * 1024),
+    },
+}
+
+
+@mlflow.trace(span_type="TOOL")
+def call_tool(context, step):
+    return f"observation {step}"
+
+
+@mlflow.trace(span_type="AGENT")
+def run_agent(steps, context_kb):
+    for step in range(steps):
+        # Every step builds a fresh context, like an agent appending to its conversation
+        context = f"{step:08d}" + "x" * (context_kb * 1024 - 8)
+        call_tool(context, step)
+    return "done"
+
+
+def measure(env, args):
+    for name in CONFIGURATIONS["all limits"]:
+        os.environ.pop(name, None)
+    os.environ.update(env)
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    run_agent(args.steps, args.context_kb)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    trace = mlflow.get_trace(mlflow.get_last_active_trace_id())
+    metadata = trace.info.request_metadata
+    return {
+        "peak": peak / 1024 / 1024,
+        "json": len(trace.to_json()) / 1024 / 1024,
+        "spans": len(trace.data.spans),
+        "dropped": int(metadata.get(TraceMetadataKey.NUM_DROPPED_SPANS, 0)),
+        "truncated": int(metadata.get(TraceMetadataKey.NUM_TRUNCATED_SPAN_ATTRIBUTES, 0)),
+        "seconds": elapsed,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--steps", type=int, default=1000, help="Number of tool calls")
+    parser.add_argument("--context-kb", type=int, default=256, help="Size of the tool inputs")
+    args = parser.parse_args()
+
+    logging.getLogger("mlflow").setLevel(logging.ERROR)
+
+    print(
+        f"{'configuration':>20} {'peak memory (MB)':>17} {'JSON size (MB)':>15} {'spans':>6} "
+        f"{'dropped':>8} {'truncated':>10} {'time (s)':>9}"
+    )
+    with tempfile.TemporaryDirectory() as tmp:
+        mlflow.set_tracking_uri(os.path.join(tmp, "mlruns"))
+        for name, env in CONFIGURATIONS.items():
+            result = measure(env, args)
+            print(
+                f"{name:>20} {result['peak']:>17.1f} {result['json']:>15.1f} "
+                f"{result['spans']:>6} {result['dropped']:>8} {result['truncated']:>10} "
+                f"{result['seconds']:>9.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
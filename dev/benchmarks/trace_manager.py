@@ -0,0 +1,88 @@
+"""
+Measures the span throughput of the in-memory trace manager when many threads trace concurrent
+requests, like a multi-threaded model server does.
+
+Each of ``--threads`` threads traces ``--traces`` requests with ``--spans`` spans each. For every
+span, the thread registers the span and then updates the trace in ``get_trace``, where it runs a
+``--work-ms`` ms stand-in for the code that callers run on the trace, e.g. span processors. The
+throughput is compared to a trace manager that holds the registry lock while the trace is
+accessed, like the trace manager did before traces had their own locks.
+
+Usage:
+    python dev/benchmarks/trace_manager.py --threads 1 4 16 64 --work-ms 0.2
+"""
+
+import argparse
+import contextlib
+import threading
+import time
+import uuid
+
+from opentelemetry.sdk.trace import TracerProvider
+
+from mlflow.entities import LiveSpan
+from mlflow.entities.trace_info import TraceInfo
+from mlflow.entities.trace_status import TraceStatus
+from mlflow.tracing.trace_manager import InMemoryTraceManager
+
+
+class GlobalLockTraceManager(InMemoryTraceManager):
+    @contextlib.contextmanager
+    def get_trace(self, request_id):
+        with self._lock:
+            yield self._traces.get(request_id)
+
+    def register_span(self, span):
+        with self._lock:
+            self._traces[span.request_id].span_dict[span.span_id] = span
+
+
+def trace_requests(trace_manager, tracer, args):
+    for _ in range(args.traces):
+        request_id = f"tr-{uuid.uuid4().hex}"
+        root = tracer.start_span("root")
+        trace_id = root.get_span_context().trace_id
+        trace_manager.register_trace(
+            trace_id,
+            TraceInfo(request_id, "0", 0, 0, TraceStatus.IN_PROGRESS, {}, {}),
+        )
+        for i in range(args.spans):
+            otel_span = root if i == 0 else tracer.start_span(f"span-{i}")
+            trace_manager.register_span(LiveSpan(otel_span, request_id))
+            with trace_manager.get_trace(request_id) as trace:
+                trace.info.tags[f"span-{i}"] = "done"
+                time.sleep(args.work_ms / 1000)
+        trace_manager.pop_trace(trace_id)
+
+
+def measure(trace_manager, threads, args):
+    tracer = TracerProvider().get_tracer("benchmark")
+    workers = [
+        threading.Thread(target=trace_requests, args=(trace_manager, tracer, args))
+        for _ in range(threads)
+    ]
+    start = time.perf_counter()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    return threads * args.traces * args.spans / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--threads", type=int, nargs="+", default=[1, 4, 16, 64])
+    parser.add_argument("--traces", type=int, default=20, help="Traces per thread")
+    parser.add_argument("--spans", type=int, default=20, help="Spans per trace")
+    parser.add_argument("--work-ms", type=float, default=0.2)
+    args = parser.parse_args()
+
+    print(f"{'threads':>7} {'global lock (spans/s)':>22} {'per-trace locks (spans/s)':>26}")
+    for threads in args.threads:
+        global_lock = measure(GlobalLockTraceManager(), threads, args)
+        per_trace = measure(InMemoryTraceManager(), threads, args)
+        print(f"{threads:>7} {global_lock:>22.0f} {per_trace:>26.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,12 @@
 import contextlib
+import inspect
 import json
 import logging
 import os
 import re
 import sys
 import warnings
+from concurrent.futures import ThreadPoolExecutor
 from datetime import timedelta
 
 import click
@@ -24,7 +26,7 @@ from mlflow.protos.databricks_pb2 import INVALID_PARAMETER_VALUE
 from mlflow.store.artifact.artifact_repository_registry import get_artifact_repository
 from mlflow.store.tracking import DEFAULT_ARTIFACTS_URI, DEFAULT_LOCAL_FILE_AND_ARTIFACT_PATH
 from mlflow.tracking import _get_store
-from mlflow.utils import cli_args
+from mlflow.utils import chunk_list, cli_args
 from mlflow.utils.logging_utils import eprint
 from mlflow.utils.os import is_windows
 from mlflow.utils.plugins import get_entry_points
@@ -494,13 +496,56 @@ def server(
     "all of their associated runs. If experiment ids are not specified, data is removed for all "
     "experiments in the `deleted` lifecycle stage.",
 )
-def gc(older_than, backend_store_uri, artifacts_destination, run_ids, experiment_ids):
+@click.option(
+    "--batch-size",
+    type=click.IntRange(min=1),
+    default=500,
+    show_default=True,
+    help="Number of runs whose artifacts and metadata are deleted together. The metadata of each "
+    "batch is deleted in a single transaction if the backend store supports it.",
+)
+@click.option(
+    "--max-workers",
+    type=click.IntRange(min=1),
+    default=8,
+    show_default=True,
+    help="Maximum number of threads used to delete the artifacts of a batch of runs concurrently.",
+)
+@click.option(
+    "--checkpoint-file",
+    metavar="PATH",
+    default=None,
+    help="Optional. File in which the IDs of the permanently deleted runs and experiments are "
+    "recorded after each batch. If the file exists, the runs and experiments it records are "
+    "skipped, so that an interrupted gc can be resumed by running the same command again.",
+)
+@click.option(
+    "--dry-run",
+    is_flag=True,
+    default=False,
+    help="Print the runs, artifact locations and experiments that would be permanently deleted "
+    "without deleting anything.",
+)
+def gc(
+    older_than,
+    backend_store_uri,
+    artifacts_destination,
+    run_ids,
+    experiment_ids,
+    batch_size,
+    max_workers,
+    checkpoint_file,
+    dry_run,
+):
     """
     Permanently delete runs in the `deleted` lifecycle stage from the specified backend store.
     This command deletes all artifacts and metadata associated with the specified runs.
     If the provided artifact URL is invalid, the artifact deletion will be bypassed,
     and the gc process will continue.
 
+    Runs are deleted in batches of ``--batch-size``: the artifacts of a batch are deleted
+    concurrently by up to ``--max-workers`` threads, then the metadata of the batch is deleted.
+
     .. attention::
 
         If you are running an MLflow tracking server with artifact proxying enabled,
@@ -544,13 +589,16 @@ def gc(older_than, backend_store_uri, artifacts_destination, run_ids, experiment
         time_params = {name: float(param) for name, param in parts.groupdict().items() if param}
         time_delta = int(timedelta(**time_params).total_seconds() * 1000)
 
-    deleted_run_ids_older_than = backend_store._get_deleted_runs(older_than=time_delta)
-    run_ids = run_ids.split(",") if run_ids else deleted_run_ids_older_than
+    deleted_run_ids_older_than = set(backend_store._get_deleted_runs(older_than=time_delta))
+    run_ids = run_ids.split(",") if run_ids else list(deleted_run_ids_older_than)
+    deleted_run_ids, deleted_experiment_ids = _read_gc_checkpoint(checkpoint_file)
 
     time_threshold = get_current_time_millis() - time_delta
     if not skip_experiments:
         if experiment_ids:
-            experiment_ids = experiment_ids.split(",")
+            experiment_ids = [
+                id for id in experiment_ids.split(",") if id not in deleted_experiment_ids
+            ]
             experiments = [backend_store.get_experiment(id) for id in experiment_ids]
 
             # Ensure that the specified experiments are soft-deleted
@@ -590,20 +638,29 @@ def gc(older_than, backend_store_uri, artifacts_destination, run_ids, experiment
 
             experiment_ids = [exp.experiment_id for exp in fetch_experiments()]
 
+        search_runs_kwargs = {"columns": []} if _supports_search_runs_columns(backend_store) else {}
+
         def fetch_runs(token=None):
             page = backend_store.search_runs(
                 experiment_ids=experiment_ids,
                 filter_string="",
                 run_view_type=ViewType.DELETED_ONLY,
                 page_token=token,
+                **search_runs_kwargs,
             )
             return (page + fetch_runs(page.token)) if page.token else page
 
         run_ids.extend([run.info.run_id for run in fetch_runs()])
 
-    for run_id in set(run_ids):
-        run = backend_store.get_run(run_id)
-        if run.info.lifecycle_stage != LifecycleStage.DELETED:
+    run_ids = [run_id for run_id in dict.fromkeys(run_ids) if run_id not in deleted_run_ids]
+    run_infos = {}
+    for batch in chunk_list(run_ids, batch_size):
+        run_infos.update((info.run_id, info) for info in _get_gc_run_infos(backend_store, batch))
+
+    for run_id in run_ids:
+        # Fall back to `get_run` to raise the "not found" error of the backend store
+        run_info = run_infos.get(run_id) or backend_store.get_run(run_id).info
+        if run_info.lifecycle_stage != LifecycleStage.DELETED:
             raise MlflowException(
                 f"Run {run_id} is not in `deleted` lifecycle stage. Only runs in"
                 " `deleted` lifecycle stage can be deleted."
@@ -615,41 +672,121 @@ def gc(older_than, backend_store_uri, artifacts_destination, run_ids, experiment
                 f"Only runs older than {older_than} can be deleted.",
                 error_code=INVALID_PARAMETER_VALUE,
             )
-        # raise MlflowException if run_id is newer than older_than parameter
-        if older_than and run_id not in deleted_run_ids_older_than:
-            raise MlflowException(
-                f"Run {run_id} is not older than the required age. "
-                f"Only runs older than {older_than} can be deleted.",
-                error_code=INVALID_PARAMETER_VALUE,
-            )
-        artifact_repo = get_artifact_repository(run.info.artifact_uri)
-        try:
-            artifact_repo.delete_artifacts()
-        except InvalidUrlException as iue:
-            click.echo(
-                click.style(
-                    f"An exception {iue!r} was raised during the deletion of a model artifact",
-                    fg="yellow",
-                )
-            )
+
+    if dry_run:
+        for run_id in run_ids:
             click.echo(
-                click.style(
-                    f"Unable to resolve the provided artifact URL: '{artifact_repo}'. "
-                    "The gc process will continue and bypass artifact deletion. "
-                    "Please ensure that the artifact exists "
-                    "and consider manually deleting any unused artifacts. ",
-                    fg="yellow",
-                ),
+                f"Run with ID {run_id} and artifacts at {run_infos[run_id].artifact_uri} "
+                "would be permanently deleted."
             )
-        backend_store._hard_delete_run(run_id)
-        click.echo(f"Run with ID {run_id} has been permanently deleted.")
+        if not skip_experiments:
+            for experiment_id in experiment_ids:
+                click.echo(f"Experiment with ID {experiment_id} would be permanently deleted.")
+        num_experiments = 0 if skip_experiments else len(experiment_ids)
+        click.echo(
+            f"Dry run: {len(run_ids)} run(s) and {num_experiments} experiment(s) would be "
+            "permanently deleted."
+        )
+        return
+
+    with ThreadPoolExecutor(
+        max_workers=max_workers, thread_name_prefix="MlflowGcArtifactDeletion"
+    ) as executor:
+        for batch in chunk_list(run_ids, batch_size):
+            # Delete the artifacts before the metadata, so that the artifacts of an interrupted
+            # batch are deleted again when gc is resumed
+            list(executor.map(_delete_run_artifacts, (run_infos[id].artifact_uri for id in batch)))
+            if hasattr(backend_store, "_hard_delete_runs"):
+                backend_store._hard_delete_runs(batch)
+            else:
+                for run_id in batch:
+                    backend_store._hard_delete_run(run_id)
+            _append_gc_checkpoint(checkpoint_file, "run", batch)
+            for run_id in batch:
+                click.echo(f"Run with ID {run_id} has been permanently deleted.")
 
     if not skip_experiments:
         for experiment_id in experiment_ids:
             backend_store._hard_delete_experiment(experiment_id)
+            _append_gc_checkpoint(checkpoint_file, "experiment", [experiment_id])
             click.echo(f"Experiment with ID {experiment_id} has been permanently deleted.")
 
 
+def _supports_search_runs_columns(backend_store):
+    """
+    Whether the runs can be searched without their metrics, params and tags, which third-party
+    stores implementing `search_runs` or `_search_runs` without `columns` don't support.
+    """
+    return all(
+        "columns" in inspect.signature(method).parameters
+        for method in (backend_store.search_runs, backend_store._search_runs)
+    )
+
+
+def _get_gc_run_infos(backend_store, run_ids):
+    if hasattr(backend_store, "_get_run_infos"):
+        return backend_store._get_run_infos(run_ids)
+    infos = []
+    for run_id in run_ids:
+        try:
+            infos.append(backend_store.get_run(run_id).info)
+        except MlflowException:
+            pass
+    return infos
+
+
+def _delete_run_artifacts(artifact_uri):
+    artifact_repo = get_artifact_repository(artifact_uri)
+    try:
+        artifact_repo.delete_artifacts()
+    except InvalidUrlException as iue:
+        click.echo(
+            click.style(
+                f"An exception {iue!r} was raised during the deletion of a model artifact",
+                fg="yellow",
+            )
+        )
+        click.echo(
+            click.style(
+                f"Unable to resolve the provided artifact URL: '{artifact_repo}'. "
+                "The gc process will continue and bypass artifact deletion. "
+                "Please ensure that the artifact exists "
+                "and consider manually deleting any unused artifacts. ",
+                fg="yellow",
+            ),
+        )
+
+
+def _read_gc_checkpoint(checkpoint_file):
+    """
+    Returns the IDs of the runs and experiments recorded in the checkpoint file of ``mlflow gc``,
+    which has a ``run <run ID>`` or ``experiment <experiment ID>`` line per deleted entity.
+    """
+    run_ids, experiment_ids = set(), set()
+    if checkpoint_file is None or not os.path.exists(checkpoint_file):
+        return run_ids, experiment_ids
+    with open(checkpoint_file) as f:
+        for line in f:
+            # A line that was partially written when gc was interrupted is ignored
+            kind, _, entity_id = line.rstrip("\n").partition(" ")
+            if not line.endswith("\n") or not entity_id:
+                continue
+            if kind == "run":
+                run_ids.add(entity_id)
+            elif kind == "experiment":
+                experiment_ids.add(entity_id)
+    return run_ids, experiment_ids
+
+
+def _append_gc_checkpoint(checkpoint_file, kind, entity_ids):
+    if checkpoint_file is None:
+        return
+    with open(checkpoint_file, "a") as f:
+        f.writelines(f"{kind} {entity_id}\n" for entity_id in entity_ids)
+        f.flush()
+        os.fsync(f.fileno())
+
+
 @cli.command(short_help="Prints out useful information for debugging issues with MLflow.")
 @click.option(
     "--mask-envs",
@@ -56,9 +56,13 @@ def create_mlflow_span(
     When creating a MLflow span object from the OpenTelemetry span, the factory function
     should always be used to ensure the correct span object is created.
     """
-    if not otel_span or isinstance(otel_span, NonRecordingSpan):
+    if not otel_span:
         return NoOpSpan()
 
+    if isinstance(otel_span, NonRecordingSpan):
+        # Keep the span of an unsampled trace so that its children are not sampled either
+        return NoOpSpan(otel_span)
+
     if isinstance(otel_span, OTelSpan):
         return LiveSpan(otel_span, trace_id, span_type)
 
@@ -372,8 +376,15 @@ class LiveSpan(Span):
                 INVALID_PARAMETER_VALUE,
             )
 
+        from mlflow.tracing.trace_manager import InMemoryTraceManager
+
         self._span = otel_span
-        self._attributes = _SpanAttributesRegistry(otel_span)
+        self._attributes = _SpanAttributesRegistry(
+            otel_span,
+            trace=InMemoryTraceManager.get_instance().get_trace_to_account_span_attributes(
+                trace_id
+            ),
+        )
         self._attributes.set(SpanAttributeKey.REQUEST_ID, trace_id)
         self._attributes.set(SpanAttributeKey.SPAN_TYPE, span_type)
 
@@ -596,8 +607,8 @@ class NoOpSpan(Span):
 
     """
 
-    def __init__(self):
-        self._span = NonRecordingSpan(context=None)
+    def __init__(self, otel_span: Optional[NonRecordingSpan] = None):
+        self._span = otel_span or NonRecordingSpan(context=None)
         self._attributes = {}
 
     @property
@@ -676,10 +687,17 @@ class _SpanAttributesRegistry:
     Therefore, we serialize all values into JSON string before storing them in the span.
     This class provides simple getter and setter methods to interact with the span attributes
     without worrying about the serde process.
+
+    If a trace is given, the serialized attributes are accounted against the size limits of the
+    trace, and truncated if they don't fit.
     """
 
-    def __init__(self, otel_span: OTelSpan):
+    def __init__(self, otel_span: OTelSpan, trace=None):
         self._span = otel_span
+        self._trace = trace
+        # Sizes in bytes of the attributes accounted against the trace, by key. Attributes set
+        # directly on the OpenTelemetry span are not accounted.
+        self._accounted_sizes = {}
 
     def get_all(self) -> dict[str, Any]:
         return {key: self.get(key) for key in self._span.attributes.keys()}
@@ -703,7 +721,26 @@ class _SpanAttributesRegistry:
         # NB: OpenTelemetry attribute can store not only string but also a few primitives like
         #   int, float, bool, and list of them. However, we serialize all into JSON string here
         #   for the simplicity in deserialization process.
-        self._span.set_attribute(key, json.dumps(value, cls=TraceJSONEncoder, ensure_ascii=False))
+        serialized_value = json.dumps(value, cls=TraceJSONEncoder, ensure_ascii=False)
+        if self._trace is not None:
+            serialized_value = self._trace.fit_span_attribute(
+                key, serialized_value, self._accounted_sizes.get(key, 0)
+            )
+            self._accounted_sizes[key] = len(serialized_value.encode("utf-8"))
+        self._span.set_attribute(key, serialized_value)
+
+    def detach_from_trace(self) -> int:
+        """
+        Stop accounting the attributes against the size limits of the trace, e.g. because the
+        span is dropped from the trace.
+
+        Returns:
+            The serialized size in bytes of the attributes that were accounted against the trace.
+        """
+        self._trace = None
+        accounted_size = sum(self._accounted_sizes.values())
+        self._accounted_sizes.clear()
+        return accounted_size
 
 
 class _CachedSpanAttributesRegistry(_SpanAttributesRegistry):
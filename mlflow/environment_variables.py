@@ -236,6 +236,38 @@ MLFLOW_SQLALCHEMYSTORE_POOLCLASS = _EnvironmentVariable(
     "MLFLOW_SQLALCHEMYSTORE_POOLCLASS", str, None
 )
 
+#: (Experimental, may be changed or removed)
+#: Specifies whether to tune SQLite databases of the SQLAlchemy tracking and model registry stores
+#: for concurrent access, e.g. by the workers of a tracking server: the database is switched to
+#: write-ahead logging (which persists in the database file, and lets readers proceed while a
+#: transaction is written), pragmas are set once per connection rather than for every session,
+#: and write transactions from the same process are queued rather than polling SQLite for its
+#: write lock.
+#: (default: ``False``)
+MLFLOW_SQLALCHEMYSTORE_SQLITE_PERFORMANCE_MODE = _BooleanEnvironmentVariable(
+    "MLFLOW_SQLALCHEMYSTORE_SQLITE_PERFORMANCE_MODE", False
+)
+
+#: (Experimental, may be changed or removed)
+#: Specifies a comma-separated list of database URIs of read replicas of the database of the
+#: SQLAlchemy tracking and model registry stores. Read-only operations (e.g. searching runs or
+#: fetching metric histories) are served by the replicas, while writes go to the primary database.
+#: (default: ``None``)
+MLFLOW_SQLALCHEMYSTORE_READ_REPLICA_URIS = _EnvironmentVariable(
+    "MLFLOW_SQLALCHEMYSTORE_READ_REPLICA_URIS", str, None
+)
+
+#: (Experimental, may be changed or removed)
+#: Specifies how stale, in seconds, the data read from a read replica configured with
+#: ``MLFLOW_SQLALCHEMYSTORE_READ_REPLICA_URIS`` may be. Replicas lagging further behind the primary
+#: database are not used, and the reads of a client made within this many seconds after it wrote
+#: are served by the primary database, so that clients read their own writes. The tracking server
+#: tells clients apart by their ``X-MLflow-Client-Id`` header, or by their address.
+#: (default: ``5``)
+MLFLOW_SQLALCHEMYSTORE_READ_REPLICA_MAX_STALENESS_SECONDS = _EnvironmentVariable(
+    "MLFLOW_SQLALCHEMYSTORE_READ_REPLICA_MAX_STALENESS_SECONDS", float, 5.0
+)
+
 #: Specifies the ``timeout_seconds`` for MLflow Model dependency inference operations.
 #: (default: ``120``)
 MLFLOW_REQUIREMENTS_INFERENCE_TIMEOUT = _EnvironmentVariable(
@@ -248,6 +280,46 @@ MLFLOW_SCORING_SERVER_REQUEST_TIMEOUT = _EnvironmentVariable(
     "MLFLOW_SCORING_SERVER_REQUEST_TIMEOUT", int, 60
 )
 
+#: (Experimental, may be changed or removed)
+#: Specifies the maximum number of rows the MLflow Model Scoring server merges into a single
+#: ``predict`` call when batching concurrent ``/invocations`` requests. Dynamic batching is
+#: disabled unless this is set to a value greater than 1.
+#: (default: ``None``)
+MLFLOW_SCORING_SERVER_MAX_BATCH_SIZE = _EnvironmentVariable(
+    "MLFLOW_SCORING_SERVER_MAX_BATCH_SIZE", int, None
+)
+
+#: (Experimental, may be changed or removed)
+#: Specifies the maximum time in milliseconds a request waits in the MLflow Model Scoring server
+#: queue for other requests to be batched with it. Only used when
+#: ``MLFLOW_SCORING_SERVER_MAX_BATCH_SIZE`` is set.
+#: (default: ``10``)
+MLFLOW_SCORING_SERVER_MAX_BATCH_DELAY_MS = _EnvironmentVariable(
+    "MLFLOW_SCORING_SERVER_MAX_BATCH_DELAY_MS", int, 10
+)
+
+#: (Experimental, may be changed or removed)
+#: Specifies whether the MLflow Model Scoring server loads the model once and forks its workers
+#: afterwards, so that the workers share the memory of the model. Not supported on Windows.
+#: (default: ``False``)
+MLFLOW_SCORING_SERVER_PREFORK = _BooleanEnvironmentVariable("MLFLOW_SCORING_SERVER_PREFORK", False)
+
+#: (Experimental, may be changed or removed)
+#: Specifies the type of pool the MLflow Model Scoring server runs model predictions on, either
+#: ``thread`` or ``process``. The pool is separate from the threads parsing requests and
+#: serializing responses. With ``process``, each worker process loads its own copy of the model.
+#: (default: ``thread``)
+MLFLOW_SCORING_SERVER_PREDICT_EXECUTOR = _EnvironmentVariable(
+    "MLFLOW_SCORING_SERVER_PREDICT_EXECUTOR", str, "thread"
+)
+
+#: (Experimental, may be changed or removed)
+#: Specifies the maximum number of workers of the MLflow Model Scoring server predict pool.
+#: (default: ``None``, the default size of the pool type)
+MLFLOW_SCORING_SERVER_PREDICT_WORKERS = _EnvironmentVariable(
+    "MLFLOW_SCORING_SERVER_PREDICT_WORKERS", int, None
+)
+
 #: (Experimental, may be changed or removed)
 #: Specifies the timeout to use when uploading or downloading a file
 #: (default: ``None``). If None, individual artifact stores will choose defaults.
@@ -400,6 +472,14 @@ MLFLOW_ENV_ROOT = _EnvironmentVariable(
     "MLFLOW_ENV_ROOT", str, str(Path.home().joinpath(".mlflow", "envs"))
 )
 
+#: (Experimental, may be changed or removed)
+#: Specifies a local directory or an artifact URI (e.g. ``s3://bucket/path``) in which Python
+#: virtual environments built for models are stored as archives named after the hash of the
+#: environment specification. A missing environment is restored by unpacking its archive instead
+#: of installing its dependencies, and newly built environments are added to the cache.
+#: (default: ``None``, which disables the cache)
+MLFLOW_ENV_ARCHIVE_CACHE_URI = _EnvironmentVariable("MLFLOW_ENV_ARCHIVE_CACHE_URI", str, None)
+
 #: Specifies whether or not to use DBFS FUSE mount to store artifacts on Databricks
 #: (default: ``False``)
 MLFLOW_ENABLE_DBFS_FUSE_ARTIFACT_REPO = _BooleanEnvironmentVariable(
@@ -492,6 +572,15 @@ MLFLOW_SYSTEM_METRICS_SAMPLES_BEFORE_LOGGING = _EnvironmentVariable(
 #: training) setup.
 MLFLOW_SYSTEM_METRICS_NODE_ID = _EnvironmentVariable("MLFLOW_SYSTEM_METRICS_NODE_ID", str, None)
 
+#: (Experimental, may be changed or removed)
+#: Specifies whether system metrics logging should report the CPU and memory usage of the process
+#: tree that started the run, i.e., the process and all its descendants, instead of the CPU and
+#: memory usage of the whole machine.
+#: (default: ``False``)
+MLFLOW_SYSTEM_METRICS_ATTRIBUTE_TO_PROCESS_TREE = _BooleanEnvironmentVariable(
+    "MLFLOW_SYSTEM_METRICS_ATTRIBUTE_TO_PROCESS_TREE", False
+)
+
 
 # Private environment variable to specify the number of chunk download retries for multipart
 # download.
@@ -594,6 +683,76 @@ MLFLOW_TRACE_BUFFER_TTL_SECONDS = _EnvironmentVariable("MLFLOW_TRACE_BUFFER_TTL_
 # How many traces to be buffered in-memory at client side before being abandoned.
 MLFLOW_TRACE_BUFFER_MAX_SIZE = _EnvironmentVariable("MLFLOW_TRACE_BUFFER_MAX_SIZE", int, 1000)
 
+#: (Experimental, may be changed or removed)
+#: The ratio of traces to record, between 0 and 1. The decision is made when the root span of a
+#: trace starts, and no span or attribute is recorded for the traces that are not sampled.
+#: (default: ``1.0``)
+MLFLOW_TRACE_SAMPLING_RATIO = _EnvironmentVariable("MLFLOW_TRACE_SAMPLING_RATIO", float, 1.0)
+
+#: (Experimental, may be changed or removed)
+#: The ratio of completed traces to export, between 0 and 1. Traces with an error status, and
+#: traces slower than ``MLFLOW_TRACE_TAIL_SAMPLING_LATENCY_THRESHOLD_MS``, are always exported.
+#: (default: ``1.0``)
+MLFLOW_TRACE_TAIL_SAMPLING_RATIO = _EnvironmentVariable(
+    "MLFLOW_TRACE_TAIL_SAMPLING_RATIO", float, 1.0
+)
+
+#: (Experimental, may be changed or removed)
+#: A JSON object mapping the names of root spans to the ratio of their completed traces to
+#: export, e.g. ``{"predict": 0.1, "health_check": 0}``. Overrides
+#: ``MLFLOW_TRACE_TAIL_SAMPLING_RATIO`` for the traces whose root span has one of these names.
+#: (default: ``None``)
+MLFLOW_TRACE_TAIL_SAMPLING_RATIOS_BY_NAME = _EnvironmentVariable(
+    "MLFLOW_TRACE_TAIL_SAMPLING_RATIOS_BY_NAME", str, None
+)
+
+#: (Experimental, may be changed or removed)
+#: Completed traces taking at least this many milliseconds are always exported, regardless of
+#: the tail sampling ratios.
+#: (default: ``None``)
+MLFLOW_TRACE_TAIL_SAMPLING_LATENCY_THRESHOLD_MS = _EnvironmentVariable(
+    "MLFLOW_TRACE_TAIL_SAMPLING_LATENCY_THRESHOLD_MS", int, None
+)
+
+#: (Experimental, may be changed or removed)
+#: The maximum number of spans recorded per trace. Spans started once a trace has this many spans
+#: are dropped: they can still be used in the code, e.g. as parents of other spans, which are
+#: dropped too, but they are not kept in memory with the trace nor exported. The number of dropped
+#: spans is recorded in the ``mlflow.traceNumDroppedSpans`` request metadata of the trace. Must be
+#: at least 1, so that the root span is kept.
+#: (default: ``None``, no limit)
+MLFLOW_TRACE_MAX_SPANS = _EnvironmentVariable("MLFLOW_TRACE_MAX_SPANS", int, None)
+
+#: (Experimental, may be changed or removed)
+#: The maximum size in bytes of a JSON-serialized span attribute, e.g. the inputs or the outputs
+#: of a span. Larger values are truncated, and replaced with a JSON string of the beginning of
+#: their serialized form followed by ``...[truncated from <size> bytes]``. The number of truncated
+#: attributes and of dropped bytes are recorded in the ``mlflow.traceNumTruncatedSpanAttributes``
+#: and ``mlflow.traceTruncatedSpanAttributeBytes`` request metadata of the trace.
+#: (default: ``None``, no limit)
+MLFLOW_TRACE_MAX_SPAN_ATTRIBUTE_SIZE_BYTES = _EnvironmentVariable(
+    "MLFLOW_TRACE_MAX_SPAN_ATTRIBUTE_SIZE_BYTES", int, None
+)
+
+#: (Experimental, may be changed or removed)
+#: The maximum total size in bytes of the JSON-serialized span attributes of a trace. Once a
+#: trace reaches this size, span attributes are truncated to the remaining size, like with
+#: ``MLFLOW_TRACE_MAX_SPAN_ATTRIBUTE_SIZE_BYTES``. The reserved attributes that identify a span,
+#: e.g. its type, are never truncated, so the total size may slightly exceed the limit.
+#: (default: ``None``, no limit)
+MLFLOW_TRACE_MAX_SIZE_BYTES = _EnvironmentVariable("MLFLOW_TRACE_MAX_SIZE_BYTES", int, None)
+
+#: (Experimental, may be changed or removed)
+#: Comma-separated keys of the span attributes stored in the span index of the SQL tracking store,
+#: so that traces can be searched by their value, e.g. ``span.attributes.model = 'gpt-4o'``. The
+#: name, type, status and timing of the spans are always indexed. Attribute values longer than
+#: 250 characters are not indexed. Behind a tracking server, set it on the server, which indexes
+#: the spans. Traces logged before the span index was added to the database are not backfilled.
+#: (default: ``None``, no attributes are indexed)
+MLFLOW_TRACE_INDEXED_SPAN_ATTRIBUTES = _EnvironmentVariable(
+    "MLFLOW_TRACE_INDEXED_SPAN_ATTRIBUTES", str, None
+)
+
 #: Private configuration option.
 #: Enables the ability to catch exceptions within MLflow evaluate for classification models
 #: where a class imbalance due to a missing target class would raise an error in the
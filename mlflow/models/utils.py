@@ -945,47 +945,39 @@ def _enforce_param_datatype(value: Any, dtype: DataType):
     )
 
 
-def _enforce_unnamed_col_schema(pf_input: pd.DataFrame, input_schema: Schema):
+def _enforce_unnamed_col_schema(
+    pf_input: pd.DataFrame,
+    input_schema: Schema,
+    compiled_schema: Optional["_CompiledSchema"] = None,
+):
     """Enforce the input columns conform to the model's column-based signature."""
+    compiled_schema = compiled_schema or _CompiledSchema(input_schema)
     input_names = pf_input.columns[: len(input_schema.inputs)]
-    input_types = input_schema.input_types()
     new_pf_input = {}
-    for i, x in enumerate(input_names):
-        if isinstance(input_types[i], DataType):
-            new_pf_input[x] = _enforce_mlflow_datatype(x, pf_input[x], input_types[i])
-        # If the input_type is objects/arrays/maps, we assume pf_input must be a pandas DataFrame.
-        # Otherwise, the schema is not valid.
-        else:
-            new_pf_input[x] = pd.Series(
-                [_enforce_type(obj, input_types[i]) for obj in pf_input[x]], name=x
-            )
+    for x, enforce_column in zip(input_names, compiled_schema.column_enforcers):
+        new_pf_input[x] = enforce_column(x, pf_input[x])
     return pd.DataFrame(new_pf_input)
 
 
-def _enforce_named_col_schema(pf_input: pd.DataFrame, input_schema: Schema):
+def _enforce_named_col_schema(
+    pf_input: pd.DataFrame,
+    input_schema: Schema,
+    compiled_schema: Optional["_CompiledSchema"] = None,
+):
     """Enforce the input columns conform to the model's column-based signature."""
-    input_names = input_schema.input_names()
-    input_dict = input_schema.input_dict()
+    compiled_schema = compiled_schema or _CompiledSchema(input_schema)
     new_pf_input = {}
-    for name in input_names:
-        input_type = input_dict[name].type
-        required = input_dict[name].required
+    for spec, enforce_column in zip(input_schema.inputs, compiled_schema.column_enforcers):
+        name = spec.name
         if name not in pf_input:
-            if required:
+            if spec.required:
                 raise MlflowException(
                     f"The input column '{name}' is required by the model "
                     "signature but missing from the input data."
                 )
             else:
                 continue
-        if isinstance(input_type, DataType):
-            new_pf_input[name] = _enforce_mlflow_datatype(name, pf_input[name], input_type)
-        # If the input_type is objects/arrays/maps, we assume pf_input must be a pandas DataFrame.
-        # Otherwise, the schema is not valid.
-        else:
-            new_pf_input[name] = pd.Series(
-                [_enforce_type(obj, input_type, required) for obj in pf_input[name]], name=name
-            )
+        new_pf_input[name] = enforce_column(name, pf_input[name])
     return pd.DataFrame(new_pf_input)
 
 
@@ -1129,7 +1121,12 @@ def _enforce_tensor_schema(pf_input: PyFuncInput, input_schema: Schema):
     return new_pf_input
 
 
-def _enforce_schema(pf_input: PyFuncInput, input_schema: Schema, flavor: Optional[str] = None):
+def _enforce_schema(
+    pf_input: PyFuncInput,
+    input_schema: Schema,
+    flavor: Optional[str] = None,
+    compiled_schema: Optional["_CompiledSchema"] = None,
+):
     """
     Enforces the provided input matches the model's input schema,
 
@@ -1144,6 +1141,10 @@ def _enforce_schema(pf_input: PyFuncInput, input_schema: Schema, flavor: Optiona
 
     For tensor-based signatures, we make sure the shape and type of the input matches the shape
     and type specified in model's input schema.
+
+    ``compiled_schema`` is the enforcement plan of ``input_schema`` built by
+    ``_CompiledSchema(input_schema)``. Callers enforcing the same schema repeatedly should pass it
+    to avoid compiling the schema on every call.
     """
 
     def _is_scalar(x):
@@ -1277,9 +1278,9 @@ def _enforce_schema(pf_input: PyFuncInput, input_schema: Schema, flavor: Optiona
     else:
         # pf_input must be a pandas Dataframe at this point
         return (
-            _enforce_named_col_schema(pf_input, input_schema)
+            _enforce_named_col_schema(pf_input, input_schema, compiled_schema)
             if input_schema.has_input_names()
-            else _enforce_unnamed_col_schema(pf_input, input_schema)
+            else _enforce_unnamed_col_schema(pf_input, input_schema, compiled_schema)
         )
 
 
@@ -1456,6 +1457,192 @@ def _enforce_type(data: Any, data_type: Union[DataType, Array, Object, Map], req
     raise MlflowException(f"Invalid data type: {data_type!r}")
 
 
+_INT64_MIN = np.iinfo(np.int64).min
+_INT64_MAX = np.iinfo(np.int64).max
+
+
+def _int_to_int64(data: int):
+    if _INT64_MIN <= data <= _INT64_MAX:
+        return np.int64(data)
+    return _enforce_datatype(data, DataType.long)
+
+
+# Conversions of scalar values whose python type already matches the expected data type, keyed by
+# data type and then by the type of the value. They return the same values as `_enforce_datatype`
+# without building a pandas Series for every value.
+_SCALAR_FAST_PATHS = {
+    DataType.string: {str: lambda x: x},
+    DataType.boolean: {bool: np.bool_, np.bool_: lambda x: x},
+    DataType.integer: {np.int32: lambda x: x},
+    DataType.long: {int: _int_to_int64, np.int64: lambda x: x},
+    DataType.float: {np.float32: lambda x: x},
+    DataType.double: {float: np.float64, np.float64: lambda x: x},
+}
+
+
+def _is_list_of_type(data: list[Any], dtype: DataType) -> bool:
+    """
+    Returns True if the values of ``data`` are python values of ``dtype`` that pandas infers as
+    ``dtype``, so that enforcing ``dtype`` on them leaves the values unchanged.
+    """
+    if dtype == DataType.string:
+        return all(type(x) is str for x in data)
+    if dtype == DataType.double:
+        return all(type(x) is float for x in data)
+    if dtype == DataType.boolean:
+        return all(type(x) is bool for x in data)
+    if dtype == DataType.long:
+        return (
+            all(type(x) is int for x in data) and _INT64_MIN <= min(data) <= max(data) <= _INT64_MAX
+        )
+    return False
+
+
+def _compile_datatype(dtype: DataType, required: bool = True):
+    fast_paths = _SCALAR_FAST_PATHS.get(dtype, {})
+
+    def enforce(data):
+        convert = fast_paths.get(type(data))
+        if convert is None or (not required and _is_none_or_nan(data)):
+            return _enforce_datatype(data, dtype, required=required)
+        return convert(data)
+
+    return enforce
+
+
+def _compile_array(arr: Array, required: bool = True):
+    accepts_empty = not required or isinstance(arr.dtype, AnyType)
+    if isinstance(arr.dtype, DataType):
+        numpy_dtype = arr.dtype.to_numpy()
+        enforce_item = None
+    else:
+        enforce_item = _compile_type(arr.dtype, required=required)
+
+    def enforce(data):
+        if accepts_empty and (
+            data is None or (isinstance(data, (list, np.ndarray)) and len(data) == 0)
+        ):
+            return data
+        if enforce_item is not None and isinstance(data, (list, np.ndarray)):
+            data_enforced = [enforce_item(x) for x in data]
+            return np.array(data_enforced) if isinstance(data, np.ndarray) else data_enforced
+        if isinstance(data, list) and len(data) > 0 and _is_list_of_type(data, arr.dtype):
+            return list(data)
+        if isinstance(data, np.ndarray) and data.ndim == 1 and data.dtype == numpy_dtype:
+            return data
+        return _enforce_array(data, arr, required=required)
+
+    return enforce
+
+
+def _compile_object(obj: Object, required: bool = True):
+    properties = {prop.name: prop for prop in obj.properties}
+    property_enforcers = {
+        prop.name: _compile_type(prop.dtype, required=prop.required) for prop in obj.properties
+    }
+    required_props = {k for k, prop in properties.items() if prop.required}
+
+    def enforce(data):
+        if HAS_PYSPARK and isinstance(data, Row):
+            data = None if len(data) == 0 else data.asDict(True)
+        if not required and (data is None or data == {}):
+            return data
+        if not isinstance(data, dict):
+            raise MlflowException(
+                f"Failed to enforce schema of '{data}' with type '{obj}'. "
+                f"Expected data to be dictionary, got {type(data).__name__}"
+            )
+        if missing_props := required_props - data.keys():
+            raise MlflowException(f"Missing required properties: {missing_props}")
+        if invalid_props := data.keys() - properties.keys():
+            raise MlflowException(
+                f"Invalid properties not defined in the schema found: {invalid_props}"
+            )
+        for k, v in data.items():
+            try:
+                data[k] = property_enforcers[k](v)
+            except MlflowException as e:
+                raise MlflowException(
+                    f"Failed to enforce schema for key `{k}`. "
+                    f"Expected type {properties[k].to_dict()[k]['type']}, "
+                    f"received type {type(v).__name__}"
+                ) from e
+        return data
+
+    return enforce
+
+
+def _compile_map(map_type: Map, required: bool = True):
+    enforce_value = _compile_type(map_type.value_type, required=required)
+
+    def enforce(data):
+        if not isinstance(data, dict) or not all(isinstance(k, str) for k in data):
+            return _enforce_map(data, map_type, required=required)
+        if (not required or isinstance(map_type.value_type, AnyType)) and data == {}:
+            return data
+        return {k: enforce_value(v) for k, v in data.items()}
+
+    return enforce
+
+
+def _compile_type(data_type: Union[DataType, Array, Object, Map], required: bool = True):
+    """
+    Compiles ``data_type`` into a function enforcing it on a single value, which behaves like
+    ``_enforce_type(value, data_type, required)``. Nested types are resolved once at compile time
+    instead of for every value, and values that already have the expected type are returned
+    without going through pandas.
+    """
+    if isinstance(data_type, DataType):
+        return _compile_datatype(data_type, required=required)
+    if isinstance(data_type, Array):
+        return _compile_array(data_type, required=required)
+    if isinstance(data_type, Object):
+        return _compile_object(data_type, required=required)
+    if isinstance(data_type, Map):
+        return _compile_map(data_type, required=required)
+    if isinstance(data_type, AnyType):
+        return lambda data: data
+    return lambda data: _enforce_type(data, data_type, required=required)
+
+
+def _compile_column(data_type: Union[DataType, Array, Object, Map], required: bool = True):
+    if isinstance(data_type, DataType):
+        # Columns whose dtype already matches are returned as is, like in _enforce_mlflow_datatype
+        matching_dtypes = {np.dtype(data_type.to_numpy()), np.dtype(data_type.to_pandas())}
+
+        def enforce_column(name, values: pd.Series):
+            if values.dtype in matching_dtypes:
+                return values
+            return _enforce_mlflow_datatype(name, values, data_type)
+
+        return enforce_column
+
+    # If the input_type is objects/arrays/maps, we assume pf_input must be a pandas DataFrame.
+    # Otherwise, the schema is not valid.
+    enforce = _compile_type(data_type, required=required)
+    return lambda name, values: pd.Series([enforce(obj) for obj in values], name=name)
+
+
+class _CompiledSchema:
+    """
+    Enforcement plan of a column-based schema, built once and reused across predictions.
+
+    Args:
+        schema: The schema to compile.
+    """
+
+    def __init__(self, schema: Schema):
+        self.schema = schema
+        if schema.is_tensor_spec():
+            self.column_enforcers = None
+        elif schema.has_input_names():
+            self.column_enforcers = [
+                _compile_column(spec.type, required=spec.required) for spec in schema.inputs
+            ]
+        else:
+            self.column_enforcers = [_compile_column(t) for t in schema.input_types()]
+
+
 def validate_schema(data: PyFuncInput, expected_schema: Schema) -> None:
     """
     Validate that the input data has the expected schema.
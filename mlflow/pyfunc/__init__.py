@@ -398,6 +398,7 @@ In summary, use the function-based Model when you have a simple function to seri
 If you need more power, use  the class-based model.
 """
 
+import asyncio
 import collections
 import functools
 import hashlib
@@ -413,6 +414,7 @@ import sys
 import tempfile
 import threading
 import uuid
+from concurrent.futures import Executor
 from copy import deepcopy
 from pathlib import Path
 from typing import Any, Iterator, Optional, Tuple, Union
@@ -432,6 +434,7 @@ from mlflow.entities.model_registry.prompt import Prompt
 from mlflow.environment_variables import (
     _MLFLOW_IN_CAPTURE_MODULE_PROCESS,
     _MLFLOW_TESTING,
+    MLFLOW_ENV_ARCHIVE_CACHE_URI,
     MLFLOW_MODEL_ENV_DOWNLOADING_TEMP_DIR,
     MLFLOW_SCORING_SERVER_REQUEST_TIMEOUT,
 )
@@ -461,6 +464,7 @@ from mlflow.models.utils import (
     PyFuncLLMOutputChunk,
     PyFuncLLMSingleInput,
     PyFuncOutput,
+    _CompiledSchema,
     _convert_llm_input_data,
     _enforce_params_schema,
     _enforce_schema,
@@ -723,14 +727,16 @@ def _validate_params(params, model_metadata):
     return
 
 
-def _validate_prediction_input(data: PyFuncInput, params, input_schema, params_schema, flavor=None):
+def _validate_prediction_input(
+    data: PyFuncInput, params, input_schema, params_schema, flavor=None, compiled_schema=None
+):
     """
     Internal helper function to transform and validate input data and params for prediction.
     Any additional transformation logics related to input data and params should be added here.
     """
     if input_schema is not None:
         try:
-            data = _enforce_schema(data, input_schema, flavor)
+            data = _enforce_schema(data, input_schema, flavor, compiled_schema)
         except Exception as e:
             # Include error in message for backwards compatibility
             raise MlflowException.invalid_parameter_value(
@@ -787,6 +793,7 @@ class PyFuncModel:
             self._predict_stream_fn = None
         self._model_id = model_id
         self._input_example = None
+        self._compiled_input_schema = None
 
     @property
     @developer_stable
@@ -839,6 +846,44 @@ class PyFuncModel:
                 context.update(model_id=self.model_id)
             return self._predict(data, params)
 
+    @property
+    def _is_async_predict(self) -> bool:
+        """
+        Whether the model implements ``predict`` as a coroutine function, in which case
+        :py:meth:`_predict_async` can await predictions without blocking the event loop.
+        """
+        return (
+            isinstance(self._model_impl, mlflow.pyfunc.model._PythonModelPyfuncWrapper)
+            and self._model_impl.is_async_predict
+        )
+
+    async def _predict_async(
+        self,
+        data: PyFuncInput,
+        params: Optional[dict[str, Any]] = None,
+        executor: Optional[Executor] = None,
+    ) -> PyFuncOutput:
+        """
+        Asynchronous counterpart of :py:meth:`predict` for models whose ``predict`` method is a
+        coroutine function. Schema enforcement is CPU-bound, so it runs on ``executor`` (the
+        default executor of the running event loop if None) rather than on the event loop.
+        """
+        if not self._is_async_predict:
+            raise MlflowException("This model does not implement an asynchronous predict method.")
+
+        context = _try_get_prediction_context() or Context()
+        with set_prediction_context(context):
+            if schema := _get_dependencies_schema_from_model(self._model_meta):
+                context.update(**schema)
+
+            if self.model_id:
+                context.update(model_id=self.model_id)
+            loop = asyncio.get_running_loop()
+            data, params = await loop.run_in_executor(
+                executor, self._prepare_prediction_input, data, params
+            )
+            return await self._call_predict_fn(self._model_impl.predict_async, data, params)
+
     def _predict(self, data: PyFuncInput, params: Optional[dict[str, Any]] = None) -> PyFuncOutput:
         """
         Generates model predictions.
@@ -867,6 +912,15 @@ class PyFuncModel:
         Returns:
             Model predictions as one of pandas.DataFrame, pandas.Series, numpy.ndarray or list.
         """
+        data, params = self._prepare_prediction_input(data, params)
+        return self._call_predict_fn(self._predict_fn, data, params)
+
+    def _prepare_prediction_input(
+        self, data: PyFuncInput, params: Optional[dict[str, Any]] = None
+    ) -> tuple[PyFuncInput, Optional[dict[str, Any]]]:
+        """
+        Enforces the input and params schemas of the model on ``data`` and ``params``.
+        """
         # fetch the schema from metadata to avoid signature change after model is loaded
         self.input_schema = self.metadata.get_input_schema()
         self.params_schema = self.metadata.get_params_schema()
@@ -877,7 +931,12 @@ class PyFuncModel:
             params = _enforce_params_schema(params, self.params_schema)
         else:
             data, params = _validate_prediction_input(
-                data, params, self.input_schema, self.params_schema, self.loader_module
+                data,
+                params,
+                self.input_schema,
+                self.params_schema,
+                self.loader_module,
+                self._get_compiled_input_schema(),
             )
             if (
                 isinstance(data, pandas.DataFrame)
@@ -885,12 +944,15 @@ class PyFuncModel:
                 and self.input_example is not None
             ):
                 data = _convert_dataframe_to_example_format(data, self.input_example)
-        params_arg = inspect.signature(self._predict_fn).parameters.get("params")
+        return data, params
+
+    def _call_predict_fn(self, predict_fn, data, params):
+        params_arg = inspect.signature(predict_fn).parameters.get("params")
         if params_arg and params_arg.kind != inspect.Parameter.VAR_KEYWORD:
-            return self._predict_fn(data, params=params)
+            return predict_fn(data, params=params)
 
         _log_warning_if_params_not_in_predict_signature(_logger, params)
-        return self._predict_fn(data)
+        return predict_fn(data)
 
     def predict_stream(
         self, data: PyFuncLLMSingleInput, params: Optional[dict[str, Any]] = None
@@ -938,7 +1000,12 @@ class PyFuncModel:
         self.input_schema = self.metadata.get_input_schema()
         self.params_schema = self.metadata.get_params_schema()
         data, params = _validate_prediction_input(
-            data, params, self.input_schema, self.params_schema, self.loader_module
+            data,
+            params,
+            self.input_schema,
+            self.params_schema,
+            self.loader_module,
+            self._get_compiled_input_schema(),
         )
         data = _convert_llm_input_data(data)
         if isinstance(data, list):
@@ -1023,6 +1090,18 @@ class PyFuncModel:
             raise MlflowException("Model is missing metadata.")
         return self._model_meta
 
+    def _get_compiled_input_schema(self) -> Optional[_CompiledSchema]:
+        """
+        Returns the enforcement plan of the input schema, which is compiled on first use and
+        compiled again only if the signature of the model changes.
+        """
+        if self.input_schema is None:
+            return None
+        compiled = getattr(self, "_compiled_input_schema", None)
+        if compiled is None or compiled.schema is not self.input_schema:
+            compiled = self._compiled_input_schema = _CompiledSchema(self.input_schema)
+        return compiled
+
     @property
     def model_config(self):
         """Model's flavor configuration"""
@@ -2220,6 +2299,8 @@ def spark_udf(
     mlflow_home = os.environ.get("MLFLOW_HOME")
     openai_env_vars = mlflow.openai.model._OpenAIEnvVar.read_environ()
     mlflow_testing = _MLFLOW_TESTING.get_raw()
+    # Executors restore the model environment from the environment archive cache of the driver
+    env_archive_cache_uri = MLFLOW_ENV_ARCHIVE_CACHE_URI.get_raw()
 
     if prebuilt_env_uri:
         if env_manager not in (None, _EnvManager.VIRTUALENV):
@@ -2570,6 +2651,8 @@ e.g., struct<a:int, b:array<int>>.
             update_envs.update(openai_env_vars)
         if mlflow_testing:
             update_envs[_MLFLOW_TESTING.name] = mlflow_testing
+        if env_archive_cache_uri:
+            update_envs[MLFLOW_ENV_ARCHIVE_CACHE_URI.name] = env_archive_cache_uri
         if extra_env:
             update_envs.update(extra_env)
 
@@ -2633,7 +2716,9 @@ e.g., struct<a:int, b:array<int>>.
                         model_config=model_config,
                     )
 
-                    client = ScoringServerClient(host, server_port)
+                    # Spark hands us Arrow batches already, so exchange Arrow with the scoring
+                    # server instead of round-tripping every batch through JSON.
+                    client = ScoringServerClient(host, server_port, use_arrow=True)
                 else:
                     scoring_server_proc = pyfunc_backend.serve_stdin(
                         model_uri=local_model_path_on_executor or local_model_path,
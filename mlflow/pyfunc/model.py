@@ -3,11 +3,14 @@ The ``mlflow.pyfunc.model`` module defines logic for saving and loading custom "
 models with a user-defined ``PythonModel`` subclass.
 """
 
+import asyncio
+import contextvars
 import inspect
 import logging
 import os
 import shutil
 from abc import ABCMeta, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any, Generator, Optional, Union
 
@@ -1153,6 +1156,18 @@ class _PythonModelPyfuncWrapper:
                 return _hydrate_dataclass(hints.input, model_input.iloc[0])
         return model_input
 
+    @property
+    def is_async_predict(self) -> bool:
+        """
+        Whether the ``predict`` method of the wrapped model is a coroutine function.
+        """
+        predict = (
+            self.python_model.func
+            if isinstance(self.python_model, _FunctionPythonModel)
+            else self.python_model.predict
+        )
+        return inspect.iscoroutinefunction(inspect.unwrap(predict))
+
     def predict(self, model_input, params: Optional[dict[str, Any]] = None):
         """
         Args:
@@ -1163,6 +1178,22 @@ class _PythonModelPyfuncWrapper:
             Model predictions as an iterator of chunks. The chunks in the iterator must be type of
             dict or string. Chunk dict fields are determined by the model implementation.
         """
+        predictions = self._call_predict(model_input, params)
+        if inspect.isawaitable(predictions):
+            return _run_coroutine_sync(predictions)
+        return predictions
+
+    async def predict_async(self, model_input, params: Optional[dict[str, Any]] = None):
+        """
+        Same as :py:meth:`predict`, but awaits the predictions of models whose ``predict`` method
+        is a coroutine function on the running event loop instead of blocking it.
+        """
+        predictions = self._call_predict(model_input, params)
+        if inspect.isawaitable(predictions):
+            predictions = await predictions
+        return predictions
+
+    def _call_predict(self, model_input, params: Optional[dict[str, Any]] = None):
         parameters = inspect.signature(self.python_model.predict).parameters
         kwargs = {}
         if "params" in parameters:
@@ -1199,6 +1230,24 @@ class _PythonModelPyfuncWrapper:
             return self.python_model.predict_stream(self._convert_input(model_input), **kwargs)
 
 
+def _run_coroutine_sync(coro):
+    """
+    Runs a coroutine to completion from synchronous code, e.g. the predictions of a
+    :class:`~PythonModel` whose ``predict`` method is defined with ``async def``.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+
+    # An event loop is already running in this thread (e.g. in a notebook), so the coroutine is
+    # run on a new event loop in a separate thread. Context variables such as the prediction
+    # context are propagated to that thread.
+    context = contextvars.copy_context()
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(context.run, asyncio.run, coro).result()
+
+
 def _get_pyfunc_loader_module(python_model):
     if isinstance(python_model, ChatModel):
         return mlflow.pyfunc.loaders.chat_model.__name__
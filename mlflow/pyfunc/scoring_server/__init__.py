@@ -3,17 +3,20 @@ Scoring server for python model format.
 The passed int model is expected to have function:
    predict(pandas.Dataframe) -> pandas.DataFrame
 
-Input, expected in text/csv or application/json format,
+Input, expected in text/csv, application/json or application/vnd.apache.arrow.stream format,
 is parsed into pandas.DataFrame and passed to the model.
 
-Defines four endpoints:
+Defines the following endpoints:
     /ping used for health check
     /health (same as /ping)
     /version used for getting the mlflow version
     /invocations used for scoring
+    /invocations/stream used for streaming scoring with server-sent events
+    /metrics/batching used for getting dynamic batching statistics (only when batching is enabled)
 """
 
 import asyncio
+import importlib.util
 import inspect
 import json
 import logging
@@ -21,11 +24,13 @@ import os
 import shlex
 import sys
 import traceback
+from contextlib import asynccontextmanager, contextmanager
 from functools import wraps
-from typing import Any, NamedTuple, Optional
+from typing import Any, NamedTuple, Optional, Union
 
 from mlflow.environment_variables import (
     _MLFLOW_IS_IN_SERVING_ENVIRONMENT,
+    MLFLOW_SCORING_SERVER_PREFORK,
     MLFLOW_SCORING_SERVER_REQUEST_TIMEOUT,
 )
 
@@ -39,6 +44,7 @@ from mlflow.pyfunc.model import _log_warning_if_params_not_in_predict_signature
 from mlflow.types import ParamSchema, Schema
 from mlflow.utils import reraise
 from mlflow.utils.file_utils import path_to_local_file_uri
+from mlflow.utils.os import is_windows
 from mlflow.utils.proto_json_utils import (
     MlflowInvalidInputException,
     NumpyEncoder,
@@ -62,12 +68,22 @@ SERVING_MODEL_CONFIG = "SERVING_MODEL_CONFIG"
 
 CONTENT_TYPE_CSV = "text/csv"
 CONTENT_TYPE_JSON = "application/json"
+CONTENT_TYPE_ARROW = "application/vnd.apache.arrow.stream"
+
+CONTENT_TYPE_EVENT_STREAM = "text/event-stream"
+_SSE_DONE_EVENT = "data: [DONE]\n\n"
+_STREAM_EXHAUSTED = object()
 
 CONTENT_TYPES = [
     CONTENT_TYPE_CSV,
     CONTENT_TYPE_JSON,
+    CONTENT_TYPE_ARROW,
 ]
 
+# Keys of the Arrow IPC stream schema metadata used by the Arrow content type
+ARROW_PARAMS_METADATA_KEY = b"mlflow.params"
+ARROW_PREDICTIONS_TYPE_METADATA_KEY = b"mlflow.predictions_type"
+
 _logger = logging.getLogger(__name__)
 
 DF_RECORDS = "dataframe_records"
@@ -261,6 +277,101 @@ def parse_csv_input(csv_input, schema: Schema = None):
         )
 
 
+def parse_arrow_input(arrow_input):
+    """
+    Args:
+        arrow_input: Bytes of an Apache Arrow IPC stream holding a single table.
+
+    Returns:
+        A tuple of the table converted to a Pandas DataFrame and the inference params stored in
+        the stream's schema metadata (or None).
+    """
+    import pyarrow as pa
+
+    try:
+        table = pa.ipc.open_stream(arrow_input).read_all()
+    except Exception as e:
+        _handle_serving_error(
+            error_message=(
+                "Failed to parse input as an Apache Arrow IPC stream. Ensure that the input is"
+                f" a valid Arrow stream written with `pyarrow.ipc.new_stream`. Error: '{e}'"
+            ),
+            error_code=BAD_REQUEST,
+        )
+    params_json = (table.schema.metadata or {}).get(ARROW_PARAMS_METADATA_KEY)
+    params = json.loads(params_json) if params_json else None
+    return table.to_pandas(), params
+
+
+def predictions_to_arrow(raw_predictions):
+    """
+    Serializes predictions to an Apache Arrow IPC stream.
+
+    DataFrame predictions are written as-is. Series, 1-D and 2-D array predictions are written as
+    columns named after their position, and the original kind of the predictions is recorded in
+    the ``mlflow.predictions_type`` schema metadata so that clients can restore it.
+
+    Returns:
+        The serialized stream, or None if the predictions cannot be represented as an Arrow table
+        of primitive columns, in which case callers should fall back to JSON.
+    """
+    import numpy as np
+    import pandas as pd
+    import pyarrow as pa
+
+    if isinstance(raw_predictions, pd.DataFrame):
+        predictions_type = "dataframe"
+        df = raw_predictions.rename(columns=str)
+    elif isinstance(raw_predictions, pd.Series):
+        predictions_type = "ndarray"
+        df = pd.DataFrame({"0": raw_predictions.to_numpy()})
+    elif isinstance(raw_predictions, (np.ndarray, list)):
+        predictions_type = "ndarray"
+        try:
+            array = np.asarray(raw_predictions)
+        except ValueError:
+            return None
+        if array.ndim == 1:
+            df = pd.DataFrame({"0": array})
+        elif array.ndim == 2:
+            df = pd.DataFrame(array, columns=[str(i) for i in range(array.shape[1])])
+        else:
+            return None
+    else:
+        return None
+
+    try:
+        table = pa.Table.from_pandas(df, preserve_index=False)
+    except (pa.ArrowException, ValueError, TypeError):
+        return None
+    if not all(_is_primitive_arrow_type(field.type) for field in table.schema):
+        return None
+
+    table = table.replace_schema_metadata(
+        {ARROW_PREDICTIONS_TYPE_METADATA_KEY: predictions_type.encode()}
+    )
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue().to_pybytes()
+
+
+def _is_primitive_arrow_type(arrow_type):
+    import pyarrow as pa
+
+    return (
+        pa.types.is_integer(arrow_type)
+        or pa.types.is_floating(arrow_type)
+        or pa.types.is_boolean(arrow_type)
+        or pa.types.is_string(arrow_type)
+        or pa.types.is_large_string(arrow_type)
+        or pa.types.is_binary(arrow_type)
+        or pa.types.is_large_binary(arrow_type)
+        or pa.types.is_timestamp(arrow_type)
+        or pa.types.is_date(arrow_type)
+    )
+
+
 def unwrapped_predictions_to_json(raw_predictions, output):
     predictions = _get_jsonable_obj(raw_predictions, pandas_orient="records")
     return json.dump(predictions, output, cls=NumpyEncoder)
@@ -298,12 +409,30 @@ def _handle_serving_error(error_message, error_code, include_traceback=True):
 
 
 class InvocationsResponse(NamedTuple):
-    response: str
+    response: Union[str, bytes]
     status: int
     mimetype: str
 
 
-def invocations(data, content_type, model, input_schema):
+def invocations(data, content_type, model, input_schema, accept=None):
+    parsed_input = _parse_invocations_input(data, content_type, model, input_schema)
+    if isinstance(parsed_input, InvocationsResponse):
+        return parsed_input
+
+    raw_predictions = _predict_with_error_handling(model, parsed_input.data, parsed_input.params)
+    return _predictions_to_invocations_response(
+        raw_predictions, parsed_input.is_unified_llm_input, accept
+    )
+
+
+def _parse_invocations_input(data, content_type, model, input_schema):
+    """
+    Parses the body of an ``/invocations`` request into the model input and params.
+
+    Returns:
+        A ``ParsedJsonInput`` on success, or an ``InvocationsResponse`` describing why the
+        request cannot be processed (e.g. an unsupported content type).
+    """
     type_parts = list(map(str.strip, content_type.split(";")))
     mime_type = type_parts[0]
     parameter_value_pairs = type_parts[1:]
@@ -334,20 +463,24 @@ def invocations(data, content_type, model, input_schema):
     # The traditional JSON request/response format, wraps the data with one of the supported keys
     # like "dataframe_split" and "predictions". For LLM use cases, we also support unwrapped JSON
     # payload, to provide unified prediction interface.
-    should_parse_as_unified_llm_input = False
-
     if mime_type == CONTENT_TYPE_CSV:
         # Convert from CSV to pandas
         if isinstance(data, bytes):
             data = data.decode("utf-8")
         csv_input = StringIO(data)
         data = parse_csv_input(csv_input=csv_input, schema=input_schema)
-        params = None
+        return ParsedJsonInput(data, None, False)
     elif mime_type == CONTENT_TYPE_JSON:
-        parsed_json_input = _parse_json_data(data, model.metadata, input_schema)
-        data = parsed_json_input.data
-        params = parsed_json_input.params
-        should_parse_as_unified_llm_input = parsed_json_input.is_unified_llm_input
+        return _parse_json_data(data, model.metadata, input_schema)
+    elif mime_type == CONTENT_TYPE_ARROW:
+        if importlib.util.find_spec("pyarrow") is None:
+            return InvocationsResponse(
+                response=f"'{CONTENT_TYPE_ARROW}' requires pyarrow in the serving environment",
+                status=415,
+                mimetype="text/plain",
+            )
+        data, params = parse_arrow_input(data)
+        return ParsedJsonInput(data, params, False)
     else:
         return InvocationsResponse(
             response=(
@@ -359,15 +492,13 @@ def invocations(data, content_type, model, input_schema):
             mimetype="text/plain",
         )
 
-    # Do the prediction
+
+@contextmanager
+def _translate_predict_errors(data):
     # NB: utils._validate_serving_input mimic the scoring process here to validate input_example
     # work for serving, so any changes here should be reflected there as well
     try:
-        if "params" in inspect.signature(model.predict).parameters:
-            raw_predictions = model.predict(data, params=params)
-        else:
-            _log_warning_if_params_not_in_predict_signature(_logger, params)
-            raw_predictions = model.predict(data)
+        yield
     except MlflowException as e:
         if "Failed to enforce schema" in e.message:
             _logger.warning(
@@ -389,11 +520,50 @@ def invocations(data, content_type, model, input_schema):
             error_code=BAD_REQUEST,
             stack_trace=traceback.format_exc(),
         )
+
+
+def _predict_with_error_handling(model, data, params):
+    # Do the prediction
+    with _translate_predict_errors(data):
+        if "params" in inspect.signature(model.predict).parameters:
+            return model.predict(data, params=params)
+        else:
+            _log_warning_if_params_not_in_predict_signature(_logger, params)
+            return model.predict(data)
+
+
+async def _predict_with_error_handling_async(model, data, params, executor=None):
+    with _translate_predict_errors(data):
+        return await model._predict_async(data, params=params, executor=executor)
+
+
+def _predict_stream_with_error_handling(model, data, params):
+    if getattr(model, "_predict_stream_fn", None) is None:
+        raise MlflowException.invalid_parameter_value(
+            "This model does not support predict_stream method."
+        )
+    with _translate_predict_errors(data):
+        yield from model.predict_stream(data, params=params)
+
+
+def _predictions_to_invocations_response(raw_predictions, is_unified_llm_input, accept=None):
+    if (
+        accept
+        and CONTENT_TYPE_ARROW in accept
+        and not is_unified_llm_input
+        and importlib.util.find_spec("pyarrow") is not None
+    ):
+        arrow_response = predictions_to_arrow(raw_predictions)
+        if arrow_response is not None:
+            return InvocationsResponse(
+                response=arrow_response, status=200, mimetype=CONTENT_TYPE_ARROW
+            )
+
     result = StringIO()
 
     # if the data was formatted using the unified LLM format,
     # then return the data without the "predictions" key
-    if should_parse_as_unified_llm_input:
+    if is_unified_llm_input:
         unwrapped_predictions_to_json(raw_predictions, result)
     else:
         predictions_to_json(raw_predictions, result)
@@ -464,11 +634,21 @@ def init(model: PyFuncModel):
     from fastapi import FastAPI, Request
     from fastapi.responses import Response
 
-    app = FastAPI()
     input_schema = model.metadata.get_input_schema()
     # set the environment variable to indicate that we are in a serving environment
     os.environ[_MLFLOW_IS_IN_SERVING_ENVIRONMENT.name] = "true"
     timeout = MLFLOW_SCORING_SERVER_REQUEST_TIMEOUT.get()
+    predict_executor = _create_predict_executor(model)
+    batcher = _create_batcher(predict_executor)
+
+    @asynccontextmanager
+    async def lifespan(app: FastAPI):
+        try:
+            yield
+        finally:
+            predict_executor.shutdown()
+
+    app = FastAPI(lifespan=lifespan)
 
     @app.middleware("http")
     async def timeout_middleware(request: Request, call_next):
@@ -510,16 +690,135 @@ def init(model: PyFuncModel):
 
         data = await request.body()
         content_type = request.headers.get("content-type")
-        # TODO: convert "invocations" to an async method to make internal logic fully non-blocking.
-        result = await asyncio.to_thread(invocations, data, content_type, model, input_schema)
+        accept = request.headers.get("accept")
+        result = await _invocations_async(
+            data,
+            content_type,
+            model,
+            input_schema,
+            predict_executor,
+            batcher=batcher,
+            accept=accept,
+        )
 
         return Response(
             content=result.response, status_code=result.status, media_type=result.mimetype
         )
 
+    @app.route("/invocations/stream", methods=["POST"])
+    @_async_catch_mlflow_exception
+    async def stream_transformation(request: Request):
+        """
+        Do a streaming inference on a single JSON input with the model's ``predict_stream``
+        method, and send the chunks back as server-sent events. Each chunk is sent as a JSON
+        ``data`` event and the stream is terminated by a ``data: [DONE]`` event.
+        """
+        from fastapi.responses import StreamingResponse
+
+        data = await request.body()
+        content_type = request.headers.get("content-type") or ""
+        if content_type.split(";")[0].strip() != CONTENT_TYPE_JSON:
+            return Response(
+                content=f"Streaming inference only supports the '{CONTENT_TYPE_JSON}' content type."
+                f" Got '{content_type}'.",
+                status_code=415,
+                media_type="text/plain",
+            )
+        parsed_input = await asyncio.to_thread(_parse_json_data, data, model.metadata, input_schema)
+        chunks = predict_executor.predict_stream(parsed_input.data, parsed_input.params)
+        # Fetch the first chunk eagerly so that invalid inputs are reported with an error status
+        # code rather than in the middle of the event stream.
+        try:
+            first_chunk = await chunks.__anext__()
+        except StopAsyncIteration:
+            first_chunk = _STREAM_EXHAUSTED
+
+        async def events():
+            if first_chunk is _STREAM_EXHAUSTED:
+                yield _SSE_DONE_EVENT
+                return
+            yield _to_sse_event(first_chunk)
+            try:
+                async for chunk in chunks:
+                    yield _to_sse_event(chunk)
+            except MlflowException as e:
+                yield f"event: error\ndata: {e.serialize_as_json()}\n\n"
+                return
+            yield _SSE_DONE_EVENT
+
+        return StreamingResponse(events(), media_type=CONTENT_TYPE_EVENT_STREAM)
+
+    if batcher is not None:
+
+        @app.route("/metrics/batching", methods=["GET"])
+        async def batching_metrics(request: Request):
+            """
+            Returns statistics about the batches formed by the dynamic batcher.
+            """
+            return Response(
+                content=json.dumps(batcher.stats.to_dict()),
+                status_code=200,
+                media_type="application/json",
+            )
+
     return app
 
 
+def _create_predict_executor(model):
+    from mlflow.pyfunc.scoring_server.predict_executor import PredictExecutor
+
+    return PredictExecutor.from_env(model)
+
+
+def _create_batcher(predict_executor):
+    from mlflow.pyfunc.scoring_server.batching import DynamicBatcher
+
+    batcher = DynamicBatcher.from_env(
+        predict_executor.predict_sync, executor=predict_executor.thread_pool
+    )
+    if batcher is not None:
+        _logger.info(
+            "Dynamic batching enabled with max batch size %d and max batch delay %.1fms",
+            batcher.max_batch_size,
+            batcher.max_batch_delay * 1000,
+        )
+    return batcher
+
+
+async def _invocations_async(
+    data, content_type, model, input_schema, predict_executor, batcher=None, accept=None
+):
+    """
+    Asynchronous counterpart of :py:func:`invocations`. Request parsing and response
+    serialization run on the default thread pool while predictions run on ``predict_executor``,
+    so that neither blocks the event loop.
+    """
+    parsed_input = await asyncio.to_thread(
+        _parse_invocations_input, data, content_type, model, input_schema
+    )
+    if isinstance(parsed_input, InvocationsResponse):
+        return parsed_input
+
+    # Requests carrying params may be scored differently from each other, so they are never
+    # merged into a batch.
+    if batcher is not None and not parsed_input.params:
+        raw_predictions = await batcher.predict(parsed_input.data)
+    else:
+        raw_predictions = await predict_executor.predict(parsed_input.data, parsed_input.params)
+
+    return await asyncio.to_thread(
+        _predictions_to_invocations_response,
+        raw_predictions,
+        parsed_input.is_unified_llm_input,
+        accept,
+    )
+
+
+def _to_sse_event(chunk):
+    chunk = _get_jsonable_obj(chunk, pandas_orient="records")
+    return f"data: {json.dumps(chunk, cls=NumpyEncoder)}\n\n"
+
+
 def _predict(model_uri, input_path, output_path, content_type):
     from mlflow.pyfunc.utils.environment import _simulate_serving_environment
 
@@ -595,7 +894,10 @@ def get_cmd(
     if nworkers:
         args.append(f"--workers {nworkers}")
 
-    command = f"uvicorn {' '.join(args)} mlflow.pyfunc.scoring_server.app:app"
+    if MLFLOW_SCORING_SERVER_PREFORK.get() and not is_windows():
+        command = f"python -m mlflow.pyfunc.scoring_server.prefork {' '.join(args)}"
+    else:
+        command = f"uvicorn {' '.join(args)} mlflow.pyfunc.scoring_server.app:app"
 
     command_env = os.environ.copy()
     command_env[_SERVER_MODEL_PATH] = local_uri
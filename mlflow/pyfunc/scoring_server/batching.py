@@ -0,0 +1,292 @@
+"""
+Adaptive request batching for the pyfunc scoring server.
+
+Concurrent ``/invocations`` requests whose parsed inputs are compatible (pandas DataFrames with
+the same columns and dtypes, or numpy arrays with the same dtype and trailing dimensions) are
+concatenated into a single ``PyFuncModel.predict`` call. The predictions are then split back
+into per-request responses. A batch is dispatched once it reaches ``max_batch_size`` rows or once
+the oldest queued request has waited ``max_batch_delay_ms`` milliseconds, whichever comes first.
+"""
+
+import asyncio
+import logging
+import time
+from concurrent.futures import Executor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Optional
+
+import numpy as np
+import pandas as pd
+
+from mlflow.environment_variables import (
+    MLFLOW_SCORING_SERVER_MAX_BATCH_DELAY_MS,
+    MLFLOW_SCORING_SERVER_MAX_BATCH_SIZE,
+)
+
+_logger = logging.getLogger(__name__)
+
+
+class _UnsplittablePredictions(Exception):
+    pass
+
+
+@dataclass
+class _PendingRequest:
+    data: Any
+    num_rows: int
+    key: tuple[Any, ...]
+    future: asyncio.Future
+    enqueued_at: float
+
+
+@dataclass
+class BatchingStats:
+    """
+    Counters describing the batches dispatched by a :py:class:`DynamicBatcher`.
+    """
+
+    num_batches: int = 0
+    num_requests: int = 0
+    num_rows: int = 0
+    num_fallbacks: int = 0
+    max_batch_rows: int = 0
+    total_queue_wait_seconds: float = 0.0
+    max_queue_wait_seconds: float = 0.0
+    # Maps the number of requests merged into a batch to the number of such batches
+    batch_size_histogram: dict[int, int] = field(default_factory=dict)
+
+    def record_batch(self, requests: list[_PendingRequest], dispatched_at: float):
+        num_rows = sum(r.num_rows for r in requests)
+        self.num_batches += 1
+        self.num_requests += len(requests)
+        self.num_rows += num_rows
+        self.max_batch_rows = max(self.max_batch_rows, num_rows)
+        self.batch_size_histogram[len(requests)] = (
+            self.batch_size_histogram.get(len(requests), 0) + 1
+        )
+        for request in requests:
+            wait = dispatched_at - request.enqueued_at
+            self.total_queue_wait_seconds += wait
+            self.max_queue_wait_seconds = max(self.max_queue_wait_seconds, wait)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "num_batches": self.num_batches,
+            "num_requests": self.num_requests,
+            "num_rows": self.num_rows,
+            "num_fallbacks": self.num_fallbacks,
+            "max_batch_rows": self.max_batch_rows,
+            "avg_requests_per_batch": (
+                self.num_requests / self.num_batches if self.num_batches else 0.0
+            ),
+            "avg_rows_per_batch": self.num_rows / self.num_batches if self.num_batches else 0.0,
+            "avg_queue_wait_ms": (
+                1000 * self.total_queue_wait_seconds / self.num_requests
+                if self.num_requests
+                else 0.0
+            ),
+            "max_queue_wait_ms": 1000 * self.max_queue_wait_seconds,
+            "batch_size_histogram": {str(k): v for k, v in self.batch_size_histogram.items()},
+        }
+
+
+def _get_batch_key(data) -> Optional[tuple[Any, ...]]:
+    """
+    Returns a hashable key such that inputs with equal keys can be concatenated along the first
+    axis, or None if the input cannot be batched.
+    """
+    if isinstance(data, pd.DataFrame):
+        return ("dataframe", tuple(data.columns), tuple(str(t) for t in data.dtypes))
+    if isinstance(data, np.ndarray) and data.ndim >= 1:
+        return ("ndarray", data.dtype.str, data.shape[1:])
+    return None
+
+
+def _concat_inputs(inputs: list[Any]):
+    if isinstance(inputs[0], pd.DataFrame):
+        return pd.concat(inputs, ignore_index=True)
+    return np.concatenate(inputs, axis=0)
+
+
+def _split_predictions(predictions, sizes: list[int]) -> list[Any]:
+    if isinstance(predictions, (pd.DataFrame, pd.Series)):
+        predictions = predictions.reset_index(drop=True)
+    elif not isinstance(predictions, (np.ndarray, list)) or getattr(predictions, "ndim", 1) == 0:
+        raise _UnsplittablePredictions()
+
+    if len(predictions) != sum(sizes):
+        raise _UnsplittablePredictions()
+
+    outputs = []
+    start = 0
+    for size in sizes:
+        if isinstance(predictions, (pd.DataFrame, pd.Series)):
+            outputs.append(predictions.iloc[start : start + size].reset_index(drop=True))
+        else:
+            outputs.append(predictions[start : start + size])
+        start += size
+    return outputs
+
+
+class DynamicBatcher:
+    """
+    Merges compatible inputs of concurrent requests into a single predict call.
+
+    Args:
+        predict_fn: Function invoked with the (possibly concatenated) model input. It is always
+            executed in a worker thread so that it does not block the event loop.
+        max_batch_size: Maximum number of rows in a merged batch. A single request larger than
+            this limit is still processed, on its own.
+        max_batch_delay_ms: Maximum time in milliseconds a request waits in the queue for other
+            requests to join its batch.
+        executor: Executor on which ``predict_fn`` is run. Defaults to the event loop's default
+            executor.
+    """
+
+    def __init__(
+        self,
+        predict_fn: Callable[[Any], Any],
+        max_batch_size: int,
+        max_batch_delay_ms,
+        executor: Optional[Executor] = None,
+    ):
+        if max_batch_size < 1:
+            raise ValueError(f"max_batch_size must be a positive integer, got {max_batch_size}")
+        if max_batch_delay_ms < 0:
+            raise ValueError(f"max_batch_delay_ms must be non-negative, got {max_batch_delay_ms}")
+        self._predict_fn = predict_fn
+        self._executor = executor
+        self.max_batch_size = max_batch_size
+        self.max_batch_delay = max_batch_delay_ms / 1000
+        self.stats = BatchingStats()
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._carry_over: Optional[_PendingRequest] = None
+
+    @classmethod
+    def from_env(
+        cls, predict_fn: Callable[[Any], Any], executor: Optional[Executor] = None
+    ) -> Optional["DynamicBatcher"]:
+        """
+        Creates a batcher configured through environment variables, or returns None if dynamic
+        batching is disabled (``MLFLOW_SCORING_SERVER_MAX_BATCH_SIZE`` is unset or at most 1).
+        """
+        max_batch_size = MLFLOW_SCORING_SERVER_MAX_BATCH_SIZE.get()
+        if not max_batch_size or max_batch_size <= 1:
+            return None
+        return cls(
+            predict_fn,
+            max_batch_size=max_batch_size,
+            max_batch_delay_ms=MLFLOW_SCORING_SERVER_MAX_BATCH_DELAY_MS.get(),
+            executor=executor,
+        )
+
+    async def predict(self, data):
+        """
+        Returns the predictions for ``data``, which may be computed as part of a larger batch.
+        """
+        loop = asyncio.get_running_loop()
+        key = _get_batch_key(data)
+        if key is None:
+            return await loop.run_in_executor(self._executor, self._predict_fn, data)
+
+        self._ensure_worker()
+        request = _PendingRequest(
+            data=data,
+            num_rows=len(data),
+            key=key,
+            future=loop.create_future(),
+            enqueued_at=loop.time(),
+        )
+        await self._queue.put(request)
+        return await request.future
+
+    def _ensure_worker(self):
+        loop = asyncio.get_running_loop()
+        if self._worker is None or self._worker.done() or self._worker.get_loop() is not loop:
+            self._queue = asyncio.Queue()
+            self._carry_over = None
+            self._worker = loop.create_task(self._run())
+
+    async def _next_request(self, timeout=None) -> Optional[_PendingRequest]:
+        if self._carry_over is not None:
+            request, self._carry_over = self._carry_over, None
+            return request
+        if timeout is None:
+            return await self._queue.get()
+        if timeout <= 0 or not self._queue.empty():
+            try:
+                return self._queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return None
+        try:
+            return await asyncio.wait_for(self._queue.get(), timeout=timeout)
+        except asyncio.TimeoutError:
+            return None
+
+    async def _collect_batch(self) -> list[_PendingRequest]:
+        loop = asyncio.get_running_loop()
+        first = await self._next_request()
+        batch = [first]
+        num_rows = first.num_rows
+        deadline = first.enqueued_at + self.max_batch_delay
+        while num_rows < self.max_batch_size:
+            request = await self._next_request(timeout=deadline - loop.time())
+            if request is None:
+                break
+            if request.future.done():
+                # The request was cancelled (e.g. timed out) while waiting in the queue
+                continue
+            if request.key != first.key or num_rows + request.num_rows > self.max_batch_size:
+                self._carry_over = request
+                break
+            batch.append(request)
+            num_rows += request.num_rows
+        return [r for r in batch if not r.future.done()]
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = await self._collect_batch()
+            if not batch:
+                continue
+            self.stats.record_batch(batch, loop.time())
+            results = await loop.run_in_executor(self._executor, self._predict_batch, batch)
+            for request, (result, error) in zip(batch, results):
+                if request.future.done():
+                    continue
+                if error is not None:
+                    request.future.set_exception(error)
+                else:
+                    request.future.set_result(result)
+
+    def _predict_individually(self, batch: list[_PendingRequest]):
+        results = []
+        for request in batch:
+            try:
+                results.append((self._predict_fn(request.data), None))
+            except Exception as e:
+                results.append((None, e))
+        return results
+
+    def _predict_batch(self, batch: list[_PendingRequest]):
+        if len(batch) == 1:
+            return self._predict_individually(batch)
+
+        start = time.monotonic()
+        try:
+            predictions = self._predict_fn(_concat_inputs([r.data for r in batch]))
+            outputs = _split_predictions(predictions, [r.num_rows for r in batch])
+        except Exception as e:
+            # Either one of the inputs is invalid or the model does not produce one output row
+            # per input row. Score the requests one by one so that each gets its own result.
+            _logger.debug(
+                "Batched prediction of %d requests failed after %.3fs, falling back to "
+                "per-request prediction: %r",
+                len(batch),
+                time.monotonic() - start,
+                e,
+            )
+            self.stats.num_fallbacks += 1
+            return self._predict_individually(batch)
+        return [(output, None) for output in outputs]
@@ -1,3 +1,4 @@
+import importlib.util
 import json
 import logging
 import tempfile
@@ -13,7 +14,7 @@ from mlflow.deployments import PredictionsResponse
 from mlflow.environment_variables import MLFLOW_SCORING_SERVER_REQUEST_TIMEOUT
 from mlflow.exceptions import MlflowException
 from mlflow.pyfunc import scoring_server
-from mlflow.utils.proto_json_utils import dump_input_data
+from mlflow.utils.proto_json_utils import _CustomJsonEncoder, dump_input_data
 
 _logger = logging.getLogger(__name__)
 
@@ -40,9 +41,71 @@ class BaseScoringServerClient(ABC):
         """
 
 
+def _dump_arrow_input(data, params: Optional[dict[str, Any]] = None) -> Optional[bytes]:
+    """
+    Serializes a Pandas DataFrame with primitive, string-named columns to an Apache Arrow IPC
+    stream. Returns None if the data cannot be sent losslessly as Arrow, in which case the caller
+    should fall back to JSON.
+    """
+    import pandas as pd
+    import pyarrow as pa
+
+    if not isinstance(data, pd.DataFrame) or not all(isinstance(c, str) for c in data.columns):
+        return None
+
+    try:
+        table = pa.Table.from_pandas(data, preserve_index=False)
+    except (pa.ArrowException, ValueError, TypeError):
+        return None
+    if not all(scoring_server._is_primitive_arrow_type(field.type) for field in table.schema):
+        return None
+
+    metadata = {}
+    if params is not None:
+        if not isinstance(params, dict):
+            raise MlflowException(
+                f"Params must be a dictionary. Got type '{type(params).__name__}'."
+            )
+        metadata[scoring_server.ARROW_PARAMS_METADATA_KEY] = json.dumps(
+            params, cls=_CustomJsonEncoder
+        ).encode()
+    table = table.replace_schema_metadata(metadata)
+
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue().to_pybytes()
+
+
+def _load_arrow_predictions(content: bytes) -> PredictionsResponse:
+    import pyarrow as pa
+
+    table = pa.ipc.open_stream(content).read_all()
+    metadata = table.schema.metadata or {}
+    df = table.to_pandas()
+    if metadata.get(scoring_server.ARROW_PREDICTIONS_TYPE_METADATA_KEY) == b"ndarray":
+        predictions = df["0"].to_numpy() if len(df.columns) == 1 else df.to_numpy()
+    else:
+        predictions = df
+    return PredictionsResponse({"predictions": predictions})
+
+
 class ScoringServerClient(BaseScoringServerClient):
-    def __init__(self, host, port):
+    """
+    Client of the MLflow Model Scoring server.
+
+    Args:
+        host: Host of the scoring server.
+        port: Port of the scoring server.
+        use_arrow: If True, send Pandas DataFrames as Apache Arrow IPC streams and accept Arrow
+            predictions, which avoids the JSON encoding round trip. Inputs that cannot be
+            represented as Arrow tables of primitive columns, and servers that do not support the
+            Arrow content type, transparently fall back to JSON.
+    """
+
+    def __init__(self, host, port, use_arrow=False):
         self.url_prefix = f"http://{host}:{port}"
+        self.use_arrow = use_arrow and importlib.util.find_spec("pyarrow") is not None
 
     def ping(self):
         ping_status = requests.get(url=self.url_prefix + "/ping")
@@ -82,15 +145,40 @@ class ScoringServerClient(BaseScoringServerClient):
         Returns:
             :py:class:`PredictionsResponse <mlflow.deployments.PredictionsResponse>` result.
         """
+        if self.use_arrow and (arrow_data := _dump_arrow_input(data, params=params)) is not None:
+            response = requests.post(
+                url=self.url_prefix + "/invocations",
+                data=arrow_data,
+                headers={
+                    "Content-Type": scoring_server.CONTENT_TYPE_ARROW,
+                    "Accept": f"{scoring_server.CONTENT_TYPE_ARROW}, "
+                    f"{scoring_server.CONTENT_TYPE_JSON}",
+                },
+            )
+            if response.status_code != 415:
+                return self._parse_invocations_response(response)
+            # The server predates the Arrow content type or lacks pyarrow, use JSON from now on.
+            _logger.info(
+                "Scoring server does not accept Arrow input, falling back to JSON. Response: %s",
+                response.text,
+            )
+            self.use_arrow = False
+
         response = requests.post(
             url=self.url_prefix + "/invocations",
             data=dump_input_data(data, params=params),
             headers={"Content-Type": scoring_server.CONTENT_TYPE_JSON},
         )
+        return self._parse_invocations_response(response)
+
+    @staticmethod
+    def _parse_invocations_response(response):
         if response.status_code != 200:
             raise Exception(
                 f"Invocation failed (error code {response.status_code}, response: {response.text})"
             )
+        if response.headers.get("Content-Type", "").startswith(scoring_server.CONTENT_TYPE_ARROW):
+            return _load_arrow_predictions(response.content)
         return PredictionsResponse.from_json(response.text)
 
 
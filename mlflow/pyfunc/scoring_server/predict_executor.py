@@ -0,0 +1,150 @@
+"""
+Executors running the model predictions of the pyfunc scoring server off the event loop.
+
+Predictions run on a pool dedicated to inference, separate from the default thread pool that
+parses request bodies and serializes responses, so that slow models cannot starve request I/O.
+Models whose ``predict`` method is a coroutine function are awaited on the event loop directly,
+after their inputs are validated against the model signature on the pool.
+"""
+
+import asyncio
+import functools
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, AsyncIterator, Optional
+
+from mlflow.environment_variables import (
+    MLFLOW_SCORING_SERVER_PREDICT_EXECUTOR,
+    MLFLOW_SCORING_SERVER_PREDICT_WORKERS,
+)
+from mlflow.exceptions import MlflowException
+from mlflow.pyfunc import scoring_server
+
+PREDICT_EXECUTOR_THREAD = "thread"
+PREDICT_EXECUTOR_PROCESS = "process"
+PREDICT_EXECUTOR_TYPES = (PREDICT_EXECUTOR_THREAD, PREDICT_EXECUTOR_PROCESS)
+
+_STREAM_END = object()
+
+# The model loaded in a predict worker process
+_worker_model = None
+
+
+def _init_worker(model_uri):
+    global _worker_model
+    _worker_model = scoring_server.load_model_with_mlflow_config(model_uri)
+
+
+def _predict_in_worker(data, params):
+    return scoring_server._predict_with_error_handling(_worker_model, data, params)
+
+
+class PredictExecutor:
+    """
+    Runs model predictions on a dedicated thread or process pool.
+
+    Args:
+        model: The loaded ``PyFuncModel`` served by the scoring server.
+        executor_type: Either ``"thread"`` or ``"process"``. A process pool loads a separate copy
+            of the model in each worker process and requires ``model_uri``.
+        max_workers: Maximum number of workers of the pool. Defaults to the pool's own default.
+        model_uri: URI of the served model, used to load the model in worker processes.
+    """
+
+    def __init__(
+        self,
+        model,
+        executor_type: str = PREDICT_EXECUTOR_THREAD,
+        max_workers: Optional[int] = None,
+        model_uri: Optional[str] = None,
+    ):
+        if executor_type not in PREDICT_EXECUTOR_TYPES:
+            raise MlflowException.invalid_parameter_value(
+                f"Invalid predict executor type '{executor_type}'. "
+                f"Must be one of {list(PREDICT_EXECUTOR_TYPES)}."
+            )
+        self._model = model
+        self.executor_type = executor_type
+        if executor_type == PREDICT_EXECUTOR_PROCESS:
+            if model_uri is None:
+                raise MlflowException.invalid_parameter_value(
+                    "The process predict executor requires the URI of the served model."
+                )
+            self._pool = ProcessPoolExecutor(
+                max_workers=max_workers,
+                # Forking a process with a running event loop and threads is unsafe
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+                initargs=(model_uri,),
+            )
+            self._predict_fn = _predict_in_worker
+        else:
+            self._pool = ThreadPoolExecutor(
+                max_workers=max_workers, thread_name_prefix="MlflowScoringServerPredict"
+            )
+            self._predict_fn = functools.partial(scoring_server._predict_with_error_handling, model)
+
+    @classmethod
+    def from_env(cls, model) -> "PredictExecutor":
+        """
+        Creates an executor configured through the ``MLFLOW_SCORING_SERVER_PREDICT_EXECUTOR``
+        and ``MLFLOW_SCORING_SERVER_PREDICT_WORKERS`` environment variables.
+        """
+        return cls(
+            model,
+            executor_type=MLFLOW_SCORING_SERVER_PREDICT_EXECUTOR.get().lower(),
+            max_workers=MLFLOW_SCORING_SERVER_PREDICT_WORKERS.get(),
+            model_uri=os.environ.get(scoring_server._SERVER_MODEL_PATH),
+        )
+
+    @property
+    def thread_pool(self) -> Optional[ThreadPoolExecutor]:
+        """
+        The thread pool predictions run on, or None if predictions run in worker processes.
+        """
+        return self._pool if self.executor_type == PREDICT_EXECUTOR_THREAD else None
+
+    @property
+    def _awaits_model(self) -> bool:
+        return self.executor_type == PREDICT_EXECUTOR_THREAD and getattr(
+            self._model, "_is_async_predict", False
+        )
+
+    async def predict(self, data, params: Optional[dict[str, Any]] = None):
+        """
+        Returns the predictions for ``data`` without blocking the event loop.
+        """
+        if self._awaits_model:
+            return await scoring_server._predict_with_error_handling_async(
+                self._model, data, params, executor=self._pool
+            )
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._pool, self._predict_fn, data, params)
+
+    def predict_sync(self, data, params: Optional[dict[str, Any]] = None):
+        """
+        Returns the predictions for ``data``, blocking the calling thread. Must not be called
+        from the event loop.
+        """
+        if self.executor_type == PREDICT_EXECUTOR_THREAD:
+            return self._predict_fn(data, params)
+        return self._pool.submit(self._predict_fn, data, params).result()
+
+    async def predict_stream(
+        self, data, params: Optional[dict[str, Any]] = None
+    ) -> AsyncIterator[Any]:
+        """
+        Yields the chunks of ``PyFuncModel.predict_stream`` without blocking the event loop.
+        Streams are always produced by threads since generators cannot cross process boundaries.
+        """
+        loop = asyncio.get_running_loop()
+        chunks = scoring_server._predict_stream_with_error_handling(self._model, data, params)
+        while True:
+            chunk = await loop.run_in_executor(self.thread_pool, next, chunks, _STREAM_END)
+            if chunk is _STREAM_END:
+                return
+            yield chunk
+
+    def shutdown(self):
+        self._pool.shutdown(wait=False, cancel_futures=True)
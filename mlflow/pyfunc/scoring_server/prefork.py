@@ -0,0 +1,235 @@
+"""
+Pre-fork mode of the pyfunc scoring server.
+
+``uvicorn --workers N`` starts fresh worker processes that each load the model, which multiplies
+the memory footprint and the start-up time of the server by the number of workers. In pre-fork
+mode the model is loaded once in a supervisor process, which then forks the workers. The workers
+share the memory pages holding the model with the supervisor through copy-on-write, so a model
+only occupies memory once regardless of the number of workers.
+
+The listening socket is bound before the model is loaded, and every request is answered with a
+503 status code until the workers are up, so that health checks on ``/ping`` can gate traffic on
+the model being loaded.
+
+Usage:
+    python -m mlflow.pyfunc.scoring_server.prefork --host 127.0.0.1 --port 5000 --workers 4
+"""
+
+import argparse
+import contextlib
+import gc
+import http.server
+import logging
+import os
+import signal
+import socket
+import threading
+import time
+from typing import Optional
+
+from mlflow.exceptions import MlflowException
+from mlflow.protos.databricks_pb2 import TEMPORARILY_UNAVAILABLE
+from mlflow.pyfunc import scoring_server
+
+_logger = logging.getLogger(__name__)
+
+_DEFAULT_HOST = "127.0.0.1"
+_DEFAULT_PORT = 8000
+_WORKER_SHUTDOWN_TIMEOUT_SECONDS = 30
+_MONITOR_INTERVAL_SECONDS = 0.5
+
+
+class _LoadingRequestHandler(http.server.BaseHTTPRequestHandler):
+    """
+    Answers every request with a 503 status code while the model is being loaded.
+    """
+
+    def _reply_unavailable(self):
+        # Drain the request body so that the client reads the response instead of a reset
+        content_length = int(self.headers.get("Content-Length") or 0)
+        if content_length:
+            self.rfile.read(content_length)
+        body = MlflowException(
+            "The model is being loaded. Please retry later.", error_code=TEMPORARILY_UNAVAILABLE
+        ).serialize_as_json()
+        body = body.encode("utf-8")
+        self.send_response(503)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Retry-After", "1")
+        self.send_header("Connection", "close")
+        self.end_headers()
+        if self.command != "HEAD":
+            self.wfile.write(body)
+        self.close_connection = True
+
+    do_GET = do_POST = do_PUT = do_DELETE = do_HEAD = _reply_unavailable
+
+    def log_message(self, format, *args):
+        _logger.debug(format, *args)
+
+
+def _bind_socket(host: str, port: int) -> socket.socket:
+    family = socket.AF_INET6 if ":" in host else socket.AF_INET
+    sock = socket.socket(family, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind((host, port))
+    sock.listen(socket.SOMAXCONN)
+    sock.set_inheritable(True)
+    return sock
+
+
+@contextlib.contextmanager
+def _serve_unavailable(sock: socket.socket):
+    """
+    Answers the requests received on ``sock`` with a 503 status code until the context exits.
+    The socket is left open, and the serving thread is stopped before exiting so that the caller
+    can safely fork afterwards.
+    """
+    server = http.server.HTTPServer(
+        sock.getsockname()[:2], _LoadingRequestHandler, bind_and_activate=False
+    )
+    server.socket.close()
+    server.socket = sock
+    thread = threading.Thread(
+        target=server.serve_forever,
+        kwargs={"poll_interval": 0.1},
+        name="MlflowScoringServerLoading",
+        daemon=True,
+    )
+    thread.start()
+    try:
+        yield
+    finally:
+        server.shutdown()
+        thread.join()
+
+
+def _run_worker(model, sock: socket.socket):
+    import uvicorn
+
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+    signal.signal(signal.SIGINT, signal.SIG_DFL)
+    app = scoring_server.init(model)
+    uvicorn.Server(uvicorn.Config(app, lifespan="on")).run(sockets=[sock])
+
+
+class PreforkServer:
+    """
+    Loads a model once and serves it from ``workers`` forked uvicorn worker processes sharing the
+    listening socket and the memory of the model.
+
+    Args:
+        model_uri: URI of the model to serve.
+        host: Host to bind the server to.
+        port: Port to bind the server to.
+        workers: Number of worker processes.
+    """
+
+    def __init__(self, model_uri: str, host: str, port: int, workers: int = 1):
+        if not hasattr(os, "fork"):
+            raise MlflowException("The pre-fork scoring server is not supported on this platform.")
+        if workers < 1:
+            raise MlflowException.invalid_parameter_value(
+                f"The number of workers must be positive, got {workers}."
+            )
+        self.model_uri = model_uri
+        self.host = host
+        self.port = port
+        self.workers = workers
+        self._worker_pids = set()
+        self._should_exit = False
+
+    def run(self, sock: Optional[socket.socket] = None):
+        sock = sock or _bind_socket(self.host, self.port)
+        _logger.info("Loading model %s before forking %d workers", self.model_uri, self.workers)
+        start = time.monotonic()
+        with _serve_unavailable(sock):
+            model = scoring_server.load_model_with_mlflow_config(self.model_uri)
+        _logger.info("Loaded model in %.1f seconds", time.monotonic() - start)
+
+        # Import the modules of the workers once so that forked workers start serving right away
+        import fastapi  # noqa: F401
+        import uvicorn  # noqa: F401
+
+        # Move every object allocated so far, including the model, to the permanent generation so
+        # that garbage collections in the workers do not write to, and thereby copy, their pages.
+        gc.collect()
+        gc.freeze()
+
+        signal.signal(signal.SIGTERM, self._handle_exit)
+        signal.signal(signal.SIGINT, self._handle_exit)
+        for _ in range(self.workers):
+            self._fork_worker(model, sock)
+        try:
+            self._monitor_workers(model, sock)
+        finally:
+            self._stop_workers()
+            sock.close()
+
+    def _handle_exit(self, signum, frame):
+        self._should_exit = True
+
+    def _fork_worker(self, model, sock):
+        pid = os.fork()
+        if pid == 0:
+            exit_code = 0
+            try:
+                _run_worker(model, sock)
+            except BaseException:
+                _logger.exception("Scoring server worker %d failed", os.getpid())
+                exit_code = 1
+            finally:
+                os._exit(exit_code)
+        _logger.info("Started scoring server worker %d", pid)
+        self._worker_pids.add(pid)
+
+    def _reap_workers(self):
+        exited = []
+        for pid in list(self._worker_pids):
+            with contextlib.suppress(ChildProcessError):
+                reaped_pid, status = os.waitpid(pid, os.WNOHANG)
+                if reaped_pid == 0:
+                    continue
+            self._worker_pids.discard(pid)
+            exited.append(pid)
+        return exited
+
+    def _monitor_workers(self, model, sock):
+        while not self._should_exit:
+            for pid in self._reap_workers():
+                if not self._should_exit:
+                    _logger.warning("Scoring server worker %d exited, starting a new one", pid)
+                    self._fork_worker(model, sock)
+            time.sleep(_MONITOR_INTERVAL_SECONDS)
+
+    def _stop_workers(self):
+        for pid in self._worker_pids:
+            with contextlib.suppress(ProcessLookupError):
+                os.kill(pid, signal.SIGTERM)
+        deadline = time.monotonic() + _WORKER_SHUTDOWN_TIMEOUT_SECONDS
+        while self._worker_pids and time.monotonic() < deadline:
+            self._reap_workers()
+            time.sleep(0.1)
+        for pid in self._worker_pids:
+            _logger.warning("Killing scoring server worker %d which did not exit in time", pid)
+            with contextlib.suppress(ProcessLookupError):
+                os.kill(pid, signal.SIGKILL)
+                os.waitpid(pid, 0)
+        self._worker_pids.clear()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().split("\n\n")[0])
+    parser.add_argument("--host", default=_DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=_DEFAULT_PORT)
+    parser.add_argument("--workers", type=int, default=1)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    model_uri = os.environ[scoring_server._SERVER_MODEL_PATH]
+    PreforkServer(model_uri, args.host, args.port, args.workers).run()
+
+
+if __name__ == "__main__":
+    main()
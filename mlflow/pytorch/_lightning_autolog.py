@@ -304,6 +304,15 @@ class MlflowModelCheckpointCallback(pl.Callback, MlflowModelCheckpointCallbackBa
             aligned to epochs, the monitored metric may potentially be less reliable (it
             could reflect as little as 1 batch, since the metrics get reset
             every epoch). Defaults to `"epoch"`.
+        async_upload: If True, checkpoints are uploaded to MLflow in the background, so that
+            training only waits for the checkpoint to be saved locally. Defaults to False.
+        max_pending_uploads: If `async_upload` is True, the maximum number of checkpoints that
+            are saved locally and not uploaded yet. Defaults to 1.
+        keep_last_n: If `save_best_only` is False, the number of most recent checkpoints to
+            keep in the run. Defaults to None, which keeps all checkpoints.
+        keep_top_k: If `save_best_only` is False, the number of best checkpoints to keep in
+            the run according to the monitored quantity. Defaults to None, which keeps all
+            checkpoints.
 
     .. code-block:: python
         :caption: Example
@@ -333,6 +342,10 @@ class MlflowModelCheckpointCallback(pl.Callback, MlflowModelCheckpointCallbackBa
         save_best_only=True,
         save_weights_only=False,
         save_freq="epoch",
+        async_upload=False,
+        max_pending_uploads=1,
+        keep_last_n=None,
+        keep_top_k=None,
     ):
         super().__init__(
             checkpoint_file_suffix=".pth",
@@ -341,6 +354,10 @@ class MlflowModelCheckpointCallback(pl.Callback, MlflowModelCheckpointCallbackBa
             save_best_only=save_best_only,
             save_weights_only=save_weights_only,
             save_freq=save_freq,
+            async_upload=async_upload,
+            max_pending_uploads=max_pending_uploads,
+            keep_last_n=keep_last_n,
+            keep_top_k=keep_top_k,
         )
         self.trainer = None
 
@@ -385,6 +402,10 @@ class MlflowModelCheckpointCallback(pl.Callback, MlflowModelCheckpointCallbackBa
                 metric_dict={k: float(v) for k, v in trainer.callback_metrics.items()},
             )
 
+    @rank_zero_only
+    def on_fit_end(self, trainer: "pl.Trainer", pl_module: "pl.LightningModule") -> None:
+        self.wait_for_pending_uploads()
+
 
 # PyTorch-Lightning refactored the LoggerConnector class in version 1.4.0 and made metrics
 # update on demand. Prior to this, the metrics from the current step were not available to
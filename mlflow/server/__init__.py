@@ -6,7 +6,7 @@ import sys
 import textwrap
 import types
 
-from flask import Flask, Response, send_from_directory
+from flask import Flask, Response, request, send_from_directory
 from packaging.version import Version
 
 from mlflow.environment_variables import MLFLOW_FLASK_SERVER_SECRET_KEY
@@ -26,6 +26,10 @@ from mlflow.server.handlers import (
     search_datasets_handler,
     upload_artifact_handler,
 )
+from mlflow.store.db.read_replica import set_caller_id
+from mlflow.tracking.request_header.default_request_header_provider import (
+    MLFLOW_CLIENT_ID_HEADER,
+)
 from mlflow.utils.os import is_windows
 from mlflow.utils.plugins import get_entry_points
 from mlflow.utils.process import _exec_cmd
@@ -59,6 +63,14 @@ if os.getenv(PROMETHEUS_EXPORTER_ENV_VAR):
     activate_prometheus_exporter(app)
 
 
+@app.before_request
+def _set_read_replica_caller_id():
+    # Clients read their own writes from the primary database when the backend store has read
+    # replicas, see mlflow.store.db.read_replica. Clients that don't send their ID, e.g. the UI,
+    # are told apart by their address.
+    set_caller_id(request.headers.get(MLFLOW_CLIENT_ID_HEADER) or request.remote_addr)
+
+
 # Provide a health check endpoint to ensure the application is responsive
 @app.route("/health")
 def health():
@@ -286,6 +286,8 @@ class MlflowSearchRunsInput(graphene.InputObjectType):
     max_results = graphene.Int()
     order_by = graphene.List(graphene.String)
     page_token = graphene.String()
+    select_columns = graphene.Boolean()
+    columns = graphene.List(graphene.String)
 
 
 class MlflowGetRunInput(graphene.InputObjectType):
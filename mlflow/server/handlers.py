@@ -36,6 +36,7 @@ from mlflow.entities.logged_model_tag import LoggedModelTag
 from mlflow.entities.model_registry import ModelVersionTag, RegisteredModelTag
 from mlflow.entities.model_registry.prompt import IS_PROMPT_TAG_KEY
 from mlflow.entities.multipart_upload import MultipartUploadPart
+from mlflow.entities.trace_data import TraceData
 from mlflow.entities.trace_info import TraceInfo
 from mlflow.entities.trace_status import TraceStatus
 from mlflow.environment_variables import MLFLOW_DEPLOYMENTS_TARGET
@@ -1048,6 +1049,8 @@ def _search_runs():
                 lambda x: _assert_less_than_or_equal(int(x), 50000),
             ],
             "order_by": [_assert_array, _assert_item_type_string],
+            "select_columns": [_assert_bool],
+            "columns": [_assert_array, _assert_item_type_string],
         },
     )
     response_message = search_runs_impl(request_message)
@@ -1066,8 +1069,15 @@ def search_runs_impl(request_message):
     experiment_ids = request_message.experiment_ids
     order_by = request_message.order_by
     page_token = request_message.page_token
+    columns = list(request_message.columns) if request_message.select_columns else None
     run_entities = _get_tracking_store().search_runs(
-        experiment_ids, filter_string, run_view_type, max_results, order_by, page_token
+        experiment_ids,
+        filter_string,
+        run_view_type,
+        max_results,
+        order_by,
+        page_token,
+        columns=columns,
     )
     response_message.runs.extend([r.to_proto() for r in run_entities])
     if run_entities.token:
@@ -1551,33 +1561,14 @@ def upload_artifact_handler():
     run = _get_tracking_store().get_run(run_uuid)
     artifact_dir = run.info.artifact_uri
 
-    basename = posixpath.basename(path)
-    dirname = posixpath.dirname(path)
-
-    def _log_artifact_to_repo(file, run, dirname, artifact_dir):
-        if _is_servable_proxied_run_artifact_root(run.info.artifact_uri):
-            artifact_repo = _get_artifact_repo_mlflow_artifacts()
-            path_to_log = (
-                os.path.join(run.info.experiment_id, run.info.run_id, "artifacts", dirname)
-                if dirname
-                else os.path.join(run.info.experiment_id, run.info.run_id, "artifacts")
-            )
-        else:
-            artifact_repo = get_artifact_repository(artifact_dir)
-            path_to_log = dirname
-
-        artifact_repo.log_artifact(file, path_to_log)
-
-    with tempfile.TemporaryDirectory() as tmpdir:
-        dir_path = os.path.join(tmpdir, dirname) if dirname else tmpdir
-        file_path = os.path.join(dir_path, basename)
-
-        os.makedirs(dir_path, exist_ok=True)
-
-        with open(file_path, "wb") as f:
-            f.write(data)
+    if _is_servable_proxied_run_artifact_root(run.info.artifact_uri):
+        artifact_repo = _get_artifact_repo_mlflow_artifacts()
+        artifact_file = posixpath.join(run.info.experiment_id, run.info.run_id, "artifacts", path)
+    else:
+        artifact_repo = get_artifact_repository(artifact_dir)
+        artifact_file = path
 
-        _log_artifact_to_repo(file_path, run, dirname, artifact_dir)
+    artifact_repo.log_artifact_stream(io.BytesIO(data), artifact_file)
 
     return Response(mimetype="application/json")
 
@@ -2265,19 +2256,9 @@ def _upload_artifact(artifact_path):
     to `artifact_path` (a relative path from the root artifact directory).
     """
     artifact_path = validate_path_is_safe(artifact_path)
-    head, tail = posixpath.split(artifact_path)
-    with tempfile.TemporaryDirectory() as tmp_dir:
-        tmp_path = os.path.join(tmp_dir, tail)
-        with open(tmp_path, "wb") as f:
-            chunk_size = 1024 * 1024  # 1 MB
-            while True:
-                chunk = request.stream.read(chunk_size)
-                if len(chunk) == 0:
-                    break
-                f.write(chunk)
-
-        artifact_repo = _get_artifact_repo_mlflow_artifacts()
-        artifact_repo.log_artifact(tmp_path, artifact_path=head or None)
+    artifact_repo = _get_artifact_repo_mlflow_artifacts()
+    # Stream the request body to the artifact store rather than spooling it to a local file
+    artifact_repo.log_artifact_stream(request.stream, artifact_path)
 
     return _wrap_response(UploadArtifact.Response())
 
@@ -2495,17 +2476,41 @@ def _end_trace(request_id):
     request_metadata = {e.key: e.value for e in request_message.request_metadata}
     tags = {e.key: e.value for e in request_message.tags}
 
-    trace_info = _get_tracking_store().end_trace(
+    store = _get_tracking_store()
+    trace_info = store.end_trace(
         request_id=request_id,
         timestamp_ms=request_message.timestamp_ms,
         status=TraceStatus.from_proto(request_message.status),
         request_metadata=request_metadata,
         tags=tags,
     )
+    _log_trace_spans(store, trace_info)
     response_message = EndTrace.Response(trace_info=trace_info.to_proto())
     return _wrap_response(response_message)
 
 
+def _log_trace_spans(store, trace_info: TraceInfo):
+    """
+    Store the span index of an ended trace from its trace data, which clients upload before
+    ending the trace, so that the trace can be searched by span. Clients logging to the tracking
+    server cannot write the index themselves.
+    """
+    from mlflow.store.tracking.sqlalchemy_store import SqlAlchemyStore
+
+    if not isinstance(store, SqlAlchemyStore):
+        return
+
+    try:
+        trace_data = TraceData.from_dict(_get_trace_artifact_repo(trace_info).download_trace_data())
+        store.log_spans(trace_info.request_id, trace_data.spans)
+    except Exception as e:
+        # Failing to index the spans must not fail logging the trace
+        _logger.warning(
+            f"Failed to index the spans of trace {trace_info.request_id}. The trace cannot be "
+            f"searched by span. Error: {e}"
+        )
+
+
 @catch_mlflow_exception
 @_disable_if_artifacts_only
 def _get_trace_info(request_id):
@@ -2,6 +2,7 @@ import json
 import logging
 import os
 import posixpath
+import shutil
 import tempfile
 import traceback
 from abc import ABC, ABCMeta, abstractmethod
@@ -24,12 +25,17 @@ from mlflow.protos.databricks_pb2 import (
     INVALID_PARAMETER_VALUE,
     RESOURCE_DOES_NOT_EXIST,
 )
+from mlflow.store.artifact.sync_manifest import MANIFEST_FILE_NAME, SyncManifest
 from mlflow.tracing.utils.artifact_utils import TRACE_DATA_FILE_NAME
 from mlflow.utils.annotations import developer_stable
 from mlflow.utils.async_logging.async_artifacts_logging_queue import (
     AsyncArtifactsLoggingQueue,
 )
-from mlflow.utils.file_utils import ArtifactProgressBar, create_tmp_dir
+from mlflow.utils.file_utils import (
+    ArtifactProgressBar,
+    create_tmp_dir,
+    relative_path_to_artifact_path,
+)
 from mlflow.utils.validation import bad_path_message, path_not_unique
 
 # Constants used to determine max level of parallelism to use while uploading/downloading artifacts.
@@ -41,6 +47,8 @@ assert _NUM_MAX_THREADS >= _NUM_MAX_THREADS_PER_CPU
 assert _NUM_MAX_THREADS_PER_CPU > 0
 # Default number of CPUs to assume on the machine if unavailable to fetch it using os.cpu_count()
 _NUM_DEFAULT_CPUS = _NUM_MAX_THREADS // _NUM_MAX_THREADS_PER_CPU
+# Size of the chunks read from streams passed to `ArtifactRepository.log_artifact_stream`
+_STREAM_CHUNK_SIZE = 1024 * 1024  # 1 MB
 _logger = logging.getLogger(__name__)
 
 
@@ -51,6 +59,14 @@ def _truncate_error(err: str, max_length: int = 10_000) -> str:
     return err[:half] + "\n\n*** Error message is too long, truncated ***\n\n" + err[-half:]
 
 
+def _link_or_copy(src: str, dst: str):
+    try:
+        os.link(src, dst)
+    except OSError:
+        # Hard links are not supported across file systems and on some file systems
+        shutil.copy2(src, dst)
+
+
 def _retry_with_new_creds(try_func, creds_func, orig_creds=None):
     """
     Attempt the try_func with the original credentials (og_creds) if provided, or by generating the
@@ -127,6 +143,27 @@ class ArtifactRepository:
                 artifact.
         """
 
+    def log_artifact_stream(self, fileobj, artifact_file):
+        """
+        Log the content of a binary file-like object as an artifact, reading it in chunks so that
+        artifacts of any size can be logged with bounded memory.
+
+        The default implementation spools the stream to a local temporary file and logs it with
+        :py:meth:`log_artifact`. Repositories that can upload directly from a stream override it
+        so that no local scratch space is needed.
+
+        Args:
+            fileobj: A binary file-like object to read the artifact content from.
+            artifact_file: The run-relative artifact file path in posixpath format to which the
+                content is saved (e.g. "dir/file.bin").
+        """
+        artifact_path, file_name = posixpath.split(artifact_file)
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            tmp_path = os.path.join(tmp_dir, file_name)
+            with open(tmp_path, "wb") as f:
+                shutil.copyfileobj(fileobj, f, _STREAM_CHUNK_SIZE)
+            self.log_artifact(tmp_path, artifact_path or None)
+
     def _log_artifact_async(self, filename, artifact_path=None, artifact=None):
         """
         Asynchronously log a local file as an artifact, optionally taking an ``artifact_path`` to
@@ -230,6 +267,29 @@ class ArtifactRepository:
             else:
                 yield file_info
 
+    def list_artifacts_recursive(self, path: Optional[str] = None) -> list[FileInfo]:
+        """
+        Return all the files under path, at any depth. Directories that contain no file are
+        returned as directories so that they can be recreated. If path is a file, returns an
+        empty list.
+
+        The default implementation lists each directory level with ``list_artifacts``.
+        Repositories backed by object stores override it to list all the objects under path at
+        once, with a prefix listing that does not group objects by directory.
+
+        Args:
+            path: Relative source path that contains desired artifacts.
+
+        Returns:
+            List of artifacts as FileInfo listed under path, at any depth.
+        """
+        return [
+            file_info
+            for file_info in self._iter_artifacts_recursive(path)
+            # `_iter_artifacts_recursive` yields path itself when it has no content
+            if file_info.path != path
+        ]
+
     def download_artifacts(self, artifact_path, dst_path=None):
         """
         Download an artifact file or directory to a local directory if applicable, and return a
@@ -268,30 +328,42 @@ class ArtifactRepository:
         else:
             dst_path = create_tmp_dir()
 
-        def _download_file(src_artifact_path, dst_local_dir_path):
-            dst_local_file_path = self._create_download_destination(
-                src_artifact_path=src_artifact_path, dst_local_dir_path=dst_local_dir_path
-            )
-            return self.thread_pool.submit(
-                self._download_file,
-                remote_file_path=src_artifact_path,
-                local_path=dst_local_file_path,
-            )
-
         # Submit download tasks
         futures = {}
         if self._is_directory(artifact_path):
-            for file_info in self._iter_artifacts_recursive(artifact_path):
+            for file_info in self.list_artifacts_recursive(artifact_path):
                 if file_info.is_dir:  # Empty directory
                     os.makedirs(os.path.join(dst_path, file_info.path), exist_ok=True)
                 else:
-                    fut = _download_file(file_info.path, dst_path)
+                    fut = self._submit_download(file_info.path, dst_path, file_info.file_size)
                     futures[fut] = file_info.path
         else:
-            fut = _download_file(artifact_path, dst_path)
+            fut = self._submit_download(artifact_path, dst_path)
             futures[fut] = artifact_path
 
-        # Wait for downloads to complete and collect failures
+        self._wait_for_downloads(futures)
+        return os.path.join(dst_path, artifact_path)
+
+    def _submit_download(self, src_artifact_path, dst_local_dir_path, file_size=None):
+        dst_local_file_path = self._create_download_destination(
+            src_artifact_path=src_artifact_path, dst_local_dir_path=dst_local_dir_path
+        )
+        return self.thread_pool.submit(
+            self._download_file_with_size,
+            remote_file_path=src_artifact_path,
+            local_path=dst_local_file_path,
+            file_size=file_size,
+        )
+
+    def _wait_for_downloads(self, futures):
+        """
+        Wait for the downloads submitted with ``_submit_download`` to complete, and raise an
+        exception listing the failed downloads if any.
+
+        Args:
+            futures: Dictionary mapping the futures of the downloads to the paths of the
+                downloaded artifacts.
+        """
         failed_downloads = {}
         tracebacks = {}
         with ArtifactProgressBar.files(desc="Downloading artifacts", total=len(futures)) as pbar:
@@ -321,7 +393,95 @@ class ArtifactRepository:
                 )
             )
 
-        return os.path.join(dst_path, artifact_path)
+    def log_artifacts_incremental(self, local_dir, artifact_path=None) -> list[str]:
+        """
+        Log the files in the specified local directory like ``log_artifacts``, but only upload
+        the files that changed since the last incremental upload to the same artifact path.
+
+        The size, modification time and SHA-256 digest of the logged files are recorded in a
+        manifest file (``.mlflow-sync-manifest.json``) stored with the artifacts. A file is
+        uploaded if it is not in the manifest or if its size or digest differ from the manifest,
+        and its digest is only computed if its size or modification time differ from the
+        manifest. Artifacts whose local file was deleted are kept.
+
+        Args:
+            local_dir: Directory of local artifacts to log.
+            artifact_path: Directory within the run's artifact directory in which to log the
+                artifacts.
+
+        Returns:
+            The paths of the uploaded files, relative to ``local_dir``.
+        """
+        artifact_path = artifact_path or ""
+        manifest = self._read_sync_manifest(artifact_path)
+        local_dir = os.path.abspath(local_dir)
+        changed_files = []
+        for root, _, filenames in os.walk(local_dir):
+            for name in filenames:
+                local_file = os.path.join(root, name)
+                rel_path = relative_path_to_artifact_path(os.path.relpath(local_file, local_dir))
+                if rel_path != MANIFEST_FILE_NAME and manifest.update(rel_path, local_file):
+                    changed_files.append(rel_path)
+
+        if changed_files:
+            # Stage the changed files in a directory, so that they are uploaded with the
+            # (possibly parallelized) `log_artifacts` implementation of the repository
+            with tempfile.TemporaryDirectory() as staging_dir:
+                for rel_path in changed_files:
+                    staged_file = os.path.join(staging_dir, rel_path)
+                    os.makedirs(os.path.dirname(staged_file), exist_ok=True)
+                    _link_or_copy(os.path.join(local_dir, rel_path), staged_file)
+                self.log_artifacts(staging_dir, artifact_path or None)
+
+        if manifest.modified:
+            with tempfile.TemporaryDirectory() as tmp_dir:
+                manifest_file = os.path.join(tmp_dir, MANIFEST_FILE_NAME)
+                manifest.write(manifest_file)
+                self.log_artifact(manifest_file, artifact_path or None)
+
+        return changed_files
+
+    def download_artifacts_incremental(self, artifact_path, dst_path) -> list[str]:
+        """
+        Download an artifact directory logged with ``log_artifacts_incremental`` to a local
+        directory like ``download_artifacts``, but skip the files that already exist in the local
+        directory with the size and SHA-256 digest recorded in the manifest of the artifacts.
+
+        Args:
+            artifact_path: Relative source path to the desired artifact directory.
+            dst_path: Absolute path of the local filesystem destination directory, which must
+                already exist. Like with ``download_artifacts``, the artifacts are downloaded to
+                ``<dst_path>/<artifact_path>``.
+
+        Returns:
+            The paths of the downloaded artifacts.
+        """
+        artifact_path = artifact_path or ""
+        dst_path = os.path.abspath(dst_path)
+        manifest = self._read_sync_manifest(artifact_path)
+        futures = {}
+        for file_info in self.list_artifacts_recursive(artifact_path):
+            local_path = os.path.join(dst_path, file_info.path)
+            if file_info.is_dir:  # Empty directory
+                os.makedirs(local_path, exist_ok=True)
+                continue
+            rel_path = posixpath.relpath(file_info.path, artifact_path or ".")
+            if rel_path == MANIFEST_FILE_NAME or manifest.matches(rel_path, local_path):
+                continue
+            fut = self._submit_download(file_info.path, dst_path, file_info.file_size)
+            futures[fut] = file_info.path
+
+        self._wait_for_downloads(futures)
+        return sorted(futures.values())
+
+    def _read_sync_manifest(self, artifact_path) -> SyncManifest:
+        manifest_path = posixpath.join(artifact_path, MANIFEST_FILE_NAME)
+        if not any(info.path == manifest_path for info in self.list_artifacts(artifact_path)):
+            return SyncManifest()
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            local_path = os.path.join(tmp_dir, MANIFEST_FILE_NAME)
+            self._download_file(remote_file_path=manifest_path, local_path=local_path)
+            return SyncManifest.read(local_path)
 
     @abstractmethod
     def _download_file(self, remote_file_path, local_path):
@@ -335,6 +495,14 @@ class ArtifactRepository:
             local_path: The path to which to save the downloaded file.
         """
 
+    def _download_file_with_size(self, remote_file_path, local_path, file_size=None):
+        """
+        Download the file like ``_download_file``, given its size in bytes when it is already
+        known from listing its directory. Repositories that need the size of a file to download it
+        override this method to avoid listing its directory again.
+        """
+        self._download_file(remote_file_path=remote_file_path, local_path=local_path)
+
     def delete_artifacts(self, artifact_path=None):
         """
         Delete the artifacts at the specified location.
@@ -119,6 +119,12 @@ class AzureBlobArtifactRepository(ArtifactRepository, MultipartUploadMixin):
                 dest_path, file, overwrite=True, timeout=self.write_timeout
             )
 
+    def log_artifact_stream(self, fileobj, artifact_file):
+        (container, _, dest_path, _) = self.parse_wasbs_uri(self.artifact_uri)
+        container_client = self.client.get_container_client(container)
+        dest_path = posixpath.join(dest_path, artifact_file)
+        container_client.upload_blob(dest_path, fileobj, overwrite=True, timeout=self.write_timeout)
+
     def log_artifacts(self, local_dir, artifact_path=None):
         (container, _, dest_path, _) = self.parse_wasbs_uri(self.artifact_uri)
         container_client = self.client.get_container_client(container)
@@ -188,6 +194,32 @@ class AzureBlobArtifactRepository(ArtifactRepository, MultipartUploadMixin):
             return []
         return sorted(infos, key=lambda f: f.path)
 
+    def list_artifacts_recursive(self, path=None):
+        (container, _, artifact_path, _) = self.parse_wasbs_uri(self.artifact_uri)
+        container_client = self.client.get_container_client(container)
+        dest_path = artifact_path
+        if path:
+            dest_path = posixpath.join(dest_path, path)
+        prefix = dest_path if dest_path.endswith("/") else dest_path + "/"
+
+        infos = []
+        # Unlike `walk_blobs`, `list_blobs` lists the blobs at any depth
+        for result in container_client.list_blobs(name_starts_with=prefix):
+            if result.name == prefix:
+                continue
+            if not result.name.startswith(artifact_path):
+                raise MlflowException(
+                    "The name of the listed Azure blob does not begin with the specified"
+                    f" artifact path. Artifact path: {artifact_path}. Blob name: {result.name}"
+                )
+            file_name = posixpath.relpath(path=result.name, start=artifact_path)
+            if result.name.endswith("/"):
+                infos.append(FileInfo(file_name, is_dir=True, file_size=None))
+            else:
+                infos.append(FileInfo(file_name, is_dir=False, file_size=result.size))
+
+        return sorted(infos, key=lambda f: f.path)
+
     def _download_file(self, remote_file_path, local_path):
         (container, _, remote_root_path, _) = self.parse_wasbs_uri(self.artifact_uri)
         container_client = self.client.get_container_client(container)
@@ -1,10 +1,12 @@
 import logging
+import os
 
 import click
 
 from mlflow.artifacts import download_artifacts as _download_artifacts
 from mlflow.store.artifact.artifact_repository_registry import get_artifact_repository
 from mlflow.tracking import _get_store
+from mlflow.tracking.artifact_utils import _get_root_uri_and_artifact_path
 from mlflow.utils.proto_json_utils import message_to_json
 
 _logger = logging.getLogger(__name__)
@@ -53,7 +55,15 @@ def log_artifact(local_file, run_id, artifact_path):
     help="If specified, we will log the artifact into this subdirectory of the "
     + "run's artifact directory.",
 )
-def log_artifacts(local_dir, run_id, artifact_path):
+@click.option(
+    "--incremental",
+    is_flag=True,
+    default=False,
+    help="Only upload the files that changed since the last incremental upload to the same "
+    "artifact path, according to a manifest of file sizes, modification times and SHA-256 "
+    "digests stored with the artifacts.",
+)
+def log_artifacts(local_dir, run_id, artifact_path, incremental):
     """
     Log the files within a local directory as an artifact of a run, optionally
     within a run-specific artifact path. Run artifacts can be organized into
@@ -62,6 +72,15 @@ def log_artifacts(local_dir, run_id, artifact_path):
     store = _get_store()
     artifact_uri = store.get_run(run_id).info.artifact_uri
     artifact_repo = get_artifact_repository(artifact_uri)
+    if incremental:
+        uploaded_files = artifact_repo.log_artifacts_incremental(local_dir, artifact_path)
+        _logger.info(
+            "Logged %d changed files from local dir %s to artifact_path=%s",
+            len(uploaded_files),
+            local_dir,
+            artifact_path,
+        )
+        return
     artifact_repo.log_artifacts(local_dir, artifact_path)
     _logger.info("Logged artifact from local dir %s to artifact_path=%s", local_dir, artifact_path)
 
@@ -116,7 +135,15 @@ def _file_infos_to_json(file_infos):
         " path is returned directly"
     ),
 )
-def download_artifacts(run_id, artifact_path, artifact_uri, dst_path):
+@click.option(
+    "--incremental",
+    is_flag=True,
+    default=False,
+    help="Skip the files that already exist in the destination directory with the size and "
+    "SHA-256 digest recorded by an incremental upload (`mlflow artifacts log-artifacts "
+    "--incremental`). Requires --dst-path.",
+)
+def download_artifacts(run_id, artifact_path, artifact_uri, dst_path, incremental):
     """
     Download an artifact file or directory to a local directory.
     The output is the name of the file or directory on the local filesystem.
@@ -131,6 +158,23 @@ def download_artifacts(run_id, artifact_path, artifact_uri, dst_path):
         run_id = None
         artifact_path = None
 
+    if incremental:
+        if dst_path is None:
+            raise click.UsageError("--dst-path must be specified with --incremental")
+        if artifact_uri is not None:
+            root_uri, artifact_path = _get_root_uri_and_artifact_path(artifact_uri)
+        elif run_id is not None:
+            root_uri = _get_store().get_run(run_id).info.artifact_uri
+            artifact_path = artifact_path or ""
+        else:
+            raise click.UsageError("Either --artifact-uri or --run-id must be specified")
+        os.makedirs(dst_path, exist_ok=True)
+        artifact_repo = get_artifact_repository(root_uri)
+        downloaded = artifact_repo.download_artifacts_incremental(artifact_path, dst_path)
+        _logger.info("Downloaded %d changed files to %s", len(downloaded), dst_path)
+        click.echo(f"\n{os.path.join(os.path.abspath(dst_path), artifact_path)}")
+        return
+
     downloaded_local_artifact_location = _download_artifacts(
         artifact_uri=artifact_uri, run_id=run_id, artifact_path=artifact_path, dst_path=dst_path
     )
@@ -272,16 +272,22 @@ class CloudArtifactRepository(ArtifactRepository):
                     message=("All retries have been exhausted. Download has failed.")
                 )
 
-    def _download_file(self, remote_file_path, local_path):
-        # list_artifacts API only returns a list of FileInfos at the specified path
-        # if it's a directory. To get file size, we need to iterate over FileInfos
-        # contained by the parent directory. A bad path could result in there being
-        # no matching FileInfos (by path), so fall back to None size to prevent
-        # parallelized download.
-        parent_dir = posixpath.dirname(remote_file_path)
-        file_infos = self.list_artifacts(parent_dir)
-        file_info = [info for info in file_infos if info.path == remote_file_path]
-        file_size = file_info[0].file_size if len(file_info) == 1 else None
+    def _download_file_with_size(self, remote_file_path, local_path, file_size=None):
+        self._download_file(
+            remote_file_path=remote_file_path, local_path=local_path, file_size=file_size
+        )
+
+    def _download_file(self, remote_file_path, local_path, file_size=None):
+        if file_size is None:
+            # list_artifacts API only returns a list of FileInfos at the specified path
+            # if it's a directory. To get file size, we need to iterate over FileInfos
+            # contained by the parent directory. A bad path could result in there being
+            # no matching FileInfos (by path), so fall back to None size to prevent
+            # parallelized download.
+            parent_dir = posixpath.dirname(remote_file_path)
+            file_infos = self.list_artifacts(parent_dir)
+            file_info = [info for info in file_infos if info.path == remote_file_path]
+            file_size = file_info[0].file_size if len(file_info) == 1 else None
 
         # NB: FUSE mounts do not support file write from a non-0th index seek position.
         # Due to this limitation (writes must start at the beginning of a file),
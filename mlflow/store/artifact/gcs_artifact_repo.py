@@ -102,6 +102,15 @@ class GCSArtifactRepository(ArtifactRepository, MultipartUploadMixin):
         blob = gcs_bucket.blob(dest_path, chunk_size=self._GCS_UPLOAD_CHUNK_SIZE)
         blob.upload_from_filename(local_file, timeout=self._GCS_DEFAULT_TIMEOUT)
 
+    def log_artifact_stream(self, fileobj, artifact_file):
+        (bucket, dest_path) = self.parse_gcs_uri(self.artifact_uri)
+        dest_path = posixpath.join(dest_path, artifact_file)
+
+        gcs_bucket = self._get_bucket(bucket)
+        # Streams of unknown size are sent as a resumable upload, one chunk at a time
+        blob = gcs_bucket.blob(dest_path, chunk_size=self._GCS_UPLOAD_CHUNK_SIZE)
+        blob.upload_from_file(fileobj, timeout=self._GCS_DEFAULT_TIMEOUT)
+
     def log_artifacts(self, local_dir, artifact_path=None):
         (bucket, dest_path) = self.parse_gcs_uri(self.artifact_uri)
         if artifact_path:
@@ -154,6 +163,26 @@ class GCSArtifactRepository(ArtifactRepository, MultipartUploadMixin):
 
         return sorted(infos, key=lambda f: f.path)
 
+    def list_artifacts_recursive(self, path=None):
+        (bucket, artifact_path) = self.parse_gcs_uri(self.artifact_uri)
+        dest_path = artifact_path
+        if path:
+            dest_path = posixpath.join(dest_path, path)
+        prefix = dest_path if dest_path.endswith("/") else dest_path + "/"
+
+        infos = []
+        # Without delimiter, blobs are listed at any depth rather than one directory level
+        for result in self._get_bucket(bucket).list_blobs(prefix=prefix):
+            if result.name == prefix:
+                continue
+            blob_path = result.name[len(artifact_path) + 1 :]
+            if blob_path.endswith("/"):
+                infos.append(FileInfo(blob_path[:-1], True, None))
+            else:
+                infos.append(FileInfo(blob_path, False, result.size))
+
+        return sorted(infos, key=lambda f: f.path)
+
     def _list_folders(self, bkt, prefix, artifact_path):
         results = bkt.list_blobs(prefix=prefix, delimiter="/")
         dir_paths = set()
@@ -1,8 +1,10 @@
 import os
+import posixpath
 import shutil
 from typing import Any
 
 from mlflow.store.artifact.artifact_repo import (
+    _STREAM_CHUNK_SIZE,
     ArtifactRepository,
     try_read_trace_data,
     verify_artifact_path,
@@ -46,6 +48,19 @@ class LocalArtifactRepository(ArtifactRepository):
         except shutil.SameFileError:
             pass
 
+    def log_artifact_stream(self, fileobj, artifact_file):
+        artifact_path, file_name = posixpath.split(artifact_file)
+        verify_artifact_path(artifact_path or None)
+        artifact_dir = (
+            os.path.join(self.artifact_dir, os.path.normpath(artifact_path))
+            if artifact_path
+            else self.artifact_dir
+        )
+        if not os.path.exists(artifact_dir):
+            mkdir(artifact_dir)
+        with open(os.path.join(artifact_dir, file_name), "wb") as f:
+            shutil.copyfileobj(fileobj, f, _STREAM_CHUNK_SIZE)
+
     def _is_directory(self, artifact_path):
         # NOTE: The path is expected to be in posix format.
         # Posix paths work fine on windows but just in case we normalize it here.
@@ -20,7 +20,7 @@ from mlflow.store.artifact.cloud_artifact_repo import (
     _compute_num_chunks,
     _validate_chunk_size_aws,
 )
-from mlflow.store.artifact.s3_artifact_repo import _get_s3_client
+from mlflow.store.artifact.s3_artifact_repo import _get_s3_client, _list_artifacts_recursive
 from mlflow.utils.file_utils import read_chunk
 from mlflow.utils.request_utils import cloud_storage_http_request
 from mlflow.utils.rest_utils import augmented_raise_for_status
@@ -302,6 +302,9 @@ class OptimizedS3ArtifactRepository(CloudArtifactRepository):
                 infos.append(FileInfo(file_rel_path, False, file_size))
         return sorted(infos, key=lambda f: f.path)
 
+    def list_artifacts_recursive(self, path=None):
+        return _list_artifacts_recursive(self._get_s3_client(), self.bucket, self.bucket_path, path)
+
     @staticmethod
     def _verify_listed_object_contains_artifact_path_prefix(listed_object_path, artifact_path):
         if not listed_object_path.startswith(artifact_path):
@@ -13,18 +13,25 @@ from mlflow.entities.multipart_upload import (
 )
 from mlflow.environment_variables import (
     MLFLOW_BOTO_CLIENT_ADDRESSING_STYLE,
+    MLFLOW_MULTIPART_UPLOAD_CHUNK_SIZE,
     MLFLOW_S3_ENDPOINT_URL,
     MLFLOW_S3_IGNORE_TLS,
     MLFLOW_S3_UPLOAD_EXTRA_ARGS,
 )
 from mlflow.exceptions import MlflowException
 from mlflow.store.artifact.artifact_repo import (
+    _NUM_MAX_THREADS,
     ArtifactRepository,
     MultipartUploadMixin,
 )
-from mlflow.utils.file_utils import relative_path_to_artifact_path
+from mlflow.utils.file_utils import ArtifactProgressBar, relative_path_to_artifact_path
 
 _MAX_CACHE_SECONDS = 300
+# S3 rejects multipart uploads with parts smaller than 5 MB (except for the last part)
+_MIN_MULTIPART_CHUNK_SIZE = 5 * 1024**2
+# `log_artifacts` uploads small files and the parts of large files concurrently, each bounded by
+# the number of workers of the artifact repository, so the connection pool is sized to fit both
+_MAX_POOL_CONNECTIONS = 2 * _NUM_MAX_THREADS
 
 
 def _get_utcnow_timestamp():
@@ -69,7 +76,9 @@ def _cached_get_s3_client(
     return boto3.client(
         "s3",
         config=Config(
-            signature_version=signature_version, s3={"addressing_style": addressing_style}
+            signature_version=signature_version,
+            s3={"addressing_style": addressing_style},
+            max_pool_connections=_MAX_POOL_CONNECTIONS,
         ),
         endpoint_url=s3_endpoint_url,
         verify=verify,
@@ -120,6 +129,38 @@ def _get_s3_client(
     )
 
 
+def _list_artifacts_recursive(s3_client, bucket, artifact_path, path=None):
+    """
+    Lists all the objects under ``path`` with a prefix listing without delimiter, which returns
+    the objects at any depth instead of one directory level per request.
+    """
+    dest_path = artifact_path
+    if path:
+        dest_path = posixpath.join(dest_path, path)
+    dest_path = dest_path.rstrip("/") if dest_path else ""
+    prefix = dest_path + "/" if dest_path else ""
+    infos = []
+    paginator = s3_client.get_paginator("list_objects_v2")
+    for result in paginator.paginate(Bucket=bucket, Prefix=prefix):
+        for obj in result.get("Contents", []):
+            key = obj.get("Key")
+            # Skip the placeholder object of the listed directory
+            if key == prefix:
+                continue
+            if not key.startswith(artifact_path):
+                raise MlflowException(
+                    "The path of the listed S3 object does not begin with the specified"
+                    f" artifact path. Artifact path: {artifact_path}. Object path: {key}."
+                )
+            rel_path = posixpath.relpath(path=key, start=artifact_path)
+            if key.endswith("/"):
+                # Placeholder object of a directory, which may have no file
+                infos.append(FileInfo(rel_path, True, None))
+            else:
+                infos.append(FileInfo(rel_path, False, int(obj.get("Size"))))
+    return sorted(infos, key=lambda f: f.path)
+
+
 class S3ArtifactRepository(ArtifactRepository, MultipartUploadMixin):
     """Stores artifacts on Amazon S3."""
 
@@ -156,9 +197,9 @@ class S3ArtifactRepository(ArtifactRepository, MultipartUploadMixin):
         else:
             return None
 
-    def _upload_file(self, s3_client, local_file, bucket, key):
+    def _get_upload_extra_args(self, file_name):
         extra_args = {}
-        guessed_type, guessed_encoding = guess_type(local_file)
+        guessed_type, guessed_encoding = guess_type(file_name)
         if guessed_type is not None:
             extra_args["ContentType"] = guessed_type
         if guessed_encoding is not None:
@@ -166,7 +207,38 @@ class S3ArtifactRepository(ArtifactRepository, MultipartUploadMixin):
         environ_extra_args = self.get_s3_file_upload_extra_args()
         if environ_extra_args is not None:
             extra_args.update(environ_extra_args)
-        s3_client.upload_file(Filename=local_file, Bucket=bucket, Key=key, ExtraArgs=extra_args)
+        return extra_args
+
+    @staticmethod
+    def _get_multipart_chunk_size():
+        return max(MLFLOW_MULTIPART_UPLOAD_CHUNK_SIZE.get(), _MIN_MULTIPART_CHUNK_SIZE)
+
+    def _get_transfer_config(self, max_concurrency):
+        """
+        Returns the boto3 transfer configuration for uploads. Files of at least
+        ``MLFLOW_MULTIPART_UPLOAD_CHUNK_SIZE`` bytes are uploaded in parts of that size, with up to
+        ``max_concurrency`` parts in flight. With ``max_concurrency=1``, the upload runs on the
+        calling thread.
+        """
+        from boto3.s3.transfer import TransferConfig
+
+        chunk_size = self._get_multipart_chunk_size()
+        return TransferConfig(
+            multipart_threshold=chunk_size,
+            multipart_chunksize=chunk_size,
+            max_concurrency=max_concurrency,
+            use_threads=max_concurrency > 1,
+        )
+
+    def _upload_file(self, s3_client, local_file, bucket, key, transfer_config=None):
+        extra_args = self._get_upload_extra_args(local_file)
+        s3_client.upload_file(
+            Filename=local_file,
+            Bucket=bucket,
+            Key=key,
+            ExtraArgs=extra_args,
+            Config=transfer_config or self._get_transfer_config(self.max_workers),
+        )
 
     def log_artifact(self, local_file, artifact_path=None):
         (bucket, dest_path) = self.parse_s3_compliant_uri(self.artifact_uri)
@@ -177,12 +249,32 @@ class S3ArtifactRepository(ArtifactRepository, MultipartUploadMixin):
             s3_client=self._get_s3_client(), local_file=local_file, bucket=bucket, key=dest_path
         )
 
+    def log_artifact_stream(self, fileobj, artifact_file):
+        (bucket, dest_path) = self.parse_s3_compliant_uri(self.artifact_uri)
+        dest_path = posixpath.join(dest_path, artifact_file)
+        # `upload_fileobj` reads the stream in chunks and switches to a multipart upload for large
+        # streams, so memory usage is bounded by the transfer configuration
+        self._get_s3_client().upload_fileobj(
+            Fileobj=fileobj,
+            Bucket=bucket,
+            Key=dest_path,
+            ExtraArgs=self._get_upload_extra_args(artifact_file),
+        )
+
     def log_artifacts(self, local_dir, artifact_path=None):
+        """
+        Parallelized implementation of `log_artifacts`. Files smaller than the multipart chunk
+        size are uploaded concurrently by the thread pool of the repository, while larger files
+        are uploaded one at a time with their parts uploaded concurrently.
+        """
         (bucket, dest_path) = self.parse_s3_compliant_uri(self.artifact_uri)
         if artifact_path:
             dest_path = posixpath.join(dest_path, artifact_path)
         s3_client = self._get_s3_client()
         local_dir = os.path.abspath(local_dir)
+        small_files = []
+        large_files = []
+        chunk_size = self._get_multipart_chunk_size()
         for root, _, filenames in os.walk(local_dir):
             upload_path = dest_path
             if root != local_dir:
@@ -191,12 +283,55 @@ class S3ArtifactRepository(ArtifactRepository, MultipartUploadMixin):
                 upload_path = posixpath.join(dest_path, rel_path)
 
             for f in filenames:
-                self._upload_file(
-                    s3_client=s3_client,
-                    local_file=os.path.join(root, f),
-                    bucket=bucket,
-                    key=posixpath.join(upload_path, f),
+                local_file = os.path.join(root, f)
+                files = large_files if os.path.getsize(local_file) >= chunk_size else small_files
+                files.append((local_file, posixpath.join(upload_path, f)))
+
+        single_part_config = self._get_transfer_config(max_concurrency=1)
+        inflight_uploads = {
+            local_file: self.thread_pool.submit(
+                self._upload_file,
+                s3_client=s3_client,
+                local_file=local_file,
+                bucket=bucket,
+                key=key,
+                transfer_config=single_part_config,
+            )
+            for local_file, key in small_files
+        }
+
+        failed_uploads = {}
+        with ArtifactProgressBar.files(
+            desc="Uploading artifacts", total=len(small_files) + len(large_files)
+        ) as pbar:
+            multipart_config = self._get_transfer_config(max_concurrency=self.max_workers)
+            for local_file, key in large_files:
+                try:
+                    self._upload_file(
+                        s3_client=s3_client,
+                        local_file=local_file,
+                        bucket=bucket,
+                        key=key,
+                        transfer_config=multipart_config,
+                    )
+                    pbar.update()
+                except Exception as e:
+                    failed_uploads[local_file] = repr(e)
+
+            for local_file, upload_future in inflight_uploads.items():
+                try:
+                    upload_future.result()
+                    pbar.update()
+                except Exception as e:
+                    failed_uploads[local_file] = repr(e)
+
+        if len(failed_uploads) > 0:
+            raise MlflowException(
+                message=(
+                    "The following failures occurred while uploading one or more artifacts"
+                    f" to {self.artifact_uri}: {failed_uploads}"
                 )
+            )
 
     def list_artifacts(self, path=None):
         (bucket, artifact_path) = self.parse_s3_compliant_uri(self.artifact_uri)
@@ -231,6 +366,10 @@ class S3ArtifactRepository(ArtifactRepository, MultipartUploadMixin):
                 infos.append(FileInfo(file_rel_path, False, file_size))
         return sorted(infos, key=lambda f: f.path)
 
+    def list_artifacts_recursive(self, path=None):
+        (bucket, artifact_path) = self.parse_s3_compliant_uri(self.artifact_uri)
+        return _list_artifacts_recursive(self._get_s3_client(), bucket, artifact_path, path)
+
     @staticmethod
     def _verify_listed_object_contains_artifact_path_prefix(listed_object_path, artifact_path):
         if not listed_object_path.startswith(artifact_path):
@@ -0,0 +1,95 @@
+"""
+Manifest of the files uploaded by ``ArtifactRepository.log_artifacts_incremental``.
+
+The manifest is stored as a JSON file next to the artifacts it describes, and records the size,
+modification time and SHA-256 digest of each file. A local file is considered unchanged if its
+size and modification time match the manifest, or, when they do not (e.g. the file was touched
+or copied from another machine), if its size and digest match the manifest.
+"""
+
+import hashlib
+import json
+import os
+from dataclasses import asdict, dataclass
+from typing import Optional
+
+MANIFEST_FILE_NAME = ".mlflow-sync-manifest.json"
+_MANIFEST_VERSION = 1
+_READ_CHUNK_SIZE = 1024 * 1024  # 1 MB
+
+
+def compute_sha256(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        while chunk := f.read(_READ_CHUNK_SIZE):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+@dataclass
+class ManifestEntry:
+    size: int
+    mtime_ns: int
+    sha256: str
+
+
+class SyncManifest:
+    """
+    Maps the paths of the synced files, relative to the synced directory, to their manifest
+    entries.
+    """
+
+    def __init__(self, entries: Optional[dict[str, ManifestEntry]] = None):
+        self.entries = entries or {}
+        # Whether the entries changed since the manifest was read
+        self.modified = False
+
+    @classmethod
+    def read(cls, path: str) -> "SyncManifest":
+        with open(path) as f:
+            data = json.load(f)
+        # A manifest written by another version is ignored, so that every file is compared by
+        # digest and the manifest is rewritten
+        if data.get("version") != _MANIFEST_VERSION:
+            return cls()
+        return cls({rel_path: ManifestEntry(**entry) for rel_path, entry in data["files"].items()})
+
+    def write(self, path: str):
+        with open(path, "w") as f:
+            json.dump(
+                {
+                    "version": _MANIFEST_VERSION,
+                    "files": {
+                        rel_path: asdict(entry) for rel_path, entry in sorted(self.entries.items())
+                    },
+                },
+                f,
+            )
+
+    def update(self, rel_path: str, local_path: str) -> bool:
+        """
+        Records the local file at ``local_path`` under ``rel_path``, and returns whether its
+        content differs from the one recorded in the manifest.
+        """
+        stat = os.stat(local_path)
+        previous = self.entries.get(rel_path)
+        if previous and (previous.size, previous.mtime_ns) == (stat.st_size, stat.st_mtime_ns):
+            return False
+
+        entry = ManifestEntry(stat.st_size, stat.st_mtime_ns, compute_sha256(local_path))
+        self.entries[rel_path] = entry
+        self.modified = True
+        return previous is None or (previous.size, previous.sha256) != (entry.size, entry.sha256)
+
+    def matches(self, rel_path: str, local_path: str) -> bool:
+        """
+        Returns whether the local file at ``local_path`` has the content recorded under
+        ``rel_path``.
+        """
+        entry = self.entries.get(rel_path)
+        return (
+            entry is not None
+            and os.path.isfile(local_path)
+            and os.path.getsize(local_path) == entry.size
+            and compute_sha256(local_path) == entry.sha256
+        )
@@ -0,0 +1,284 @@
+"""
+Routing of the read-only operations of the SQLAlchemy stores to read replicas of their database.
+
+The read replicas are configured with ``MLFLOW_SQLALCHEMYSTORE_READ_REPLICA_URIS``. The sessions
+created by the methods of a store decorated with :py:func:`read_only` are served by a replica,
+unless:
+
+- A session on the primary database is already open in the thread, e.g. when a write operation
+  reads the experiment it writes to.
+- The caller wrote something within the last
+  ``MLFLOW_SQLALCHEMYSTORE_READ_REPLICA_MAX_STALENESS_SECONDS``, so that clients read their own
+  writes. The caller is identified with :py:func:`set_caller_id`, e.g. by the tracking server from
+  the client ID header of each request, and is the current thread otherwise. Only the sessions
+  that actually wrote to the database count as writes.
+- No replica is reachable with a replication lag of at most
+  ``MLFLOW_SQLALCHEMYSTORE_READ_REPLICA_MAX_STALENESS_SECONDS``. The lag is measured for PostgreSQL
+  and MySQL replicas, and assumed to be zero for other databases.
+
+All other sessions are served by the primary database.
+"""
+
+import contextvars
+import functools
+import itertools
+import logging
+import math
+import threading
+import time
+from contextlib import contextmanager
+from typing import Optional
+
+import sqlalchemy
+from sqlalchemy import sql
+
+from mlflow.environment_variables import (
+    MLFLOW_SQLALCHEMYSTORE_READ_REPLICA_MAX_STALENESS_SECONDS,
+    MLFLOW_SQLALCHEMYSTORE_READ_REPLICA_URIS,
+)
+from mlflow.store.db.db_types import MYSQL, POSTGRES
+from mlflow.store.db.utils import _get_managed_session_maker, create_sqlalchemy_engine
+from mlflow.utils.uri import extract_db_type_from_uri
+
+_logger = logging.getLogger(__name__)
+
+# Minimum interval between two measurements of the replication lag of a replica, in seconds
+_LAG_CHECK_INTERVAL_SECONDS = 1.0
+
+# Sessions that wrote to the database are flagged with this key in their `info` dictionary
+_WROTE_KEY = "mlflow_read_replica_wrote"
+
+# The number of callers with a recent write above which the expired entries are pruned
+_MAX_WRITERS_BEFORE_PRUNING = 1000
+
+# Identifies the client on whose behalf the store is used, see `set_caller_id`
+_caller_id = contextvars.ContextVar("mlflow_read_replica_caller_id", default=None)
+
+
+def set_caller_id(caller_id: Optional[str]):
+    """
+    Sets the ID of the client on whose behalf the SQLAlchemy stores are used in the current
+    context. Reads are served by the primary database for a while after the client writes, so that
+    it reads its own writes, without affecting the reads of other clients. If no ID is set, the
+    current thread is the caller.
+    """
+    _caller_id.set(caller_id)
+
+
+def _get_caller_key():
+    caller_id = _caller_id.get()
+    return ("thread", threading.get_ident()) if caller_id is None else ("id", caller_id)
+
+
+def _flag_write(session, *args):
+    session.info[_WROTE_KEY] = True
+
+
+def _flag_write_statement(orm_execute_state):
+    if orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete:
+        _flag_write(orm_execute_state.session)
+
+
+# The lag is zero when all the received changes have been replayed, since the timestamp of the last
+# replayed transaction keeps aging while the primary database is idle
+_POSTGRES_LAG_QUERY = """
+SELECT CASE
+    WHEN NOT pg_is_in_recovery() OR pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+    ELSE EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp())
+END
+"""
+
+
+def _measure_lag_seconds(connection, db_type):
+    if db_type == POSTGRES:
+        return float(connection.execute(sql.text(_POSTGRES_LAG_QUERY)).scalar() or 0)
+    if db_type == MYSQL:
+        try:
+            status = connection.execute(sql.text("SHOW REPLICA STATUS")).mappings().first()
+            lag_column = "Seconds_Behind_Source"
+        except sqlalchemy.exc.DBAPIError:
+            # MySQL < 8.0.22
+            status = connection.execute(sql.text("SHOW SLAVE STATUS")).mappings().first()
+            lag_column = "Seconds_Behind_Master"
+        if status is None:
+            # The database is not a replica
+            return 0.0
+        lag = status[lag_column]
+        # The lag is NULL while the replication is stopped
+        return math.inf if lag is None else float(lag)
+    connection.execute(sql.text("SELECT 1"))
+    return 0.0
+
+
+class _ReadReplica:
+    def __init__(self, db_uri):
+        self.db_type = extract_db_type_from_uri(db_uri)
+        # Unlike for the primary database, the engine is not created with retries, so that an
+        # unreachable replica does not prevent the store from being created
+        self.engine = create_sqlalchemy_engine(db_uri)
+        self.ManagedSessionMaker = _get_managed_session_maker(
+            sqlalchemy.orm.sessionmaker(bind=self.engine), self.db_type
+        )
+        self._lag_seconds = math.inf
+        self._lag_measured_at = -math.inf
+        self._lag_lock = threading.Lock()
+
+    def get_lag_seconds(self):
+        """
+        Returns the replication lag of the replica, in seconds, or infinity if it is unreachable.
+        The lag is measured by at most one thread at a time, at most every
+        ``_LAG_CHECK_INTERVAL_SECONDS``, and the last measurement is returned otherwise.
+        """
+        if time.monotonic() - self._lag_measured_at >= _LAG_CHECK_INTERVAL_SECONDS:
+            if self._lag_lock.acquire(blocking=False):
+                try:
+                    self._lag_seconds = self._measure_lag_seconds()
+                    self._lag_measured_at = time.monotonic()
+                finally:
+                    self._lag_lock.release()
+        return self._lag_seconds
+
+    def _measure_lag_seconds(self):
+        try:
+            with self.engine.connect() as connection:
+                return _measure_lag_seconds(connection, self.db_type)
+        except Exception as e:
+            _logger.warning(
+                "Failed to check the read replica %s, reads are served by the primary database: %s",
+                self.engine.url.render_as_string(hide_password=True),
+                e,
+            )
+            return math.inf
+
+
+class _RoutingState(threading.local):
+    def __init__(self):
+        # Whether the sessions are created by a read-only method
+        self.read_only = False
+        # The number of sessions on the primary database that are open
+        self.primary_sessions = 0
+
+
+class ReadReplicaRouter:
+    """
+    Creates the sessions of a SQLAlchemy store, on its primary database or on one of its read
+    replicas.
+
+    Args:
+        primary_session_maker: The managed session maker of the primary database.
+        replica_uris: The database URIs of the read replicas.
+        max_staleness_seconds: How stale the data read from a replica may be, in seconds.
+    """
+
+    def __init__(self, primary_session_maker, replica_uris, max_staleness_seconds):
+        self._primary_session_maker = primary_session_maker
+        self._replicas = [_ReadReplica(uri) for uri in replica_uris]
+        self._max_staleness_seconds = max_staleness_seconds
+        # The time of the last write of each caller, see `_get_caller_key`
+        self._last_write_times = {}
+        self._last_write_times_lock = threading.Lock()
+        self._next_replica_index = itertools.count()
+        self._state = _RoutingState()
+
+    @classmethod
+    def from_env(cls, primary_session_maker) -> Optional["ReadReplicaRouter"]:
+        """
+        Returns a router to the read replicas configured with
+        ``MLFLOW_SQLALCHEMYSTORE_READ_REPLICA_URIS``, or None if there are none.
+        """
+        replica_uris = [
+            uri.strip()
+            for uri in (MLFLOW_SQLALCHEMYSTORE_READ_REPLICA_URIS.get() or "").split(",")
+            if uri.strip()
+        ]
+        if not replica_uris:
+            return None
+        return cls(
+            primary_session_maker,
+            replica_uris,
+            MLFLOW_SQLALCHEMYSTORE_READ_REPLICA_MAX_STALENESS_SECONDS.get(),
+        )
+
+    @contextmanager
+    def read_only(self):
+        """
+        Marks the sessions created within the context as used for reading only.
+        """
+        previous = self._state.read_only
+        self._state.read_only = True
+        try:
+            yield
+        finally:
+            self._state.read_only = previous
+
+    @contextmanager
+    def ManagedSessionMaker(self):
+        """
+        Provides a managed session on a read replica if possible, or on the primary database.
+        """
+        if replica := self._select_replica():
+            with replica.ManagedSessionMaker() as session:
+                yield session
+            return
+
+        state = self._state
+        state.primary_sessions += 1
+        session = None
+        try:
+            with self._primary_session_maker() as session:
+                sqlalchemy.event.listen(session, "after_flush", _flag_write)
+                sqlalchemy.event.listen(session, "do_orm_execute", _flag_write_statement)
+                yield session
+        finally:
+            state.primary_sessions -= 1
+            if session is not None:
+                sqlalchemy.event.remove(session, "after_flush", _flag_write)
+                sqlalchemy.event.remove(session, "do_orm_execute", _flag_write_statement)
+                if session.info.pop(_WROTE_KEY, False):
+                    self._record_write()
+
+    def _record_write(self):
+        now = time.monotonic()
+        with self._last_write_times_lock:
+            self._last_write_times[_get_caller_key()] = now
+            if len(self._last_write_times) > _MAX_WRITERS_BEFORE_PRUNING:
+                self._last_write_times = {
+                    key: write_time
+                    for key, write_time in self._last_write_times.items()
+                    if now - write_time < self._max_staleness_seconds
+                }
+
+    def _select_replica(self):
+        state = self._state
+        if not state.read_only or state.primary_sessions:
+            return None
+        last_write_time = self._last_write_times.get(_get_caller_key(), -math.inf)
+        if time.monotonic() - last_write_time < self._max_staleness_seconds:
+            return None
+        # Spread the reads across the replicas
+        start = next(self._next_replica_index)
+        for i in range(len(self._replicas)):
+            replica = self._replicas[(start + i) % len(self._replicas)]
+            if replica.get_lag_seconds() <= self._max_staleness_seconds:
+                return replica
+        return None
+
+    def dispose(self):
+        for replica in self._replicas:
+            replica.engine.dispose()
+
+
+def read_only(method):
+    """
+    Decorates a method of a SQLAlchemy store that does not write to the database, so that the
+    sessions it creates may be served by a read replica.
+    """
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        if self._read_replica_router is None:
+            return method(self, *args, **kwargs)
+        with self._read_replica_router.read_only():
+            return method(self, *args, **kwargs)
+
+    return wrapper
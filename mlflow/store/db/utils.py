@@ -1,12 +1,13 @@
 import logging
 import os
+import threading
 import time
 from contextlib import contextmanager
 
 import sqlalchemy
 from alembic.migration import MigrationContext
 from alembic.script import ScriptDirectory
-from sqlalchemy import sql
+from sqlalchemy import event, sql
 
 # We need to import sqlalchemy.pool to convert poolclass string to class object
 from sqlalchemy.pool import (
@@ -28,6 +29,7 @@ from mlflow.environment_variables import (
     MLFLOW_SQLALCHEMYSTORE_POOL_RECYCLE,
     MLFLOW_SQLALCHEMYSTORE_POOL_SIZE,
     MLFLOW_SQLALCHEMYSTORE_POOLCLASS,
+    MLFLOW_SQLALCHEMYSTORE_SQLITE_PERFORMANCE_MODE,
 )
 from mlflow.exceptions import MlflowException
 from mlflow.protos.databricks_pb2 import (
@@ -64,6 +66,28 @@ _logger = logging.getLogger(__name__)
 
 MAX_RETRY_COUNT = 10
 
+_SQLITE_BUSY_TIMEOUT_MS = 20000
+
+# Pragmas set on the SQLite connections of each session, unless they are set once per connection
+# in the SQLite performance mode
+_SQLITE_CONNECTION_PRAGMAS = [
+    f"PRAGMA busy_timeout = {_SQLITE_BUSY_TIMEOUT_MS};",
+    "PRAGMA case_sensitive_like = true;",
+]
+
+# Pragmas set once per connection in the SQLite performance mode. With write-ahead logging, the
+# NORMAL synchronous mode is safe from corruption, and only syncs the log at checkpoints. Foreign
+# keys are still enforced per session, since the schema migrations, which use the connections of
+# the same engine, rely on them not being enforced
+_SQLITE_PERFORMANCE_MODE_PRAGMAS = [
+    "PRAGMA journal_mode = WAL;",
+    "PRAGMA synchronous = NORMAL;",
+    *_SQLITE_CONNECTION_PRAGMAS,
+]
+
+# Key of the info dictionary of the connections holding the SQLite writer lock
+_HOLDS_SQLITE_WRITER_LOCK = "mlflow_holds_sqlite_writer_lock"
+
 
 def _get_package_dir():
     """Returns directory containing MLflow python package."""
@@ -142,15 +166,20 @@ def _get_managed_session_maker(SessionMaker, db_type):
     automatically closed when the session's associated context is exited.
     """
 
+    if db_type != SQLITE:
+        sqlite_pragmas = []
+    elif MLFLOW_SQLALCHEMYSTORE_SQLITE_PERFORMANCE_MODE.get():
+        sqlite_pragmas = ["PRAGMA foreign_keys = ON;"]
+    else:
+        sqlite_pragmas = ["PRAGMA foreign_keys = ON;", *_SQLITE_CONNECTION_PRAGMAS]
+
     @contextmanager
     def make_managed_session():
         """Provide a transactional scope around a series of operations."""
         with SessionMaker() as session:
             try:
-                if db_type == SQLITE:
-                    session.execute(sql.text("PRAGMA foreign_keys = ON;"))
-                    session.execute(sql.text("PRAGMA busy_timeout = 20000;"))
-                    session.execute(sql.text("PRAGMA case_sensitive_like = true;"))
+                for pragma in sqlite_pragmas:
+                    session.execute(sql.text(pragma))
                 yield session
                 session.commit()
             except MlflowException:
@@ -311,4 +340,82 @@ def create_sqlalchemy_engine(db_uri):
         if connect_args:
             kwargs["connect_args"] = connect_args
 
-    return sqlalchemy.create_engine(db_uri, pool_pre_ping=True, **kwargs)
+    engine = sqlalchemy.create_engine(db_uri, pool_pre_ping=True, **kwargs)
+    if engine.dialect.name == SQLITE and MLFLOW_SQLALCHEMYSTORE_SQLITE_PERFORMANCE_MODE.get():
+        _enable_sqlite_performance_mode(engine)
+    return engine
+
+
+class _SQLiteWriterLock:
+    """
+    Queues the write transactions of the connections of a SQLite engine. SQLite allows a single
+    writer at a time, and writers waiting for it poll for its write lock with growing sleeps,
+    whereas the writers waiting for this lock resume as soon as it is released. Connections of the
+    same thread share the lock, so that a thread writing with several connections does not wait
+    for itself. Writers that cannot acquire the lock within the SQLite busy timeout proceed without
+    it, and are left to the busy timeout of SQLite.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._owner = None
+        self._count = 0
+
+    def acquire(self):
+        if self._owner == threading.get_ident():
+            self._count += 1
+            return True
+        if not self._lock.acquire(timeout=_SQLITE_BUSY_TIMEOUT_MS / 1000):
+            return False
+        self._owner = threading.get_ident()
+        self._count = 1
+        return True
+
+    def release(self):
+        self._count -= 1
+        if self._count == 0:
+            self._owner = None
+            self._lock.release()
+
+
+def _is_sqlite_read_statement(statement):
+    return statement.lstrip()[:6].upper() in ("SELECT", "PRAGMA")
+
+
+def _enable_sqlite_performance_mode(engine):
+    """
+    Sets the pragmas of the SQLite performance mode on each new connection of the engine, and
+    queues its write transactions. See ``MLFLOW_SQLALCHEMYSTORE_SQLITE_PERFORMANCE_MODE``.
+    """
+    writer_lock = _SQLiteWriterLock()
+
+    @event.listens_for(engine, "connect")
+    def set_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            for pragma in _SQLITE_PERFORMANCE_MODE_PRAGMAS:
+                cursor.execute(pragma)
+        finally:
+            cursor.close()
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def acquire_writer_lock(conn, cursor, statement, parameters, context, executemany):
+        # A connection that timed out waiting for the lock does not wait for it again until the
+        # end of its transaction
+        if _HOLDS_SQLITE_WRITER_LOCK not in conn.info and not _is_sqlite_read_statement(statement):
+            conn.info[_HOLDS_SQLITE_WRITER_LOCK] = writer_lock.acquire()
+
+    def release_writer_lock(connection_info):
+        if connection_info.pop(_HOLDS_SQLITE_WRITER_LOCK, False):
+            writer_lock.release()
+
+    @event.listens_for(engine, "commit")
+    @event.listens_for(engine, "rollback")
+    def release_writer_lock_at_transaction_end(conn):
+        release_writer_lock(conn.info)
+
+    # Connections returned to the pool without committing or rolling back are reset by the pool,
+    # which does not emit the rollback event of the engine
+    @event.listens_for(engine, "checkin")
+    def release_writer_lock_at_checkin(dbapi_connection, connection_record):
+        release_writer_lock(connection_record.info)
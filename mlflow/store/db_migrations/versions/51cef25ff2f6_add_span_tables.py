@@ -0,0 +1,65 @@
+"""add span tables
+
+Revision ID: 51cef25ff2f6
+Revises: 6953534de441
+Create Date: 2026-10-19 10:12:43.518204
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "51cef25ff2f6"
+down_revision = "6953534de441"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # The spans of the existing traces are not backfilled, as their data is stored in artifacts.
+    # Searching by span in experiments without indexed spans raises an error.
+    op.create_table(
+        "spans",
+        sa.Column("request_id", sa.String(length=50), nullable=False),
+        sa.Column("span_id", sa.String(length=50), nullable=False),
+        sa.Column("parent_span_id", sa.String(length=50), nullable=True),
+        sa.Column("name", sa.String(length=250), nullable=True),
+        sa.Column("type", sa.String(length=250), nullable=True),
+        sa.Column("status", sa.String(length=50), nullable=False),
+        sa.Column("start_time_ms", sa.BigInteger(), nullable=False),
+        sa.Column("end_time_ms", sa.BigInteger(), nullable=True),
+        sa.Column("duration_ms", sa.BigInteger(), nullable=True),
+        sa.ForeignKeyConstraint(
+            ["request_id"],
+            ["trace_info.request_id"],
+            name="fk_spans_request_id",
+            ondelete="CASCADE",
+        ),
+        sa.PrimaryKeyConstraint("request_id", "span_id", name="spans_pk"),
+    )
+    with op.batch_alter_table("spans", schema=None) as batch_op:
+        batch_op.create_index("index_spans_name_duration_ms", ["name", "duration_ms"], unique=False)
+        batch_op.create_index("index_spans_type_duration_ms", ["type", "duration_ms"], unique=False)
+        batch_op.create_index("index_spans_status", ["status"], unique=False)
+
+    op.create_table(
+        "span_attributes",
+        sa.Column("request_id", sa.String(length=50), nullable=False),
+        sa.Column("span_id", sa.String(length=50), nullable=False),
+        sa.Column("key", sa.String(length=250), nullable=False),
+        sa.Column("value", sa.String(length=250), nullable=True),
+        sa.ForeignKeyConstraint(
+            ["request_id", "span_id"],
+            ["spans.request_id", "spans.span_id"],
+            name="fk_span_attributes_request_id_span_id",
+            ondelete="CASCADE",
+        ),
+        sa.PrimaryKeyConstraint("request_id", "span_id", "key", name="span_attributes_pk"),
+    )
+    with op.batch_alter_table("span_attributes", schema=None) as batch_op:
+        batch_op.create_index("index_span_attributes_key_value", ["key", "value"], unique=False)
+
+
+def downgrade():
+    pass
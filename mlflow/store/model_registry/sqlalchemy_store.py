@@ -24,6 +24,7 @@ from mlflow.protos.databricks_pb2 import (
     RESOURCE_DOES_NOT_EXIST,
 )
 from mlflow.store.artifact.utils.models import _parse_model_uri
+from mlflow.store.db.read_replica import ReadReplicaRouter, read_only
 from mlflow.store.entities.paged_list import PagedList
 from mlflow.store.model_registry import (
     SEARCH_MODEL_VERSION_MAX_RESULTS_DEFAULT,
@@ -81,6 +82,7 @@ class SqlAlchemyStore(AbstractStore):
     """
 
     CREATE_MODEL_VERSION_RETRIES = 3
+    _read_replica_router = None
 
     def __init__(self, db_uri):
         """
@@ -107,6 +109,9 @@ class SqlAlchemyStore(AbstractStore):
         self.ManagedSessionMaker = mlflow.store.db.utils._get_managed_session_maker(
             SessionMaker, self.db_type
         )
+        self._read_replica_router = ReadReplicaRouter.from_env(self.ManagedSessionMaker)
+        if self._read_replica_router is not None:
+            self.ManagedSessionMaker = self._read_replica_router.ManagedSessionMaker
         # TODO: verify schema here once we add logic to initialize the registry tables if they
         # don't exist (schema verification will fail in tests otherwise)
         # mlflow.store.db.utils._verify_schema(self.engine)
@@ -116,6 +121,8 @@ class SqlAlchemyStore(AbstractStore):
 
     def _dispose_engine(self):
         self.engine.dispose()
+        if self._read_replica_router is not None:
+            self._read_replica_router.dispose()
 
     @staticmethod
     def _verify_registry_tables_exist(engine):
@@ -302,6 +309,7 @@ class SqlAlchemyStore(AbstractStore):
             next_token = SearchUtils.create_page_token(final_offset)
         return next_token
 
+    @read_only
     def search_registered_models(
         self,
         filter_string=None,
@@ -608,6 +616,7 @@ class SqlAlchemyStore(AbstractStore):
             clauses.append(SqlRegisteredModel.name.asc())
         return clauses
 
+    @read_only
     def get_registered_model(self, name):
         """
         Get registered model instance by name.
@@ -621,6 +630,7 @@ class SqlAlchemyStore(AbstractStore):
         with self.ManagedSessionMaker() as session:
             return self._get_registered_model(session, name, eager=True).to_mlflow_entity()
 
+    @read_only
     def get_latest_versions(self, name, stages=None):
         """
         Latest version models for each requested stage. If no ``stages`` argument is provided,
@@ -743,11 +753,13 @@ class SqlAlchemyStore(AbstractStore):
 
         """
 
-        def next_version(sql_registered_model):
-            if sql_registered_model.model_versions:
-                return max([mv.version for mv in sql_registered_model.model_versions]) + 1
-            else:
-                return 1
+        def next_version(session):
+            latest_version = (
+                session.query(sqlalchemy.func.max(SqlModelVersion.version))
+                .filter(SqlModelVersion.name == name)
+                .scalar()
+            )
+            return (latest_version or 0) + 1
 
         _validate_model_name(name)
         for tag in tags or []:
@@ -776,9 +788,21 @@ class SqlAlchemyStore(AbstractStore):
             creation_time = get_current_time_millis()
             for attempt in range(self.CREATE_MODEL_VERSION_RETRIES):
                 try:
-                    sql_registered_model = self._get_registered_model(session, name)
-                    sql_registered_model.last_updated_time = creation_time
-                    version = next_version(sql_registered_model)
+                    # Updating the registered model first locks its row until the transaction ends,
+                    # so that concurrent creations of versions of the same model are serialized
+                    # instead of allocating the same version and conflicting
+                    updated = (
+                        session.query(SqlRegisteredModel)
+                        .filter(SqlRegisteredModel.name == name)
+                        .update(
+                            {SqlRegisteredModel.last_updated_time: creation_time},
+                            synchronize_session=False,
+                        )
+                    )
+                    if not updated:
+                        # Raises the "not found" error
+                        self._get_registered_model(session, name)
+                    version = next_version(session)
                     model_version = SqlModelVersion(
                         name=name,
                         version=version,
@@ -796,12 +820,13 @@ class SqlAlchemyStore(AbstractStore):
                     model_version.model_version_tags = [
                         SqlModelVersionTag(key=key, value=value) for key, value in tags_dict.items()
                     ]
-                    session.add_all([sql_registered_model, model_version])
+                    session.add(model_version)
                     session.flush()
                     return self._populate_model_version_aliases(
                         session, name, model_version.to_mlflow_entity()
                     )
                 except sqlalchemy.exc.IntegrityError:
+                    session.rollback()
                     more_retries = self.CREATE_MODEL_VERSION_RETRIES - attempt - 1
                     _logger.info(
                         "Model Version creation error (name=%s) Retrying %s more time%s.",
@@ -988,6 +1013,7 @@ class SqlAlchemyStore(AbstractStore):
             sql_model_version.status_message = None
             session.add_all([sql_registered_model, sql_model_version])
 
+    @read_only
     def get_model_version(self, name, version):
         """
         Get the model version instance by name and version.
@@ -1005,6 +1031,7 @@ class SqlAlchemyStore(AbstractStore):
                 session, name, sql_model_version.to_mlflow_entity()
             )
 
+    @read_only
     def get_model_version_download_uri(self, name, version):
         """
         Get the download location in Model Registry for this model version.
@@ -1022,6 +1049,7 @@ class SqlAlchemyStore(AbstractStore):
             sql_model_version = self._get_sql_model_version(session, name, version)
             return sql_model_version.storage_location or sql_model_version.source
 
+    @read_only
     def search_model_versions(
         self,
         filter_string=None,
@@ -1255,6 +1283,7 @@ class SqlAlchemyStore(AbstractStore):
             if existing_alias is not None:
                 session.delete(existing_alias)
 
+    @read_only
     def get_model_version_by_alias(self, name, alias):
         """
         Get the model version instance by name and alias.
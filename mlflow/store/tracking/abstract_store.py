@@ -10,6 +10,7 @@ from mlflow.entities import (
     LoggedModelParameter,
     LoggedModelStatus,
     LoggedModelTag,
+    Span,
     TraceInfo,
     ViewType,
 )
@@ -290,6 +291,18 @@ class AbstractStore:
         """
         raise NotImplementedError
 
+    def log_spans(self, request_id: str, spans: list[Span]) -> None:
+        """
+        Store the index of the spans of an ended trace, used to search traces by span. The span
+        data itself is stored as a trace artifact. Stores that cannot search traces by span
+        ignore the spans, and so does the REST store, as the tracking server indexes the spans
+        of a trace from its trace data when the trace is ended.
+
+        Args:
+            request_id: Unique string identifier of the trace.
+            spans: The spans of the trace.
+        """
+
     def delete_traces(
         self,
         experiment_id: str,
@@ -552,6 +565,7 @@ class AbstractStore:
         max_results=SEARCH_MAX_RESULTS_DEFAULT,
         order_by=None,
         page_token=None,
+        columns=None,
     ):
         """
         Return runs that match the given list of search expressions within the experiments.
@@ -564,6 +578,9 @@ class AbstractStore:
             order_by: List of order_by clauses.
             page_token: Token specifying the next page of results. It should be obtained from
                 a ``search_runs`` call.
+            columns: List of the metrics, params, and tags to return for each run, e.g.
+                ``["metrics.rmse", "params.alpha"]``. If empty, only the run info is returned.
+                If None, all the metrics, params, and tags of the runs are returned.
 
         Returns:
             A :py:class:`PagedList <mlflow.store.entities.PagedList>` of
@@ -573,6 +590,9 @@ class AbstractStore:
             implementations may not support pagination and thus the returned token would not be
             meaningful in such cases.
         """
+        # ``columns`` is only passed when specified, for stores implementing ``_search_runs``
+        # without it
+        kwargs = {} if columns is None else {"columns": columns}
         runs, token = self._search_runs(
             experiment_ids,
             filter_string,
@@ -580,6 +600,7 @@ class AbstractStore:
             max_results,
             order_by,
             page_token,
+            **kwargs,
         )
         return PagedList(runs, token)
 
@@ -592,6 +613,7 @@ class AbstractStore:
         max_results,
         order_by,
         page_token,
+        columns=None,
     ):
         """
         Return runs that match the given list of search expressions within the experiments, as
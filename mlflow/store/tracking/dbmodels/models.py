@@ -761,6 +761,112 @@ class SqlTraceRequestMetadata(Base):
     )
 
 
+class SqlSpan(Base):
+    """
+    Compact index of the spans of a trace, used to search traces by span. The full span data is
+    stored as a file artifact with the rest of the trace data.
+    """
+
+    __tablename__ = "spans"
+
+    request_id = Column(
+        String(50), ForeignKey("trace_info.request_id", ondelete="CASCADE"), nullable=False
+    )
+    """
+    Request ID of the trace to which this span belongs: *Foreign Key* into ``trace_info`` table.
+    """
+    span_id = Column(String(50), nullable=False)
+    """
+    Span ID: `String` (limit 50 characters). Unique within a trace.
+    """
+    parent_span_id = Column(String(50), nullable=True)
+    """
+    Span ID of the parent span. *null* for the root span.
+    """
+    name = Column(String(250), nullable=True)
+    """
+    Span name: `String` (limit 250 characters). Longer names are truncated.
+    """
+    type = Column(String(250), nullable=True)
+    """
+    Span type, e.g. ``RETRIEVER``: `String` (limit 250 characters).
+    """
+    status = Column(String(50), nullable=False)
+    """
+    Status code of the span. The values are defined in
+    :py:class:`mlflow.entities.span_status.SpanStatusCode` enum.
+    """
+    start_time_ms = Column(BigInteger, nullable=False)
+    """
+    Start time of the span, in milliseconds.
+    """
+    end_time_ms = Column(BigInteger, nullable=True)
+    """
+    End time of the span, in milliseconds. Could be *null* if the span was not ended.
+    """
+    duration_ms = Column(BigInteger, nullable=True)
+    """
+    Duration of the span, in milliseconds. Stored so that searches by duration can use an index.
+    """
+    trace_info = relationship("SqlTraceInfo", backref=backref("spans", cascade="all"))
+    """
+    SQLAlchemy relationship (many:one) with
+    :py:class:`mlflow.store.dbmodels.models.SqlTraceInfo`.
+    """
+
+    __table_args__ = (
+        PrimaryKeyConstraint("request_id", "span_id", name="spans_pk"),
+        # Searches by span usually look for the slow spans of a given name or type, e.g.
+        # `span.name = 'retriever' AND span.duration_ms > 2000`, or for failed spans.
+        Index(f"index_{__tablename__}_name_duration_ms", "name", "duration_ms"),
+        Index(f"index_{__tablename__}_type_duration_ms", "type", "duration_ms"),
+        Index(f"index_{__tablename__}_status", "status"),
+    )
+
+
+class SqlSpanAttribute(Base):
+    """
+    Span attributes selected with ``MLFLOW_TRACE_INDEXED_SPAN_ATTRIBUTES``, used to search
+    traces by span attribute.
+    """
+
+    __tablename__ = "span_attributes"
+
+    request_id = Column(String(50), nullable=False)
+    """
+    Request ID of the trace to which the span belongs.
+    """
+    span_id = Column(String(50), nullable=False)
+    """
+    Span ID to which this attribute belongs: *Foreign Key* into ``spans`` table with
+    ``request_id``.
+    """
+    key = Column(String(250), nullable=False)
+    """
+    Attribute key: `String` (limit 250 characters).
+    """
+    value = Column(String(250), nullable=True)
+    """
+    Attribute value: `String` (limit 250 characters). String values are stored as is, and other
+    values in JSON.
+    """
+    span = relationship("SqlSpan", backref=backref("attributes", cascade="all"))
+    """
+    SQLAlchemy relationship (many:one) with :py:class:`mlflow.store.dbmodels.models.SqlSpan`.
+    """
+
+    __table_args__ = (
+        PrimaryKeyConstraint("request_id", "span_id", "key", name="span_attributes_pk"),
+        ForeignKeyConstraint(
+            ["request_id", "span_id"],
+            ["spans.request_id", "spans.span_id"],
+            ondelete="CASCADE",
+            name="fk_span_attributes_request_id_span_id",
+        ),
+        Index(f"index_{__tablename__}_key_value", "key", "value"),
+    )
+
+
 class SqlLoggedModel(Base):
     __tablename__ = "logged_models"
 
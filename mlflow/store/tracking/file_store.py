@@ -165,6 +165,22 @@ def _read_persisted_run_info_dict(run_info_dict):
     return RunInfo.from_dictionary(dict_copy)
 
 
+def _filter_keys(file_names, keys):
+    return file_names if keys is None else [name for name in file_names if name in keys]
+
+
+def _project_run(run, data_keys):
+    """
+    Returns a copy of the run with only the metrics, params, and tags with the given keys.
+    """
+    data = RunData(
+        metrics=[m for m in run.data._metric_objs if m.key in data_keys["metrics"]],
+        params=[Param(k, v) for k, v in run.data.params.items() if k in data_keys["params"]],
+        tags=[RunTag(k, v) for k, v in run.data.tags.items() if k in data_keys["tags"]],
+    )
+    return Run(run.info, data, run.inputs, run.outputs)
+
+
 class FileStore(AbstractStore):
     TRASH_FOLDER_NAME = ".trash"
     ARTIFACTS_FOLDER_NAME = "artifacts"
@@ -590,6 +606,26 @@ class FileStore(AbstractStore):
         _, run_dir = self._find_run_root(run_id)
         shutil.rmtree(run_dir)
 
+    def _hard_delete_runs(self, run_ids):
+        """
+        Permanently delete a batch of runs (metadata and metrics, tags, parameters). Run IDs that
+        do not exist are ignored. This is used by the ``mlflow gc`` command line and is not
+        intended to be used elsewhere.
+        """
+        for _, run_dir in self._find_run_roots(run_ids).values():
+            shutil.rmtree(run_dir)
+
+    def _get_run_infos(self, run_ids):
+        """
+        Get the infos of a batch of runs in any lifecycle stage. Run IDs that do not exist are
+        ignored. This is used by the ``mlflow gc`` command line and is not intended to be used
+        elsewhere.
+        """
+        return [
+            self._get_run_info_from_dir(run_dir)
+            for _, run_dir in self._find_run_roots(run_ids).values()
+        ]
+
     def _get_deleted_runs(self, older_than=0):
         """
         Get all deleted run ids.
@@ -644,6 +680,26 @@ class FileStore(AbstractStore):
             return os.path.basename(os.path.abspath(experiment_dir)), runs[0]
         return None, None
 
+    def _find_run_roots(self, run_uuids):
+        """
+        Like ``_find_run_root``, but lists the experiment directories once for a batch of runs.
+        Returns a dictionary mapping the ID of each existing run to its experiment ID and run
+        directory.
+        """
+        run_uuids = set(run_uuids)
+        for run_uuid in run_uuids:
+            _validate_run_id(run_uuid)
+        self._check_root_dir()
+        run_roots = {}
+        all_experiments = self._get_active_experiments(True) + self._get_deleted_experiments(True)
+        for experiment_dir in all_experiments:
+            experiment_id = os.path.basename(os.path.abspath(experiment_dir))
+            for run_uuid in run_uuids - run_roots.keys():
+                run_dir = os.path.join(experiment_dir, run_uuid)
+                if os.path.isdir(run_dir):
+                    run_roots[run_uuid] = (experiment_id, run_dir)
+        return run_roots
+
     def update_run_info(self, run_id, run_status, end_time, run_name):
         _validate_run_id(run_id)
         run_info = self._get_run_info(run_id)
@@ -721,10 +777,21 @@ class FileStore(AbstractStore):
             )
         return self._get_run_from_info(run_info)
 
-    def _get_run_from_info(self, run_info):
-        metrics = self._get_all_metrics(run_info)
-        params = self._get_all_params(run_info)
-        tags = self._get_all_tags(run_info)
+    def _get_run_from_info(self, run_info, data_keys=None):
+        """
+        Args:
+            run_info: The info of the run.
+            data_keys: The keys of the metrics, params, and tags to read, as returned by
+                ``SearchUtils.parse_columns_for_search_runs``. If None, all of them are read.
+        """
+        if data_keys is None:
+            metrics = self._get_all_metrics(run_info)
+            params = self._get_all_params(run_info)
+            tags = self._get_all_tags(run_info)
+        else:
+            metrics = self._get_all_metrics(run_info, data_keys["metrics"])
+            params = self._get_all_params(run_info, data_keys["params"])
+            tags = self._get_all_tags(run_info, data_keys["tags"])
         inputs: RunInputs = self._get_all_inputs(run_info)
         outputs: RunOutputs = self._get_all_outputs(run_info)
         if not run_info.run_name:
@@ -813,10 +880,10 @@ class FileStore(AbstractStore):
         run_info = self._get_run_info(run_uuid)
         return self._get_all_metrics(run_info)
 
-    def _get_all_metrics(self, run_info):
+    def _get_all_metrics(self, run_info, keys=None):
         parent_path, metric_files = self._get_run_files(run_info, "metric")
         metrics = []
-        for metric_file in metric_files:
+        for metric_file in _filter_keys(metric_files, keys):
             metrics.append(
                 self._get_metric_from_file(
                     parent_path, metric_file, run_info.run_id, run_info.experiment_id
@@ -905,10 +972,10 @@ class FileStore(AbstractStore):
         run_info = self._get_run_info(run_uuid)
         return self._get_all_params(run_info)
 
-    def _get_all_params(self, run_info):
+    def _get_all_params(self, run_info, keys=None):
         parent_path, param_files = self._get_run_files(run_info, "param")
         params = []
-        for param_file in param_files:
+        for param_file in _filter_keys(param_files, keys):
             params.append(self._get_param_from_file(parent_path, param_file))
         return params
 
@@ -936,10 +1003,10 @@ class FileStore(AbstractStore):
         run_info = self._get_run_info(run_uuid)
         return self._get_all_tags(run_info)
 
-    def _get_all_tags(self, run_info):
+    def _get_all_tags(self, run_info, keys=None):
         parent_path, tag_files = self._get_run_files(run_info, "tag")
         tags = []
-        for tag_file in tag_files:
+        for tag_file in _filter_keys(tag_files, keys):
             tags.append(self._get_tag_from_file(parent_path, tag_file))
         return tags
 
@@ -995,6 +1062,7 @@ class FileStore(AbstractStore):
         max_results,
         order_by,
         page_token,
+        columns=None,
     ):
         if max_results > SEARCH_MAX_RESULTS_THRESHOLD:
             raise MlflowException(
@@ -1002,13 +1070,26 @@ class FileStore(AbstractStore):
                 f"most {SEARCH_MAX_RESULTS_THRESHOLD}, but got value {max_results}",
                 databricks_pb2.INVALID_PARAMETER_VALUE,
             )
+        data_keys = SearchUtils.parse_columns_for_search_runs(columns)
+        read_keys = None
+        if data_keys is not None:
+            # The metrics, params, and tags the runs are filtered and sorted on are read as well,
+            # along with the run name tag of runs whose meta file predates the run name
+            referenced_keys = SearchUtils.get_referenced_run_data_keys(filter_string, order_by)
+            referenced_keys["tags"].add(MLFLOW_RUN_NAME)
+            read_keys = {
+                data_type: keys | referenced_keys[data_type]
+                for data_type, keys in data_keys.items()
+            }
         runs = []
         for experiment_id in experiment_ids:
             run_infos = self._list_run_infos(experiment_id, run_view_type)
-            runs.extend(self._get_run_from_info(r) for r in run_infos)
+            runs.extend(self._get_run_from_info(r, read_keys) for r in run_infos)
         filtered = SearchUtils.filter(runs, filter_string)
         sorted_runs = SearchUtils.sort(filtered, order_by)
         runs, next_page_token = SearchUtils.paginate(sorted_runs, page_token, max_results)
+        if read_keys != data_keys:
+            runs = [_project_run(run, data_keys) for run in runs]
         return runs, next_page_token
 
     def log_metric(self, run_id: str, metric: Metric):
@@ -713,7 +713,14 @@ class RestStore(AbstractStore):
         return PagedList(metric_history, response_proto.next_page_token or None)
 
     def _search_runs(
-        self, experiment_ids, filter_string, run_view_type, max_results, order_by, page_token
+        self,
+        experiment_ids,
+        filter_string,
+        run_view_type,
+        max_results,
+        order_by,
+        page_token,
+        columns=None,
     ):
         experiment_ids = [str(experiment_id) for experiment_id in experiment_ids]
         sr = SearchRuns(
@@ -724,6 +731,9 @@ class RestStore(AbstractStore):
             order_by=order_by,
             page_token=page_token,
         )
+        if columns is not None:
+            sr.select_columns = True
+            sr.columns.extend(columns)
         req_body = message_to_json(sr)
         response_proto = self._call_endpoint(SearchRuns, req_body)
         runs = [Run.from_proto(proto_run) for proto_run in response_proto.runs]
@@ -14,6 +14,8 @@ import sqlalchemy.orm
 import sqlalchemy.sql.expression as sql
 from sqlalchemy import and_, func, sql, text
 from sqlalchemy.future import select
+from sqlalchemy.sql import operators
+from sqlalchemy.sql.elements import Label, UnaryExpression
 
 import mlflow.store.db.utils
 from mlflow.entities import (
@@ -25,6 +27,7 @@ from mlflow.entities import (
     RunStatus,
     RunTag,
     SourceType,
+    Span,
     TraceInfo,
     ViewType,
     _DatasetSummary,
@@ -38,6 +41,7 @@ from mlflow.entities.logged_model_status import LoggedModelStatus
 from mlflow.entities.logged_model_tag import LoggedModelTag
 from mlflow.entities.metric import Metric, MetricWithRunId
 from mlflow.entities.trace_status import TraceStatus
+from mlflow.environment_variables import MLFLOW_TRACE_INDEXED_SPAN_ATTRIBUTES
 from mlflow.exceptions import MlflowException
 from mlflow.protos.databricks_pb2 import (
     INTERNAL_ERROR,
@@ -46,7 +50,8 @@ from mlflow.protos.databricks_pb2 import (
     RESOURCE_ALREADY_EXISTS,
     RESOURCE_DOES_NOT_EXIST,
 )
-from mlflow.store.db.db_types import MSSQL, MYSQL
+from mlflow.store.db.db_types import MSSQL, MYSQL, POSTGRES
+from mlflow.store.db.read_replica import ReadReplicaRouter, read_only
 from mlflow.store.entities.paged_list import PagedList
 from mlflow.store.tracking import (
     SEARCH_LOGGED_MODEL_MAX_RESULTS_DEFAULT,
@@ -69,6 +74,8 @@ from mlflow.store.tracking.dbmodels.models import (
     SqlMetric,
     SqlParam,
     SqlRun,
+    SqlSpan,
+    SqlSpanAttribute,
     SqlTag,
     SqlTraceInfo,
     SqlTraceRequestMetadata,
@@ -155,6 +162,7 @@ class SqlAlchemyStore(AbstractStore):
     DEFAULT_EXPERIMENT_ID = "0"
     _db_uri_sql_alchemy_engine_map = {}
     _db_uri_sql_alchemy_engine_map_lock = threading.Lock()
+    _read_replica_router = None
 
     def __init__(self, db_uri, default_artifact_root):
         """
@@ -204,11 +212,17 @@ class SqlAlchemyStore(AbstractStore):
             with self.ManagedSessionMaker() as session:
                 self._create_default_experiment(session)
 
+        self._read_replica_router = ReadReplicaRouter.from_env(self.ManagedSessionMaker)
+        if self._read_replica_router is not None:
+            self.ManagedSessionMaker = self._read_replica_router.ManagedSessionMaker
+
     def _get_dialect(self):
         return self.engine.dialect.name
 
     def _dispose_engine(self):
         self.engine.dispose()
+        if self._read_replica_router is not None:
+            self._read_replica_router.dispose()
 
     def _set_zero_value_insertion_for_autoincrement_column(self, session):
         if self.db_type == MYSQL:
@@ -313,6 +327,7 @@ class SqlAlchemyStore(AbstractStore):
             session.flush()
             return str(experiment.experiment_id)
 
+    @read_only
     def _search_experiments(
         self,
         view_type,
@@ -321,14 +336,6 @@ class SqlAlchemyStore(AbstractStore):
         order_by,
         page_token,
     ):
-        def compute_next_token(current_size):
-            next_token = None
-            if max_results + 1 == current_size:
-                final_offset = offset + max_results
-                next_token = SearchExperimentsUtils.create_page_token(final_offset)
-
-            return next_token
-
         self._validate_max_results_param(max_results)
         with self.ManagedSessionMaker() as session:
             parsed_filters = SearchExperimentsUtils.parse_search_filter(filter_string)
@@ -337,25 +344,35 @@ class SqlAlchemyStore(AbstractStore):
             )
 
             order_by_clauses = _get_search_experiments_order_by_clauses(order_by)
-            offset = SearchUtils.parse_start_offset_from_page_token(page_token)
+            sort_keys = _get_sort_keys([], order_by_clauses)
             lifecycle_stags = set(LifecycleStage.view_type_to_stages(view_type))
 
             stmt = (
-                reduce(lambda s, f: s.join(f), non_attribute_filters, select(SqlExperiment))
+                reduce(
+                    lambda s, f: s.join(f),
+                    non_attribute_filters,
+                    select(SqlExperiment, *(expr for expr, _ in sort_keys)),
+                )
                 .options(*self._get_eager_experiment_query_options())
                 .filter(
                     *attribute_filters,
                     SqlExperiment.lifecycle_stage.in_(lifecycle_stags),
                 )
                 .order_by(*order_by_clauses)
-                .offset(offset)
-                .limit(max_results + 1)
             )
-            queried_experiments = session.execute(stmt).scalars(SqlExperiment).all()
-            experiments = [e.to_mlflow_entity() for e in queried_experiments]
-            next_page_token = compute_next_token(len(experiments))
+            if (keyset := SearchUtils.parse_keyset_from_page_token(page_token)) is not None:
+                stmt = stmt.filter(_get_seek_predicate(sort_keys, keyset, self._get_dialect()))
+            else:
+                stmt = stmt.offset(SearchUtils.parse_start_offset_from_page_token(page_token))
+            rows = session.execute(stmt.limit(max_results + 1)).all()
+            experiments = [row[0].to_mlflow_entity() for row in rows[:max_results]]
+            next_page_token = None
+            if len(rows) == max_results + 1:
+                next_page_token = SearchExperimentsUtils.create_keyset_page_token(
+                    rows[max_results - 1][1:]
+                )
 
-        return experiments[:max_results], next_page_token
+        return experiments, next_page_token
 
     def search_experiments(
         self,
@@ -412,12 +429,14 @@ class SqlAlchemyStore(AbstractStore):
             sqlalchemy.orm.subqueryload(SqlExperiment.tags),
         ]
 
+    @read_only
     def get_experiment(self, experiment_id):
         with self.ManagedSessionMaker() as session:
             return self._get_experiment(
                 session, experiment_id, ViewType.ALL, eager=True
             ).to_mlflow_entity()
 
+    @read_only
     def get_experiment_by_name(self, experiment_name):
         """
         Specialized implementation for SQL backed store.
@@ -594,11 +613,24 @@ class SqlAlchemyStore(AbstractStore):
         return [list(dataset_inputs_per_run[run_uuid].values()) for run_uuid in run_uuids]
 
     @staticmethod
-    def _get_eager_run_query_options():
+    def _get_eager_run_query_options(data_keys=None):
         """
         A list of SQLAlchemy query options that can be used to eagerly load the following
         run attributes when fetching a run: ``latest_metrics``, ``params``, and ``tags``.
+
+        Args:
+            data_keys: The keys of the metrics, params, and tags to load, as returned by
+                ``SearchUtils.parse_columns_for_search_runs``. If None, all of them are loaded.
         """
+        if data_keys is not None:
+            return [
+                _selectinload_keys(relationship, key_column, data_keys[data_type])
+                for relationship, key_column, data_type in [
+                    (SqlRun.latest_metrics, SqlLatestMetric.key, "metrics"),
+                    (SqlRun.params, SqlParam.key, "params"),
+                    (SqlRun.tags, SqlTag.key, "tags"),
+                ]
+            ]
         return [
             # Use a select in load rather than a joined load in order to minimize the memory
             # overhead of the eager loading procedure. For more information about relationship
@@ -659,6 +691,7 @@ class SqlAlchemyStore(AbstractStore):
             .one_or_none()
         )
 
+    @read_only
     def get_run(self, run_id):
         with self.ManagedSessionMaker() as session:
             # Load the run with the specified id and eagerly load its summary metrics, params, and
@@ -701,6 +734,56 @@ class SqlAlchemyStore(AbstractStore):
             run = self._get_run(run_uuid=run_id, session=session)
             session.delete(run)
 
+    def _hard_delete_runs(self, run_ids):
+        """
+        Permanently delete a batch of runs (metadata and metrics, tags, parameters, inputs) with
+        one set-based ``DELETE`` per table in a single transaction. Run IDs that do not exist are
+        ignored. This is used by the ``mlflow gc`` command line and is not intended to be used
+        elsewhere.
+        """
+        run_ids = list(run_ids)
+        if not run_ids:
+            return
+        with self.ManagedSessionMaker() as session:
+            run_input_uuids = select(SqlInput.input_uuid).where(
+                SqlInput.destination_type == "RUN", SqlInput.destination_id.in_(run_ids)
+            )
+            session.query(SqlInputTag).filter(SqlInputTag.input_uuid.in_(run_input_uuids)).delete(
+                synchronize_session=False
+            )
+            session.query(SqlInput).filter(
+                sqlalchemy.or_(
+                    and_(SqlInput.destination_type == "RUN", SqlInput.destination_id.in_(run_ids)),
+                    and_(
+                        SqlInput.source_type.in_(["RUN_INPUT", "RUN_OUTPUT"]),
+                        SqlInput.source_id.in_(run_ids),
+                    ),
+                )
+            ).delete(synchronize_session=False)
+            for model in (SqlMetric, SqlLatestMetric, SqlParam, SqlTag, SqlRun):
+                session.query(model).filter(model.run_uuid.in_(run_ids)).delete(
+                    synchronize_session=False
+                )
+
+    def _get_run_infos(self, run_ids):
+        """
+        Get the infos of a batch of runs in any lifecycle stage without loading their metrics,
+        params, and tags. Run IDs that do not exist are ignored. This is used by the ``mlflow gc``
+        command line and is not intended to be used elsewhere.
+        """
+        with self.ManagedSessionMaker() as session:
+            runs = (
+                session.query(SqlRun)
+                .filter(SqlRun.run_uuid.in_(list(run_ids)))
+                .options(
+                    *self._get_eager_run_query_options(
+                        data_keys=SearchUtils.parse_columns_for_search_runs([])
+                    )
+                )
+                .all()
+            )
+            return [run.to_mlflow_entity().info for run in runs]
+
     def _get_deleted_runs(self, older_than=0):
         """
         Get all deleted run ids.
@@ -1005,6 +1088,7 @@ class SqlAlchemyStore(AbstractStore):
         if new_latest_metric_dict:
             session.add_all(new_latest_metric_dict.values())
 
+    @read_only
     def get_metric_history(self, run_id, metric_key, max_results=None, page_token=None):
         """
         Return all logged values for a given metric.
@@ -1037,6 +1121,7 @@ class SqlAlchemyStore(AbstractStore):
             metrics = session.query(SqlMetric).filter_by(run_uuid=run_id, key=metric_key).all()
             return PagedList([metric.to_mlflow_entity() for metric in metrics], None)
 
+    @read_only
     def get_metric_history_bulk(self, run_ids, metric_key, max_results):
         """
         Return all logged values for a given metric.
@@ -1080,6 +1165,7 @@ class SqlAlchemyStore(AbstractStore):
                 for metric in metrics
             ]
 
+    @read_only
     def get_max_step_for_metric(self, run_id, metric_key):
         with self.ManagedSessionMaker() as session:
             max_step = (
@@ -1089,6 +1175,7 @@ class SqlAlchemyStore(AbstractStore):
             )
             return max_step or 0
 
+    @read_only
     def get_metric_history_bulk_interval_from_steps(self, run_id, metric_key, steps, max_results):
         with self.ManagedSessionMaker() as session:
             metrics = (
@@ -1115,6 +1202,7 @@ class SqlAlchemyStore(AbstractStore):
                 for metric in metrics
             ]
 
+    @read_only
     def _search_datasets(self, experiment_ids):
         """
         Return all dataset summaries associated to the given experiments.
@@ -1390,6 +1478,7 @@ class SqlAlchemyStore(AbstractStore):
                 )
             session.delete(filtered_tags[0])
 
+    @read_only
     def _search_runs(
         self,
         experiment_ids,
@@ -1398,28 +1487,25 @@ class SqlAlchemyStore(AbstractStore):
         max_results,
         order_by,
         page_token,
+        columns=None,
     ):
-        def compute_next_token(current_size):
-            next_token = None
-            if max_results == current_size:
-                final_offset = offset + max_results
-                next_token = SearchUtils.create_page_token(final_offset)
-
-            return next_token
-
         self._validate_max_results_param(max_results, allow_null=True)
 
         stages = set(LifecycleStage.view_type_to_stages(run_view_type))
+        data_keys = SearchUtils.parse_columns_for_search_runs(columns)
 
         with self.ManagedSessionMaker() as session:
             # Fetch the appropriate runs and eagerly load their summary metrics, params, and
-            # tags. These run attributes are referenced during the invocation of
-            # ``run.to_mlflow_entity()``, so eager loading helps avoid additional database queries
-            # that are otherwise executed at attribute access time under a lazy loading model.
+            # tags, or only those listed in ``columns``. These run attributes are referenced
+            # during the invocation of ``run.to_mlflow_entity()``, so eager loading helps avoid
+            # additional database queries that are otherwise executed at attribute access time
+            # under a lazy loading model.
             parsed_filters = SearchUtils.parse_search_filter(filter_string)
             cases_orderby, parsed_orderby, sorting_joins = _get_orderby_clauses(order_by, session)
+            sort_keys = _get_sort_keys(cases_orderby, parsed_orderby)
 
-            stmt = select(SqlRun, *cases_orderby)
+            # The sort keys are selected to create the page token from the last run of the page
+            stmt = select(SqlRun, *(expr for expr, _ in sort_keys), *cases_orderby)
             (
                 attribute_filters,
                 non_attribute_filters,
@@ -1440,22 +1526,23 @@ class SqlAlchemyStore(AbstractStore):
             for j in sorting_joins:
                 stmt = stmt.outerjoin(j)
 
-            offset = SearchUtils.parse_start_offset_from_page_token(page_token)
             stmt = (
                 stmt.distinct()
-                .options(*self._get_eager_run_query_options())
+                .options(*self._get_eager_run_query_options(data_keys))
                 .filter(
                     SqlRun.experiment_id.in_(experiment_ids),
                     SqlRun.lifecycle_stage.in_(stages),
                     *attribute_filters,
                 )
                 .order_by(*parsed_orderby)
-                .offset(offset)
-                .limit(max_results)
             )
-            queried_runs = session.execute(stmt).scalars(SqlRun).all()
+            if (keyset := SearchUtils.parse_keyset_from_page_token(page_token)) is not None:
+                stmt = stmt.filter(_get_seek_predicate(sort_keys, keyset, self._get_dialect()))
+            else:
+                stmt = stmt.offset(SearchUtils.parse_start_offset_from_page_token(page_token))
+            rows = session.execute(stmt.limit(max_results)).all()
 
-            runs = [run.to_mlflow_entity() for run in queried_runs]
+            runs = [row[0].to_mlflow_entity() for row in rows]
             run_ids = [run.info.run_id for run in runs]
 
             # add inputs to runs
@@ -1466,7 +1553,11 @@ class SqlAlchemyStore(AbstractStore):
                     Run(run.info, run.data, RunInputs(dataset_inputs=inputs[i]))
                 )
 
-            next_page_token = compute_next_token(len(runs_with_inputs))
+            next_page_token = None
+            if max_results == len(rows):
+                next_page_token = SearchUtils.create_keyset_page_token(
+                    rows[-1][1 : len(sort_keys) + 1]
+                )
 
         return runs_with_inputs, next_page_token
 
@@ -1794,6 +1885,7 @@ class SqlAlchemyStore(AbstractStore):
             RESOURCE_DOES_NOT_EXIST,
         )
 
+    @read_only
     def get_logged_model(self, model_id: str) -> LoggedModel:
         with self.ManagedSessionMaker() as session:
             logged_model = (
@@ -2012,6 +2104,7 @@ class SqlAlchemyStore(AbstractStore):
             *attr_filters,
         )
 
+    @read_only
     def search_logged_models(
         self,
         experiment_ids: list[str],
@@ -2148,6 +2241,29 @@ class SqlAlchemyStore(AbstractStore):
                 session.merge(SqlTraceTag(request_id=request_id, key=k, value=v))
             return sql_trace_info.to_mlflow_entity()
 
+    def log_spans(self, request_id: str, spans: list[Span]) -> None:
+        """
+        Store the index of the spans of an ended trace, used to search traces by span. The name,
+        type, status and timing of each span are stored, along with the attributes selected with
+        ``MLFLOW_TRACE_INDEXED_SPAN_ATTRIBUTES``.
+
+        Args:
+            request_id: Unique string identifier of the trace.
+            spans: The spans of the trace.
+        """
+        # Attribute keys by the key they are indexed with, truncated to the size of the key column.
+        # Keys that are duplicated once truncated are indexed once, as the rows are unique by key.
+        attribute_keys = {}
+        for key in (MLFLOW_TRACE_INDEXED_SPAN_ATTRIBUTES.get() or "").split(","):
+            if key := key.strip():
+                attribute_keys.setdefault(key[:250], key)
+        sql_spans = [_get_sql_span(request_id, span, attribute_keys) for span in spans]
+        with self.ManagedSessionMaker() as session:
+            # Replace the index of a trace that is logged again, rather than failing on duplicates
+            session.query(SqlSpan).filter(SqlSpan.request_id == request_id).delete()
+            session.add_all(sql_spans)
+
+    @read_only
     def get_trace_info(self, request_id, should_query_v3: bool = False) -> TraceInfo:
         """
         Fetch the trace info for the given request id.
@@ -2180,6 +2296,7 @@ class SqlAlchemyStore(AbstractStore):
             )
         return sql_trace_info
 
+    @read_only
     def search_traces(
         self,
         experiment_ids: list[str],
@@ -2214,10 +2331,12 @@ class SqlAlchemyStore(AbstractStore):
             cases_orderby, parsed_orderby, sorting_joins = _get_orderby_clauses_for_search_traces(
                 order_by or [], session
             )
-            stmt = select(SqlTraceInfo, *cases_orderby)
+            sort_keys = _get_sort_keys(cases_orderby, parsed_orderby)
+            # The sort keys are selected to create the page token from the last trace of the page
+            stmt = select(SqlTraceInfo, *(expr for expr, _ in sort_keys), *cases_orderby)
 
             attribute_filters, non_attribute_filters = _get_filter_clauses_for_search_traces(
-                filter_string, session, self._get_dialect()
+                filter_string, session, self._get_dialect(), experiment_ids
             )
             for non_attr_filter in non_attribute_filters:
                 stmt = stmt.join(non_attr_filter)
@@ -2228,7 +2347,6 @@ class SqlAlchemyStore(AbstractStore):
             for j in sorting_joins:
                 stmt = stmt.outerjoin(j)
 
-            offset = SearchTraceUtils.parse_start_offset_from_page_token(page_token)
             stmt = (
                 # NB: We don't need to distinct the results of joins because of the fact that
                 #   the right tables of the joins are unique on the join key, request_id.
@@ -2240,18 +2358,20 @@ class SqlAlchemyStore(AbstractStore):
                 stmt.filter(
                     SqlTraceInfo.experiment_id.in_(experiment_ids),
                     *attribute_filters,
-                )
-                .order_by(*parsed_orderby)
-                .offset(offset)
-                .limit(max_results)
+                ).order_by(*parsed_orderby)
             )
-            queried_traces = session.execute(stmt).scalars(SqlTraceInfo).all()
-            trace_infos = [t.to_mlflow_entity() for t in queried_traces]
+            if (keyset := SearchTraceUtils.parse_keyset_from_page_token(page_token)) is not None:
+                stmt = stmt.filter(_get_seek_predicate(sort_keys, keyset, self._get_dialect()))
+            else:
+                stmt = stmt.offset(SearchTraceUtils.parse_start_offset_from_page_token(page_token))
+            rows = session.execute(stmt.limit(max_results)).all()
+            trace_infos = [row[0].to_mlflow_entity() for row in rows]
 
             # Compute next search token
             if max_results == len(trace_infos):
-                final_offset = offset + max_results
-                next_token = SearchTraceUtils.create_page_token(final_offset)
+                next_token = SearchTraceUtils.create_keyset_page_token(
+                    rows[-1][1 : len(sort_keys) + 1]
+                )
             else:
                 next_token = None
 
@@ -2347,6 +2467,33 @@ class SqlAlchemyStore(AbstractStore):
             )
 
 
+def _get_sql_span(request_id: str, span: Span, attribute_keys: dict[str, str]) -> SqlSpan:
+    start_time_ms = span.start_time_ns // 1_000_000
+    end_time_ms = span.end_time_ns // 1_000_000 if span.end_time_ns is not None else None
+    sql_span = SqlSpan(
+        request_id=request_id,
+        span_id=span.span_id,
+        parent_span_id=span.parent_id,
+        name=span.name[:250] if span.name is not None else None,
+        type=span.span_type[:250] if span.span_type is not None else None,
+        status=span.status.status_code.value,
+        start_time_ms=start_time_ms,
+        end_time_ms=end_time_ms,
+        duration_ms=end_time_ms - start_time_ms if end_time_ms is not None else None,
+    )
+    for indexed_key, key in attribute_keys.items():
+        value = span.get_attribute(key)
+        if value is None:
+            continue
+        if not isinstance(value, str):
+            value = json.dumps(value)
+        # Long values are not indexed rather than truncated, so that equality searches on
+        # indexed values are exact
+        if len(value) <= 250:
+            sql_span.attributes.append(SqlSpanAttribute(key=indexed_key, value=value))
+    return sql_span
+
+
 def _get_sqlalchemy_filter_clauses(parsed, session, dialect):
     """
     Creates run attribute filters and subqueries that will be inner-joined to SqlRun to act as
@@ -2440,6 +2587,17 @@ def _get_sqlalchemy_filter_clauses(parsed, session, dialect):
     return attribute_filters, non_attribute_filters, dataset_filters
 
 
+def _selectinload_keys(relationship, key_column, keys):
+    """
+    Returns a query option eagerly loading only the entities of a run relationship with the given
+    keys, e.g. the latest metrics listed in the ``columns`` of a run search.
+    """
+    if not keys:
+        # The relationship is loaded as an empty collection, without querying the database
+        return sqlalchemy.orm.noload(relationship)
+    return sqlalchemy.orm.selectinload(relationship.and_(key_column.in_(keys)))
+
+
 def _get_orderby_clauses(order_by_list, session):
     """Sorts a set of runs based on their natural ordering and an overriding set of order_bys.
     Runs are naturally ordered first by start time descending, then by run id for tie-breaking.
@@ -2638,13 +2796,70 @@ def _get_orderby_clauses_for_search_traces(order_by_list: list[str], session):
     return select_clauses, clauses, ordering_joins
 
 
-def _get_filter_clauses_for_search_traces(filter_string, session, dialect):
+def _get_sort_keys(select_clauses, order_by_clauses):
+    """
+    Returns the expressions that the order_by clauses returned by ``_get_orderby_clauses``,
+    ``_get_orderby_clauses_for_search_traces`` or ``_get_search_experiments_order_by_clauses``
+    sort on, with whether they are sorted in ascending order. Clauses referring to a labeled
+    select clause by name are resolved to the labeled expression.
+    """
+    labeled_clauses = {c.name: c.element for c in select_clauses if isinstance(c, Label)}
+    sort_keys = []
+    for clause in order_by_clauses:
+        if isinstance(clause, str):
+            sort_keys.append((labeled_clauses[clause], True))
+        elif isinstance(clause, UnaryExpression) and clause.modifier in (
+            operators.asc_op,
+            operators.desc_op,
+        ):
+            sort_keys.append((clause.element, clause.modifier is operators.asc_op))
+        else:
+            sort_keys.append((clause, True))
+    return sort_keys
+
+
+def _get_seek_predicate(sort_keys, values, dialect):
+    """
+    Returns a predicate selecting the rows that come after the row whose sort keys have the
+    given values, in the order defined by the sort keys. Together with the order_by clauses, it
+    replaces an offset to fetch the next page of results (keyset pagination), which lets the
+    database seek to the first row of the page using an index instead of scanning and discarding
+    all the rows of the previous pages.
+    """
+    if len(values) != len(sort_keys):
+        raise MlflowException(
+            "Invalid page token, it does not match the order_by clauses of the search",
+            error_code=INVALID_PARAMETER_VALUE,
+        )
+
+    # NULLs are sorted as the lowest values by SQLite, MySQL and MSSQL, and as the highest values
+    # by PostgreSQL
+    nulls_are_lowest = dialect != POSTGRES
+    predicates = []
+    equal_to_previous_keys = []
+    for (expr, ascending), value in zip(sort_keys, values):
+        nulls_come_last = ascending != nulls_are_lowest
+        if value is None:
+            if not nulls_come_last:
+                predicates.append(sql.and_(*equal_to_previous_keys, expr.isnot(None)))
+            equal_to_previous_keys.append(expr.is_(None))
+        else:
+            after = expr > value if ascending else expr < value
+            if nulls_come_last:
+                after = sql.or_(after, expr.is_(None))
+            predicates.append(sql.and_(*equal_to_previous_keys, after))
+            equal_to_previous_keys.append(expr == value)
+    return sql.or_(*predicates)
+
+
+def _get_filter_clauses_for_search_traces(filter_string, session, dialect, experiment_ids):
     """
     Creates trace attribute filters and subqueries that will be inner-joined
     to SqlTraceInfo to act as multi-clause filters and return them as a tuple.
     """
     attribute_filters = []
     non_attribute_filters = []
+    span_filters = []
 
     parsed_filters = SearchTraceUtils.parse_search_filter_for_search_traces(filter_string)
     for sql_statement in parsed_filters:
@@ -2659,6 +2874,27 @@ def _get_filter_clauses_for_search_traces(filter_string, session, dialect):
                 attribute, value
             )
             attribute_filters.append(attr_filter)
+        elif SearchTraceUtils.is_span(key_type, key_name, comparator):
+            span_filters.append(
+                SearchTraceUtils.get_sql_comparison_func(comparator, dialect)(
+                    getattr(SqlSpan, key_name), value
+                )
+            )
+        elif SearchTraceUtils.is_span_attribute(key_type, comparator):
+            key_filter = SearchTraceUtils.get_sql_comparison_func("=", dialect)(
+                SqlSpanAttribute.key, key_name
+            )
+            val_filter = SearchTraceUtils.get_sql_comparison_func(comparator, dialect)(
+                SqlSpanAttribute.value, value
+            )
+            span_filters.append(
+                sql.exists().where(
+                    SqlSpanAttribute.request_id == SqlSpan.request_id,
+                    SqlSpanAttribute.span_id == SqlSpan.span_id,
+                    key_filter,
+                    val_filter,
+                )
+            )
         else:
             if SearchTraceUtils.is_tag(key_type, comparator):
                 entity = SqlTraceTag
@@ -2680,4 +2916,41 @@ def _get_filter_clauses_for_search_traces(filter_string, session, dialect):
                 session.query(entity).filter(key_filter, val_filter).subquery()
             )
 
+    if span_filters:
+        _validate_span_index(session, experiment_ids)
+        # All the span clauses must be satisfied by the same span, e.g. the trace must have a
+        # span named 'retriever' that took more than 2s, not just a span named 'retriever' and
+        # another slow span. A correlated EXISTS also keeps the traces unique, unlike a join.
+        attribute_filters.append(
+            sql.exists().where(SqlSpan.request_id == SqlTraceInfo.request_id, *span_filters)
+        )
+
     return attribute_filters, non_attribute_filters
+
+
+def _validate_span_index(session, experiment_ids):
+    """
+    Raise if the experiments have ended traces but none of their spans are indexed, rather than
+    silently returning no traces for a span filter. This happens for traces logged before the
+    span index was added to the database, which are not backfilled, or logged by a client that
+    does not index spans.
+    """
+    ended_traces = session.query(SqlTraceInfo.request_id).filter(
+        SqlTraceInfo.experiment_id.in_(experiment_ids),
+        SqlTraceInfo.status != TraceStatus.IN_PROGRESS.value,
+    )
+    indexed_spans = (
+        session.query(SqlSpan.request_id)
+        .join(SqlTraceInfo, SqlTraceInfo.request_id == SqlSpan.request_id)
+        .filter(SqlTraceInfo.experiment_id.in_(experiment_ids))
+    )
+    if (
+        session.query(ended_traces.exists()).scalar()
+        and not session.query(indexed_spans.exists()).scalar()
+    ):
+        raise MlflowException(
+            f"The traces in experiments {experiment_ids} cannot be searched by span, as none of "
+            "their spans are indexed. Spans are indexed for traces logged after the database "
+            "is upgraded with `mlflow db upgrade`; earlier traces are not backfilled.",
+            error_code=INVALID_PARAMETER_VALUE,
+        )
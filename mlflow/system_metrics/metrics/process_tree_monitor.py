@@ -0,0 +1,61 @@
+"""Class for monitoring the CPU and memory stats of a process tree."""
+
+import psutil
+
+from mlflow.system_metrics.metrics.base_metrics_monitor import BaseMetricsMonitor
+
+
+class ProcessTreeMonitor(BaseMetricsMonitor):
+    """Class for monitoring the CPU and memory stats of a process and all its descendants.
+
+    Unlike `CPUMonitor`, which reports the usage of the whole machine, this monitor only accounts
+    for the processes that belong to the process tree rooted at `pid`, e.g., a training script and
+    the data loader workers it spawned.
+
+    Args:
+        pid: int, default to None. The ID of the root process of the tree. If None, the current
+            process is used.
+    """
+
+    def __init__(self, pid=None):
+        super().__init__()
+        self._root_process = psutil.Process(pid)
+        self._cpu_count = psutil.cpu_count() or 1
+        self._total_memory = psutil.virtual_memory().total
+        # `psutil.Process.cpu_percent()` measures the CPU time since the previous call on the same
+        # `Process` object, so the objects are kept across samples.
+        self._processes = {}
+
+    def collect_metrics(self):
+        try:
+            processes = [self._root_process, *self._root_process.children(recursive=True)]
+        except psutil.NoSuchProcess:
+            return
+
+        cpu_percent = 0.0
+        memory_bytes = 0
+        alive_processes = {}
+        for process in processes:
+            # `Process` objects compare equal only if both the PID and the creation time match, so
+            # a reused PID doesn't pick up the CPU times of a dead process.
+            if (cached_process := self._processes.get(process.pid)) == process:
+                process = cached_process
+            try:
+                with process.oneshot():
+                    cpu_percent += process.cpu_percent()
+                    memory_bytes += process.memory_info().rss
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                continue
+            alive_processes[process.pid] = process
+        self._processes = alive_processes
+
+        # `cpu_percent()` of a process can exceed 100% on multi-core machines, so it is normalized
+        # by the number of CPUs to be comparable with the machine-wide CPU utilization.
+        self._metrics["process_cpu_utilization_percentage"].append(cpu_percent / self._cpu_count)
+        self._metrics["process_memory_usage_megabytes"].append(memory_bytes / 1e6)
+        self._metrics["process_memory_usage_percentage"].append(
+            memory_bytes / self._total_memory * 100
+        )
+
+    def aggregate_metrics(self):
+        return {k: round(sum(v) / len(v), 1) for k, v in self._metrics.items()}
@@ -1,21 +1,21 @@
 """Class for monitoring system stats."""
 
 import logging
-import threading
-from typing import Optional
+import os
+import time
+from collections import defaultdict
 
+from mlflow.entities import Metric
 from mlflow.environment_variables import (
+    MLFLOW_SYSTEM_METRICS_ATTRIBUTE_TO_PROCESS_TREE,
     MLFLOW_SYSTEM_METRICS_NODE_ID,
     MLFLOW_SYSTEM_METRICS_SAMPLES_BEFORE_LOGGING,
     MLFLOW_SYSTEM_METRICS_SAMPLING_INTERVAL,
 )
 from mlflow.exceptions import MlflowException
-from mlflow.system_metrics.metrics.base_metrics_monitor import BaseMetricsMonitor
-from mlflow.system_metrics.metrics.cpu_monitor import CPUMonitor
-from mlflow.system_metrics.metrics.disk_monitor import DiskMonitor
-from mlflow.system_metrics.metrics.gpu_monitor import GPUMonitor
-from mlflow.system_metrics.metrics.network_monitor import NetworkMonitor
-from mlflow.system_metrics.metrics.rocm_monitor import ROCMMonitor
+from mlflow.system_metrics.system_metrics_sampler import register_monitor, unregister_monitor
+from mlflow.tracking._tracking_service.utils import _resolve_tracking_uri
+from mlflow.utils.async_logging.run_operations import get_combined_run_operations
 
 _logger = logging.getLogger(__name__)
 
@@ -24,7 +24,10 @@ class SystemMetricsMonitor:
     """Class for monitoring system stats.
 
     This class is used for pulling system metrics and logging them to MLflow. Calling `start()` will
-    spawn a thread that logs system metrics periodically. Calling `finish()` will stop the thread.
+    register the monitor to a sampler thread, shared by all the monitors of the process with the
+    same tracking URI and sampling interval, that collects system metrics periodically and logs
+    them to the run. Calling `finish()` will unregister the monitor, and stop the thread when no
+    monitors are left.
     Logging is done on a different frequency from pulling metrics, so that the metrics are
     aggregated over the period. Users can change the logging frequency by setting
     `MLFLOW_SYSTEM_METRICS_SAMPLING_INTERVAL` and `MLFLOW_SYSTEM_METRICS_SAMPLES_BEFORE_LOGGING`
@@ -49,6 +52,13 @@ class SystemMetricsMonitor:
             evnironment variable. This is useful in multi-node training to distinguish the metrics
             from different nodes. For example, if you set node_id to "node_0", the system metrics
             getting logged will be of format "system/node_0/cpu_utilization_percentage".
+        attribute_to_process_tree: bool, default to False. If True, the CPU and memory usage of the
+            current process and its descendants is logged, e.g.,
+            "system/process_cpu_utilization_percentage", instead of the CPU and memory usage of
+            the whole machine. Will be overridden by
+            `MLFLOW_SYSTEM_METRICS_ATTRIBUTE_TO_PROCESS_TREE` environment variable.
+        tracking_uri: string, default to None. The tracking URI of the run. Defaults to the
+            current tracking URI when the monitor is created.
     """
 
     def __init__(
@@ -58,32 +68,44 @@ class SystemMetricsMonitor:
         samples_before_logging=1,
         resume_logging=False,
         node_id=None,
+        attribute_to_process_tree=False,
+        tracking_uri=None,
     ):
-        from mlflow.utils.autologging_utils import BatchMetricsLogger
-
-        # Instantiate default monitors.
-        self.monitors = [CPUMonitor(), DiskMonitor(), NetworkMonitor()]
-
-        if gpu_monitor := self._initialize_gpu_monitor():
-            self.monitors.append(gpu_monitor)
-
         self.sampling_interval = MLFLOW_SYSTEM_METRICS_SAMPLING_INTERVAL.get() or sampling_interval
         self.samples_before_logging = (
             MLFLOW_SYSTEM_METRICS_SAMPLES_BEFORE_LOGGING.get() or samples_before_logging
         )
+        attribute_to_process_tree = (
+            MLFLOW_SYSTEM_METRICS_ATTRIBUTE_TO_PROCESS_TREE.get() or attribute_to_process_tree
+        )
+        # The root of the process tree whose CPU and memory usage is logged, or None to log the
+        # usage of the whole machine.
+        self.process_id = os.getpid() if attribute_to_process_tree else None
 
         self._run_id = run_id
-        self.mlflow_logger = BatchMetricsLogger(self._run_id)
-        self._shutdown_event = threading.Event()
-        self._process = None
+        # Resolved now rather than when the metrics are logged, as the current tracking URI may
+        # change while the run is monitored.
+        self.tracking_uri = _resolve_tracking_uri(tracking_uri)
+        self.sampler = None
         self._metrics_prefix = "system/"
         self.node_id = MLFLOW_SYSTEM_METRICS_NODE_ID.get() or node_id
         self._logging_step = self._get_next_logging_step(run_id) if resume_logging else 0
+        # Samples of the run, and the values of cumulative metrics when the run was registered to
+        # the sampler. Only accessed by the sampler thread.
+        self._samples = defaultdict(list)
+        self._num_samples = 0
+        self._cumulative_metrics = {}
+        self._cumulative_baseline = {}
+        self._pending_operations = []
+
+    @property
+    def run_id(self):
+        return self._run_id
 
     def _get_next_logging_step(self, run_id):
         from mlflow.tracking.client import MlflowClient
 
-        client = MlflowClient()
+        client = MlflowClient(self.tracking_uri)
         try:
             run = client.get_run(run_id)
         except MlflowException:
@@ -101,98 +123,71 @@ class SystemMetricsMonitor:
     def start(self):
         """Start monitoring system metrics."""
         try:
-            self._process = threading.Thread(
-                target=self.monitor,
-                daemon=True,
-                name="SystemMetricsMonitor",
-            )
-            self._process.start()
+            register_monitor(self)
             _logger.info("Started monitoring system metrics.")
         except Exception as e:
             _logger.warning(f"Failed to start monitoring system metrics: {e}")
-            self._process = None
-
-    def monitor(self):
-        """Main monitoring loop, which consistently collect and log system metrics."""
-        from mlflow.tracking.fluent import get_run
-
-        while not self._shutdown_event.is_set():
-            for _ in range(self.samples_before_logging):
-                self.collect_metrics()
-                self._shutdown_event.wait(self.sampling_interval)
-                try:
-                    # Get the MLflow run to check if the run is not RUNNING.
-                    run = get_run(self._run_id)
-                except Exception as e:
-                    _logger.warning(f"Failed to get mlflow run: {e}.")
-                    return
-                if run.info.status != "RUNNING" or self._shutdown_event.is_set():
-                    # If the mlflow run is terminated or receives the shutdown signal, stop
-                    # monitoring.
-                    return
-            metrics = self.aggregate_metrics()
-            try:
-                self.publish_metrics(metrics)
-            except Exception as e:
-                _logger.warning(
-                    f"Failed to log system metrics: {e}, this is expected if the experiment/run is "
-                    "already terminated."
-                )
-                return
-
-    def collect_metrics(self):
-        """Collect system metrics."""
-        metrics = {}
-        for monitor in self.monitors:
-            monitor.collect_metrics()
-            metrics.update(monitor._metrics)
-        return metrics
+            self.sampler = None
+
+    def record_sample(self, metrics, cumulative_metrics):
+        """Record a sample of system metrics, and return the metrics to log if they are due.
+
+        Args:
+            metrics: dict, the metrics of the sample that are averaged before logging.
+            cumulative_metrics: dict, the metrics of the sample that accumulate over the run, e.g.
+                network usage, which are logged as is.
+
+        Returns:
+            A list of :py:class:`mlflow.entities.Metric` to log once `samples_before_logging`
+            samples have been recorded, otherwise None.
+        """
+        for name, value in metrics.items():
+            self._samples[name].append(value)
+        self._cumulative_metrics = cumulative_metrics
+        self._num_samples += 1
+        if self._num_samples < self.samples_before_logging:
+            return None
+
+        metrics = self.aggregate_metrics()
+        self._samples.clear()
+        self._num_samples = 0
+        return self.publish_metrics(metrics)
 
     def aggregate_metrics(self):
         """Aggregate collected metrics."""
-        metrics = {}
-        for monitor in self.monitors:
-            metrics.update(monitor.aggregate_metrics())
+        metrics = {k: round(sum(v) / len(v), 1) for k, v in self._samples.items()}
+        metrics.update(self._cumulative_metrics)
         return metrics
 
     def publish_metrics(self, metrics):
-        """Log collected metrics to MLflow."""
+        """Convert aggregated metrics to MLflow metrics to log at the next logging step."""
         # Add prefix "system/" to the metrics name for grouping. If `self.node_id` is not None, also
         # add it to the metrics name.
         prefix = self._metrics_prefix + (self.node_id + "/" if self.node_id else "")
-        metrics = {prefix + k: v for k, v in metrics.items()}
-
-        self.mlflow_logger.record_metrics(metrics, self._logging_step)
+        timestamp = int(time.time() * 1000)
+        metrics = [Metric(prefix + k, v, timestamp, self._logging_step) for k, v in metrics.items()]
         self._logging_step += 1
-        for monitor in self.monitors:
-            monitor.clear_metrics()
+        return metrics
+
+    def add_pending_operation(self, operation):
+        """Track an async logging operation of the metrics, to wait for it in `finish()`."""
+        self._pending_operations = [
+            op
+            for op in self._pending_operations
+            if not all(future.done() for future in op._operation_futures)
+        ]
+        self._pending_operations.append(operation)
 
     def finish(self):
         """Stop monitoring system metrics."""
-        if self._process is None:
+        if self.sampler is None:
             return
         _logger.info("Stopping system metrics monitoring...")
-        self._shutdown_event.set()
         try:
-            self._process.join()
-            self.mlflow_logger.flush()
+            unregister_monitor(self)
+            if operations := get_combined_run_operations(self._pending_operations):
+                operations.wait()
             _logger.info("Successfully terminated system metrics monitoring!")
         except Exception as e:
             _logger.error(f"Error terminating system metrics monitoring process: {e}.")
-        self._process = None
-
-    def _initialize_gpu_monitor(self) -> Optional[BaseMetricsMonitor]:
-        # NVIDIA GPU
-        try:
-            return GPUMonitor()
-        except Exception:
-            _logger.debug("Failed to initialize GPU monitor for NVIDIA GPU.", exc_info=True)
-
-        # Falling back to pyrocml (AMD/HIP GPU)
-        try:
-            return ROCMMonitor()
-        except Exception:
-            _logger.debug("Failed to initialize GPU monitor for AMD/HIP GPU.", exc_info=True)
-
-        _logger.info("Skip logging GPU metrics. Set logger level to DEBUG for more details.")
-        return None
+        self.sampler = None
@@ -0,0 +1,308 @@
+"""Process-wide sampler of system stats shared by all system metrics monitors."""
+
+import logging
+import threading
+import time
+from typing import Optional
+
+from mlflow.system_metrics.metrics.base_metrics_monitor import BaseMetricsMonitor
+from mlflow.system_metrics.metrics.cpu_monitor import CPUMonitor
+from mlflow.system_metrics.metrics.disk_monitor import DiskMonitor
+from mlflow.system_metrics.metrics.gpu_monitor import GPUMonitor
+from mlflow.system_metrics.metrics.network_monitor import NetworkMonitor
+from mlflow.system_metrics.metrics.process_tree_monitor import ProcessTreeMonitor
+from mlflow.system_metrics.metrics.rocm_monitor import ROCMMonitor
+
+_logger = logging.getLogger(__name__)
+
+# Samplers by tracking URI and sampling interval. Monitors of runs with the same tracking URI and
+# sampling interval share a sampler, which logs the metrics of their runs to that tracking URI.
+_samplers = {}
+_samplers_lock = threading.Lock()
+
+# Maximum number of runs whose status is checked with a single search.
+_MAX_RUNS_PER_SEARCH = 100
+# Minimum interval between checks of the status of the runs, so that the checks don't dominate
+# the cost of sampling when the sampling interval is short.
+_RUN_STATUS_CHECK_INTERVAL_SECONDS = 5
+
+
+class SystemMetricsSampler:
+    """Class for sampling system stats on behalf of all `SystemMetricsMonitor`s of the process.
+
+    A single thread collects the system stats once per `sampling_interval` and fans the sample out
+    to every registered monitor, so the cost of sampling doesn't grow with the number of active
+    runs. Each monitor aggregates the samples of its own run, and the metrics of all the runs that
+    are due for logging are then submitted together to the async logging queue, which logs them in
+    batches.
+
+    Machine-wide CPU and memory stats are reported to monitors that don't set a `process_id`.
+    Monitors that set a `process_id` get the CPU and memory stats of that process tree instead,
+    which are collected once per process tree, however many monitors report them.
+
+    Use `register_monitor()` and `unregister_monitor()` rather than this class directly, so that
+    monitors with the same tracking URI and sampling interval share a sampler.
+
+    Args:
+        sampling_interval: float, the interval (in seconds) at which to pull system stats.
+        tracking_uri: string, the tracking URI to log the metrics of the runs to.
+    """
+
+    def __init__(self, sampling_interval, tracking_uri=None):
+        from mlflow.tracking.client import MlflowClient
+
+        self.sampling_interval = sampling_interval
+        self.tracking_uri = tracking_uri
+        self._cpu_monitor = CPUMonitor()
+        self._monitors = [DiskMonitor(), NetworkMonitor()]
+        if gpu_monitor := self._initialize_gpu_monitor():
+            self._monitors.append(gpu_monitor)
+        # Process tree monitors by root process ID.
+        self._process_tree_monitors = {}
+
+        self._client = MlflowClient(tracking_uri)
+        self._system_metrics_monitors = []
+        # Experiment IDs by run ID, to search the runs of the monitors.
+        self._experiment_ids = {}
+        # IDs of the runs that were RUNNING when their status was last checked.
+        self._running_run_ids = set()
+        self._last_run_status_check = 0
+        self._last_cumulative_metrics = {}
+        self._lock = threading.Lock()
+        # Held while a sample is fanned out and logged, so that no metrics are logged for a monitor
+        # once `remove_monitor()` returns.
+        self._sample_lock = threading.Lock()
+        self._shutdown_event = threading.Event()
+        self._thread = None
+
+    def add_monitor(self, monitor):
+        """Fan the samples out to `monitor`, starting from the next sample."""
+        with self._lock:
+            # Cumulative stats, e.g. network usage, are reported relative to when the monitor
+            # started.
+            monitor._cumulative_baseline = dict(self._last_cumulative_metrics)
+            if monitor.process_id is not None and (
+                monitor.process_id not in self._process_tree_monitors
+            ):
+                self._process_tree_monitors[monitor.process_id] = ProcessTreeMonitor(
+                    monitor.process_id
+                )
+            self._system_metrics_monitors.append(monitor)
+
+    def remove_monitor(self, monitor):
+        """Stop fanning the samples out to `monitor`.
+
+        Returns:
+            True if `monitor` was the last monitor of the sampler.
+        """
+        with self._sample_lock, self._lock:
+            if monitor not in self._system_metrics_monitors:
+                return False
+            self._system_metrics_monitors.remove(monitor)
+            self._experiment_ids.pop(monitor.run_id, None)
+            process_ids = {m.process_id for m in self._system_metrics_monitors}
+            for process_id in list(self._process_tree_monitors):
+                if process_id not in process_ids:
+                    del self._process_tree_monitors[process_id]
+            return not self._system_metrics_monitors
+
+    def start(self):
+        """Start sampling system stats."""
+        self._thread = threading.Thread(
+            target=self._sample_until_shutdown,
+            daemon=True,
+            # Monitors used to sample the system stats in their own threads with this name, so the
+            # name is kept for tools that look for it.
+            name="SystemMetricsMonitor",
+        )
+        self._thread.start()
+
+    def stop(self):
+        """Stop sampling system stats, and wait for the sampling thread to exit."""
+        self._shutdown_event.set()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join()
+
+    def _sample_until_shutdown(self):
+        while not self._shutdown_event.is_set():
+            start_time = time.monotonic()
+            terminated_monitors = []
+            try:
+                with self._sample_lock:
+                    terminated_monitors = self.sample()
+            except Exception as e:
+                _logger.warning(f"Failed to sample system metrics: {e}")
+            for monitor in terminated_monitors:
+                unregister_monitor(monitor)
+            # Sample on a fixed schedule, however long the sample took to collect and log.
+            elapsed_time = time.monotonic() - start_time
+            self._shutdown_event.wait(max(self.sampling_interval - elapsed_time, 0))
+
+    def sample(self):
+        """Collect system stats once, fan them out to the monitors, and log the due metrics.
+
+        Returns:
+            The monitors whose runs are terminated, which should no longer be sampled.
+        """
+        with self._lock:
+            system_metrics_monitors = list(self._system_metrics_monitors)
+            process_tree_monitors = dict(self._process_tree_monitors)
+
+        averaged_metrics, cumulative_metrics = self._collect_metrics(self._monitors)
+        cpu_metrics = None
+        if any(m.process_id is None for m in system_metrics_monitors):
+            cpu_metrics, _ = self._collect_metrics([self._cpu_monitor])
+        process_tree_metrics = {
+            process_id: self._collect_metrics([process_tree_monitor])[0]
+            for process_id, process_tree_monitor in process_tree_monitors.items()
+        }
+        with self._lock:
+            self._last_cumulative_metrics = cumulative_metrics
+
+        due_metrics = {}
+        for monitor in system_metrics_monitors:
+            if monitor.process_id is None:
+                monitor_averaged_metrics = {**averaged_metrics, **cpu_metrics}
+            else:
+                monitor_averaged_metrics = {
+                    **averaged_metrics,
+                    **process_tree_metrics.get(monitor.process_id, {}),
+                }
+            monitor_cumulative_metrics = {
+                k: v - monitor._cumulative_baseline.get(k, 0) for k, v in cumulative_metrics.items()
+            }
+            if metrics := monitor.record_sample(
+                monitor_averaged_metrics, monitor_cumulative_metrics
+            ):
+                due_metrics[monitor] = metrics
+        return self._log_metrics(due_metrics)
+
+    def _collect_metrics(self, monitors):
+        """Collect the latest stats of `monitors`.
+
+        Returns:
+            A tuple of the stats that are averaged over the samples before logging, and the
+            cumulative stats that are reported as is, e.g. network usage.
+        """
+        averaged_metrics = {}
+        cumulative_metrics = {}
+        for monitor in monitors:
+            try:
+                monitor.collect_metrics()
+            except Exception as e:
+                _logger.debug(f"Failed to collect metrics with {type(monitor).__name__}: {e}")
+            for name, value in monitor.metrics.items():
+                # Monitors append the stats that they average, and overwrite the cumulative ones.
+                if isinstance(value, list):
+                    averaged_metrics[name] = value[-1]
+                else:
+                    cumulative_metrics[name] = value
+            monitor.clear_metrics()
+        return averaged_metrics, cumulative_metrics
+
+    def _log_metrics(self, due_metrics):
+        run_ids = [monitor.run_id for monitor in due_metrics]
+        now = time.monotonic()
+        if now - self._last_run_status_check >= _RUN_STATUS_CHECK_INTERVAL_SECONDS:
+            self._running_run_ids = self._get_running_run_ids(run_ids)
+            self._last_run_status_check = now
+        elif new_run_ids := [run_id for run_id in run_ids if run_id not in self._running_run_ids]:
+            self._running_run_ids |= self._get_running_run_ids(new_run_ids)
+
+        terminated_monitors = []
+        for monitor, metrics in due_metrics.items():
+            if monitor.run_id not in self._running_run_ids:
+                # If the mlflow run is terminated, stop monitoring it.
+                terminated_monitors.append(monitor)
+                continue
+            try:
+                operation = self._client.log_batch(
+                    monitor.run_id, metrics=metrics, synchronous=False
+                )
+            except Exception as e:
+                _logger.warning(
+                    f"Failed to log system metrics: {e}, this is expected if the experiment/run is "
+                    "already terminated."
+                )
+                terminated_monitors.append(monitor)
+                continue
+            monitor.add_pending_operation(operation)
+        return terminated_monitors
+
+    def _get_running_run_ids(self, run_ids):
+        """Get the IDs of the runs in `run_ids` that are RUNNING.
+
+        The runs are searched in batches rather than fetched one by one, which would take longer
+        than the sampling interval with many concurrent runs.
+        """
+        for run_id in run_ids:
+            if run_id not in self._experiment_ids:
+                try:
+                    self._experiment_ids[run_id] = self._client.get_run(run_id).info.experiment_id
+                except Exception as e:
+                    _logger.warning(f"Failed to get mlflow run: {e}.")
+        run_ids = [run_id for run_id in run_ids if run_id in self._experiment_ids]
+
+        running_run_ids = set()
+        for i in range(0, len(run_ids), _MAX_RUNS_PER_SEARCH):
+            batch = run_ids[i : i + _MAX_RUNS_PER_SEARCH]
+            quoted_run_ids = ", ".join(f"'{run_id}'" for run_id in batch)
+            try:
+                runs = self._client.search_runs(
+                    list({self._experiment_ids[run_id] for run_id in batch}),
+                    filter_string=(
+                        f"attributes.run_id IN ({quoted_run_ids}) AND attributes.status = 'RUNNING'"
+                    ),
+                    max_results=len(batch),
+                )
+            except Exception as e:
+                _logger.warning(f"Failed to search mlflow runs: {e}.")
+                continue
+            running_run_ids.update(run.info.run_id for run in runs)
+        return running_run_ids
+
+    def _initialize_gpu_monitor(self) -> Optional[BaseMetricsMonitor]:
+        # NVIDIA GPU
+        try:
+            return GPUMonitor()
+        except Exception:
+            _logger.debug("Failed to initialize GPU monitor for NVIDIA GPU.", exc_info=True)
+
+        # Falling back to pyrocml (AMD/HIP GPU)
+        try:
+            return ROCMMonitor()
+        except Exception:
+            _logger.debug("Failed to initialize GPU monitor for AMD/HIP GPU.", exc_info=True)
+
+        _logger.info("Skip logging GPU metrics. Set logger level to DEBUG for more details.")
+        return None
+
+
+def register_monitor(monitor):
+    """
+    Register `monitor` to the sampler of its tracking URI and sampling interval, starting it if
+    needed.
+    """
+    key = (monitor.tracking_uri, monitor.sampling_interval)
+    with _samplers_lock:
+        if sampler := _samplers.get(key):
+            monitor.sampler = sampler
+            sampler.add_monitor(monitor)
+            return
+        sampler = SystemMetricsSampler(monitor.sampling_interval, monitor.tracking_uri)
+        monitor.sampler = sampler
+        sampler.add_monitor(monitor)
+        sampler.start()
+        _samplers[key] = sampler
+
+
+def unregister_monitor(monitor):
+    """Unregister `monitor` from its sampler, and stop the sampler if no monitors are left."""
+    with _samplers_lock:
+        sampler = monitor.sampler
+        if sampler is None or not sampler.remove_monitor(monitor):
+            return
+        key = (sampler.tracking_uri, sampler.sampling_interval)
+        if _samplers.get(key) is sampler:
+            del _samplers[key]
+    sampler.stop()
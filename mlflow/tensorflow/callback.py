@@ -126,6 +126,15 @@ class MlflowModelCheckpointCallback(Callback, MlflowModelCheckpointCallbackBase)
             aligned to epochs, the monitored metric may potentially be less reliable (it
             could reflect as little as 1 batch, since the metrics get reset
             every epoch). Defaults to `"epoch"`.
+        async_upload: If True, checkpoints are uploaded to MLflow in the background, so that
+            training only waits for the checkpoint to be saved locally. Defaults to False.
+        max_pending_uploads: If `async_upload` is True, the maximum number of checkpoints that
+            are saved locally and not uploaded yet. Defaults to 1.
+        keep_last_n: If `save_best_only` is False, the number of most recent checkpoints to
+            keep in the run. Defaults to None, which keeps all checkpoints.
+        keep_top_k: If `save_best_only` is False, the number of best checkpoints to keep in
+            the run according to the monitored quantity. Defaults to None, which keeps all
+            checkpoints.
 
     .. code-block:: python
         :caption: Example
@@ -179,6 +188,10 @@ class MlflowModelCheckpointCallback(Callback, MlflowModelCheckpointCallbackBase)
         save_best_only=True,
         save_weights_only=False,
         save_freq="epoch",
+        async_upload=False,
+        max_pending_uploads=1,
+        keep_last_n=None,
+        keep_top_k=None,
     ):
         Callback.__init__(self)
         MlflowModelCheckpointCallbackBase.__init__(
@@ -189,6 +202,10 @@ class MlflowModelCheckpointCallback(Callback, MlflowModelCheckpointCallbackBase)
             save_best_only=save_best_only,
             save_weights_only=save_weights_only,
             save_freq=save_freq,
+            async_upload=async_upload,
+            max_pending_uploads=max_pending_uploads,
+            keep_last_n=keep_last_n,
+            keep_top_k=keep_top_k,
         )
         self.trainer = None
         self.current_epoch = None
@@ -231,3 +248,6 @@ class MlflowModelCheckpointCallback(Callback, MlflowModelCheckpointCallbackBase)
                 global_step=self.global_step,
                 metric_dict={k: float(v) for k, v in logs.items()},
             )
+
+    def on_train_end(self, logs=None):
+        self.wait_for_pending_uploads()
@@ -538,7 +538,16 @@ class TracingClient:
     def _upload_trace_data(self, trace_info: TraceInfo, trace_data: TraceData) -> None:
         artifact_repo = self._get_artifact_repo_for_trace(trace_info)
         trace_data_json = json.dumps(trace_data.to_dict(), cls=TraceJSONEncoder, ensure_ascii=False)
-        return artifact_repo.upload_trace_data(trace_data_json)
+        artifact_repo.upload_trace_data(trace_data_json)
+        try:
+            self.store.log_spans(trace_info.trace_id, trace_data.spans)
+        except Exception as e:
+            # The trace data is already uploaded, so failing to index the spans must not fail
+            # logging the trace
+            _logger.warning(
+                f"Failed to index the spans of trace {trace_info.trace_id}. The trace cannot be "
+                f"searched by span. Error: {e}"
+            )
 
     def _upload_ended_trace_info(
         self,
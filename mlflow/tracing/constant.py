@@ -4,6 +4,12 @@ class TraceMetadataKey:
     OUTPUTS = "mlflow.traceOutputs"
     SOURCE_RUN = "mlflow.sourceRun"
     MODEL_ID = "mlflow.modelId"
+    # Counters of what was dropped to keep the trace within the limits configured by
+    # MLFLOW_TRACE_MAX_SPANS, MLFLOW_TRACE_MAX_SPAN_ATTRIBUTE_SIZE_BYTES and
+    # MLFLOW_TRACE_MAX_SIZE_BYTES. Only set if something was dropped.
+    NUM_DROPPED_SPANS = "mlflow.traceNumDroppedSpans"
+    NUM_TRUNCATED_SPAN_ATTRIBUTES = "mlflow.traceNumTruncatedSpanAttributes"
+    TRUNCATED_SPAN_ATTRIBUTE_BYTES = "mlflow.traceTruncatedSpanAttributeBytes"
 
 
 class TraceTagKey:
@@ -46,6 +52,10 @@ MAX_CHARS_IN_TRACE_INFO_TAGS_KEY = 250
 MAX_CHARS_IN_TRACE_INFO_TAGS_VALUE = 4096
 TRUNCATION_SUFFIX = "..."
 
+# Appended to span attribute values truncated to the trace size limits, with the size in bytes of
+# the original JSON-serialized value.
+SPAN_ATTRIBUTE_TRUNCATION_MARKER = "...[truncated from {size} bytes]"
+
 # Trace request ID must have the prefix "tr-" appended to the OpenTelemetry trace ID
 TRACE_REQUEST_ID_PREFIX = "tr-"
 
@@ -11,6 +11,7 @@ from mlflow.environment_variables import (
 from mlflow.tracing.client import TracingClient
 from mlflow.tracing.export.async_export_queue import AsyncTraceExportQueue, Task
 from mlflow.tracing.fluent import _set_last_active_trace_id
+from mlflow.tracing.sampling import TailSampler
 from mlflow.tracing.trace_manager import InMemoryTraceManager
 
 _logger = logging.getLogger(__name__)
@@ -27,6 +28,7 @@ class DatabricksSpanExporter(SpanExporter):
             _logger.info("MLflow is configured to log traces asynchronously.")
             self._async_queue = AsyncTraceExportQueue()
         self._client = TracingClient()
+        self._tail_sampler = TailSampler.from_env()
 
     def export(self, spans: Sequence[ReadableSpan]):
         """
@@ -46,6 +48,9 @@ class DatabricksSpanExporter(SpanExporter):
                 _logger.debug(f"Trace for span {span} not found. Skipping export.")
                 continue
 
+            if not self._tail_sampler.should_export(trace.info, span.name):
+                continue
+
             _set_last_active_trace_id(trace.info.request_id)
 
             if self._is_async:
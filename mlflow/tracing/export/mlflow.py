@@ -12,6 +12,7 @@ from mlflow.tracing.display import get_display_handler
 from mlflow.tracing.display.display_handler import IPythonTraceDisplayHandler
 from mlflow.tracing.export.async_export_queue import AsyncTraceExportQueue, Task
 from mlflow.tracing.fluent import _EVAL_REQUEST_ID_TO_TRACE_ID, _set_last_active_trace_id
+from mlflow.tracing.sampling import TailSampler
 from mlflow.tracing.trace_manager import InMemoryTraceManager
 from mlflow.tracing.utils import maybe_get_request_id
 
@@ -43,6 +44,7 @@ class MlflowSpanExporter(SpanExporter):
         self._display_handler = display_handler or get_display_handler()
         self._trace_manager = InMemoryTraceManager.get_instance()
         self._async_queue = AsyncTraceExportQueue()
+        self._tail_sampler = TailSampler.from_env()
 
     def export(self, spans: Sequence[ReadableSpan]):
         """
@@ -62,6 +64,10 @@ class MlflowSpanExporter(SpanExporter):
                 _logger.debug(f"TraceInfo for span {span} not found. Skipping export.")
                 continue
 
+            if not self._tail_sampler.should_export(trace.info, span.name):
+                self._discard_trace(trace)
+                continue
+
             _set_last_active_trace_id(trace.info.request_id)
 
             # Store mapping from eval request ID to trace ID so that the evaluation
@@ -76,6 +82,21 @@ class MlflowSpanExporter(SpanExporter):
 
             self._log_trace(trace)
 
+    def _discard_trace(self, trace: Trace):
+        """
+        Delete the trace info created in MLflow backend when the trace started, for a trace
+        dropped by tail sampling.
+        """
+        delete_trace_info_task = Task(
+            handler=self._client.delete_traces,
+            args=(trace.info.experiment_id, None, None, [trace.info.request_id]),
+            error_msg="Failed to delete a trace dropped by sampling from MLflow backend.",
+        )
+        if MLFLOW_ENABLE_ASYNC_LOGGING.get():
+            self._async_queue.put(delete_trace_info_task)
+        else:
+            delete_trace_info_task.handle()
+
     def _log_trace(self, trace: Trace):
         """Log the trace to MLflow backend."""
         upload_trace_data_task = Task(
@@ -93,8 +114,20 @@ class MlflowSpanExporter(SpanExporter):
         # TODO: Use MLFLOW_ENABLE_ASYNC_TRACE_LOGGING instead and default to async
         # logging once the async logging implementation becomes stable.
         if MLFLOW_ENABLE_ASYNC_LOGGING.get():
-            self._async_queue.put(upload_trace_data_task)
-            self._async_queue.put(upload_ended_trace_info_task)
+            # Run both uploads in one task, as the workers of the queue may run tasks out of
+            # order. A tracking server indexes the spans of a trace from its data when the trace
+            # is ended, so the data must be uploaded first.
+            self._async_queue.put(
+                Task(
+                    handler=_handle_in_order,
+                    args=(upload_trace_data_task, upload_ended_trace_info_task),
+                )
+            )
         else:
             upload_trace_data_task.handle()
             upload_ended_trace_info_task.handle()
+
+
+def _handle_in_order(*tasks: Task):
+    for task in tasks:
+        task.handle()
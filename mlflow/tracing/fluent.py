@@ -187,8 +187,9 @@ def _wrap_function(
             with start_span(
                 name=span_name, span_type=span_type, attributes=attributes, model_id=model_id
             ) as span:
-                span.set_attribute(SpanAttributeKey.FUNCTION_NAME, fn.__name__)
-                span.set_inputs(capture_function_input_args(fn, args, kwargs))
+                if not isinstance(span, NoOpSpan):
+                    span.set_attribute(SpanAttributeKey.FUNCTION_NAME, fn.__name__)
+                    span.set_inputs(capture_function_input_args(fn, args, kwargs))
                 result = yield  # sync/async function output to be sent here
                 span.set_outputs(result)
                 try:
@@ -419,14 +420,18 @@ def start_span(
     try:
         otel_span = provider.start_span_in_context(name)
 
-        # Create a new MLflow span and register it to the in-memory trace manager
-        request_id = get_otel_attribute(otel_span, SpanAttributeKey.REQUEST_ID)
-        mlflow_span = create_mlflow_span(otel_span, request_id, span_type)
-        attributes = dict(attributes) if attributes is not None else {}
-        if model_id is not None:
-            attributes[SpanAttributeKey.MODEL_ID] = model_id
-        mlflow_span.set_attributes(attributes)
-        InMemoryTraceManager.get_instance().register_span(mlflow_span)
+        if not otel_span.is_recording():
+            # Tracing is disabled or the trace is not sampled, so nothing needs to be recorded
+            mlflow_span = create_mlflow_span(otel_span, None)
+        else:
+            # Create a new MLflow span and register it to the in-memory trace manager
+            request_id = get_otel_attribute(otel_span, SpanAttributeKey.REQUEST_ID)
+            mlflow_span = create_mlflow_span(otel_span, request_id, span_type)
+            attributes = dict(attributes) if attributes is not None else {}
+            if model_id is not None:
+                attributes[SpanAttributeKey.MODEL_ID] = model_id
+            mlflow_span.set_attributes(attributes)
+            InMemoryTraceManager.get_instance().register_span(mlflow_span)
 
     except Exception:
         _logger.debug(f"Failed to start span {name}.", exc_info=True)
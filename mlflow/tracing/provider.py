@@ -289,7 +289,12 @@ def _setup_tracer_provider(disabled=False):
         exporter = MlflowSpanExporter()
         processor = MlflowSpanProcessor(exporter)
 
-    tracer_provider = TracerProvider()
+    from mlflow.tracing.sampling import get_head_sampler
+
+    if sampler := get_head_sampler():
+        tracer_provider = TracerProvider(sampler=sampler)
+    else:
+        tracer_provider = TracerProvider()
     tracer_provider.add_span_processor(processor)
     _MLFLOW_TRACER_PROVIDER = tracer_provider
 
@@ -0,0 +1,172 @@
+"""
+Sampling of traces.
+
+Head-based sampling decides whether a trace is recorded when its root span starts, based on
+``MLFLOW_TRACE_SAMPLING_RATIO``. It is implemented as an OpenTelemetry sampler, so that no span
+is created, no attribute is recorded, and no span processor is invoked for the traces that are
+not sampled. Child spans follow the decision made for their root span.
+
+Tail-based sampling decides whether a completed trace is exported, right before the export:
+
+- Traces with an error status are always exported.
+- Traces taking at least ``MLFLOW_TRACE_TAIL_SAMPLING_LATENCY_THRESHOLD_MS`` are always exported.
+- Other traces are exported with the ratio configured for the name of their root span in
+  ``MLFLOW_TRACE_TAIL_SAMPLING_RATIOS_BY_NAME``, or ``MLFLOW_TRACE_TAIL_SAMPLING_RATIO``.
+"""
+
+import json
+import logging
+import random
+import threading
+from typing import Optional
+
+from opentelemetry.sdk.trace.sampling import (
+    ParentBased,
+    Sampler,
+    SamplingResult,
+    TraceIdRatioBased,
+)
+
+from mlflow.entities.trace_info import TraceInfo
+from mlflow.entities.trace_status import TraceStatus
+from mlflow.environment_variables import (
+    MLFLOW_TRACE_SAMPLING_RATIO,
+    MLFLOW_TRACE_TAIL_SAMPLING_LATENCY_THRESHOLD_MS,
+    MLFLOW_TRACE_TAIL_SAMPLING_RATIO,
+    MLFLOW_TRACE_TAIL_SAMPLING_RATIOS_BY_NAME,
+)
+from mlflow.exceptions import MlflowException
+
+_logger = logging.getLogger(__name__)
+
+HEAD_SAMPLED = "head_sampled"
+HEAD_DROPPED = "head_dropped"
+TAIL_SAMPLED = "tail_sampled"
+TAIL_DROPPED = "tail_dropped"
+
+
+class _SamplingCounters:
+    """
+    Thread-safe counters of the traces sampled and dropped in this process.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counts = dict.fromkeys((HEAD_SAMPLED, HEAD_DROPPED, TAIL_SAMPLED, TAIL_DROPPED), 0)
+
+    def increment(self, key: str):
+        with self._lock:
+            self._counts[key] += 1
+
+    def get(self) -> dict[str, int]:
+        with self._lock:
+            return dict(self._counts)
+
+    def reset(self):
+        with self._lock:
+            self._counts = dict.fromkeys(self._counts, 0)
+
+
+_counters = _SamplingCounters()
+
+
+def get_sampling_counts() -> dict[str, int]:
+    """
+    Returns the number of traces sampled and dropped in this process, by head-based sampling
+    (``head_sampled`` and ``head_dropped``) and by tail-based sampling (``tail_sampled`` and
+    ``tail_dropped``). Head-based sampling is only counted when a sampling ratio is configured.
+    """
+    return _counters.get()
+
+
+def _validate_ratio(name: str, ratio: float) -> float:
+    if not 0 <= ratio <= 1:
+        raise MlflowException.invalid_parameter_value(
+            f"The trace sampling ratio {name} must be between 0 and 1, got {ratio}."
+        )
+    return ratio
+
+
+class _CountingRatioSampler(TraceIdRatioBased):
+    """
+    Samples root spans with a ratio based on their trace ID, and counts the decisions.
+    """
+
+    def should_sample(self, *args, **kwargs) -> SamplingResult:
+        result = super().should_sample(*args, **kwargs)
+        _counters.increment(HEAD_SAMPLED if result.decision.is_sampled() else HEAD_DROPPED)
+        return result
+
+
+def get_head_sampler() -> Optional[Sampler]:
+    """
+    Returns the sampler to set on the tracer provider, or None if every trace is recorded.
+    """
+    ratio = _validate_ratio(MLFLOW_TRACE_SAMPLING_RATIO.name, MLFLOW_TRACE_SAMPLING_RATIO.get())
+    if ratio >= 1:
+        return None
+    return ParentBased(root=_CountingRatioSampler(ratio))
+
+
+class TailSampler:
+    """
+    Decides whether to export completed traces.
+
+    Args:
+        ratio: The ratio of traces to export, for root span names not listed in
+            ``ratios_by_name``.
+        ratios_by_name: The ratio of traces to export, by name of the root span.
+        latency_threshold_ms: Traces taking at least this many milliseconds are always exported.
+    """
+
+    def __init__(
+        self,
+        ratio: float = 1.0,
+        ratios_by_name: Optional[dict[str, float]] = None,
+        latency_threshold_ms: Optional[int] = None,
+    ):
+        self._ratio = _validate_ratio("ratio", ratio)
+        self._ratios_by_name = {
+            name: _validate_ratio(name, r) for name, r in (ratios_by_name or {}).items()
+        }
+        self._latency_threshold_ms = latency_threshold_ms
+
+    @classmethod
+    def from_env(cls) -> "TailSampler":
+        ratios_by_name = None
+        if value := MLFLOW_TRACE_TAIL_SAMPLING_RATIOS_BY_NAME.get():
+            try:
+                ratios_by_name = {name: float(r) for name, r in json.loads(value).items()}
+            except (ValueError, TypeError, AttributeError) as e:
+                raise MlflowException.invalid_parameter_value(
+                    f"{MLFLOW_TRACE_TAIL_SAMPLING_RATIOS_BY_NAME.name} must be a JSON object "
+                    f"mapping span names to ratios, got {value!r}."
+                ) from e
+        return cls(
+            ratio=MLFLOW_TRACE_TAIL_SAMPLING_RATIO.get(),
+            ratios_by_name=ratios_by_name,
+            latency_threshold_ms=MLFLOW_TRACE_TAIL_SAMPLING_LATENCY_THRESHOLD_MS.get(),
+        )
+
+    def should_export(self, trace_info: TraceInfo, root_span_name: str) -> bool:
+        """
+        Returns whether the completed trace should be exported, and counts the decision.
+        """
+        if self._should_export(trace_info, root_span_name):
+            _counters.increment(TAIL_SAMPLED)
+            return True
+        _logger.debug(f"Trace {trace_info.request_id} is dropped by tail sampling.")
+        _counters.increment(TAIL_DROPPED)
+        return False
+
+    def _should_export(self, trace_info: TraceInfo, root_span_name: str) -> bool:
+        if trace_info.status == TraceStatus.ERROR:
+            return True
+        if (
+            self._latency_threshold_ms is not None
+            and trace_info.execution_time_ms is not None
+            and trace_info.execution_time_ms >= self._latency_threshold_ms
+        ):
+            return True
+        ratio = self._ratios_by_name.get(root_span_name, self._ratio)
+        return ratio >= 1 or random.random() < ratio
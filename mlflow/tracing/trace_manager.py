@@ -1,15 +1,88 @@
 import contextlib
+import json
 import logging
 import threading
 from dataclasses import dataclass, field
 from typing import Generator, Optional
 
 from mlflow.entities import LiveSpan, Trace, TraceData, TraceInfo
-from mlflow.environment_variables import MLFLOW_TRACE_TIMEOUT_SECONDS
+from mlflow.environment_variables import (
+    MLFLOW_TRACE_MAX_SIZE_BYTES,
+    MLFLOW_TRACE_MAX_SPAN_ATTRIBUTE_SIZE_BYTES,
+    MLFLOW_TRACE_MAX_SPANS,
+    MLFLOW_TRACE_TIMEOUT_SECONDS,
+)
+from mlflow.exceptions import MlflowException
+from mlflow.tracing.constant import (
+    SPAN_ATTRIBUTE_TRUNCATION_MARKER,
+    SpanAttributeKey,
+    TraceMetadataKey,
+)
 from mlflow.tracing.utils.timeout import get_trace_cache_with_timeout
 
 _logger = logging.getLogger(__name__)
 
+# Span attributes that identify a span, which are small and never truncated.
+_UNTRUNCATED_SPAN_ATTRIBUTE_KEYS = {
+    SpanAttributeKey.EXPERIMENT_ID,
+    SpanAttributeKey.REQUEST_ID,
+    SpanAttributeKey.SPAN_TYPE,
+    SpanAttributeKey.FUNCTION_NAME,
+    SpanAttributeKey.START_TIME_NS,
+    SpanAttributeKey.MODEL_ID,
+}
+
+
+@dataclass
+class _TraceLimits:
+    """Limits on the size of a trace, read from the environment when the trace starts."""
+
+    max_spans: Optional[int] = None
+    max_span_attribute_size_bytes: Optional[int] = None
+    max_size_bytes: Optional[int] = None
+
+    @classmethod
+    def from_env(cls) -> "_TraceLimits":
+        return cls(
+            max_spans=_get_limit(MLFLOW_TRACE_MAX_SPANS),
+            max_span_attribute_size_bytes=_get_limit(MLFLOW_TRACE_MAX_SPAN_ATTRIBUTE_SIZE_BYTES),
+            max_size_bytes=_get_limit(MLFLOW_TRACE_MAX_SIZE_BYTES),
+        )
+
+    @property
+    def limits_attribute_size(self) -> bool:
+        return self.max_span_attribute_size_bytes is not None or self.max_size_bytes is not None
+
+
+def _get_limit(env_var) -> Optional[int]:
+    value = env_var.get()
+    # A limit of 0 would drop the root span, or truncate every attribute to the marker alone
+    if value is not None and value < 1:
+        raise MlflowException.invalid_parameter_value(
+            f"{env_var.name} must be a positive integer, got {value}."
+        )
+    return value
+
+
+def _truncate_serialized_value(serialized_value: str, size: int, max_size: int) -> str:
+    """
+    Truncate a JSON-serialized value of `size` bytes to a JSON string of at most `max_size` bytes,
+    or of the truncation marker alone if it doesn't fit, that holds the beginning of the
+    serialized value followed by the truncation marker.
+    """
+    marker = SPAN_ATTRIBUTE_TRUNCATION_MARKER.format(size=size)
+    encoded_value = serialized_value.encode("utf-8")
+    prefix_size = max(max_size - len(marker) - 2, 0)
+    while True:
+        # Characters split at the end of the prefix are dropped.
+        prefix = encoded_value[:prefix_size].decode("utf-8", errors="ignore")
+        truncated_value = json.dumps(prefix + marker, ensure_ascii=False)
+        # Escaping quotes and control characters makes the JSON string longer than the prefix.
+        excess_size = len(truncated_value.encode("utf-8")) - max_size
+        if excess_size <= 0 or prefix_size == 0:
+            return truncated_value
+        prefix_size = max(prefix_size - excess_size, 0)
+
 
 # Internal representation to keep the state of a trace.
 # Dict[str, Span] is used instead of TraceData to allow access by span_id.
@@ -17,14 +90,66 @@ _logger = logging.getLogger(__name__)
 class _Trace:
     info: TraceInfo
     span_dict: dict[str, LiveSpan] = field(default_factory=dict)
+    # Guards the trace state, so that operations on different traces don't contend on a lock
+    lock: threading.RLock = field(default_factory=threading.RLock, repr=False, compare=False)
+    # Set once the trace is popped from the registry to be exported
+    is_popped: bool = False
+    limits: _TraceLimits = field(default_factory=_TraceLimits.from_env)
+    # Serialized size of the span attributes, and what was dropped to stay within the limits
+    size_bytes: int = 0
+    num_dropped_spans: int = 0
+    num_truncated_span_attributes: int = 0
+    truncated_span_attribute_bytes: int = 0
 
     def to_mlflow_trace(self) -> Trace:
         trace_data = TraceData()
         for span in self.span_dict.values():
             # Convert LiveSpan, mutable objects, into immutable Span objects before persisting.
             trace_data.spans.append(span.to_immutable_span())
+        for key, value in [
+            (TraceMetadataKey.NUM_DROPPED_SPANS, self.num_dropped_spans),
+            (TraceMetadataKey.NUM_TRUNCATED_SPAN_ATTRIBUTES, self.num_truncated_span_attributes),
+            (TraceMetadataKey.TRUNCATED_SPAN_ATTRIBUTE_BYTES, self.truncated_span_attribute_bytes),
+        ]:
+            if value:
+                self.info.request_metadata[key] = str(value)
         return Trace(self.info, trace_data)
 
+    def fit_span_attribute(self, key: str, serialized_value: str, previous_size: int) -> str:
+        """
+        Account a span attribute against the size limits of the trace, and return its serialized
+        value, truncated if it doesn't fit.
+
+        Args:
+            key: The key of the span attribute.
+            serialized_value: The JSON-serialized value of the span attribute.
+            previous_size: The size in bytes that was accounted for the previous value of the
+                attribute, if any, which no longer counts towards the size of the trace.
+        """
+        size = len(serialized_value.encode("utf-8"))
+        with self.lock:
+            max_size = self.limits.max_span_attribute_size_bytes
+            if self.limits.max_size_bytes is not None:
+                remaining_size = self.limits.max_size_bytes - self.size_bytes + previous_size
+                max_size = remaining_size if max_size is None else min(max_size, remaining_size)
+
+            if (
+                max_size is not None
+                and size > max_size
+                and key not in _UNTRUNCATED_SPAN_ATTRIBUTE_KEYS
+            ):
+                truncated_value = _truncate_serialized_value(serialized_value, size, max_size)
+                truncated_size = len(truncated_value.encode("utf-8"))
+                # The truncation marker alone may be longer than a short value.
+                if truncated_size < size:
+                    serialized_value = truncated_value
+                    self.num_truncated_span_attributes += 1
+                    self.truncated_span_attribute_bytes += size - truncated_size
+                    size = truncated_size
+
+            self.size_bytes += size - previous_size
+        return serialized_value
+
     def get_root_span(self) -> Optional[LiveSpan]:
         for span in self.span_dict.values():
             if span.parent_id is None:
@@ -35,6 +160,10 @@ class _Trace:
 class InMemoryTraceManager:
     """
     Manage spans and traces created by the tracing system in memory.
+
+    The registry lock only guards lookups and updates of the trace registry. The state of each
+    trace is guarded by its own lock, which is held while the caller of `get_trace` accesses the
+    trace, so that spans of concurrent traces are started and ended without contention.
     """
 
     _instance_lock = threading.Lock()
@@ -54,7 +183,7 @@ class InMemoryTraceManager:
 
         # Store mapping between OpenTelemetry trace ID and MLflow request ID
         self._trace_id_to_request_id: dict[int, str] = {}
-        self._lock = threading.Lock()  # Lock for _traces
+        self._lock = threading.Lock()  # Lock for _traces, never held while accessing a trace
 
     def register_trace(self, trace_id: int, trace_info: TraceInfo):
         """
@@ -78,10 +207,12 @@ class InMemoryTraceManager:
             trace_info: The updated trace info object to be stored.
         """
         with self._lock:
-            if trace_info.request_id not in self._traces:
-                _logger.debug(f"Trace data with request ID {trace_info.request_id} not found.")
-                return
-            self._traces[trace_info.request_id].info = trace_info
+            trace = self._traces.get(trace_info.request_id)
+        if trace is None:
+            _logger.debug(f"Trace data with request ID {trace_info.request_id} not found.")
+            return
+        with trace.lock:
+            trace.info = trace_info
 
     def register_span(self, span: LiveSpan):
         """
@@ -95,18 +226,51 @@ class InMemoryTraceManager:
             return
 
         with self._lock:
-            trace_data_dict = self._traces[span.request_id].span_dict
-            trace_data_dict[span.span_id] = span
+            trace = self._traces[span.request_id]
+        with trace.lock:
+            max_spans = trace.limits.max_spans
+            if (
+                max_spans is not None
+                and len(trace.span_dict) >= max_spans
+                and span.span_id not in trace.span_dict
+            ):
+                # The attributes of the dropped span no longer count towards the trace size.
+                trace.size_bytes -= span._attributes.detach_from_trace()
+                trace.num_dropped_spans += 1
+                _logger.debug(
+                    f"Dropping span {span.name!r} of trace {span.request_id}, which reached the "
+                    f"limit of {max_spans} spans set by {MLFLOW_TRACE_MAX_SPANS}."
+                )
+                return
+            trace.span_dict[span.span_id] = span
 
     @contextlib.contextmanager
     def get_trace(self, request_id: str) -> Generator[Optional[_Trace], None, None]:
         """
         Yield the trace info for the given request_id.
         This is designed to be used as a context manager to ensure the trace info is accessed
-        with the lock held.
+        with the lock of the trace held. None is yielded if the trace doesn't exist or has been
+        popped for export.
         """
         with self._lock:
-            yield self._traces.get(request_id)
+            trace = self._traces.get(request_id)
+
+        if trace is None:
+            yield None
+            return
+
+        with trace.lock:
+            yield None if trace.is_popped else trace
+
+    def get_trace_to_account_span_attributes(self, request_id: str) -> Optional[_Trace]:
+        """
+        Get the trace that the attributes of a new span of `request_id` are accounted against,
+        or None if the trace doesn't limit the size of span attributes.
+        """
+        with self._lock:
+            trace = self._traces.get(request_id)
+
+        return trace if trace and trace.limits.limits_attribute_size else None
 
     def get_span_from_id(self, request_id: str, span_id: str) -> Optional[LiveSpan]:
         """
@@ -125,9 +289,10 @@ class InMemoryTraceManager:
             trace = self._traces.get(request_id)
 
         if trace:
-            for span in trace.span_dict.values():
-                if span.parent_id is None:
-                    return span.span_id
+            with trace.lock:
+                for span in trace.span_dict.values():
+                    if span.parent_id is None:
+                        return span.span_id
 
         return None
 
@@ -152,7 +317,14 @@ class InMemoryTraceManager:
         with self._lock:
             request_id = self._trace_id_to_request_id.pop(trace_id, None)
             trace = self._traces.pop(request_id, None)
-        return trace.to_mlflow_trace() if trace else None
+
+        if trace is None:
+            return None
+
+        # Wait for the callers of `get_trace` that found the trace before it was popped
+        with trace.lock:
+            trace.is_popped = True
+            return trace.to_mlflow_trace()
 
     def _check_timeout_update(self):
         """
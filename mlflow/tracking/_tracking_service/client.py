@@ -36,6 +36,7 @@ from mlflow.store.tracking import (
 )
 from mlflow.store.tracking.rest_store import RestStore
 from mlflow.tracking._tracking_service import utils
+from mlflow.tracking._tracking_service.run_context_cache import _run_context_cache
 from mlflow.tracking.metric_value_conversion_utils import convert_metric_value_to_float_if_possible
 from mlflow.utils import chunk_list
 from mlflow.utils.async_logging.run_operations import RunOperations, get_combined_run_operations
@@ -572,9 +573,11 @@ class TrackingServiceClient:
             None
         """
         self.store.log_inputs(run_id=run_id, datasets=datasets, models=models)
+        _run_context_cache.add_inputs(run_id, datasets=datasets, models=models)
 
     def log_outputs(self, run_id: str, models: list[LoggedModelOutput]):
         self.store.log_outputs(run_id=run_id, models=models)
+        _run_context_cache.add_outputs(run_id, models)
 
     def _record_logged_model(self, run_id, mlflow_model):
         from mlflow.models import Model
@@ -770,6 +773,7 @@ class TrackingServiceClient:
         max_results=SEARCH_MAX_RESULTS_DEFAULT,
         order_by=None,
         page_token=None,
+        columns=None,
     ):
         """Search experiments that fit the search criteria.
 
@@ -784,6 +788,9 @@ class TrackingServiceClient:
                 The default ordering is to sort by ``start_time DESC``, then ``run_id``.
             page_token: Token specifying the next page of results. It should be obtained from
                 a ``search_runs`` call.
+            columns: List of the metrics, params, and tags to return for each run (e.g.,
+                ``["metrics.rmse", "params.alpha"]``). If empty, only the run info is returned.
+                If None, all the metrics, params, and tags of the runs are returned.
 
         Returns:
             A :py:class:`PagedList <mlflow.store.entities.PagedList>` of
@@ -794,6 +801,9 @@ class TrackingServiceClient:
         """
         if isinstance(experiment_ids, int) or is_string_type(experiment_ids):
             experiment_ids = [experiment_ids]
+        # ``columns`` is only passed when specified, for stores implementing ``search_runs``
+        # without it
+        kwargs = {} if columns is None else {"columns": columns}
         return self.store.search_runs(
             experiment_ids=experiment_ids,
             filter_string=filter_string,
@@ -801,6 +811,7 @@ class TrackingServiceClient:
             max_results=max_results,
             order_by=order_by,
             page_token=page_token,
+            **kwargs,
         )
 
     def create_logged_model(
@@ -0,0 +1,119 @@
+"""
+Client-side cache of the inputs and outputs linked to runs.
+
+Fluent metric logging needs to know which datasets and models are already linked to a run, and
+which models were logged at the step of a metric. Fetching the run for every metric costs two full
+``get_run`` round trips per ``mlflow.log_metric`` call, so this module keeps that information per
+run: it is populated from the first ``get_run`` and then kept up to date by the inputs and outputs
+logged through :py:class:`mlflow.tracking.MlflowClient` in this process.
+"""
+
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Callable, Optional
+
+from mlflow.entities import DatasetInput, LoggedModelInput, LoggedModelOutput, Run
+
+# Maximum number of runs whose context is cached
+_MAX_CACHED_RUNS = 128
+
+
+@dataclass
+class RunContext:
+    """
+    The datasets and models linked to a run.
+
+    Args:
+        dataset_inputs: ``(name, digest)`` pairs of the datasets logged as inputs of the run.
+        model_input_ids: IDs of the models logged as inputs of the run.
+        model_outputs: ``(model_id, step)`` pairs of the models logged as outputs of the run, in
+            logging order.
+    """
+
+    dataset_inputs: set[tuple[str, str]] = field(default_factory=set)
+    model_input_ids: set[str] = field(default_factory=set)
+    model_outputs: list[tuple[str, int]] = field(default_factory=list)
+
+    @classmethod
+    def from_run(cls, run: Run) -> "RunContext":
+        inputs = run.inputs
+        outputs = run.outputs
+        return cls(
+            dataset_inputs={
+                (i.dataset.name, i.dataset.digest) for i in (inputs and inputs.dataset_inputs) or []
+            },
+            model_input_ids={i.model_id for i in (inputs and inputs.model_inputs) or []},
+            model_outputs=[(o.model_id, o.step) for o in (outputs and outputs.model_outputs) or []],
+        )
+
+    def has_model(self, model_id: str) -> bool:
+        return model_id in self.model_input_ids or any(
+            output_id == model_id for output_id, _ in self.model_outputs
+        )
+
+    def get_output_model_ids(self, step: int) -> list[str]:
+        return [model_id for model_id, output_step in self.model_outputs if output_step == step]
+
+
+class RunContextCache:
+    """
+    A thread-safe LRU cache of :py:class:`RunContext` by run ID.
+    """
+
+    def __init__(self, max_size: int = _MAX_CACHED_RUNS):
+        self._max_size = max_size
+        self._contexts: OrderedDict[str, RunContext] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, run_id: str, get_run: Callable[[], Run]) -> RunContext:
+        """
+        Returns the context of the run, calling ``get_run`` to populate it on a cache miss.
+        """
+        with self._lock:
+            if context := self._contexts.get(run_id):
+                self._contexts.move_to_end(run_id)
+                return context
+
+        # Fetch the run outside of the lock so that a slow request does not block other runs
+        context = RunContext.from_run(get_run())
+        with self._lock:
+            # Keep the entry of a concurrent caller, which may have been updated since
+            context = self._contexts.setdefault(run_id, context)
+            self._contexts.move_to_end(run_id)
+            while len(self._contexts) > self._max_size:
+                self._contexts.popitem(last=False)
+            return context
+
+    def add_inputs(
+        self,
+        run_id: str,
+        datasets: Optional[list[DatasetInput]] = None,
+        models: Optional[list[LoggedModelInput]] = None,
+    ) -> None:
+        with self._lock:
+            if context := self._contexts.get(run_id):
+                context.dataset_inputs.update(
+                    (d.dataset.name, d.dataset.digest) for d in datasets or []
+                )
+                context.model_input_ids.update(m.model_id for m in models or [])
+
+    def add_outputs(self, run_id: str, models: list[LoggedModelOutput]) -> None:
+        with self._lock:
+            if context := self._contexts.get(run_id):
+                for model in models:
+                    if (model.model_id, model.step) not in context.model_outputs:
+                        context.model_outputs.append((model.model_id, model.step))
+
+    def invalidate(self, run_id: Optional[str] = None) -> None:
+        """
+        Drops the context of the run, or of every run if ``run_id`` is None.
+        """
+        with self._lock:
+            if run_id is None:
+                self._contexts.clear()
+            else:
+                self._contexts.pop(run_id, None)
+
+
+_run_context_cache = RunContextCache()
@@ -1259,6 +1259,11 @@ class MlflowClient:
 
         trace_manager = InMemoryTraceManager.get_instance()
         if not (parent_span := trace_manager.get_span_from_id(trace_id, parent_id)):
+            with trace_manager.get_trace(trace_id) as trace:
+                if trace and trace.num_dropped_spans:
+                    # The parent span was dropped as the trace reached its span limit, so the
+                    # child would be dropped too
+                    return NoOpSpan()
             raise MlflowException(
                 f"Parent span with ID '{parent_id}' not found.",
                 error_code=RESOURCE_DOES_NOT_EXIST,
@@ -3346,6 +3351,7 @@ class MlflowClient:
         max_results: int = SEARCH_MAX_RESULTS_DEFAULT,
         order_by: Optional[list[str]] = None,
         page_token: Optional[str] = None,
+        columns: Optional[list[str]] = None,
     ) -> PagedList[Run]:
         """
         Search for Runs that fit the specified criteria.
@@ -3361,6 +3367,11 @@ class MlflowClient:
                 The default ordering is to sort by ``start_time DESC``, then ``run_id``.
             page_token: Token specifying the next page of results. It should be obtained from
                 a ``search_runs`` call.
+            columns: List of the metrics, params, and tags to return for each run (e.g.,
+                ``["metrics.rmse", "params.alpha", "tags.`user-name`"]``). If empty, only the run
+                info is returned. If None, all the metrics, params, and tags of the runs are
+                returned. Listing only the displayed columns speeds up searches over runs with
+                many metrics, params, or tags.
 
         Returns:
             A :py:class:`PagedList <mlflow.store.entities.PagedList>` of
@@ -3428,7 +3439,13 @@ class MlflowClient:
             tags: {'s.release': '1.1.0-RC'}
         """
         return self._tracking_client.search_runs(
-            experiment_ids, filter_string, run_view_type, max_results, order_by, page_token
+            experiment_ids,
+            filter_string,
+            run_view_type,
+            max_results,
+            order_by,
+            page_token,
+            columns=columns,
         )
 
     # Registry API
@@ -47,6 +47,7 @@ from mlflow.protos.databricks_pb2 import (
 from mlflow.store.tracking import SEARCH_MAX_RESULTS_DEFAULT
 from mlflow.tracing.provider import _get_trace_exporter
 from mlflow.tracking._tracking_service.client import TrackingServiceClient
+from mlflow.tracking._tracking_service.run_context_cache import RunContext, _run_context_cache
 from mlflow.tracking._tracking_service.utils import _resolve_tracking_uri
 from mlflow.utils import get_results_from_paginated_fn
 from mlflow.utils.annotations import experimental
@@ -541,6 +542,7 @@ def end_run(status: str = RunStatus.to_string(RunStatus.FINISHED)) -> None:
         last_active_run_id = run.info.run_id
         _last_active_run_id.set(last_active_run_id)
         MlflowClient().set_terminated(last_active_run_id, status)
+        _run_context_cache.invalidate(last_active_run_id)
         if last_active_run_id in run_id_to_system_metrics_monitor:
             system_metrics_monitor = run_id_to_system_metrics_monitor.pop(last_active_run_id)
             system_metrics_monitor.finish()
@@ -988,20 +990,17 @@ def log_metric(
 def _log_inputs_for_metrics_if_necessary(
     run_id, metrics: list[Metric], datasets: Optional[list["Dataset"]] = None
 ) -> None:
-    client = MlflowClient()
-    run = client.get_run(run_id)
     datasets = datasets or []
+    if not datasets and all(metric.model_id is None for metric in metrics):
+        return
+
+    client = MlflowClient()
+    # Logging inputs through the client updates the cached run context
+    run_context = _get_run_context(run_id)
     for metric in metrics:
-        input_model_ids = [i.model_id for i in (run.inputs and run.inputs.model_inputs) or []]
-        output_model_ids = [o.model_id for o in (run.outputs and run.outputs.model_outputs) or []]
-        if (
-            metric.model_id is not None
-            and metric.model_id not in input_model_ids + output_model_ids
-        ):
+        if metric.model_id is not None and not run_context.has_model(metric.model_id):
             client.log_inputs(run_id, models=[LoggedModelInput(model_id=metric.model_id)])
-        if (metric.dataset_name, metric.dataset_digest) not in [
-            (inp.dataset.name, inp.dataset.digest) for inp in run.inputs.dataset_inputs
-        ]:
+        if (metric.dataset_name, metric.dataset_digest) not in run_context.dataset_inputs:
             matching_dataset = next(
                 (
                     dataset
@@ -1019,11 +1018,15 @@ def _log_inputs_for_metrics_if_necessary(
 
 
 def _get_model_ids_for_new_metric_if_exist(run_id: str, metric_step: str) -> list[str]:
-    client = MlflowClient()
-    run = client.get_run(run_id)
-    outputs = run.outputs.model_outputs if run.outputs else []
-    model_outputs_at_step = [mo for mo in outputs if mo.step == metric_step]
-    return [mo.model_id for mo in model_outputs_at_step]
+    return _get_run_context(run_id).get_output_model_ids(metric_step)
+
+
+def _get_run_context(run_id: str) -> RunContext:
+    """
+    Returns the datasets and models linked to the run. The run is only fetched the first time,
+    after which the context is kept up to date by the inputs and outputs logged in this process.
+    """
+    return _run_context_cache.get(run_id, lambda: MlflowClient().get_run(run_id))
 
 
 def log_metrics(
@@ -2551,6 +2554,7 @@ def search_runs(
     output_format: str = "pandas",
     search_all_experiments: bool = False,
     experiment_names: Optional[list[str]] = None,
+    columns: Optional[list[str]] = None,
 ) -> Union[list[Run], "pandas.DataFrame"]:
     """
     Search for Runs that fit the specified criteria.
@@ -2579,6 +2583,9 @@ def search_runs(
             than ``None`` or ``[]`` will result in error if ``experiment_ids``
             is also not ``None`` or ``[]``. ``None`` will default to the active
             experiment if ``experiment_ids`` is ``None`` or ``[]``.
+        columns: List of the metrics, params, and tags to return for each run (e.g.,
+            ``["metrics.rmse", "params.alpha"]``). If empty, only the run info is returned. If
+            ``None``, all the metrics, params, and tags of the runs are returned.
 
     Returns:
         If output_format is ``list``: a list of :py:class:`mlflow.entities.Run`. If
@@ -2670,6 +2677,7 @@ def search_runs(
                 number_to_get,
                 order_by,
                 next_page_token,
+                columns=columns,
             )
 
         runs = get_results_from_paginated_fn(
@@ -1,8 +1,16 @@
+import uuid
+
 from mlflow import __version__
 from mlflow.tracking.request_header.abstract_request_header_provider import RequestHeaderProvider
 
 _USER_AGENT = "User-Agent"
-_DEFAULT_HEADERS = {_USER_AGENT: f"mlflow-python-client/{__version__}"}
+# Identifies the client process, e.g. so that a tracking server with read replicas serves the reads
+# of a client from the primary database right after the client writes
+MLFLOW_CLIENT_ID_HEADER = "X-MLflow-Client-Id"
+_DEFAULT_HEADERS = {
+    _USER_AGENT: f"mlflow-python-client/{__version__}",
+    MLFLOW_CLIENT_ID_HEADER: uuid.uuid4().hex,
+}
 
 
 class DefaultRequestHeaderProvider(RequestHeaderProvider):
@@ -1,6 +1,13 @@
+import json
 import logging
 import os
 import posixpath
+import shutil
+import tempfile
+import threading
+from collections import deque
+from dataclasses import dataclass
+from typing import Optional
 
 import mlflow
 from mlflow.exceptions import MlflowException
@@ -22,6 +29,18 @@ _CHECKPOINT_GLOBAL_STEP_PREFIX = "global_step_"
 _WEIGHT_ONLY_CHECKPOINT_SUFFIX = ".weights"
 
 
+@dataclass
+class _Checkpoint:
+    """A checkpoint saved in ``local_dir`` to be uploaded to ``artifact_dir`` of a run."""
+
+    run_id: str
+    local_dir: str
+    artifact_dir: str
+    model_filename: str
+    monitor_value: Optional[float]
+    index: int
+
+
 class MlflowModelCheckpointCallbackBase(metaclass=ExceptionSafeAbstractClass):
     """Callback base class for automatic model checkpointing to MLflow.
 
@@ -48,6 +67,22 @@ class MlflowModelCheckpointCallbackBase(metaclass=ExceptionSafeAbstractClass):
             aligned to epochs, the monitored metric may potentially be less reliable (it
             could reflect as little as 1 batch, since the metrics get reset
             every epoch). Defaults to `"epoch"`.
+        async_upload: If True, checkpoints are uploaded to MLflow by background threads, so that
+            training only waits for the checkpoint to be saved to a local temporary directory.
+            The latest checkpoint tag of the run is set once the upload of the checkpoint has
+            completed. Defaults to False.
+        max_pending_uploads: If `async_upload` is True, the maximum number of checkpoints
+            that are saved locally and not uploaded yet. When the limit is reached, saving the
+            next checkpoint waits for the oldest upload to complete, which bounds the local disk
+            space used by the checkpoints. With `save_best_only`, the checkpoints overwrite
+            each other, so they are uploaded one at a time. Defaults to 1.
+        keep_last_n: If `save_best_only` is False, the number of most recent checkpoints to
+            keep in the run. Older checkpoints are deleted from the run's artifacts.
+            Defaults to None, which keeps all checkpoints.
+        keep_top_k: If `save_best_only` is False, the number of best checkpoints to keep in
+            the run according to the `monitor` metric and `mode`. If `keep_last_n` is also set,
+            the checkpoints kept by either policy are kept. The latest checkpoint is always kept.
+            Defaults to None, which keeps all checkpoints.
     """
 
     def __init__(
@@ -58,6 +93,10 @@ class MlflowModelCheckpointCallbackBase(metaclass=ExceptionSafeAbstractClass):
         save_best_only,
         save_weights_only,
         save_freq,
+        async_upload=False,
+        max_pending_uploads=1,
+        keep_last_n=None,
+        keep_top_k=None,
     ):
         self.checkpoint_file_suffix = checkpoint_file_suffix
         self.monitor = monitor
@@ -66,9 +105,26 @@ class MlflowModelCheckpointCallbackBase(metaclass=ExceptionSafeAbstractClass):
         self.save_weights_only = save_weights_only
         self.save_freq = save_freq
         self.last_monitor_value = None
+        self.async_upload = async_upload
+        self.max_pending_uploads = max_pending_uploads
+        self.keep_last_n = keep_last_n
+        self.keep_top_k = keep_top_k
 
         self.mlflow_tracking_uri = mlflow.get_tracking_uri()
 
+        # The upload queue and the lock are created on the first checkpoint, so that the callback
+        # can be pickled to the trainer workers of distributed training before that
+        self._upload_queue = None
+        self._pending_uploads = deque()
+        self._checkpoint_lock = None
+        self._num_checkpoints = 0
+        self._uploaded_checkpoints = []
+        self._latest_tagged_index = -1
+        # Locks serializing the uploads to each artifact path, and the index of the checkpoint
+        # last uploaded to each artifact path
+        self._artifact_path_locks = {}
+        self._uploaded_index_by_artifact_path = {}
+
         if self.save_best_only:
             if self.monitor is None:
                 raise MlflowException(
@@ -81,6 +137,23 @@ class MlflowModelCheckpointCallbackBase(metaclass=ExceptionSafeAbstractClass):
                     "'mode' config and available modes includes 'min' and 'max', but you set "
                     f"'mode' to '{self.mode}'."
                 )
+        if self.async_upload and self.max_pending_uploads < 1:
+            raise MlflowException(
+                f"Checkpoint 'max_pending_uploads' config must be at least 1, but you set it to "
+                f"{self.max_pending_uploads}."
+            )
+        for name, value in [("keep_last_n", keep_last_n), ("keep_top_k", keep_top_k)]:
+            if value is not None and value < 1:
+                raise MlflowException(
+                    f"Checkpoint '{name}' config must be at least 1, but you set it to {value}."
+                )
+        if self.keep_top_k is not None and (
+            self.monitor is None or self.mode not in ["min", "max"]
+        ):
+            raise MlflowException(
+                "If checkpoint 'keep_top_k' config is set, you need to set 'monitor' config and "
+                "'mode' config to 'min' or 'max' as well."
+            )
 
     def _is_new_checkpoint_better(self, new_monitor_value):
         if self.last_monitor_value is None:
@@ -149,13 +222,24 @@ class MlflowModelCheckpointCallbackBase(metaclass=ExceptionSafeAbstractClass):
             checkpoint_metrics_filename = _CHECKPOINT_METRIC_FILENAME
             checkpoint_artifact_dir = f"{_CHECKPOINT_DIR}/{sub_dir_name}"
 
+        checkpoint_metrics = {**metric_dict, "epoch": current_epoch, "global_step": global_step}
+
+        if self.async_upload:
+            self._save_checkpoint_async(
+                checkpoint_artifact_dir,
+                checkpoint_model_filename,
+                checkpoint_metrics_filename,
+                checkpoint_metrics,
+            )
+            return
+
         mlflow.set_tag(
             LATEST_CHECKPOINT_ARTIFACT_TAG_KEY,
             f"{checkpoint_artifact_dir}/{checkpoint_model_filename}",
         )
 
         mlflow.log_dict(
-            {**metric_dict, "epoch": current_epoch, "global_step": global_step},
+            checkpoint_metrics,
             f"{checkpoint_artifact_dir}/{checkpoint_metrics_filename}",
         )
 
@@ -164,6 +248,144 @@ class MlflowModelCheckpointCallbackBase(metaclass=ExceptionSafeAbstractClass):
             self.save_checkpoint(tmp_model_save_path)
             mlflow.log_artifact(tmp_model_save_path, checkpoint_artifact_dir)
 
+        if not self.save_best_only:
+            self._apply_retention_policy(
+                self._new_checkpoint(
+                    None, checkpoint_artifact_dir, checkpoint_model_filename, checkpoint_metrics
+                )
+            )
+
+    def _new_checkpoint(self, local_dir, artifact_dir, model_filename, checkpoint_metrics):
+        from mlflow.tracking.fluent import _get_or_start_run
+
+        if self._checkpoint_lock is None:
+            self._checkpoint_lock = threading.Lock()
+        checkpoint = _Checkpoint(
+            run_id=_get_or_start_run().info.run_id,
+            local_dir=local_dir,
+            artifact_dir=artifact_dir,
+            model_filename=model_filename,
+            monitor_value=checkpoint_metrics.get(self.monitor),
+            index=self._num_checkpoints,
+        )
+        self._num_checkpoints += 1
+        return checkpoint
+
+    def _save_checkpoint_async(
+        self, artifact_dir, model_filename, metrics_filename, checkpoint_metrics
+    ):
+        from mlflow.utils.async_logging.async_artifacts_logging_queue import (
+            AsyncArtifactsLoggingQueue,
+        )
+
+        if self._upload_queue is None:
+            self._upload_queue = AsyncArtifactsLoggingQueue(self._upload_checkpoint)
+            self._upload_queue.activate()
+
+        # Bound the number of checkpoints saved locally that are not uploaded yet
+        while len(self._pending_uploads) >= self.max_pending_uploads:
+            self._pending_uploads.popleft().wait()
+
+        local_dir = tempfile.mkdtemp()
+        try:
+            self.save_checkpoint(os.path.join(local_dir, model_filename))
+            with open(os.path.join(local_dir, metrics_filename), "w") as f:
+                json.dump(checkpoint_metrics, f, indent=2)
+        except Exception:
+            shutil.rmtree(local_dir, ignore_errors=True)
+            raise
+        checkpoint = self._new_checkpoint(
+            local_dir, artifact_dir, model_filename, checkpoint_metrics
+        )
+        self._pending_uploads.append(
+            self._upload_queue.log_artifacts_async(
+                filename=model_filename, artifact_path=artifact_dir, artifact=checkpoint
+            )
+        )
+
+    def _upload_checkpoint(self, filename, artifact_path, artifact):
+        from mlflow import MlflowClient
+
+        checkpoint = artifact
+        client = MlflowClient(self.mlflow_tracking_uri)
+        with self._checkpoint_lock:
+            artifact_path_lock = self._artifact_path_locks.setdefault(
+                artifact_path, threading.Lock()
+            )
+        try:
+            # With `save_best_only`, all the checkpoints are uploaded to the same artifact path.
+            # Uploads to the same path are serialized, and a checkpoint is not uploaded once a
+            # newer one is, so that an older checkpoint never overwrites a better one.
+            with artifact_path_lock:
+                if checkpoint.index < self._uploaded_index_by_artifact_path.get(artifact_path, -1):
+                    return
+                client.log_artifacts(checkpoint.run_id, checkpoint.local_dir, artifact_path)
+                self._uploaded_index_by_artifact_path[artifact_path] = checkpoint.index
+        finally:
+            shutil.rmtree(checkpoint.local_dir, ignore_errors=True)
+
+        with self._checkpoint_lock:
+            # Uploads may complete out of order, so the tag is only moved forward
+            if checkpoint.index > self._latest_tagged_index:
+                client.set_tag(
+                    checkpoint.run_id,
+                    LATEST_CHECKPOINT_ARTIFACT_TAG_KEY,
+                    f"{artifact_path}/{filename}",
+                )
+                self._latest_tagged_index = checkpoint.index
+        if not self.save_best_only:
+            self._apply_retention_policy(checkpoint)
+
+    def _apply_retention_policy(self, checkpoint):
+        """
+        Deletes the uploaded checkpoints of the run that are neither among the `keep_last_n`
+        latest checkpoints, nor among the `keep_top_k` best checkpoints, nor the latest one.
+        """
+        if self.keep_last_n is None and self.keep_top_k is None:
+            return
+
+        with self._checkpoint_lock:
+            self._uploaded_checkpoints.append(checkpoint)
+            by_recency = sorted(self._uploaded_checkpoints, key=lambda c: c.index, reverse=True)
+            kept = {by_recency[0].index}
+            if self.keep_last_n is not None:
+                kept.update(c.index for c in by_recency[: self.keep_last_n])
+            if self.keep_top_k is not None:
+                ranked = sorted(
+                    (c for c in self._uploaded_checkpoints if c.monitor_value is not None),
+                    key=lambda c: c.monitor_value,
+                    reverse=self.mode == "max",
+                )
+                kept.update(c.index for c in ranked[: self.keep_top_k])
+            superseded = [c for c in self._uploaded_checkpoints if c.index not in kept]
+            self._uploaded_checkpoints = [c for c in self._uploaded_checkpoints if c.index in kept]
+
+        for superseded_checkpoint in superseded:
+            _delete_checkpoint_artifacts(superseded_checkpoint, self.mlflow_tracking_uri)
+
+    def wait_for_pending_uploads(self):
+        """
+        Blocks until the checkpoints handed off to the background uploader have been uploaded.
+        It must be called at the end of training if `async_upload` is True.
+        """
+        while self._pending_uploads:
+            self._pending_uploads.popleft().wait()
+
+
+def _delete_checkpoint_artifacts(checkpoint, tracking_uri):
+    from mlflow import MlflowClient
+
+    try:
+        repo = MlflowClient(tracking_uri)._tracking_client._get_artifact_repo(checkpoint.run_id)
+        repo.delete_artifacts(checkpoint.artifact_dir)
+    except Exception as e:
+        _logger.warning(
+            "Failed to delete superseded checkpoint '%s' of run %s: %s",
+            checkpoint.artifact_dir,
+            checkpoint.run_id,
+            e,
+        )
+
 
 def download_checkpoint_artifact(run_id=None, epoch=None, global_step=None, dst_path=None):
     from mlflow.client import MlflowClient
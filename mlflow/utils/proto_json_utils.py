@@ -5,127 +5,57 @@ import json
 import os
 from collections import defaultdict
 from copy import deepcopy
-from functools import partial
+from functools import lru_cache
 from json import JSONEncoder
 from typing import Any, Optional
 
 import pydantic
+from google.protobuf import json_format
 from google.protobuf.descriptor import FieldDescriptor
 from google.protobuf.duration_pb2 import Duration
-from google.protobuf.json_format import MessageToJson, ParseDict
+from google.protobuf.json_format import ParseDict
 from google.protobuf.struct_pb2 import NULL_VALUE, Value
 from google.protobuf.timestamp_pb2 import Timestamp
 
 from mlflow.exceptions import MlflowException
 from mlflow.utils import IS_PYDANTIC_V2_OR_NEWER
 
-_PROTOBUF_INT64_FIELDS = [
-    FieldDescriptor.TYPE_INT64,
-    FieldDescriptor.TYPE_UINT64,
-    FieldDescriptor.TYPE_FIXED64,
-    FieldDescriptor.TYPE_SFIXED64,
-    FieldDescriptor.TYPE_SINT64,
-]
+_PROTOBUF_INT64_CPP_TYPES = frozenset(
+    [FieldDescriptor.CPPTYPE_INT64, FieldDescriptor.CPPTYPE_UINT64]
+)
 
 from mlflow.protos.databricks_pb2 import BAD_REQUEST
 
 
-def _mark_int64_fields_for_proto_maps(proto_map, value_field_type):
-    """Converts a proto map to JSON, preserving only int64-related fields."""
-    json_dict = {}
-    for key, value in proto_map.items():
-        # The value of a protobuf map can only be a scalar or a message (not a map or repeated
-        # field).
-        if value_field_type == FieldDescriptor.TYPE_MESSAGE:
-            json_dict[key] = _mark_int64_fields(value)
-        elif value_field_type in _PROTOBUF_INT64_FIELDS:
-            json_dict[key] = int(value)
-        elif isinstance(key, int):
-            json_dict[key] = value
-    return json_dict
-
-
-def _mark_int64_fields(proto_message):
-    """Converts a proto message to JSON, preserving only int64-related fields."""
-    json_dict = {}
-    for field, value in proto_message.ListFields():
-        if (
-            # These three conditions check if this field is a protobuf map.
-            # See the official implementation: https://bit.ly/3EMx1rl
-            field.type == FieldDescriptor.TYPE_MESSAGE
-            and field.message_type.has_options
-            and field.message_type.GetOptions().map_entry
-        ):
-            # Deal with proto map fields separately in another function.
-            json_dict[field.name] = _mark_int64_fields_for_proto_maps(
-                value, field.message_type.fields_by_name["value"].type
-            )
-            continue
+def _is_well_known_type(message_descriptor):
+    return message_descriptor.full_name.startswith("google.protobuf.")
 
-        if field.type == FieldDescriptor.TYPE_MESSAGE:
-            ftype = partial(_mark_int64_fields)
-        elif field.type in _PROTOBUF_INT64_FIELDS:
-            ftype = int
-        else:
-            # Skip all non-int64 fields.
-            continue
-
-        json_dict[field.name] = (
-            [ftype(v) for v in value]
-            if field.label == FieldDescriptor.LABEL_REPEATED
-            else ftype(value)
-        )
-    return json_dict
 
+class _MlflowJsonPrinter(json_format._Printer):
+    """
+    Converts a proto message to a JSON object in a single pass.
 
-def _merge_json_dicts(from_dict, to_dict):
-    """Merges the json elements of from_dict into to_dict. Only works for json dicts
-    converted from proto messages
+    Google's printer converts int64 proto fields to JSON strings (see
+    https://github.com/protocolbuffers/protobuf/issues/2954), while MLflow emits them as JSON
+    numbers. Extensions and well-known types such as wrappers keep the standard representation.
     """
-    for key, value in from_dict.items():
-        if isinstance(key, int) and str(key) in to_dict:
-            # When the key (i.e. the proto field name) is an integer, it must be a proto map field
-            # with integer as the key. For example:
-            # from_dict is {'field_map': {1: '2', 3: '4'}}
-            # to_dict is {'field_map': {'1': '2', '3': '4'}}
-            # So we need to replace the str keys with int keys in to_dict.
-            to_dict[key] = to_dict[str(key)]
-            del to_dict[str(key)]
-
-        if key not in to_dict:
-            continue
 
-        if isinstance(value, dict):
-            _merge_json_dicts(from_dict[key], to_dict[key])
-        elif isinstance(value, list):
-            for i, v in enumerate(value):
-                if isinstance(v, dict):
-                    _merge_json_dicts(v, to_dict[key][i])
-                else:
-                    to_dict[key][i] = v
-        else:
-            to_dict[key] = from_dict[key]
-    return to_dict
+    def _FieldToJsonObject(self, field, value):
+        if (
+            field.cpp_type in _PROTOBUF_INT64_CPP_TYPES
+            and not field.is_extension
+            and not _is_well_known_type(field.containing_type)
+        ):
+            return value
+        return super()._FieldToJsonObject(field, value)
 
 
 def message_to_json(message):
-    """Converts a message to JSON, using snake_case for field names."""
-
-    # Google's MessageToJson API converts int64 proto fields to JSON strings.
-    # For more info, see https://github.com/protocolbuffers/protobuf/issues/2954
-    json_dict_with_int64_as_str = json.loads(
-        MessageToJson(message, preserving_proto_field_name=True)
-    )
-    # We convert this proto message into a JSON dict where only int64 proto fields
-    # are preserved, and they are treated as JSON numbers, not strings.
-    json_dict_with_int64_fields_only = _mark_int64_fields(message)
-    # By merging these two JSON dicts, we end up with a JSON dict where int64 proto fields are not
-    # converted to JSON strings. Int64 keys in proto maps will always be converted to JSON strings
-    # because JSON doesn't support non-string keys.
-    json_dict_with_int64_as_numbers = _merge_json_dicts(
-        json_dict_with_int64_fields_only, json_dict_with_int64_as_str
-    )
-    return json.dumps(json_dict_with_int64_as_numbers, indent=2)
+    """Converts a message to compact JSON, using snake_case for field names."""
+    printer = _MlflowJsonPrinter(preserving_proto_field_name=True)
+    # Int64 keys in proto maps are converted to JSON strings because JSON doesn't support
+    # non-string keys.
+    return json.dumps(printer._MessageToJsonObject(message), separators=(",", ":"))
 
 
 def proto_timestamp_to_milliseconds(timestamp: str) -> int:
@@ -192,10 +122,127 @@ def _stringify_all_experiment_ids(x):
             _stringify_all_experiment_ids(y)
 
 
+_NOT_PARSED = object()
+
+
+def _parse_json_int(value):
+    return value if type(value) is int else _NOT_PARSED
+
+
+def _parse_json_double(value):
+    return value if type(value) in (int, float) else _NOT_PARSED
+
+
+def _parse_json_bool(value):
+    return value if type(value) is bool else _NOT_PARSED
+
+
+def _parse_json_str(value):
+    return value if type(value) is str else _NOT_PARSED
+
+
+_JSON_VALUE_PARSERS = {
+    FieldDescriptor.CPPTYPE_INT32: _parse_json_int,
+    FieldDescriptor.CPPTYPE_INT64: _parse_json_int,
+    FieldDescriptor.CPPTYPE_UINT32: _parse_json_int,
+    FieldDescriptor.CPPTYPE_UINT64: _parse_json_int,
+    FieldDescriptor.CPPTYPE_DOUBLE: _parse_json_double,
+    FieldDescriptor.CPPTYPE_BOOL: _parse_json_bool,
+    FieldDescriptor.CPPTYPE_STRING: _parse_json_str,
+}
+
+
+def _get_enum_value_parser(enum_descriptor):
+    numbers = {value.name: value.number for value in enum_descriptor.values}
+
+    def parse_enum_value(value):
+        return numbers.get(value, _NOT_PARSED) if type(value) is str else _NOT_PARSED
+
+    return parse_enum_value
+
+
+@lru_cache(maxsize=None)
+def _get_directly_parsable_fields(message_descriptor):
+    """
+    Returns the fields of a message whose JSON values `_parse_dict` sets directly, i.e. the fields
+    that are not maps, oneofs, floats, bytes or well-known types, as a dict mapping the field name
+    to a tuple of (is_repeated, value_parser). The value parser is None for message fields.
+    """
+    if _is_well_known_type(message_descriptor):
+        return {}
+    fields = {}
+    for field in message_descriptor.fields:
+        if field.containing_oneof is not None or field.type == FieldDescriptor.TYPE_BYTES:
+            continue
+        if field.cpp_type == FieldDescriptor.CPPTYPE_MESSAGE:
+            if field.message_type.GetOptions().map_entry or _is_well_known_type(field.message_type):
+                continue
+            value_parser = None
+        elif field.cpp_type == FieldDescriptor.CPPTYPE_ENUM:
+            value_parser = _get_enum_value_parser(field.enum_type)
+        elif field.cpp_type in _JSON_VALUE_PARSERS:
+            value_parser = _JSON_VALUE_PARSERS[field.cpp_type]
+        else:
+            continue
+        fields[field.name] = (field.label == FieldDescriptor.LABEL_REPEATED, value_parser)
+    return fields
+
+
+def _parse_field(name, is_repeated, value_parser, value, message):
+    """
+    Sets a field of the message from a JSON value of the types MLflow clients send. Returns False
+    without modifying the message if the value needs the conversions of `ParseDict` instead, e.g.
+    int64 values encoded as strings or null values.
+    """
+    if is_repeated and type(value) is not list:
+        return False
+    values = value if is_repeated else [value]
+
+    if value_parser is None:
+        if not all(type(v) is dict for v in values):
+            return False
+        if is_repeated:
+            container = getattr(message, name)
+            for v in values:
+                _parse_dict(v, container.add())
+        else:
+            sub_message = getattr(message, name)
+            sub_message.SetInParent()
+            _parse_dict(value, sub_message)
+        return True
+
+    values = [value_parser(v) for v in values]
+    if _NOT_PARSED in values:
+        return False
+    try:
+        if is_repeated:
+            getattr(message, name).extend(values)
+        else:
+            setattr(message, name, values[0])
+    except (TypeError, ValueError):
+        # E.g. out-of-range integers or strings with unpaired surrogates, for which `ParseDict`
+        # raises a `ParseError`
+        return False
+    return True
+
+
+def _parse_dict(js_dict, message):
+    fields = _get_directly_parsable_fields(message.DESCRIPTOR)
+    remaining = {}
+    for name, value in js_dict.items():
+        field = fields.get(name)
+        if field is None or not _parse_field(name, *field, value, message):
+            remaining[name] = value
+    if remaining:
+        ParseDict(js_dict=remaining, message=message, ignore_unknown_fields=True)
+
+
 def parse_dict(js_dict, message):
     """Parses a JSON dictionary into a message proto, ignoring unknown fields in the JSON."""
     _stringify_all_experiment_ids(js_dict)
-    ParseDict(js_dict=js_dict, message=message, ignore_unknown_fields=True)
+    # Sets the fields of common types directly and leaves the others, e.g. fields in camelCase,
+    # maps or well-known types, to `ParseDict`, which is several times slower
+    _parse_dict(js_dict, message)
 
 
 def set_pb_value(proto: Value, value: Any):
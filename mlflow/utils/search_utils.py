@@ -1,5 +1,7 @@
 import ast
 import base64
+import copy
+import functools
 import json
 import math
 import operator
@@ -49,6 +51,77 @@ def _ilike(string, pattern):
     return _convert_like_pattern_to_regex(pattern, flags=re.IGNORECASE).match(string) is not None
 
 
+# Maximum number of filter and order_by strings whose parsed form is cached, across search types.
+# The same strings tend to be searched repeatedly, e.g. when the UI polls the runs of an experiment.
+_PARSE_CACHE_SIZE = 1024
+
+
+def _mapping_value_getter(attr, key):
+    """
+    Returns a function that gets the value of ``key`` in the mapping found at the (possibly dotted)
+    attribute ``attr`` of an entity, or None if the key is missing.
+    """
+    get_mapping = operator.attrgetter(attr)
+
+    def get_value(entity):
+        return get_mapping(entity).get(key)
+
+    return get_value
+
+
+def _compile_comparison(get_lhs, comparator, value):
+    """
+    Returns a predicate comparing the value returned by ``get_lhs`` for an entity with ``value``,
+    which is False for entities for which ``get_lhs`` returns None. LIKE patterns and IN lists are
+    converted once, rather than for each entity.
+    """
+    if comparator in ("LIKE", "ILIKE"):
+        regex = _convert_like_pattern_to_regex(
+            value, flags=re.IGNORECASE if comparator == "ILIKE" else 0
+        )
+
+        def compare(lhs, _):
+            return regex.match(lhs) is not None
+
+    else:
+        if comparator in ("IN", "NOT IN") and isinstance(value, (list, tuple, set)):
+            value = set(value)
+        compare = SearchUtils.get_comparison_func(comparator)
+
+    def matches(entity):
+        lhs = get_lhs(entity)
+        return lhs is not None and compare(lhs, value)
+
+    return matches
+
+
+def _compile_prompt_tag_comparison(get_lhs, comparator, value):
+    """
+    Returns a predicate for a comparison on the ``mlflow.prompt.is_prompt`` tag of registered
+    models or model versions.
+    """
+    # NB: Handling the special `mlflow.prompt.is_prompt` tag. This tag is used for
+    #   distinguishing between prompt models and normal models. For example, we want to
+    #   search for models only by the following filter string:
+    #
+    #     tags.`mlflow.prompt.is_prompt` != 'true'
+    #     tags.`mlflow.prompt.is_prompt` = 'false'
+    #
+    #   However, models do not have this tag, so lhs is None in this case. Instead of returning
+    #   False like normal tag filter, we need to return True here.
+    matches_without_tag = (comparator == "=" and value == "false") or (
+        comparator == "!=" and value == "true"
+    )
+    matches_tag = _compile_comparison(get_lhs, comparator, value)
+
+    def matches(entity):
+        if get_lhs(entity) is None:
+            return matches_without_tag
+        return matches_tag(entity)
+
+    return matches
+
+
 def _join_in_comparison_tokens(tokens, search_traces=False):
     """
     Find a sequence of tokens that matches the pattern of an IN comparison or a NOT IN comparison,
@@ -175,6 +248,12 @@ class SearchUtils:
         _ATTRIBUTE_IDENTIFIER,
         _DATASET_IDENTIFIER,
     ]
+    # Attributes of ``RunData`` holding the entities of each identifier type
+    _RUN_DATA_TYPES = {
+        _METRIC_IDENTIFIER: "metrics",
+        _PARAM_IDENTIFIER: "params",
+        _TAG_IDENTIFIER: "tags",
+    }
     _VALID_IDENTIFIERS = set(
         _IDENTIFIERS
         + list(_ALTERNATE_METRIC_IDENTIFIERS)
@@ -496,6 +575,12 @@ class SearchUtils:
     def parse_search_filter(cls, filter_string):
         if not filter_string:
             return []
+        # The parsed clauses are cached by search type, and copied since callers may modify them
+        return copy.deepcopy(cls._parse_search_filter(filter_string))
+
+    @classmethod
+    @functools.lru_cache(maxsize=_PARSE_CACHE_SIZE)
+    def _parse_search_filter(cls, filter_string):
         try:
             parsed = sqlparse.parse(filter_string)
         except Exception:
@@ -591,7 +676,11 @@ class SearchUtils:
         return False
 
     @classmethod
-    def _does_run_match_clause(cls, run, sed):
+    def _compile_run_clause(cls, sed):
+        """
+        Returns a predicate evaluating the parsed clause ``sed`` on a run. The clause is validated
+        and its value converted once, rather than for each run.
+        """
         key_type = sed.get("type")
         key = sed.get("key")
         value = sed.get("value")
@@ -600,40 +689,44 @@ class SearchUtils:
         key = SearchUtils.translate_key_alias(key)
 
         if cls.is_metric(key_type, comparator):
-            lhs = run.data.metrics.get(key, None)
+            get_lhs = _mapping_value_getter("data.metrics", key)
             value = float(value)
         elif cls.is_param(key_type, comparator):
-            lhs = run.data.params.get(key, None)
+            get_lhs = _mapping_value_getter("data.params", key)
         elif cls.is_tag(key_type, comparator):
-            lhs = run.data.tags.get(key, None)
+            get_lhs = _mapping_value_getter("data.tags", key)
         elif cls.is_string_attribute(key_type, key, comparator):
-            lhs = getattr(run.info, key)
+            get_lhs = operator.attrgetter(f"info.{key}")
         elif cls.is_numeric_attribute(key_type, key, comparator):
-            lhs = getattr(run.info, key)
+            get_lhs = operator.attrgetter(f"info.{key}")
             value = int(value)
         elif cls.is_dataset(key_type, comparator):
+            compare = SearchUtils.get_comparison_func(comparator)
             if key == "context":
-                return any(
-                    SearchUtils.get_comparison_func(comparator)(tag.value if tag else None, value)
-                    for dataset_input in run.inputs.dataset_inputs
-                    for tag in dataset_input.tags
-                    if tag.key == MLFLOW_DATASET_CONTEXT
-                )
+
+                def matches_dataset(run):
+                    return any(
+                        compare(tag.value if tag else None, value)
+                        for dataset_input in run.inputs.dataset_inputs
+                        for tag in dataset_input.tags
+                        if tag.key == MLFLOW_DATASET_CONTEXT
+                    )
+
             else:
-                return any(
-                    SearchUtils.get_comparison_func(comparator)(
-                        getattr(dataset_input.dataset, key), value
+
+                def matches_dataset(run):
+                    return any(
+                        compare(getattr(dataset_input.dataset, key), value)
+                        for dataset_input in run.inputs.dataset_inputs
                     )
-                    for dataset_input in run.inputs.dataset_inputs
-                )
+
+            return matches_dataset
         else:
             raise MlflowException(
                 f"Invalid search expression type '{key_type}'", error_code=INVALID_PARAMETER_VALUE
             )
-        if lhs is None:
-            return False
 
-        return SearchUtils.get_comparison_func(comparator)(lhs, value)
+        return _compile_comparison(get_lhs, comparator, value)
 
     @classmethod
     def _does_model_match_clause(cls, model, sed):
@@ -672,12 +765,8 @@ class SearchUtils:
         """Filters a set of runs based on a search filter string."""
         if not filter_string:
             return runs
-        parsed = cls.parse_search_filter(filter_string)
-
-        def run_matches(run):
-            return all(cls._does_run_match_clause(run, s) for s in parsed)
-
-        return [run for run in runs if run_matches(run)]
+        predicates = [cls._compile_run_clause(s) for s in cls.parse_search_filter(filter_string)]
+        return [run for run in runs if all(matches(run) for matches in predicates)]
 
     @classmethod
     def _validate_order_by_and_generate_token(cls, order_by):
@@ -722,6 +811,7 @@ class SearchUtils:
         return token_value
 
     @classmethod
+    @functools.lru_cache(maxsize=_PARSE_CACHE_SIZE)
     def _parse_order_by_string(cls, order_by):
         token_value = cls._validate_order_by_and_generate_token(order_by)
         is_ascending = True
@@ -748,6 +838,45 @@ class SearchUtils:
         identifier = cls._get_identifier(token_value.strip(), cls.VALID_ORDER_BY_ATTRIBUTE_KEYS)
         return identifier["type"], identifier["key"], is_ascending
 
+    @classmethod
+    def parse_columns_for_search_runs(cls, columns):
+        """
+        Parses the ``columns`` of a run search, e.g. ``["metrics.rmse", "params.`learning rate`"]``,
+        into a dictionary mapping ``"metrics"``, ``"params"``, and ``"tags"`` to the set of keys
+        to return. Returns None if ``columns`` is None, in which case all the run data is returned.
+        """
+        if columns is None:
+            return None
+        data_keys = {"metrics": set(), "params": set(), "tags": set()}
+        for column in columns:
+            identifier = cls._get_identifier(column.strip(), cls.VALID_SEARCH_ATTRIBUTE_KEYS)
+            if (data_type := cls._RUN_DATA_TYPES.get(identifier["type"])) is None:
+                raise MlflowException.invalid_parameter_value(
+                    f"Invalid column '{column}'. Columns should be specified as 'metrics.<key>', "
+                    "'params.<key>', or 'tags.<key>'."
+                )
+            data_keys[data_type].add(identifier["key"])
+        return data_keys
+
+    @classmethod
+    def get_referenced_run_data_keys(cls, filter_string, order_by):
+        """
+        Returns the keys of the metrics, params, and tags a run search filters or sorts on, in the
+        format of ``parse_columns_for_search_runs``.
+        """
+        data_keys = cls.parse_columns_for_search_runs([])
+        key_types = [
+            (clause["type"], clause["key"]) for clause in cls.parse_search_filter(filter_string)
+        ]
+        key_types.extend(
+            cls.parse_order_by_for_search_runs(order_by_clause)[:2]
+            for order_by_clause in order_by or []
+        )
+        for key_type, key in key_types:
+            if (data_type := cls._RUN_DATA_TYPES.get(key_type)) is not None:
+                data_keys[data_type].add(key)
+        return data_keys
+
     @classmethod
     def parse_order_by_for_search_registered_models(cls, order_by):
         token_value, is_ascending = cls._parse_order_by_string(order_by)
@@ -761,23 +890,25 @@ class SearchUtils:
         return token_value, is_ascending
 
     @classmethod
-    def _get_value_for_sort(cls, run, key_type, key, ascending):
-        """Returns a tuple suitable to be used as a sort key for runs."""
-        sort_value = None
+    def _get_sort_value_getter(cls, key_type, key):
+        """Returns a function getting the value to sort runs on."""
         key = SearchUtils.translate_key_alias(key)
         if key_type == cls._METRIC_IDENTIFIER:
-            sort_value = run.data.metrics.get(key)
+            return _mapping_value_getter("data.metrics", key)
         elif key_type == cls._PARAM_IDENTIFIER:
-            sort_value = run.data.params.get(key)
+            return _mapping_value_getter("data.params", key)
         elif key_type == cls._TAG_IDENTIFIER:
-            sort_value = run.data.tags.get(key)
+            return _mapping_value_getter("data.tags", key)
         elif key_type == cls._ATTRIBUTE_IDENTIFIER:
-            sort_value = getattr(run.info, key)
+            return operator.attrgetter(f"info.{key}")
         else:
             raise MlflowException(
                 f"Invalid order_by entity type '{key_type}'", error_code=INVALID_PARAMETER_VALUE
             )
 
+    @staticmethod
+    def _get_run_sort_key(sort_value, ascending):
+        """Returns a tuple suitable to be used as a sort key for a run with the given value."""
         # Return a key such that None values are always at the end.
         is_none = sort_value is None
         is_nan = isinstance(sort_value, float) and math.isnan(sort_value)
@@ -838,22 +969,17 @@ class SearchUtils:
         # the ordering conditions in reverse order.
         for order_by_clause in reversed(order_by_list):
             (key_type, key, ascending) = cls.parse_order_by_for_search_runs(order_by_clause)
+            get_sort_value = cls._get_sort_value_getter(key_type, key)
 
             runs = sorted(
                 runs,
-                key=lambda run: cls._get_value_for_sort(run, key_type, key, ascending),
+                key=lambda run: cls._get_run_sort_key(get_sort_value(run), ascending),
                 reverse=not ascending,
             )
         return runs
 
     @classmethod
-    def parse_start_offset_from_page_token(cls, page_token):
-        # Note: the page_token is expected to be a base64-encoded JSON that looks like
-        # { "offset": xxx }. However, this format is not stable, so it should not be
-        # relied upon outside of this method.
-        if not page_token:
-            return 0
-
+    def _decode_page_token(cls, page_token):
         try:
             decoded_token = base64.b64decode(page_token)
         except TypeError:
@@ -872,7 +998,22 @@ class SearchUtils:
                 f"Invalid page token, decoded value={decoded_token}",
                 error_code=INVALID_PARAMETER_VALUE,
             )
+        if not isinstance(parsed_token, dict):
+            raise MlflowException(
+                f"Invalid page token, parsed value={parsed_token}",
+                error_code=INVALID_PARAMETER_VALUE,
+            )
+        return parsed_token
+
+    @classmethod
+    def parse_start_offset_from_page_token(cls, page_token):
+        # Note: the page_token is expected to be a base64-encoded JSON that looks like
+        # { "offset": xxx }. However, this format is not stable, so it should not be
+        # relied upon outside of this method.
+        if not page_token:
+            return 0
 
+        parsed_token = cls._decode_page_token(page_token)
         offset_str = parsed_token.get("offset")
         if not offset_str:
             raise MlflowException(
@@ -894,6 +1035,35 @@ class SearchUtils:
     def create_page_token(cls, offset):
         return base64.b64encode(json.dumps({"offset": offset}).encode("utf-8"))
 
+    @classmethod
+    def create_keyset_page_token(cls, sort_key_values):
+        """
+        Creates a page token encoding the values of the sort keys of the last row of a page, so
+        that the next page can be fetched with a seek predicate rather than an offset.
+        """
+        return base64.b64encode(json.dumps({"keyset": list(sort_key_values)}).encode("utf-8"))
+
+    @classmethod
+    def parse_keyset_from_page_token(cls, page_token):
+        """
+        Returns the sort key values encoded in a page token created by
+        ``create_keyset_page_token``, or None if there is no page token or if it encodes an
+        offset.
+        """
+        if not page_token:
+            return None
+
+        parsed_token = cls._decode_page_token(page_token)
+        if "keyset" not in parsed_token:
+            return None
+        keyset = parsed_token["keyset"]
+        if not isinstance(keyset, list):
+            raise MlflowException(
+                f"Invalid page token, parsed value={parsed_token}",
+                error_code=INVALID_PARAMETER_VALUE,
+            )
+        return keyset
+
     @classmethod
     def paginate(cls, runs, page_token, max_results):
         """Paginates a set of runs based on an offset encoded into the page_token and a max
@@ -1048,38 +1218,41 @@ class SearchExperimentsUtils(SearchUtils):
         return False
 
     @classmethod
-    def _does_experiment_match_clause(cls, experiment, sed):
+    def _compile_experiment_clause(cls, sed):
+        """Returns a predicate evaluating the parsed clause ``sed`` on an experiment."""
         key_type = sed.get("type")
         key = sed.get("key")
         value = sed.get("value")
         comparator = sed.get("comparator").upper()
 
         if cls.is_string_attribute(key_type, key, comparator):
-            lhs = getattr(experiment, key)
+            return _compile_comparison(operator.attrgetter(key), comparator, value)
         elif cls.is_numeric_attribute(key_type, key, comparator):
-            lhs = getattr(experiment, key)
-            value = float(value)
+            return _compile_comparison(operator.attrgetter(key), comparator, float(value))
         elif cls.is_tag(key_type, comparator):
-            if key not in experiment.tags:
-                return False
-            lhs = experiment.tags.get(key, None)
-            if lhs is None:
-                return experiment
+            matches_tag = _compile_comparison(_mapping_value_getter("tags", key), comparator, value)
+
+            def matches(experiment):
+                if key not in experiment.tags:
+                    return False
+                return experiment.tags[key] is None or matches_tag(experiment)
+
+            return matches
         else:
             raise MlflowException(
                 f"Invalid search expression type '{key_type}'", error_code=INVALID_PARAMETER_VALUE
             )
 
-        return SearchUtils.get_comparison_func(comparator)(lhs, value)
-
     @classmethod
     def filter(cls, experiments, filter_string):
         if not filter_string:
             return experiments
-        parsed = cls.parse_search_filter(filter_string)
+        predicates = [
+            cls._compile_experiment_clause(s) for s in cls.parse_search_filter(filter_string)
+        ]
 
         def experiment_matches(experiment):
-            return all(cls._does_experiment_match_clause(experiment, s) for s in parsed)
+            return all(matches(experiment) for matches in predicates)
 
         return list(filter(experiment_matches, experiments))
 
@@ -1156,7 +1329,8 @@ class SearchModelUtils(SearchUtils):
     VALID_ORDER_BY_KEYS_REGISTERED_MODELS = {"name", "creation_timestamp", "last_updated_timestamp"}
 
     @classmethod
-    def _does_registered_model_match_clauses(cls, model, sed):
+    def _compile_registered_model_clause(cls, sed):
+        """Returns a predicate evaluating the parsed clause ``sed`` on a registered model."""
         key_type = sed.get("type")
         key = sed.get("key")
         value = sed.get("value")
@@ -1164,47 +1338,34 @@ class SearchModelUtils(SearchUtils):
 
         # what comparators do we support here?
         if cls.is_string_attribute(key_type, key, comparator):
-            lhs = getattr(model, key)
+            get_lhs = operator.attrgetter(key)
         elif cls.is_numeric_attribute(key_type, key, comparator):
-            lhs = getattr(model, key)
+            get_lhs = operator.attrgetter(key)
             value = int(value)
         elif cls.is_tag(key_type, comparator):
             # NB: We should use the private attribute `_tags` instead of the `tags` property
             # to consider all tags including reserved ones.
-            lhs = model._tags.get(key, None)
+            get_lhs = _mapping_value_getter("_tags", key)
         else:
             raise MlflowException(
                 f"Invalid search expression type '{key_type}'", error_code=INVALID_PARAMETER_VALUE
             )
 
-        # NB: Handling the special `mlflow.prompt.is_prompt` tag. This tag is used for
-        #   distinguishing between prompt models and normal models. For example, we want to
-        #   search for models only by the following filter string:
-        #
-        #     tags.`mlflow.prompt.is_prompt` != 'true'
-        #     tags.`mlflow.prompt.is_prompt` = 'false'
-        #
-        #   However, models do not have this tag, so lhs is None in this case. Instead of returning
-        #   False like normal tag filter, we need to return True here.
-        if key == IS_PROMPT_TAG_KEY and lhs is None:
-            return (comparator == "=" and value == "false") or (
-                comparator == "!=" and value == "true"
-            )
-
-        if lhs is None:
-            return False
-
-        return SearchUtils.get_comparison_func(comparator)(lhs, value)
+        if key == IS_PROMPT_TAG_KEY:
+            return _compile_prompt_tag_comparison(get_lhs, comparator, value)
+        return _compile_comparison(get_lhs, comparator, value)
 
     @classmethod
     def filter(cls, registered_models, filter_string):
         """Filters a set of registered models based on a search filter string."""
         if not filter_string:
             return registered_models
-        parsed = cls.parse_search_filter(filter_string)
+        predicates = [
+            cls._compile_registered_model_clause(s) for s in cls.parse_search_filter(filter_string)
+        ]
 
         def registered_model_matches(model):
-            return all(cls._does_registered_model_match_clauses(model, s) for s in parsed)
+            return all(matches(model) for matches in predicates)
 
         return [
             registered_model
@@ -1351,47 +1512,30 @@ class SearchModelVersionUtils(SearchUtils):
     VALID_STRING_ATTRIBUTE_COMPARATORS = {"!=", "=", "LIKE", "ILIKE", "IN"}
 
     @classmethod
-    def _does_model_version_match_clauses(cls, mv, sed):
+    def _compile_model_version_clause(cls, sed):
+        """Returns a predicate evaluating the parsed clause ``sed`` on a model version."""
         key_type = sed.get("type")
         key = sed.get("key")
         value = sed.get("value")
         comparator = sed.get("comparator").upper()
 
         if cls.is_string_attribute(key_type, key, comparator):
-            lhs = getattr(mv, "source" if key == "source_path" else key)
+            get_lhs = operator.attrgetter("source" if key == "source_path" else key)
         elif cls.is_numeric_attribute(key_type, key, comparator):
             if key == "version_number":
                 key = "version"
-            lhs = getattr(mv, key)
+            get_lhs = operator.attrgetter(key)
             value = int(value)
         elif cls.is_tag(key_type, comparator):
-            lhs = mv.tags.get(key, None)
+            get_lhs = _mapping_value_getter("tags", key)
         else:
             raise MlflowException(
                 f"Invalid search expression type '{key_type}'", error_code=INVALID_PARAMETER_VALUE
             )
 
-        # NB: Handling the special `mlflow.prompt.is_prompt` tag. This tag is used for
-        #   distinguishing between prompt models and normal models. For example, we want to
-        #   search for models only by the following filter string:
-        #
-        #     tags.`mlflow.prompt.is_prompt` != 'true'
-        #     tags.`mlflow.prompt.is_prompt` = 'false'
-        #
-        #   However, models do not have this tag, so lhs is None in this case. Instead of returning
-        #   False like normal tag filter, we need to return True here.
-        if key == IS_PROMPT_TAG_KEY and lhs is None:
-            return (comparator == "=" and value == "false") or (
-                comparator == "!=" and value == "true"
-            )
-
-        if lhs is None:
-            return False
-
-        if comparator == "IN" and isinstance(value, (set, list)):
-            return lhs in set(value)
-
-        return SearchUtils.get_comparison_func(comparator)(lhs, value)
+        if key == IS_PROMPT_TAG_KEY:
+            return _compile_prompt_tag_comparison(get_lhs, comparator, value)
+        return _compile_comparison(get_lhs, comparator, value)
 
     @classmethod
     def filter(cls, model_versions, filter_string):
@@ -1399,10 +1543,12 @@ class SearchModelVersionUtils(SearchUtils):
         model_versions = [mv for mv in model_versions if mv.current_stage != STAGE_DELETED_INTERNAL]
         if not filter_string:
             return model_versions
-        parsed = cls.parse_search_filter(filter_string)
+        predicates = [
+            cls._compile_model_version_clause(s) for s in cls.parse_search_filter(filter_string)
+        ]
 
         def model_version_matches(mv):
-            return all(cls._does_model_version_match_clauses(mv, s) for s in parsed)
+            return all(matches(mv) for matches in predicates)
 
         return [mv for mv in model_versions if model_version_matches(mv)]
 
@@ -1545,29 +1691,6 @@ class SearchModelVersionUtils(SearchUtils):
             return False
         return True
 
-    @classmethod
-    def parse_search_filter(cls, filter_string):
-        if not filter_string:
-            return []
-        try:
-            parsed = sqlparse.parse(filter_string)
-        except Exception:
-            raise MlflowException(
-                f"Error on parsing filter '{filter_string}'", error_code=INVALID_PARAMETER_VALUE
-            )
-        if len(parsed) == 0 or not isinstance(parsed[0], Statement):
-            raise MlflowException(
-                f"Invalid filter '{filter_string}'. Could not be parsed.",
-                error_code=INVALID_PARAMETER_VALUE,
-            )
-        elif len(parsed) > 1:
-            raise MlflowException(
-                f"Search filter contained multiple expression {filter_string!r}. "
-                "Provide AND-ed expression list.",
-                error_code=INVALID_PARAMETER_VALUE,
-            )
-        return cls._process_statement(parsed[0])
-
 
 class SearchTraceUtils(SearchUtils):
     """
@@ -1611,9 +1734,33 @@ class SearchTraceUtils(SearchUtils):
     VALID_TAG_COMPARATORS = {"!=", "="}
     VALID_STRING_ATTRIBUTE_COMPARATORS = {"!=", "=", "IN", "NOT IN"}
 
+    # Keys of the span index of the SQL tracking store, e.g. span.name = 'retriever'. All the
+    # span clauses of a filter must be satisfied by the same span of the trace.
+    VALID_SPAN_KEYS = {
+        "name",
+        "type",
+        "status",
+        "start_time_ms",
+        "end_time_ms",
+        "duration_ms",
+    }
+    NUMERIC_SPAN_KEYS = {
+        "start_time_ms",
+        "end_time_ms",
+        "duration_ms",
+    }
+    SEARCH_KEY_TO_SPAN_KEY = {
+        "start_time": "start_time_ms",
+        "end_time": "end_time_ms",
+        "duration": "duration_ms",
+    }
+
     _REQUEST_METADATA_IDENTIFIER = "request_metadata"
     _TAG_IDENTIFIER = "tag"
     _ATTRIBUTE_IDENTIFIER = "attribute"
+    _SPAN_IDENTIFIER = "span"
+    # Span attributes are specified as span.attributes.<key>, and parsed into this identifier
+    _SPAN_ATTRIBUTE_IDENTIFIER = "span_attribute"
 
     # These are aliases for the base identifiers
     # e.g. trace.status is equivalent to attribute.status
@@ -1622,8 +1769,14 @@ class SearchTraceUtils(SearchUtils):
         "attributes": _ATTRIBUTE_IDENTIFIER,
         "trace": _ATTRIBUTE_IDENTIFIER,
         "metadata": _REQUEST_METADATA_IDENTIFIER,
+        "spans": _SPAN_IDENTIFIER,
+    }
+    _IDENTIFIERS = {
+        _TAG_IDENTIFIER,
+        _REQUEST_METADATA_IDENTIFIER,
+        _ATTRIBUTE_IDENTIFIER,
+        _SPAN_IDENTIFIER,
     }
-    _IDENTIFIERS = {_TAG_IDENTIFIER, _REQUEST_METADATA_IDENTIFIER, _ATTRIBUTE_IDENTIFIER}
     _VALID_IDENTIFIERS = _IDENTIFIERS | set(_ALTERNATE_IDENTIFIERS.keys())
 
     SUPPORT_IN_COMPARISON_ATTRIBUTE_KEYS = {"name", "status", "request_id", "run_id"}
@@ -1647,37 +1800,44 @@ class SearchTraceUtils(SearchUtils):
         """Filters a set of traces based on a search filter string."""
         if not filter_string:
             return traces
-        parsed = cls.parse_search_filter_for_search_traces(filter_string)
+        predicates = [
+            cls._compile_trace_clause(s)
+            for s in cls.parse_search_filter_for_search_traces(filter_string)
+        ]
 
         def trace_matches(trace):
-            return all(cls._does_trace_match_clause(trace, s) for s in parsed)
+            return all(matches(trace) for matches in predicates)
 
         return list(filter(trace_matches, traces))
 
     @classmethod
-    def _does_trace_match_clause(cls, trace, sed):
+    def _compile_trace_clause(cls, sed):
+        """Returns a predicate evaluating the parsed clause ``sed`` on a trace info."""
         type_ = sed.get("type")
         key = sed.get("key")
         value = sed.get("value")
         comparator = sed.get("comparator").upper()
 
         if cls.is_tag(type_, comparator):
-            lhs = trace.tags.get(key)
+            get_lhs = _mapping_value_getter("tags", key)
         elif cls.is_request_metadata(type_, comparator):
-            lhs = trace.request_metadata.get(key)
+            get_lhs = _mapping_value_getter("request_metadata", key)
         elif cls.is_attribute(type_, key, comparator):
-            lhs = getattr(trace, key)
+            get_lhs = operator.attrgetter(key)
         elif sed.get("type") == cls._TAG_IDENTIFIER:
-            lhs = trace.tags.get(key)
+            get_lhs = _mapping_value_getter("tags", key)
+        elif type_ in (cls._SPAN_IDENTIFIER, cls._SPAN_ATTRIBUTE_IDENTIFIER):
+            raise MlflowException(
+                "Searching traces by span is only supported by the SQL tracking store.",
+                error_code=INVALID_PARAMETER_VALUE,
+            )
         else:
             raise MlflowException(
                 f"Invalid search key '{key}', supported are {cls.VALID_SEARCH_ATTRIBUTE_KEYS}",
                 error_code=INVALID_PARAMETER_VALUE,
             )
-        if lhs is None:
-            return False
 
-        return SearchUtils.get_comparison_func(comparator)(lhs, value)
+        return _compile_comparison(get_lhs, comparator, value)
 
     @classmethod
     def sort(cls, traces, order_by_list):
@@ -1700,6 +1860,8 @@ class SearchTraceUtils(SearchUtils):
         """
         Replace search key to tag or metadata key if it is in the mapping.
         """
+        if parsed.get("type") in (cls._SPAN_IDENTIFIER, cls._SPAN_ATTRIBUTE_IDENTIFIER):
+            return parsed
         key = parsed.get("key").lower()
         if key in cls.SEARCH_KEY_TO_TAG:
             parsed["type"] = cls._TAG_IDENTIFIER
@@ -1723,6 +1885,53 @@ class SearchTraceUtils(SearchUtils):
             return True
         return False
 
+    @classmethod
+    def is_span(cls, key_type, key_name, comparator):
+        if key_type == cls._SPAN_IDENTIFIER:
+            if key_name in cls.NUMERIC_SPAN_KEYS:
+                valid_comparators = cls.VALID_NUMERIC_ATTRIBUTE_COMPARATORS
+            else:
+                valid_comparators = cls.VALID_STRING_ATTRIBUTE_COMPARATORS
+            if comparator not in valid_comparators:
+                raise MlflowException(
+                    f"Invalid comparator '{comparator}' not one of '{valid_comparators}'",
+                    error_code=INVALID_PARAMETER_VALUE,
+                )
+            return True
+        return False
+
+    @classmethod
+    def is_span_attribute(cls, key_type, comparator):
+        if key_type == cls._SPAN_ATTRIBUTE_IDENTIFIER:
+            if comparator not in cls.VALID_STRING_ATTRIBUTE_COMPARATORS:
+                raise MlflowException(
+                    f"Invalid comparator '{comparator}' not one of "
+                    f"'{cls.VALID_STRING_ATTRIBUTE_COMPARATORS}'",
+                    error_code=INVALID_PARAMETER_VALUE,
+                )
+            return True
+        return False
+
+    @classmethod
+    def _get_identifier(cls, identifier, valid_attributes):
+        parsed = super()._get_identifier(identifier, valid_attributes)
+        if parsed["type"] != cls._SPAN_IDENTIFIER:
+            return parsed
+
+        prefix, _, attribute_key = parsed["key"].partition(".")
+        if prefix in ("attribute", "attributes") and attribute_key:
+            return {
+                "type": cls._SPAN_ATTRIBUTE_IDENTIFIER,
+                "key": cls._trim_backticks(cls._strip_quotes(attribute_key)),
+            }
+        key = cls.SEARCH_KEY_TO_SPAN_KEY.get(parsed["key"], parsed["key"])
+        if key not in cls.VALID_SPAN_KEYS:
+            raise MlflowException.invalid_parameter_value(
+                f"Invalid span key '{parsed['key']}' specified. Valid keys are "
+                f"'{cls.VALID_SPAN_KEYS}' and 'attributes.<key>'"
+            )
+        return {"type": cls._SPAN_IDENTIFIER, "key": key}
+
     @classmethod
     def _valid_entity_type(cls, entity_type):
         entity_type = cls._trim_backticks(entity_type)
@@ -1807,6 +2016,22 @@ class SearchTraceUtils(SearchUtils):
                     f"{token.value}",
                     error_code=INVALID_PARAMETER_VALUE,
                 )
+        elif identifier_type in (cls._SPAN_IDENTIFIER, cls._SPAN_ATTRIBUTE_IDENTIFIER):
+            is_numeric = identifier_type == cls._SPAN_IDENTIFIER and key in cls.NUMERIC_SPAN_KEYS
+            if is_numeric:
+                if token.ttype == TokenType.Literal.Number.Integer:
+                    return int(token.value)
+                elif token.ttype == TokenType.Literal.Number.Float:
+                    return float(token.value)
+            elif token.ttype in cls.STRING_VALUE_TYPES or isinstance(token, Identifier):
+                return cls._strip_quotes(token.value, expect_quoted_value=True)
+            elif isinstance(token, Parenthesis):
+                return cls._parse_attribute_lists(token)
+            expected = "a numeric value" if is_numeric else "a quoted string value or a list"
+            raise MlflowException(
+                f"Expected {expected} for span key '{key}'. Got value {token.value}",
+                error_code=INVALID_PARAMETER_VALUE,
+            )
         else:
             # Expected to be either "param" or "metric".
             raise MlflowException(
@@ -1870,7 +2095,8 @@ class SearchLoggedModelsUtils(SearchUtils):
     VALID_ORDER_BY_ATTRIBUTE_KEYS = VALID_SEARCH_ATTRIBUTE_KEYS
 
     @classmethod
-    def _does_logged_model_match_clause(cls, model: LoggedModel, condition: dict[str, Any]):
+    def _compile_logged_model_clause(cls, condition: dict[str, Any]):
+        """Returns a predicate evaluating the parsed clause ``condition`` on a logged model."""
         key_type = condition.get("type")
         key = condition.get("key")
         value = condition.get("value")
@@ -1879,26 +2105,26 @@ class SearchLoggedModelsUtils(SearchUtils):
         key = SearchUtils.translate_key_alias(key)
 
         if cls.is_metric(key_type, comparator):
-            matching_metrics = [metric for metric in model.metrics if metric.key == key]
-            lhs = matching_metrics[0].value if matching_metrics else None
+
+            def get_lhs(model):
+                return next((metric.value for metric in model.metrics if metric.key == key), None)
+
             value = float(value)
         elif cls.is_param(key_type, comparator):
-            lhs = model.params.get(key, None)
+            get_lhs = _mapping_value_getter("params", key)
         elif cls.is_tag(key_type, comparator):
-            lhs = model.tags.get(key, None)
+            get_lhs = _mapping_value_getter("tags", key)
         elif cls.is_numeric_attribute(key_type, key, comparator):
-            lhs = getattr(model, key)
+            get_lhs = operator.attrgetter(key)
             value = int(value)
-        elif hasattr(model, key):
-            lhs = getattr(model, key)
+        elif hasattr(LoggedModel, key):
+            get_lhs = operator.attrgetter(key)
         else:
             raise MlflowException.invalid_parameter_value(
                 f"Invalid logged model search key '{key}'",
             )
-        if lhs is None:
-            return False
 
-        return SearchUtils.get_comparison_func(comparator)(lhs, value)
+        return _compile_comparison(get_lhs, comparator, value)
 
     @classmethod
     def filter_logged_models(cls, models: list[LoggedModel], filter_string: Optional[str] = None):
@@ -1906,10 +2132,12 @@ class SearchLoggedModelsUtils(SearchUtils):
         if not filter_string:
             return models
 
-        parsed = cls.parse_search_filter(filter_string)
+        predicates = [
+            cls._compile_logged_model_clause(s) for s in cls.parse_search_filter(filter_string)
+        ]
 
         def model_matches(model):
-            return all(cls._does_logged_model_match_clause(model, s) for s in parsed)
+            return all(matches(model) for matches in predicates)
 
         return [model for model in models if model_matches(model)]
 
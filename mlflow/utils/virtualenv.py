@@ -1,5 +1,6 @@
 import logging
 import os
+import platform
 import re
 import shutil
 import sys
@@ -11,7 +12,11 @@ from typing import Literal, Optional
 from packaging.version import Version
 
 import mlflow
-from mlflow.environment_variables import _MLFLOW_TESTING, MLFLOW_ENV_ROOT
+from mlflow.environment_variables import (
+    _MLFLOW_TESTING,
+    MLFLOW_ENV_ARCHIVE_CACHE_URI,
+    MLFLOW_ENV_ROOT,
+)
 from mlflow.exceptions import MlflowException
 from mlflow.models.model import MLMODEL_FILE_NAME, Model
 from mlflow.utils import env_manager as em
@@ -369,6 +374,125 @@ def _get_virtualenv_extra_env_vars(env_root_dir=None):
 
 _VIRTUALENV_ENVS_DIR = "virtualenv_envs"
 _PYENV_ROOT_DIR = "pyenv_root"
+# File in an archived environment that records the directory the environment was built in
+_ENV_ARCHIVE_PREFIX_FILE = ".mlflow-env-prefix"
+
+
+def _get_env_archive_name(env_name, env_manager):
+    """
+    Returns the name of the archive of an environment in the environment archive cache. The name
+    contains the hash of the environment specification along with the platform, because the
+    installed packages may contain platform-specific binaries.
+    """
+    system = platform.system().lower()
+    machine = platform.machine().lower()
+    return f"{env_name}-{env_manager}-{system}-{machine}.tar.gz"
+
+
+def _get_virtualenv_base_python_dir(env_dir: Path) -> Optional[str]:
+    """
+    Returns the directory of the interpreter the environment was created from, which is recorded
+    as ``home`` in its ``pyvenv.cfg`` file.
+    """
+    pyvenv_cfg = env_dir / "pyvenv.cfg"
+    if not pyvenv_cfg.exists():
+        return None
+    for line in pyvenv_cfg.read_text().splitlines():
+        key, sep, value = line.partition("=")
+        if sep and key.strip() == "home":
+            return value.strip()
+    return None
+
+
+def _relocate_virtualenv(env_dir: Path, old_prefix: str, new_prefix: str):
+    """
+    Rewrites the absolute paths of an environment that was built in ``old_prefix`` and unpacked
+    in ``env_dir``, so that it works from ``new_prefix``. The paths are recorded in the activation
+    scripts, the shebangs of the console scripts, ``pyvenv.cfg``, and ``.pth`` files.
+    """
+    if old_prefix == new_prefix:
+        return
+    old, new = old_prefix.encode(), new_prefix.encode()
+    paths = [
+        env_dir / "pyvenv.cfg",
+        *env_dir.joinpath("bin").iterdir(),
+        *env_dir.glob("lib/python*/site-packages/*.pth"),
+    ]
+    for path in paths:
+        if path.is_symlink() or not path.is_file():
+            continue
+        content = path.read_bytes()
+        if old in content:
+            path.write_bytes(content.replace(old, new))
+
+
+def _restore_virtualenv_from_archive(cache_uri, archive_name, env_dir: Path) -> bool:
+    """
+    Restores an environment in ``env_dir`` by unpacking its archive from the environment archive
+    cache. Returns False if the archive does not exist or the environment cannot be used on this
+    host, in which case the environment must be built.
+    """
+    from mlflow.pyfunc.dbconnect_artifact_cache import extract_archive_to_dir
+    from mlflow.store.artifact.artifact_repository_registry import get_artifact_repository
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        try:
+            archive_path = get_artifact_repository(cache_uri).download_artifacts(
+                archive_name, dst_path=tmpdir
+            )
+        except Exception as e:
+            _logger.debug("Environment archive %s not found in %s: %s", archive_name, cache_uri, e)
+            return False
+
+        _logger.info("Restoring environment %s from %s in %s", env_dir, archive_name, cache_uri)
+        # Unpack the environment next to its final location and rename it, so that concurrent
+        # restorations of the same environment never observe a partially unpacked environment
+        unpack_dir = env_dir.with_name(f".{env_dir.name}.{uuid.uuid4().hex}")
+        try:
+            extract_archive_to_dir(archive_path, unpack_dir)
+            old_prefix = unpack_dir.joinpath(_ENV_ARCHIVE_PREFIX_FILE).read_text()
+            _relocate_virtualenv(unpack_dir, old_prefix, str(env_dir))
+            unpack_dir.joinpath(_ENV_ARCHIVE_PREFIX_FILE).write_text(str(env_dir))
+            base_python_dir = _get_virtualenv_base_python_dir(unpack_dir)
+            if base_python_dir is None or not os.path.isdir(base_python_dir):
+                _logger.info(
+                    "The interpreter %s the archived environment was created from does not exist "
+                    "on this host, building the environment instead",
+                    base_python_dir,
+                )
+                return False
+            try:
+                os.rename(unpack_dir, env_dir)
+            except OSError:
+                if not env_dir.exists():
+                    raise
+                # Another process restored the environment first
+        except Exception as e:
+            _logger.warning(
+                "Failed to restore environment %s from %s: %r", env_dir, archive_name, e
+            )
+            return False
+        finally:
+            shutil.rmtree(unpack_dir, ignore_errors=True)
+    return True
+
+
+def _store_virtualenv_archive(cache_uri, archive_name, env_dir: Path):
+    """
+    Packs a newly built environment into an archive and stores it in the environment archive
+    cache. Failures are logged and do not fail the environment creation.
+    """
+    from mlflow.pyfunc.dbconnect_artifact_cache import archive_directory
+    from mlflow.store.artifact.artifact_repository_registry import get_artifact_repository
+
+    env_dir.joinpath(_ENV_ARCHIVE_PREFIX_FILE).write_text(str(env_dir))
+    with tempfile.TemporaryDirectory() as tmpdir:
+        try:
+            archive_path = archive_directory(env_dir, os.path.join(tmpdir, archive_name))
+            get_artifact_repository(cache_uri).log_artifact(archive_path)
+            _logger.info("Stored environment %s as %s in %s", env_dir, archive_name, cache_uri)
+        except Exception as e:
+            _logger.warning("Failed to store environment %s in %s: %r", env_dir, cache_uri, e)
 
 
 def _get_or_create_virtualenv(  # noqa: D417
@@ -382,6 +506,9 @@ def _get_or_create_virtualenv(  # noqa: D417
     """Restores an MLflow model's environment in a virtual environment and returns a command
     to activate it.
 
+    If ``MLFLOW_ENV_ARCHIVE_CACHE_URI`` is set, a missing environment is unpacked from its archive
+    in the cache if available, and a newly built environment is archived in the cache.
+
     Args:
         local_model_path: Local directory containing the model artifacts.
         env_id: Optional string that is added to the contents of the yaml file before
@@ -430,8 +557,23 @@ def _get_or_create_virtualenv(  # noqa: D417
     env_dir = virtual_envs_root_path / env_name
     extra_env = _get_virtualenv_extra_env_vars(env_root_dir)
 
+    # Environments with overridden requirements do not match the hash of their specification, so
+    # they are never archived
+    archive_cache_uri = (
+        MLFLOW_ENV_ARCHIVE_CACHE_URI.get()
+        if not (pip_requirements_override or is_windows())
+        else None
+    )
+    archive_name = _get_env_archive_name(env_name, env_manager)
+    if archive_cache_uri and not env_dir.exists():
+        if _restore_virtualenv_from_archive(archive_cache_uri, archive_name, env_dir):
+            return _get_virtualenv_activate_cmd(env_dir)
+        should_store_archive = True
+    else:
+        should_store_archive = False
+
     # Create an environment
-    return _create_virtualenv(
+    activate_cmd = _create_virtualenv(
         local_model_path=local_model_path,
         python_env=python_env,
         env_dir=env_dir,
@@ -441,3 +583,6 @@ def _get_or_create_virtualenv(  # noqa: D417
         capture_output=capture_output,
         pip_requirements_override=pip_requirements_override,
     )
+    if should_store_archive:
+        _store_virtualenv_archive(archive_cache_uri, archive_name, env_dir)
+    return activate_cmd
@@ -235,6 +235,21 @@ CREATE TABLE params (
 )
 
 
+CREATE TABLE spans (
+	request_id VARCHAR(50) COLLATE "SQL_Latin1_General_CP1_CI_AS" NOT NULL,
+	span_id VARCHAR(50) COLLATE "SQL_Latin1_General_CP1_CI_AS" NOT NULL,
+	parent_span_id VARCHAR(50) COLLATE "SQL_Latin1_General_CP1_CI_AS",
+	name VARCHAR(250) COLLATE "SQL_Latin1_General_CP1_CI_AS",
+	type VARCHAR(250) COLLATE "SQL_Latin1_General_CP1_CI_AS",
+	status VARCHAR(50) COLLATE "SQL_Latin1_General_CP1_CI_AS" NOT NULL,
+	start_time_ms BIGINT NOT NULL,
+	end_time_ms BIGINT,
+	duration_ms BIGINT,
+	CONSTRAINT spans_pk PRIMARY KEY (request_id, span_id),
+	CONSTRAINT fk_spans_request_id FOREIGN KEY(request_id) REFERENCES trace_info (request_id) ON DELETE CASCADE
+)
+
+
 CREATE TABLE tags (
 	key VARCHAR(250) COLLATE "SQL_Latin1_General_CP1_CI_AS" NOT NULL,
 	value VARCHAR(8000) COLLATE "SQL_Latin1_General_CP1_CI_AS",
@@ -260,3 +275,13 @@ CREATE TABLE trace_tags (
 	CONSTRAINT trace_tag_pk PRIMARY KEY (key, request_id),
 	CONSTRAINT fk_trace_tags_request_id FOREIGN KEY(request_id) REFERENCES trace_info (request_id) ON DELETE CASCADE
 )
+
+
+CREATE TABLE span_attributes (
+	request_id VARCHAR(50) COLLATE "SQL_Latin1_General_CP1_CI_AS" NOT NULL,
+	span_id VARCHAR(50) COLLATE "SQL_Latin1_General_CP1_CI_AS" NOT NULL,
+	key VARCHAR(250) COLLATE "SQL_Latin1_General_CP1_CI_AS" NOT NULL,
+	value VARCHAR(250) COLLATE "SQL_Latin1_General_CP1_CI_AS",
+	CONSTRAINT span_attributes_pk PRIMARY KEY (request_id, span_id, key),
+	CONSTRAINT fk_span_attributes_request_id_span_id FOREIGN KEY(request_id, span_id) REFERENCES spans (request_id, span_id) ON DELETE CASCADE
+)
@@ -243,6 +243,21 @@ CREATE TABLE params (
 )
 
 
+CREATE TABLE spans (
+	request_id VARCHAR(50) NOT NULL,
+	span_id VARCHAR(50) NOT NULL,
+	parent_span_id VARCHAR(50),
+	name VARCHAR(250),
+	type VARCHAR(250),
+	status VARCHAR(50) NOT NULL,
+	start_time_ms BIGINT NOT NULL,
+	end_time_ms BIGINT,
+	duration_ms BIGINT,
+	PRIMARY KEY (request_id, span_id),
+	CONSTRAINT fk_spans_request_id FOREIGN KEY(request_id) REFERENCES trace_info (request_id) ON DELETE CASCADE
+)
+
+
 CREATE TABLE tags (
 	key VARCHAR(250) NOT NULL,
 	value VARCHAR(8000),
@@ -268,3 +283,13 @@ CREATE TABLE trace_tags (
 	PRIMARY KEY (key, request_id),
 	CONSTRAINT fk_trace_tags_request_id FOREIGN KEY(request_id) REFERENCES trace_info (request_id) ON DELETE CASCADE
 )
+
+
+CREATE TABLE span_attributes (
+	request_id VARCHAR(50) NOT NULL,
+	span_id VARCHAR(50) NOT NULL,
+	key VARCHAR(250) NOT NULL,
+	value VARCHAR(250),
+	PRIMARY KEY (request_id, span_id, key),
+	CONSTRAINT fk_span_attributes_request_id_span_id FOREIGN KEY(request_id, span_id) REFERENCES spans (request_id, span_id) ON DELETE CASCADE
+)
@@ -1,6 +1,8 @@
 import os
 import random
+import re
 from collections import namedtuple
+from copy import deepcopy
 from unittest import mock
 
 import numpy as np
@@ -15,19 +17,21 @@ from mlflow.entities.model_registry import ModelVersion
 from mlflow.exceptions import MlflowException
 from mlflow.models import add_libraries_to_model
 from mlflow.models.utils import (
+    _compile_type,
     _config_context,
     _convert_llm_input_data,
     _enforce_array,
     _enforce_datatype,
     _enforce_object,
     _enforce_property,
+    _enforce_type,
     _flatten_nested_params,
     _validate_and_get_model_code_path,
     _validate_model_code_from_notebook,
     get_model_version_from_model_uri,
 )
 from mlflow.types import DataType
-from mlflow.types.schema import Array, Object, Property
+from mlflow.types.schema import AnyType, Array, Map, Object, Property
 
 ModelWithData = namedtuple("ModelWithData", ["model", "inference_data"])
 
@@ -434,6 +438,70 @@ def test_enforce_array_with_errors():
         )
 
 
+@pytest.mark.parametrize(
+    ("data", "data_type", "required"),
+    [
+        ("a", DataType.string, True),
+        (True, DataType.boolean, True),
+        (1, DataType.long, True),
+        (1.5, DataType.double, True),
+        (np.float32(1.5), DataType.float, True),
+        (float("nan"), DataType.double, False),
+        (None, DataType.string, False),
+        ([1.0, 2.0], Array(DataType.double), True),
+        ([1, 2.5], Array(DataType.double), True),
+        (np.array([1, 2]), Array(DataType.long), True),
+        (np.array([["a"], ["b"]]), Array(Array(DataType.string)), True),
+        ([], Array(DataType.string), False),
+        (
+            {"a": "x", "b": [{"c": 1}], "d": {"e": [True]}},
+            Object(
+                [
+                    Property("a", DataType.string),
+                    Property("b", Array(Object([Property("c", DataType.long)]))),
+                    Property("d", Map(Array(DataType.boolean))),
+                    Property("f", DataType.double, required=False),
+                ]
+            ),
+            True,
+        ),
+        ({}, Map(DataType.string), False),
+        ({"a": [1, "b"]}, Map(AnyType()), True),
+    ],
+)
+def test_compiled_type_matches_enforce_type(data, data_type, required):
+    expected = _enforce_type(deepcopy(data), data_type, required=required)
+    result = _compile_type(data_type, required=required)(deepcopy(data))
+    assert type(result) is type(expected)
+    if isinstance(expected, np.ndarray):
+        np.testing.assert_array_equal(result, expected)
+        assert result.dtype == expected.dtype
+    elif isinstance(expected, float) and np.isnan(expected):
+        assert np.isnan(result)
+    else:
+        assert result == expected
+
+
+@pytest.mark.parametrize(
+    ("data", "data_type"),
+    [
+        (123, DataType.string),
+        (2**70, DataType.long),
+        ("abc", Array(DataType.string)),
+        ([1, 2**63], Array(DataType.long)),
+        ([["a", "b"], [1, 2]], Array(Array(DataType.string))),
+        ({"a": "x", "c": "y"}, Object([Property("a", DataType.string)])),
+        ({"a": 1}, Object([Property("a", DataType.string)])),
+        ({1: "a"}, Map(DataType.string)),
+    ],
+)
+def test_compiled_type_raises_same_errors_as_enforce_type(data, data_type):
+    with pytest.raises(MlflowException, match=r".+") as expected:
+        _enforce_type(deepcopy(data), data_type)
+    with pytest.raises(MlflowException, match=re.escape(expected.value.message)):
+        _compile_type(data_type)(deepcopy(data))
+
+
 def test_model_code_validation():
     # Invalid code with dbutils
     invalid_code = "dbutils.library.restartPython()\nsome_python_variable = 5"
@@ -1140,6 +1140,33 @@ def test_enforce_schema_warns_with_extra_fields():
         )
 
 
+def test_pyfunc_model_compiles_input_schema_once():
+    m = Model()
+    m.signature = ModelSignature(
+        inputs=Schema(
+            [
+                ColSpec(DataType.double, "a"),
+                ColSpec(Array(DataType.string), "b"),
+                ColSpec(Object([Property("c", DataType.long)]), "d"),
+            ]
+        )
+    )
+    pyfunc_model = PyFuncModel(model_meta=m, model_impl=TestModel())
+    data = pd.DataFrame({"a": [1.0, 2.0], "b": [["x"], ["y", "z"]], "d": [{"c": 1}, {"c": 2}]})
+
+    with mock.patch(
+        "mlflow.pyfunc._CompiledSchema", wraps=mlflow.pyfunc._CompiledSchema
+    ) as mock_compile:
+        for _ in range(3):
+            result = pyfunc_model.predict(data)
+            pd.testing.assert_frame_equal(result, data)
+        mock_compile.assert_called_once_with(m.signature.inputs)
+
+        m.signature = ModelSignature(inputs=Schema([ColSpec(DataType.double, "a")]))
+        pd.testing.assert_frame_equal(pyfunc_model.predict(data), data[["a"]])
+        assert mock_compile.call_count == 2
+
+
 def test_enforce_params_schema_with_success():
     # Correct parameters & schema
     test_parameters = {
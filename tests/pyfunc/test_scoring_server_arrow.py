@@ -0,0 +1,232 @@
+import json
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pytest
+from fastapi.testclient import TestClient
+
+import mlflow
+import mlflow.pyfunc.scoring_server as pyfunc_scoring_server
+from mlflow.models import infer_signature
+from mlflow.pyfunc import PythonModel
+from mlflow.pyfunc.scoring_server.client import ScoringServerClient, _dump_arrow_input
+
+
+class EchoModel(PythonModel):
+    def predict(self, context, model_input, params=None):
+        if params and params.get("scale"):
+            return model_input * params["scale"]
+        return model_input
+
+
+class SumModel(PythonModel):
+    def predict(self, context, model_input, params=None):
+        return model_input.sum(axis=1).to_numpy()
+
+
+class DictModel(PythonModel):
+    def predict(self, context, model_input, params=None):
+        return {"count": len(model_input)}
+
+
+def _create_app(tmp_path, python_model, signature=None):
+    model_path = tmp_path / "model"
+    mlflow.pyfunc.save_model(model_path, python_model=python_model, signature=signature)
+    return pyfunc_scoring_server.init(mlflow.pyfunc.load_model(model_path))
+
+
+def _to_arrow(df, metadata=None):
+    table = pa.Table.from_pandas(df, preserve_index=False).replace_schema_metadata(metadata)
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue().to_pybytes()
+
+
+def _read_arrow(content):
+    return pa.ipc.open_stream(content).read_all()
+
+
+@pytest.fixture
+def df():
+    return pd.DataFrame({"a": [1, 2, 3], "b": [0.5, 1.5, 2.5], "c": ["x", "y", "z"]})
+
+
+def test_arrow_input_with_json_output(tmp_path, df):
+    app = _create_app(tmp_path, EchoModel())
+    with TestClient(app) as client:
+        response = client.post(
+            "/invocations",
+            content=_to_arrow(df),
+            headers={"Content-Type": pyfunc_scoring_server.CONTENT_TYPE_ARROW},
+        )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == pyfunc_scoring_server.CONTENT_TYPE_JSON
+    assert json.loads(response.content)["predictions"] == df.to_dict(orient="records")
+
+
+def test_arrow_input_with_arrow_output(tmp_path, df):
+    app = _create_app(tmp_path, EchoModel())
+    with TestClient(app) as client:
+        response = client.post(
+            "/invocations",
+            content=_to_arrow(df),
+            headers={
+                "Content-Type": pyfunc_scoring_server.CONTENT_TYPE_ARROW,
+                "Accept": pyfunc_scoring_server.CONTENT_TYPE_ARROW,
+            },
+        )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == pyfunc_scoring_server.CONTENT_TYPE_ARROW
+    table = _read_arrow(response.content)
+    assert table.schema.metadata[pyfunc_scoring_server.ARROW_PREDICTIONS_TYPE_METADATA_KEY] == (
+        b"dataframe"
+    )
+    pd.testing.assert_frame_equal(table.to_pandas(), df)
+
+
+def test_arrow_input_params_are_read_from_schema_metadata(tmp_path):
+    df = pd.DataFrame({"a": [1, 2]})
+    app = _create_app(tmp_path, EchoModel(), infer_signature(df, params={"scale": 1}))
+    metadata = {pyfunc_scoring_server.ARROW_PARAMS_METADATA_KEY: json.dumps({"scale": 3})}
+    with TestClient(app) as client:
+        response = client.post(
+            "/invocations",
+            content=_to_arrow(df, metadata),
+            headers={"Content-Type": pyfunc_scoring_server.CONTENT_TYPE_ARROW},
+        )
+
+    assert response.status_code == 200
+    assert json.loads(response.content)["predictions"] == [{"a": 3}, {"a": 6}]
+
+
+def test_arrow_output_falls_back_to_json_for_non_tabular_predictions(tmp_path, df):
+    app = _create_app(tmp_path, DictModel())
+    with TestClient(app) as client:
+        response = client.post(
+            "/invocations",
+            content=_to_arrow(df),
+            headers={
+                "Content-Type": pyfunc_scoring_server.CONTENT_TYPE_ARROW,
+                "Accept": pyfunc_scoring_server.CONTENT_TYPE_ARROW,
+            },
+        )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == pyfunc_scoring_server.CONTENT_TYPE_JSON
+    assert json.loads(response.content)["predictions"] == {"count": 3}
+
+
+def test_invalid_arrow_input_returns_bad_request(tmp_path):
+    app = _create_app(tmp_path, EchoModel())
+    with TestClient(app) as client:
+        response = client.post(
+            "/invocations",
+            content=b"not an arrow stream",
+            headers={"Content-Type": pyfunc_scoring_server.CONTENT_TYPE_ARROW},
+        )
+
+    assert response.status_code == 400
+    assert "Failed to parse input as an Apache Arrow IPC stream" in response.json()["message"]
+
+
+@pytest.mark.parametrize(
+    ("predictions", "expected_type", "expected_columns"),
+    [
+        (pd.Series([1, 2]), b"ndarray", ["0"]),
+        (np.array([1.0, 2.0]), b"ndarray", ["0"]),
+        (np.array([[1, 2], [3, 4]]), b"ndarray", ["0", "1"]),
+        (["a", "b"], b"ndarray", ["0"]),
+        (pd.DataFrame({0: [1], "b": [2]}), b"dataframe", ["0", "b"]),
+    ],
+)
+def test_predictions_to_arrow(predictions, expected_type, expected_columns):
+    table = _read_arrow(pyfunc_scoring_server.predictions_to_arrow(predictions))
+    assert table.schema.metadata[pyfunc_scoring_server.ARROW_PREDICTIONS_TYPE_METADATA_KEY] == (
+        expected_type
+    )
+    assert table.column_names == expected_columns
+
+
+@pytest.mark.parametrize(
+    "predictions",
+    [
+        {"a": 1},
+        "text",
+        np.zeros((2, 2, 2)),
+        [[1], [2, 3]],
+        pd.DataFrame({"a": [[1, 2], [3]]}),
+        pd.DataFrame({"a": [{"x": 1}, {"x": 2}]}),
+    ],
+)
+def test_predictions_to_arrow_returns_none_for_unsupported_predictions(predictions):
+    assert pyfunc_scoring_server.predictions_to_arrow(predictions) is None
+
+
+def test_dump_arrow_input_only_supports_primitive_dataframes(df):
+    assert _dump_arrow_input(df) is not None
+    assert _dump_arrow_input(df.to_numpy()) is None
+    assert _dump_arrow_input(pd.DataFrame({0: [1]})) is None
+    assert _dump_arrow_input(pd.DataFrame({"a": [[1, 2]]})) is None
+
+
+def _route_requests_to(test_client):
+    def post(url, data, headers):
+        return test_client.post(url.replace("http://test:0", ""), content=data, headers=headers)
+
+    return mock.patch("mlflow.pyfunc.scoring_server.client.requests.post", side_effect=post)
+
+
+@pytest.mark.parametrize(
+    ("python_model", "expected"),
+    [
+        (EchoModel(), pd.DataFrame({"a": [1, 2, 3], "b": [0.5, 1.5, 2.5], "c": ["x", "y", "z"]})),
+        (SumModel(), pd.DataFrame({0: [1.5, 3.5, 5.5]})),
+    ],
+)
+def test_scoring_server_client_arrow_and_json_results_match(tmp_path, df, python_model, expected):
+    app = _create_app(tmp_path, python_model)
+    df = df[["a", "b"]] if isinstance(python_model, SumModel) else df
+
+    with TestClient(app) as test_client, _route_requests_to(test_client) as mock_post:
+        arrow_client = ScoringServerClient("test", 0, use_arrow=True)
+        arrow_predictions = arrow_client.invoke(df).get_predictions()
+        assert mock_post.call_args.kwargs["headers"]["Content-Type"] == (
+            pyfunc_scoring_server.CONTENT_TYPE_ARROW
+        )
+        json_predictions = ScoringServerClient("test", 0).invoke(df).get_predictions()
+        assert mock_post.call_args.kwargs["headers"]["Content-Type"] == (
+            pyfunc_scoring_server.CONTENT_TYPE_JSON
+        )
+
+    pd.testing.assert_frame_equal(arrow_predictions, expected)
+    pd.testing.assert_frame_equal(json_predictions, expected)
+
+
+def test_scoring_server_client_falls_back_to_json_when_arrow_is_unsupported(tmp_path, df):
+    app = _create_app(tmp_path, EchoModel())
+    content_types = []
+
+    with TestClient(app) as test_client, _route_requests_to(test_client) as mock_post:
+
+        def post(url, data, headers):
+            content_types.append(headers["Content-Type"])
+            if headers["Content-Type"] == pyfunc_scoring_server.CONTENT_TYPE_ARROW:
+                return mock.Mock(status_code=415, text="unsupported")
+            return test_client.post("/invocations", content=data, headers=headers)
+
+        mock_post.side_effect = post
+        client = ScoringServerClient("test", 0, use_arrow=True)
+        client.invoke(df)
+        client.invoke(df)
+
+    assert content_types == [
+        pyfunc_scoring_server.CONTENT_TYPE_ARROW,
+        pyfunc_scoring_server.CONTENT_TYPE_JSON,
+        pyfunc_scoring_server.CONTENT_TYPE_JSON,
+    ]
+    assert client.use_arrow is False
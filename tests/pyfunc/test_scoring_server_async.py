@@ -0,0 +1,200 @@
+import asyncio
+import json
+import threading
+from unittest import mock
+
+import pandas as pd
+import pytest
+from fastapi.testclient import TestClient
+
+import mlflow
+import mlflow.pyfunc.scoring_server as pyfunc_scoring_server
+from mlflow.exceptions import MlflowException
+from mlflow.pyfunc import PythonModel
+from mlflow.pyfunc.model import _run_coroutine_sync
+from mlflow.pyfunc.scoring_server.predict_executor import PredictExecutor
+
+
+class AsyncModel(PythonModel):
+    async def predict(self, context, model_input, params=None):
+        await asyncio.sleep(0)
+        return model_input * 2
+
+
+class StreamModel(PythonModel):
+    def predict(self, context, model_input, params=None):
+        return [model_input]
+
+    def predict_stream(self, context, model_input, params=None):
+        for word in model_input.split():
+            if word == "fail":
+                raise ValueError("cannot stream this word")
+            yield {"token": word}
+
+
+class DoubleModel(PythonModel):
+    def predict(self, context, model_input, params=None):
+        return model_input * 2
+
+
+def _load_model(tmp_path, python_model):
+    model_path = tmp_path / "model"
+    mlflow.pyfunc.save_model(model_path, python_model=python_model)
+    return mlflow.pyfunc.load_model(model_path)
+
+
+def _post_json(client, url, payload):
+    return client.post(
+        url,
+        content=json.dumps(payload),
+        headers={"Content-Type": pyfunc_scoring_server.CONTENT_TYPE_JSON},
+    )
+
+
+def _read_events(response):
+    return [event for event in response.text.split("\n\n") if event]
+
+
+def test_async_python_model_predict(tmp_path):
+    model = _load_model(tmp_path, AsyncModel())
+    df = pd.DataFrame({"x": [1, 2]})
+
+    assert model._is_async_predict
+    pd.testing.assert_frame_equal(model.predict(df), df * 2)
+    pd.testing.assert_frame_equal(asyncio.run(model._predict_async(df)), df * 2)
+
+
+def test_sync_python_model_is_not_async(tmp_path):
+    assert not _load_model(tmp_path, DoubleModel())._is_async_predict
+
+
+@pytest.mark.asyncio
+async def test_run_coroutine_sync_inside_running_event_loop():
+    async def add(a, b):
+        await asyncio.sleep(0)
+        return a + b
+
+    assert _run_coroutine_sync(add(1, 2)) == 3
+
+
+@pytest.mark.parametrize("python_model", [AsyncModel(), DoubleModel()])
+def test_scoring_server_serves_sync_and_async_models(tmp_path, python_model):
+    app = pyfunc_scoring_server.init(_load_model(tmp_path, python_model))
+    with TestClient(app) as client:
+        response = _post_json(
+            client, "/invocations", {"dataframe_split": {"columns": ["x"], "data": [[1], [2]]}}
+        )
+
+    assert response.status_code == 200
+    assert json.loads(response.content)["predictions"] == [{"x": 2}, {"x": 4}]
+
+
+@pytest.mark.asyncio
+async def test_predict_executor_runs_predictions_on_dedicated_pool(tmp_path):
+    executor = PredictExecutor(_load_model(tmp_path, DoubleModel()), max_workers=1)
+    try:
+        df = pd.DataFrame({"x": [1, 2]})
+        pd.testing.assert_frame_equal(await executor.predict(df), df * 2)
+        assert executor.thread_pool is not None
+    finally:
+        executor.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_predict_executor_enforces_async_model_schema_on_pool(tmp_path, monkeypatch):
+    model = _load_model(tmp_path, AsyncModel())
+    enforce_threads = []
+    prepare_prediction_input = model._prepare_prediction_input
+
+    def record_thread(*args, **kwargs):
+        enforce_threads.append(threading.current_thread().name)
+        return prepare_prediction_input(*args, **kwargs)
+
+    monkeypatch.setattr(model, "_prepare_prediction_input", record_thread)
+    executor = PredictExecutor(model, max_workers=1)
+    try:
+        df = pd.DataFrame({"x": [1, 2]})
+        pd.testing.assert_frame_equal(await executor.predict(df), df * 2)
+    finally:
+        executor.shutdown()
+
+    assert len(enforce_threads) == 1
+    assert enforce_threads[0].startswith("MlflowScoringServerPredict")
+
+
+def test_scoring_server_shuts_down_predict_executor_on_lifespan_exit(tmp_path):
+    with mock.patch.object(PredictExecutor, "shutdown") as mock_shutdown:
+        app = pyfunc_scoring_server.init(_load_model(tmp_path, DoubleModel()))
+        with TestClient(app):
+            mock_shutdown.assert_not_called()
+        mock_shutdown.assert_called_once()
+
+
+def test_predict_executor_from_env(tmp_path, monkeypatch):
+    model = _load_model(tmp_path, DoubleModel())
+    monkeypatch.setenv("MLFLOW_SCORING_SERVER_PREDICT_WORKERS", "3")
+    executor = PredictExecutor.from_env(model)
+    assert executor.executor_type == "thread"
+    assert executor.thread_pool._max_workers == 3
+    executor.shutdown()
+
+    monkeypatch.setenv("MLFLOW_SCORING_SERVER_PREDICT_EXECUTOR", "fork")
+    with pytest.raises(MlflowException, match="Invalid predict executor type 'fork'"):
+        PredictExecutor.from_env(model)
+
+
+def test_process_predict_executor_requires_model_uri(tmp_path):
+    with pytest.raises(MlflowException, match="requires the URI of the served model"):
+        PredictExecutor(_load_model(tmp_path, DoubleModel()), executor_type="process")
+
+
+def test_stream_invocations_sends_server_sent_events(tmp_path):
+    app = pyfunc_scoring_server.init(_load_model(tmp_path, StreamModel()))
+    with TestClient(app) as client:
+        response = _post_json(client, "/invocations/stream", {"inputs": "hello world"})
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith(
+        pyfunc_scoring_server.CONTENT_TYPE_EVENT_STREAM
+    )
+    assert _read_events(response) == [
+        'data: {"token": "hello"}',
+        'data: {"token": "world"}',
+        "data: [DONE]",
+    ]
+
+
+def test_stream_invocations_reports_mid_stream_errors_as_events(tmp_path):
+    app = pyfunc_scoring_server.init(_load_model(tmp_path, StreamModel()))
+    with TestClient(app) as client:
+        response = _post_json(client, "/invocations/stream", {"inputs": "hello fail"})
+
+    assert response.status_code == 200
+    events = _read_events(response)
+    assert events[0] == 'data: {"token": "hello"}'
+    assert events[1].startswith("event: error\ndata: ")
+    assert "cannot stream this word" in events[1]
+
+
+def test_stream_invocations_reports_errors_before_first_chunk_as_responses(tmp_path):
+    app = pyfunc_scoring_server.init(_load_model(tmp_path, StreamModel()))
+    with TestClient(app) as client:
+        response = _post_json(client, "/invocations/stream", {"inputs": "fail"})
+
+    assert response.status_code == 400
+    assert "cannot stream this word" in response.json()["stack_trace"]
+
+
+def test_stream_invocations_on_model_without_predict_stream(tmp_path):
+    app = pyfunc_scoring_server.init(_load_model(tmp_path, DoubleModel()))
+    with TestClient(app) as client:
+        response = _post_json(client, "/invocations/stream", {"inputs": "hello"})
+        csv_response = client.post(
+            "/invocations/stream",
+            content="x\n1\n",
+            headers={"Content-Type": pyfunc_scoring_server.CONTENT_TYPE_CSV},
+        )
+
+    assert response.status_code == 400
+    assert "does not support predict_stream" in response.json()["message"]
+    assert csv_response.status_code == 415
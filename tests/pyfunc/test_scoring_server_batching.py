@@ -0,0 +1,185 @@
+import asyncio
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+import pytest
+from fastapi.testclient import TestClient
+
+import mlflow
+import mlflow.pyfunc.scoring_server as pyfunc_scoring_server
+from mlflow.pyfunc import PythonModel
+from mlflow.pyfunc.scoring_server.batching import DynamicBatcher
+
+
+class _RecordingPredictFn:
+    def __init__(self, fn=None):
+        self.calls = []
+        self._lock = threading.Lock()
+        self._fn = fn or (lambda data: data * 2)
+
+    def __call__(self, data):
+        with self._lock:
+            self.calls.append(len(data))
+        return self._fn(data)
+
+
+async def _predict_concurrently(batcher, inputs):
+    return await asyncio.gather(*(batcher.predict(data) for data in inputs))
+
+
+@pytest.mark.asyncio
+async def test_batcher_merges_concurrent_dataframes():
+    predict_fn = _RecordingPredictFn()
+    batcher = DynamicBatcher(predict_fn, max_batch_size=100, max_batch_delay_ms=50)
+    inputs = [pd.DataFrame({"x": [i, i + 1]}) for i in range(5)]
+
+    outputs = await _predict_concurrently(batcher, inputs)
+
+    assert predict_fn.calls == [10]
+    for data, output in zip(inputs, outputs):
+        pd.testing.assert_frame_equal(output, data * 2)
+    stats = batcher.stats.to_dict()
+    assert stats["num_batches"] == 1
+    assert stats["num_requests"] == 5
+    assert stats["num_rows"] == 10
+    assert stats["batch_size_histogram"] == {"5": 1}
+
+
+@pytest.mark.asyncio
+async def test_batcher_merges_concurrent_ndarrays():
+    predict_fn = _RecordingPredictFn(lambda data: data.sum(axis=1))
+    batcher = DynamicBatcher(predict_fn, max_batch_size=100, max_batch_delay_ms=50)
+    inputs = [np.full((i + 1, 3), i, dtype=np.float32) for i in range(4)]
+
+    outputs = await _predict_concurrently(batcher, inputs)
+
+    assert predict_fn.calls == [10]
+    for data, output in zip(inputs, outputs):
+        np.testing.assert_array_equal(output, data.sum(axis=1))
+
+
+@pytest.mark.asyncio
+async def test_batcher_respects_max_batch_size():
+    predict_fn = _RecordingPredictFn()
+    batcher = DynamicBatcher(predict_fn, max_batch_size=4, max_batch_delay_ms=50)
+    inputs = [pd.DataFrame({"x": [i, i]}) for i in range(5)]
+
+    outputs = await _predict_concurrently(batcher, inputs)
+
+    assert predict_fn.calls == [4, 4, 2]
+    for data, output in zip(inputs, outputs):
+        pd.testing.assert_frame_equal(output, data * 2)
+
+
+@pytest.mark.asyncio
+async def test_batcher_does_not_merge_incompatible_inputs():
+    predict_fn = _RecordingPredictFn()
+    batcher = DynamicBatcher(predict_fn, max_batch_size=100, max_batch_delay_ms=50)
+    inputs = [
+        pd.DataFrame({"x": [1]}),
+        pd.DataFrame({"x": [1.5]}),
+        pd.DataFrame({"y": [2]}),
+        pd.DataFrame({"x": [3]}),
+    ]
+
+    outputs = await _predict_concurrently(batcher, inputs)
+
+    assert sorted(predict_fn.calls) == [1, 1, 1, 1]
+    for data, output in zip(inputs, outputs):
+        pd.testing.assert_frame_equal(output, data * 2)
+
+
+@pytest.mark.asyncio
+async def test_batcher_falls_back_to_individual_predictions_when_output_is_not_row_aligned():
+    predict_fn = _RecordingPredictFn(lambda data: {"total": int(data["x"].sum())})
+    batcher = DynamicBatcher(predict_fn, max_batch_size=100, max_batch_delay_ms=50)
+    inputs = [pd.DataFrame({"x": [i, i]}) for i in range(3)]
+
+    outputs = await _predict_concurrently(batcher, inputs)
+
+    assert predict_fn.calls == [6, 2, 2, 2]
+    assert outputs == [{"total": 0}, {"total": 2}, {"total": 4}]
+    assert batcher.stats.num_fallbacks == 1
+
+
+@pytest.mark.asyncio
+async def test_batcher_isolates_failing_requests():
+    def predict(data):
+        if (data["x"] < 0).any():
+            raise ValueError("negative input")
+        return data
+
+    batcher = DynamicBatcher(predict, max_batch_size=100, max_batch_delay_ms=50)
+    inputs = [pd.DataFrame({"x": [1]}), pd.DataFrame({"x": [-1]}), pd.DataFrame({"x": [2]})]
+
+    results = await asyncio.gather(
+        *(batcher.predict(data) for data in inputs), return_exceptions=True
+    )
+
+    pd.testing.assert_frame_equal(results[0], inputs[0])
+    assert isinstance(results[1], ValueError)
+    pd.testing.assert_frame_equal(results[2], inputs[2])
+
+
+@pytest.mark.asyncio
+async def test_batcher_passes_through_unbatchable_inputs():
+    predict_fn = _RecordingPredictFn(lambda data: [len(data)])
+    batcher = DynamicBatcher(predict_fn, max_batch_size=100, max_batch_delay_ms=50)
+
+    assert await batcher.predict({"a": [1, 2]}) == [1]
+    assert batcher.stats.num_batches == 0
+
+
+def test_batcher_from_env(monkeypatch):
+    assert DynamicBatcher.from_env(lambda data: data) is None
+
+    monkeypatch.setenv("MLFLOW_SCORING_SERVER_MAX_BATCH_SIZE", "32")
+    monkeypatch.setenv("MLFLOW_SCORING_SERVER_MAX_BATCH_DELAY_MS", "5")
+    batcher = DynamicBatcher.from_env(lambda data: data)
+    assert batcher.max_batch_size == 32
+    assert batcher.max_batch_delay == 0.005
+
+
+class DoubleModel(PythonModel):
+    def predict(self, context, model_input, params=None):
+        return model_input * 2
+
+
+def test_scoring_server_batches_concurrent_requests(tmp_path, monkeypatch):
+    monkeypatch.setenv("MLFLOW_SCORING_SERVER_MAX_BATCH_SIZE", "64")
+    monkeypatch.setenv("MLFLOW_SCORING_SERVER_MAX_BATCH_DELAY_MS", "100")
+    model_path = tmp_path / "model"
+    mlflow.pyfunc.save_model(model_path, python_model=DoubleModel())
+    app = pyfunc_scoring_server.init(mlflow.pyfunc.load_model(model_path))
+
+    with TestClient(app) as client:
+
+        def score(i):
+            return client.post(
+                "/invocations",
+                content=json.dumps({"dataframe_split": {"columns": ["x"], "data": [[i], [i]]}}),
+                headers={"Content-Type": pyfunc_scoring_server.CONTENT_TYPE_JSON},
+            )
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            responses = list(executor.map(score, range(8)))
+
+        stats = client.get("/metrics/batching").json()
+
+    for i, response in enumerate(responses):
+        assert response.status_code == 200
+        assert json.loads(response.content)["predictions"] == [{"x": 2 * i}, {"x": 2 * i}]
+    assert stats["num_requests"] == 8
+    assert stats["num_rows"] == 16
+
+
+def test_scoring_server_does_not_expose_batching_metrics_when_disabled(tmp_path):
+    model_path = tmp_path / "model"
+    mlflow.pyfunc.save_model(model_path, python_model=DoubleModel())
+    app = pyfunc_scoring_server.init(mlflow.pyfunc.load_model(model_path))
+
+    with TestClient(app) as client:
+        assert client.get("/metrics/batching").status_code == 404
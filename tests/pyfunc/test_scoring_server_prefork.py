@@ -0,0 +1,122 @@
+import os
+import signal
+import socket
+import subprocess
+import sys
+import time
+
+import psutil
+import pytest
+import requests
+
+import mlflow
+from mlflow.exceptions import MlflowException
+from mlflow.pyfunc import PythonModel, scoring_server
+from mlflow.pyfunc.scoring_server.prefork import PreforkServer, _bind_socket, _serve_unavailable
+
+from tests.helper_functions import LOCALHOST, get_safe_port
+
+pytestmark = pytest.mark.skipif(not hasattr(os, "fork"), reason="Requires os.fork")
+
+
+class DoubleModel(PythonModel):
+    def predict(self, context, model_input, params=None):
+        return model_input * 2
+
+
+def test_get_cmd_uses_prefork_server_when_enabled(monkeypatch):
+    command, _ = scoring_server.get_cmd("/model", port=5000, nworkers=4)
+    assert command.startswith("uvicorn ")
+
+    monkeypatch.setenv("MLFLOW_SCORING_SERVER_PREFORK", "true")
+    command, env = scoring_server.get_cmd("/model", port=5000, nworkers=4)
+    assert command == "python -m mlflow.pyfunc.scoring_server.prefork --port 5000 --workers 4"
+    assert env[scoring_server._SERVER_MODEL_PATH].endswith("/model")
+
+
+def test_prefork_server_rejects_invalid_number_of_workers():
+    with pytest.raises(MlflowException, match="number of workers must be positive"):
+        PreforkServer("/model", LOCALHOST, 5000, workers=0)
+
+
+def test_serve_unavailable_answers_requests_with_503_while_loading():
+    sock = _bind_socket(LOCALHOST, 0)
+    url = f"http://{LOCALHOST}:{sock.getsockname()[1]}"
+    try:
+        with _serve_unavailable(sock):
+            ping = requests.get(f"{url}/ping", timeout=5)
+            invocation = requests.post(f"{url}/invocations", json={"inputs": [1]}, timeout=5)
+
+        assert ping.status_code == 503
+        assert ping.headers["Retry-After"] == "1"
+        assert invocation.status_code == 503
+        assert invocation.json()["error_code"] == "TEMPORARILY_UNAVAILABLE"
+        # The socket keeps listening so that the workers can take it over
+        with socket.create_connection(sock.getsockname()[:2], timeout=5):
+            pass
+    finally:
+        sock.close()
+
+
+def _wait_until_ready(url, timeout=60):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            if requests.get(f"{url}/ping", timeout=5).status_code == 200:
+                return
+        except requests.ConnectionError:
+            pass
+        time.sleep(0.2)
+    raise TimeoutError(f"Server at {url} did not become ready")
+
+
+def _wait_for_workers(proc, num_workers, timeout=60):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        workers = psutil.Process(proc.pid).children()
+        if len(workers) == num_workers:
+            return workers
+        time.sleep(0.2)
+    raise TimeoutError(f"Expected {num_workers} workers")
+
+
+def test_prefork_server_serves_model_and_replaces_dead_workers(tmp_path):
+    model_path = tmp_path / "model"
+    mlflow.pyfunc.save_model(model_path, python_model=DoubleModel())
+    port = get_safe_port()
+    url = f"http://{LOCALHOST}:{port}"
+    proc = subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "mlflow.pyfunc.scoring_server.prefork",
+            "--host",
+            LOCALHOST,
+            "--port",
+            str(port),
+            "--workers",
+            "2",
+        ],
+        env={**os.environ, scoring_server._SERVER_MODEL_PATH: str(model_path)},
+    )
+    try:
+        _wait_until_ready(url)
+        workers = _wait_for_workers(proc, 2)
+        response = requests.post(
+            f"{url}/invocations",
+            json={"dataframe_split": {"columns": ["x"], "data": [[1], [2]]}},
+            timeout=10,
+        )
+        assert response.status_code == 200
+        assert response.json()["predictions"] == [{"x": 2}, {"x": 4}]
+
+        workers[0].kill()
+        workers[0].wait(timeout=10)
+        deadline = time.monotonic() + 30
+        while workers[0].pid in {w.pid for w in _wait_for_workers(proc, 2)}:
+            assert time.monotonic() < deadline
+            time.sleep(0.2)
+        _wait_until_ready(url)
+    finally:
+        proc.send_signal(signal.SIGTERM)
+        assert proc.wait(timeout=60) == 0
@@ -265,6 +265,24 @@ def test_search_runs_default_view_type(mock_get_request_message, mock_tracking_s
     assert args[2] == ViewType.ACTIVE_ONLY
 
 
+@pytest.mark.parametrize(
+    ("request_fields", "columns"),
+    [
+        ({}, None),
+        ({"select_columns": True}, []),
+        ({"select_columns": True, "columns": ["metrics.m", "params.p"]}, ["metrics.m", "params.p"]),
+    ],
+)
+def test_search_runs_columns(
+    mock_get_request_message, mock_tracking_store, request_fields, columns
+):
+    mock_get_request_message.return_value = SearchRuns(experiment_ids=["0"], **request_fields)
+    mock_tracking_store.search_runs.return_value = PagedList([], None)
+    _search_runs()
+    _, kwargs = mock_tracking_store.search_runs.call_args
+    assert kwargs["columns"] == columns
+
+
 def test_log_batch_api_req(mock_get_request_json):
     mock_get_request_json.return_value = "a" * (MAX_BATCH_LOG_REQUEST_SIZE + 1)
     response = _log_batch()
@@ -809,6 +827,23 @@ def test_get_model_version_by_alias(mock_get_request_message, mock_model_registr
     assert json.loads(resp.get_data()) == {"model_version": jsonify(mvd)}
 
 
+def test_upload_artifact_mlflow_artifacts_streams_to_artifact_repo(
+    enable_serve_artifacts, tmp_path
+):
+    repo = LocalArtifactRepository(tmp_path.as_uri())
+    content = b"0123456789" * 300_000
+    with (
+        mock.patch("mlflow.server.handlers._get_artifact_repo_mlflow_artifacts", return_value=repo),
+        mock.patch.object(repo, "log_artifact") as mock_log_artifact,
+        app.test_client() as c,
+    ):
+        response = c.put("/api/2.0/mlflow-artifacts/artifacts/dir/a.bin", data=content)
+
+    assert response.status_code == 200
+    mock_log_artifact.assert_not_called()
+    assert tmp_path.joinpath("dir", "a.bin").read_bytes() == content
+
+
 @pytest.mark.parametrize(
     "path",
     [
@@ -1266,7 +1266,7 @@ def get_request_mock(
 
         json_dict = kwargs["json"] if method == "POST" else kwargs["params"]
         response_message = req_info_to_response[
-            (host_creds.host, endpoint, method, json.dumps(json_dict, indent=2))
+            (host_creds.host, endpoint, method, json.dumps(json_dict, separators=(",", ":")))
         ]
         mock_resp = mock.MagicMock(autospec=Response)
         mock_resp.status_code = 200
@@ -1,4 +1,6 @@
+import io
 import logging
+import os
 import posixpath
 import time
 from unittest import mock
@@ -8,6 +10,7 @@ import pytest
 from mlflow.entities import FileInfo
 from mlflow.exceptions import MlflowException
 from mlflow.store.artifact.artifact_repo import ArtifactRepository
+from mlflow.store.artifact.local_artifact_repo import LocalArtifactRepository
 from mlflow.utils.file_utils import TempDir
 
 from tests.utils.test_logging_utils import logger, reset_logging_level  # noqa F401
@@ -235,3 +238,75 @@ def test_download_artifacts_provides_traceback_info(debug, reset_logging_level):
                 assert "Traceback" in err_msg
             else:
                 assert "Traceback" not in err_msg
+
+
+def test_log_artifact_stream_spools_to_log_artifact():
+    logged = []
+
+    def log_artifact(local_file, artifact_path=None):
+        with open(local_file) as f:
+            logged.append((posixpath.basename(local_file), artifact_path, f.read()))
+
+    repo = ArtifactRepositoryImpl("uri")
+    with mock.patch.object(repo, "log_artifact", side_effect=log_artifact):
+        repo.log_artifact_stream(io.BytesIO(b"hello"), "dir/sub/file.txt")
+        repo.log_artifact_stream(io.BytesIO(b"world"), "file.txt")
+
+    assert logged == [("file.txt", "dir/sub", "hello"), ("file.txt", None, "world")]
+
+
+def test_log_artifacts_incremental_uploads_changed_files_only(tmp_path):
+    local_dir = tmp_path / "local"
+    (local_dir / "sub").mkdir(parents=True)
+    (local_dir / "a.txt").write_text("a")
+    (local_dir / "sub" / "b.txt").write_text("b")
+    repo = LocalArtifactRepository(str(tmp_path / "artifacts"))
+
+    assert repo.log_artifacts_incremental(local_dir, "model") == ["a.txt", "sub/b.txt"]
+    assert (tmp_path / "artifacts" / "model" / "sub" / "b.txt").read_text() == "b"
+
+    with (
+        mock.patch.object(repo, "log_artifacts", wraps=repo.log_artifacts) as log_artifacts_mock,
+        mock.patch.object(repo, "log_artifact", wraps=repo.log_artifact) as log_artifact_mock,
+    ):
+        # Nothing changed, so neither the files nor the manifest are uploaded
+        assert repo.log_artifacts_incremental(local_dir, "model") == []
+        log_artifacts_mock.assert_not_called()
+        log_artifact_mock.assert_not_called()
+
+        # A touched file is compared by digest, and only the manifest is uploaded
+        os.utime(local_dir / "a.txt", ns=(0, 0))
+        assert repo.log_artifacts_incremental(local_dir, "model") == []
+        log_artifacts_mock.assert_not_called()
+        log_artifact_mock.assert_called_once()
+
+    (local_dir / "sub" / "b.txt").write_text("bb")
+    (local_dir / "c.txt").write_text("c")
+    assert repo.log_artifacts_incremental(local_dir, "model") == ["c.txt", "sub/b.txt"]
+    assert (tmp_path / "artifacts" / "model" / "sub" / "b.txt").read_text() == "bb"
+    assert (tmp_path / "artifacts" / "model" / "c.txt").read_text() == "c"
+
+
+def test_download_artifacts_incremental_skips_matching_files(tmp_path):
+    local_dir = tmp_path / "local"
+    (local_dir / "sub").mkdir(parents=True)
+    (local_dir / "a.txt").write_text("a")
+    (local_dir / "sub" / "b.txt").write_text("b")
+    repo = LocalArtifactRepository(str(tmp_path / "artifacts"))
+    repo.log_artifacts_incremental(local_dir, "model")
+    dst_path = tmp_path / "dst"
+    dst_path.mkdir()
+
+    assert repo.download_artifacts_incremental("model", dst_path) == [
+        "model/a.txt",
+        "model/sub/b.txt",
+    ]
+    assert sorted(p.name for p in (dst_path / "model").rglob("*") if p.is_file()) == [
+        "a.txt",
+        "b.txt",
+    ]
+    assert repo.download_artifacts_incremental("model", dst_path) == []
+
+    (dst_path / "model" / "sub" / "b.txt").write_text("modified")
+    assert repo.download_artifacts_incremental("model", dst_path) == ["model/sub/b.txt"]
+    assert (dst_path / "model" / "sub" / "b.txt").read_text() == "b"
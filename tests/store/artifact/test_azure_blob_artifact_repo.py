@@ -1,4 +1,5 @@
 import base64
+import io
 import json
 import os
 import posixpath
@@ -165,6 +166,27 @@ def test_list_artifacts(mock_client, root_path):
     assert artifacts[1].file_size == 42
 
 
+def test_list_artifacts_recursive(mock_client):
+    repo = AzureBlobArtifactRepository(TEST_URI, mock_client)
+
+    blobs = []
+    for name, size in [("dir/", 0), ("dir/nested/file", 1), ("file", 42)]:
+        blob_props = BlobProperties()
+        blob_props.size = size
+        blob_props.name = posixpath.join(TEST_ROOT_PATH, name)
+        blobs.append(blob_props)
+    mock_client.get_container_client().list_blobs.return_value = MockBlobList(blobs)
+
+    artifacts = repo.list_artifacts_recursive()
+    mock_client.get_container_client().list_blobs.assert_called_with(name_starts_with="some/path/")
+    mock_client.get_container_client().walk_blobs.assert_not_called()
+    assert [(a.path, a.is_dir, a.file_size) for a in artifacts] == [
+        ("dir", True, None),
+        ("dir/nested/file", False, 1),
+        ("file", False, 42),
+    ]
+
+
 def test_log_artifact(mock_client, tmp_path):
     repo = AzureBlobArtifactRepository(TEST_URI, mock_client)
 
@@ -183,6 +205,21 @@ def test_log_artifact(mock_client, tmp_path):
     assert arg2.name == fpath
 
 
+def test_log_artifact_stream(mock_client):
+    repo = AzureBlobArtifactRepository(TEST_URI, mock_client)
+    stream = io.BytesIO(b"hello world!")
+
+    repo.log_artifact_stream(stream, "dir/test.txt")
+
+    mock_client.get_container_client.assert_called_with("container")
+    mock_client.get_container_client().upload_blob.assert_called_with(
+        posixpath.join(TEST_ROOT_PATH, "dir/test.txt"),
+        stream,
+        overwrite=True,
+        timeout=repo.write_timeout,
+    )
+
+
 def test_log_artifacts(mock_client, tmp_path):
     repo = AzureBlobArtifactRepository(TEST_URI, mock_client)
 
@@ -276,6 +313,8 @@ def test_download_directory_artifact_succeeds_when_artifact_root_is_not_blob_con
         f.write_text("hello world!")
 
     mock_client.get_container_client().walk_blobs.side_effect = get_mock_listing
+    # The directory is listed recursively with a flat listing of the blobs under the prefix
+    mock_client.get_container_client().list_blobs.side_effect = get_mock_listing
     mock_client.get_container_client().download_blob().readinto.side_effect = create_file
 
     # Ensure that the root directory can be downloaded successfully
@@ -327,6 +366,10 @@ def test_download_directory_artifact_succeeds_when_artifact_root_is_blob_contain
         f.write_text("hello world!")
 
     mock_client.get_container_client().walk_blobs.side_effect = get_mock_listing
+    # The directory is listed recursively with a flat listing of the blobs under the prefix
+    mock_client.get_container_client().list_blobs.return_value = MockBlobList(
+        [blob_props_1, blob_props_2]
+    )
     mock_client.get_container_client().download_blob().readinto.side_effect = create_file
 
     # Ensure that the root directory can be downloaded successfully
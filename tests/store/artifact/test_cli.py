@@ -8,7 +8,8 @@ from click.testing import CliRunner
 import mlflow
 import mlflow.pyfunc
 from mlflow.entities import FileInfo
-from mlflow.store.artifact.cli import _file_infos_to_json, download_artifacts
+from mlflow.store.artifact.artifact_repo import ArtifactRepository
+from mlflow.store.artifact.cli import _file_infos_to_json, download_artifacts, log_artifacts
 from mlflow.tracking.artifact_utils import _download_artifact_from_uri
 
 
@@ -135,3 +136,36 @@ def test_download_artifacts_with_dst_path(run_with_artifact, tmp_path, dst_subdi
     dst_path = tmp_path / dst_subdir_path if dst_subdir_path else tmp_path
     downloaded_file_path = _run_download_artifact_command(["-u", artifact_uri, "-d", str(dst_path)])
     assert str(downloaded_file_path).startswith(str(dst_path))
+
+
+def test_log_and_download_artifacts_incrementally(tmp_path):
+    local_dir = tmp_path / "local"
+    local_dir.mkdir()
+    (local_dir / "a.txt").write_text("a")
+    (local_dir / "b.txt").write_text("b")
+    dst_path = tmp_path / "dst"
+    with mlflow.start_run() as run:
+        pass
+
+    runner = CliRunner()
+    log_args = ["-l", str(local_dir), "-r", run.info.run_id, "-a", "outputs", "--incremental"]
+    with mock.patch(
+        "mlflow.store.artifact.artifact_repo.ArtifactRepository.log_artifacts_incremental",
+        autospec=True,
+        side_effect=ArtifactRepository.log_artifacts_incremental,
+    ) as log_incremental_mock:
+        for _ in range(2):
+            resp = runner.invoke(log_artifacts, args=log_args, catch_exceptions=False)
+            assert resp.exit_code == 0
+    assert log_incremental_mock.call_count == 2
+
+    download_args = ["-r", run.info.run_id, "-a", "outputs", "-d", str(dst_path), "--incremental"]
+    resp = runner.invoke(download_artifacts, args=download_args, catch_exceptions=False)
+    assert resp.exit_code == 0
+    assert resp.stdout.rstrip().split("\n")[-1] == str(dst_path / "outputs")
+    assert (dst_path / "outputs" / "a.txt").read_text() == "a"
+    assert (dst_path / "outputs" / "b.txt").read_text() == "b"
+
+    resp = runner.invoke(download_artifacts, args=["-r", run.info.run_id, "--incremental"])
+    assert resp.exit_code != 0
+    assert "--dst-path must be specified with --incremental" in resp.output
@@ -1,3 +1,4 @@
+import io
 import os
 import posixpath
 from unittest import mock
@@ -116,6 +117,41 @@ def test_list_artifacts_with_subdir(mock_client, dir_name):
     assert artifacts[1].file_size is None
 
 
+def test_list_artifacts_recursive(mock_client):
+    artifact_root_path = "experiment_id/run_id"
+    repo = GCSArtifactRepository(f"gs://test_bucket/{artifact_root_path}", client=mock_client)
+
+    # mocked bucket/blob structure
+    # gs://test_bucket/experiment_id/run_id/
+    #  |- model
+    #     |- model.pb
+    #     |- variables
+    #        |- variables.data
+    #     |- empty (placeholder blob)
+    blob_mocks = []
+    for name, size in [
+        ("model/", 0),
+        ("model/model.pb", 1),
+        ("model/variables/variables.data", 2),
+        ("model/empty/", 0),
+    ]:
+        blob_mock = mock.Mock()
+        blob_mock.configure_mock(name=posixpath.join(artifact_root_path, name), size=size)
+        blob_mocks.append(blob_mock)
+    mock_client.bucket.return_value.list_blobs.return_value = blob_mocks
+
+    artifacts = repo.list_artifacts_recursive(path="model")
+    # A single listing without delimiter returns the blobs at any depth
+    mock_client.bucket().list_blobs.assert_called_once_with(
+        prefix=posixpath.join(artifact_root_path, "model/")
+    )
+    assert [(a.path, a.is_dir, a.file_size) for a in artifacts] == [
+        ("model/empty", True, None),
+        ("model/model.pb", False, 1),
+        ("model/variables/variables.data", False, 2),
+    ]
+
+
 def test_log_artifact(mock_client, tmp_path):
     repo = GCSArtifactRepository("gs://test_bucket/some/path", mock_client)
 
@@ -153,6 +189,21 @@ def test_log_artifact(mock_client, tmp_path):
     )
 
 
+def test_log_artifact_stream(mock_client):
+    repo = GCSArtifactRepository("gs://test_bucket/some/path", mock_client)
+    stream = io.BytesIO(b"hello world!")
+
+    repo.log_artifact_stream(stream, "dir/test.txt")
+
+    mock_client.bucket.assert_called_with("test_bucket")
+    mock_client.bucket().blob.assert_called_with(
+        "some/path/dir/test.txt", chunk_size=repo._GCS_UPLOAD_CHUNK_SIZE
+    )
+    mock_client.bucket().blob().upload_from_file.assert_called_with(
+        stream, timeout=repo._GCS_DEFAULT_TIMEOUT
+    )
+
+
 def test_log_artifacts(mock_client, tmp_path):
     repo = GCSArtifactRepository("gs://test_bucket/some/path", mock_client)
 
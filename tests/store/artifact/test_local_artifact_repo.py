@@ -1,3 +1,4 @@
+import io
 import json
 import os
 import pathlib
@@ -54,6 +55,15 @@ def test_log_artifacts(local_artifact_repo, local_artifact_root):
         assert f.read() == artifact_text
 
 
+@pytest.mark.parametrize("artifact_file", ["test.bin", "nested/dir/test.bin"])
+def test_log_artifact_stream(local_artifact_repo, local_artifact_root, artifact_file):
+    content = os.urandom(3 * 1024 * 1024 + 7)
+    local_artifact_repo.log_artifact_stream(io.BytesIO(content), artifact_file)
+
+    with open(os.path.join(local_artifact_root, artifact_file), "rb") as f:
+        assert f.read() == content
+
+
 @pytest.mark.parametrize("dst_path", [None, "dest"])
 def test_download_artifacts(local_artifact_repo, dst_path):
     artifact_rel_path = "test.txt"
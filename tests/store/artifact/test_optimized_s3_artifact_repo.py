@@ -238,6 +238,10 @@ def test_download_file_in_parallel_when_necessary(
             f"{S3_ARTIFACT_REPOSITORY}.list_artifacts",
             return_value=list_artifacts_result,
         ),
+        mock.patch(
+            f"{S3_ARTIFACT_REPOSITORY}.list_artifacts_recursive",
+            return_value=list_artifacts_result,
+        ),
         mock.patch(
             f"{S3_ARTIFACT_REPOSITORY}._download_from_cloud", return_value=None
         ) as download_mock,
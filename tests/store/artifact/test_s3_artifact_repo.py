@@ -1,3 +1,4 @@
+import io
 import json
 import os
 import posixpath
@@ -11,7 +12,8 @@ import pytest
 import requests
 
 from mlflow.entities.multipart_upload import MultipartUploadPart
-from mlflow.exceptions import MlflowTraceDataCorrupted
+from mlflow.exceptions import MlflowException, MlflowTraceDataCorrupted
+from mlflow.store.artifact.artifact_repo import ArtifactRepository
 from mlflow.store.artifact.artifact_repository_registry import get_artifact_repository
 from mlflow.store.artifact.optimized_s3_artifact_repo import OptimizedS3ArtifactRepository
 from mlflow.store.artifact.s3_artifact_repo import (
@@ -77,6 +79,18 @@ def test_file_artifact_is_logged_with_content_metadata(
     assert response.get("ContentEncoding") == "aws-chunked"
 
 
+def test_log_artifact_stream(s3_artifact_repo, s3_artifact_root):
+    content = b"Hello world!"
+    s3_artifact_repo.log_artifact_stream(io.BytesIO(content), "nested/test.txt")
+
+    with open(s3_artifact_repo.download_artifacts("nested/test.txt"), "rb") as f:
+        assert f.read() == content
+    bucket, _ = s3_artifact_repo.parse_s3_compliant_uri(s3_artifact_root)
+    s3_client = s3_artifact_repo._get_s3_client()
+    response = s3_client.head_object(Bucket=bucket, Key="some/path/nested/test.txt")
+    assert response.get("ContentType") == "text/plain"
+
+
 def test_get_s3_client_hits_cache(s3_artifact_root, monkeypatch):
     repo = get_artifact_repository(posixpath.join(s3_artifact_root, "some/path"))
     repo._get_s3_client()
@@ -267,6 +281,97 @@ def test_file_and_directories_artifacts_are_logged_and_listed_successfully_in_ba
     assert nested_artifacts_listing == [("nested/c.txt", False, 1)]
 
 
+def test_list_artifacts_recursive(s3_artifact_repo, s3_artifact_root, tmp_path):
+    nested = tmp_path / "nested"
+    (nested / "deeper").mkdir(parents=True)
+    (tmp_path / "a.txt").write_text("A")
+    (nested / "b.txt").write_text("BB")
+    (nested / "deeper" / "c.txt").write_text("CCC")
+    s3_artifact_repo.log_artifacts(tmp_path)
+    bucket, _ = s3_artifact_repo.parse_s3_compliant_uri(s3_artifact_root)
+    s3_artifact_repo._get_s3_client().put_object(Bucket=bucket, Key="some/path/empty/", Body=b"")
+
+    def listing(path=None):
+        return [
+            (f.path, f.is_dir, f.file_size) for f in s3_artifact_repo.list_artifacts_recursive(path)
+        ]
+
+    assert listing() == [
+        ("a.txt", False, 1),
+        ("empty", True, None),
+        ("nested/b.txt", False, 2),
+        ("nested/deeper/c.txt", False, 3),
+    ]
+    assert listing("nested") == [("nested/b.txt", False, 2), ("nested/deeper/c.txt", False, 3)]
+    assert listing("nested/") == listing("nested")
+    assert listing("a.txt") == []
+    # The listing matches the one of the default implementation, which walks each directory
+    assert (
+        s3_artifact_repo.list_artifacts_recursive()
+        == ArtifactRepository.list_artifacts_recursive(s3_artifact_repo)
+    )
+
+
+def test_download_directory_does_not_list_each_directory_and_file(s3_artifact_repo, tmp_path):
+    src = tmp_path / "src"
+    for i in range(3):
+        (src / f"dir_{i}").mkdir(parents=True)
+        for j in range(3):
+            (src / f"dir_{i}" / f"file_{j}.txt").write_text(f"{i}{j}")
+    s3_artifact_repo.log_artifacts(src)
+    dst = tmp_path / "dst"
+    dst.mkdir()
+
+    with mock.patch.object(
+        s3_artifact_repo, "list_artifacts", wraps=s3_artifact_repo.list_artifacts
+    ) as mock_list_artifacts:
+        s3_artifact_repo.download_artifacts("", dst)
+
+    # Only to check that the path is a directory
+    mock_list_artifacts.assert_called_once_with("")
+    assert (dst / "dir_2" / "file_1.txt").read_text() == "21"
+    assert len(list(dst.rglob("*.txt"))) == 9
+
+
+def test_log_artifacts_uploads_large_files_in_parts(s3_artifact_root, tmp_path, monkeypatch):
+    monkeypatch.setenv("MLFLOW_MULTIPART_UPLOAD_CHUNK_SIZE", str(5 * 1024**2))
+    repo = S3ArtifactRepository(posixpath.join(s3_artifact_root, "some/path"))
+    (tmp_path / "large.bin").write_bytes(os.urandom(12 * 1024**2))
+    for i in range(10):
+        (tmp_path / f"small_{i}.txt").write_text(str(i))
+
+    repo.log_artifacts(tmp_path)
+
+    bucket, _ = repo.parse_s3_compliant_uri(s3_artifact_root)
+    s3_client = repo._get_s3_client()
+    # The ETag of an object uploaded in parts is suffixed with the number of parts
+    response = s3_client.head_object(Bucket=bucket, Key="some/path/large.bin")
+    assert response["ETag"].strip('"').endswith("-3")
+    response = s3_client.head_object(Bucket=bucket, Key="some/path/small_0.txt")
+    assert "-" not in response["ETag"]
+    assert sorted(f.path for f in repo.list_artifacts()) == ["large.bin"] + [
+        f"small_{i}.txt" for i in range(10)
+    ]
+
+
+def test_log_artifacts_reports_failed_uploads(s3_artifact_root, tmp_path):
+    repo = S3ArtifactRepository(posixpath.join(s3_artifact_root, "some/path"))
+    for name in ["a.txt", "b.txt", "c.txt"]:
+        (tmp_path / name).write_text(name)
+    upload_file = repo._upload_file
+
+    def failing_upload_file(local_file, **kwargs):
+        if local_file.endswith("b.txt"):
+            raise Exception("upload failed")
+        return upload_file(local_file=local_file, **kwargs)
+
+    with mock.patch.object(repo, "_upload_file", side_effect=failing_upload_file):
+        with pytest.raises(MlflowException, match=r"b\.txt.+upload failed"):
+            repo.log_artifacts(tmp_path)
+
+    assert sorted(f.path for f in repo.list_artifacts()) == ["a.txt", "c.txt"]
+
+
 def test_download_directory_artifact_succeeds_when_artifact_root_is_s3_bucket_root(
     s3_artifact_root, tmp_path
 ):
@@ -0,0 +1,152 @@
+import shutil
+import threading
+from unittest import mock
+
+import pytest
+import sqlalchemy
+
+from mlflow.entities import ViewType
+from mlflow.exceptions import MlflowException
+from mlflow.store.db.read_replica import set_caller_id
+from mlflow.store.model_registry.sqlalchemy_store import (
+    SqlAlchemyStore as SqlAlchemyModelRegistryStore,
+)
+from mlflow.store.tracking.sqlalchemy_store import SqlAlchemyStore
+from mlflow.tracking.request_header.default_request_header_provider import (
+    MLFLOW_CLIENT_ID_HEADER,
+)
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    clock = _Clock()
+    with mock.patch("mlflow.store.db.read_replica.time.monotonic", clock):
+        yield clock
+
+
+@pytest.fixture
+def db_uris(tmp_path, monkeypatch):
+    primary_path = tmp_path / "primary.db"
+    replica_path = tmp_path / "replica.db"
+    store = SqlAlchemyStore(f"sqlite:///{primary_path}", (tmp_path / "artifacts").as_uri())
+    store.create_experiment("replicated")
+    store._dispose_engine()
+    # The replica is a snapshot of the primary database, which stops replicating from here
+    shutil.copy(primary_path, replica_path)
+
+    monkeypatch.setenv("MLFLOW_SQLALCHEMYSTORE_READ_REPLICA_URIS", f"sqlite:///{replica_path}")
+    monkeypatch.setenv("MLFLOW_SQLALCHEMYSTORE_READ_REPLICA_MAX_STALENESS_SECONDS", "5")
+    return f"sqlite:///{primary_path}", f"sqlite:///{replica_path}"
+
+
+@pytest.fixture
+def store(db_uris, tmp_path, clock):
+    store = SqlAlchemyStore(db_uris[0], (tmp_path / "artifacts").as_uri())
+    yield store
+    store._dispose_engine()
+
+
+def _experiment_names(store):
+    return {e.name for e in store.search_experiments(view_type=ViewType.ALL)}
+
+
+def test_reads_are_served_by_replica_unless_written_recently(store, clock):
+    clock.now = 100
+    store.create_experiment("primary-only")
+    # Reads following a write from this server are served by the primary database
+    clock.now = 104
+    assert _experiment_names(store) == {"Default", "replicated", "primary-only"}
+
+    clock.now = 106
+    assert _experiment_names(store) == {"Default", "replicated"}
+    assert store.get_experiment_by_name("primary-only") is None
+
+
+def test_reads_of_write_operations_are_served_by_primary(store, clock):
+    clock.now = 100
+    experiment_id = store.create_experiment("primary-only")
+    clock.now = 200
+    # create_run reads the experiment in the session it writes the run with
+    run = store.create_run(experiment_id, "user", 0, [], "run")
+    clock.now = 300
+    with pytest.raises(MlflowException, match="not found"):
+        store.get_run(run.info.run_id)
+
+
+def test_writes_of_a_client_do_not_pin_reads_of_other_clients_to_primary(store, clock):
+    clock.now = 100
+    written = threading.Event()
+    results = {}
+
+    def writer():
+        set_caller_id("writer")
+        store.create_experiment("primary-only")
+        written.set()
+        results["writer"] = _experiment_names(store)
+
+    def reader():
+        set_caller_id("reader")
+        written.wait()
+        results["reader"] = _experiment_names(store)
+
+    threads = [threading.Thread(target=writer), threading.Thread(target=reader)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert results["writer"] == {"Default", "replicated", "primary-only"}
+    assert results["reader"] == {"Default", "replicated"}
+
+
+def test_sessions_that_do_not_write_do_not_pin_reads_to_primary(store, clock):
+    clock.now = 100
+    store.create_experiment("primary-only")
+    clock.now = 200
+    # A session that is not read-only but only reads, like an undecorated read path
+    with store.ManagedSessionMaker() as session:
+        session.execute(sqlalchemy.text("SELECT 1"))
+    clock.now = 201
+    assert _experiment_names(store) == {"Default", "replicated"}
+
+
+def test_tracking_server_identifies_callers_by_client_id_header():
+    from mlflow.server import app
+
+    with mock.patch("mlflow.server.set_caller_id") as mock_set_caller_id:
+        app.test_client().get("/health", headers={MLFLOW_CLIENT_ID_HEADER: "client-1"})
+        mock_set_caller_id.assert_called_once_with("client-1")
+
+
+@pytest.mark.parametrize("lag_seconds", [10, float("inf")])
+def test_lagging_or_unreachable_replicas_are_not_used(store, clock, lag_seconds):
+    clock.now = 100
+    store.create_experiment("primary-only")
+    clock.now = 200
+    with mock.patch(
+        "mlflow.store.db.read_replica._measure_lag_seconds", return_value=lag_seconds
+    ) as measure_lag_seconds:
+        assert _experiment_names(store) == {"Default", "replicated", "primary-only"}
+        # The lag is measured at most once per second
+        assert _experiment_names(store) == {"Default", "replicated", "primary-only"}
+        measure_lag_seconds.assert_called_once()
+
+
+def test_model_registry_reads_are_served_by_replica(db_uris, clock):
+    store = SqlAlchemyModelRegistryStore(db_uris[0])
+    try:
+        clock.now = 100
+        store.create_registered_model("primary-only")
+        assert store.get_registered_model("primary-only").name == "primary-only"
+        clock.now = 200
+        assert store.search_registered_models() == []
+    finally:
+        store._dispose_engine()
@@ -1,3 +1,6 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from unittest import mock
 
 import pytest
@@ -168,3 +171,76 @@ def test_non_mysql_no_ssl_params(monkeypatch):
             pool_pre_ping=True,
             poolclass=NullPool,
         )
+
+
+def test_sqlite_performance_mode_sets_pragmas_per_connection(tmp_path, monkeypatch):
+    monkeypatch.setenv("MLFLOW_SQLALCHEMYSTORE_SQLITE_PERFORMANCE_MODE", "true")
+    engine = utils.create_sqlalchemy_engine(f"sqlite:///{tmp_path / 'mlflow.db'}")
+    try:
+        with engine.connect() as conn:
+            assert conn.exec_driver_sql("PRAGMA journal_mode").scalar() == "wal"
+            # NORMAL
+            assert conn.exec_driver_sql("PRAGMA synchronous").scalar() == 1
+            assert conn.exec_driver_sql("PRAGMA busy_timeout").scalar() == 20000
+    finally:
+        engine.dispose()
+
+
+def test_sqlite_performance_mode_queues_concurrent_writes(tmp_path, monkeypatch):
+    monkeypatch.setenv("MLFLOW_SQLALCHEMYSTORE_SQLITE_PERFORMANCE_MODE", "true")
+    engine = utils.create_sqlalchemy_engine(f"sqlite:///{tmp_path / 'mlflow.db'}")
+    with engine.begin() as conn:
+        conn.exec_driver_sql("CREATE TABLE t (thread INTEGER, i INTEGER)")
+
+    writers = 0
+    max_writers = 0
+    lock = threading.Lock()
+
+    def write(thread):
+        nonlocal writers, max_writers
+        for i in range(20):
+            with engine.begin() as conn:
+                conn.exec_driver_sql("INSERT INTO t VALUES (?, ?)", (thread, i))
+                with lock:
+                    writers += 1
+                    max_writers = max(max_writers, writers)
+                time.sleep(0.001)
+                with lock:
+                    writers -= 1
+            # Reads do not wait for the writer lock
+            with engine.connect() as conn:
+                conn.exec_driver_sql("SELECT COUNT(*) FROM t").scalar()
+
+    try:
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(write, range(8)))
+        with engine.connect() as conn:
+            assert conn.exec_driver_sql("SELECT COUNT(*) FROM t").scalar() == 160
+        assert max_writers == 1
+    finally:
+        engine.dispose()
+
+
+def test_sqlite_performance_mode_releases_writer_lock_of_abandoned_transactions(
+    tmp_path, monkeypatch
+):
+    monkeypatch.setenv("MLFLOW_SQLALCHEMYSTORE_SQLITE_PERFORMANCE_MODE", "true")
+    engine = utils.create_sqlalchemy_engine(f"sqlite:///{tmp_path / 'mlflow.db'}")
+    with engine.begin() as conn:
+        conn.exec_driver_sql("CREATE TABLE t (i INTEGER)")
+
+    def write():
+        # The transaction is neither committed nor rolled back, and is reset by the pool
+        with engine.connect() as conn:
+            conn.exec_driver_sql("INSERT INTO t VALUES (1)")
+
+    try:
+        write()
+        thread = threading.Thread(target=write)
+        thread.start()
+        thread.join(timeout=5)
+        assert not thread.is_alive()
+        with engine.connect() as conn:
+            assert conn.exec_driver_sql("SELECT COUNT(*) FROM t").scalar() == 0
+    finally:
+        engine.dispose()
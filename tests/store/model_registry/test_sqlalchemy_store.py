@@ -1,5 +1,6 @@
 import time
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from unittest import mock
 
 import pytest
@@ -520,6 +521,33 @@ def test_create_model_version(store):
     assert mvd6.run_id is None
 
 
+def test_create_model_version_does_not_reuse_deleted_versions(store):
+    name = "test_for_deleted_MV"
+    _rm_maker(store, name)
+    _mv_maker(store, name)
+    mv2 = _mv_maker(store, name)
+    store.delete_model_version(name, mv2.version)
+    assert _mv_maker(store, name).version == 3
+
+    with pytest.raises(MlflowException, match=r"Registered Model with name=missing not found"):
+        _mv_maker(store, "missing")
+
+
+def test_create_model_version_concurrently(store):
+    name = "test_for_concurrent_MV"
+    _rm_maker(store, name)
+
+    def create_versions():
+        return [_mv_maker(store, name).version for _ in range(5)]
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        futures = [executor.submit(create_versions) for _ in range(8)]
+        versions = [version for future in futures for version in future.result()]
+
+    assert sorted(versions) == list(range(1, 41))
+    assert store.get_registered_model(name).last_updated_timestamp is not None
+
+
 def test_update_model_version(store):
     name = "test_for_update_MV"
     _rm_maker(store, name)
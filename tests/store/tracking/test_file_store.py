@@ -853,6 +853,25 @@ def test_hard_delete_run(store):
         store.get_all_params(run_id)
 
 
+def test_hard_delete_runs(store):
+    experiments, exp_data, _ = _create_root(store)
+    run_ids = [run_id for exp_id in experiments for run_id in exp_data[exp_id]["runs"]]
+    deleted_run_ids = [run_ids[0], run_ids[-1]]
+    store.delete_run(run_ids[-1])
+
+    run_infos = store._get_run_infos(deleted_run_ids + ["0" * 32])
+    assert sorted(run_infos, key=lambda info: info.run_id) == sorted(
+        [store.get_run(run_id).info for run_id in deleted_run_ids], key=lambda info: info.run_id
+    )
+
+    store._hard_delete_runs(deleted_run_ids + ["0" * 32])
+    for run_id in deleted_run_ids:
+        with pytest.raises(MlflowException, match=f"Run '{run_id}' not found"):
+            store.get_run(run_id)
+    for run_id in run_ids[1:-1]:
+        store.get_run(run_id)
+
+
 def test_get_deleted_runs(store):
     experiments, exp_data, _ = _create_root(store)
     exp_id = experiments[0]
@@ -1255,6 +1274,47 @@ def test_search_runs_pagination(store):
     assert result.token is None
 
 
+def test_search_runs_columns(store):
+    exp = store.create_experiment("test_search_runs_columns")
+    run_ids = []
+    for i in range(3):
+        run_id = store.create_run(exp, "user", i, [], f"name-{i}").info.run_id
+        store.log_batch(
+            run_id,
+            metrics=[Metric("m1", i, 0, 0), Metric("m2", -i, 0, 0)],
+            params=[Param("p1", str(i)), Param("p 2", "v")],
+            tags=[RunTag("t1", str(i)), RunTag("t2", "v")],
+        )
+        run_ids.append(run_id)
+
+    with mock.patch.object(
+        FileStore, "_get_param_from_file", wraps=FileStore._get_param_from_file
+    ) as get_param_from_file:
+        runs = store.search_runs(
+            [exp],
+            "metrics.m2 <= 0 and params.p1 != '1'",
+            ViewType.ALL,
+            order_by=["metrics.m1 DESC"],
+            columns=["metrics.m1", "params.`p 2`", "tags.t1", "tags.unknown"],
+        )
+    # Only the params the runs are filtered on or that are returned are read
+    assert get_param_from_file.call_count == 6
+    assert [r.info.run_id for r in runs] == [run_ids[2], run_ids[0]]
+    for run, i in zip(runs, [2, 0]):
+        assert run.data.metrics == {"m1": i}
+        assert run.data.params == {"p 2": "v"}
+        assert run.data.tags == {"t1": str(i)}
+        assert run.info.run_name == f"name-{i}"
+
+    runs = store.search_runs([exp], None, ViewType.ALL, columns=[])
+    assert [r.info.run_id for r in runs] == run_ids[::-1]
+    for run in runs:
+        assert (run.data.metrics, run.data.params, run.data.tags) == ({}, {}, {})
+
+    with pytest.raises(MlflowException, match="Invalid column 'attributes.status'"):
+        store.search_runs([exp], None, ViewType.ALL, columns=["attributes.status"])
+
+
 def test_search_runs_run_name(store):
     exp_id = store.create_experiment("test_search_runs_pagination")
     run1 = store.create_run(exp_id, user_id="user", start_time=1000, tags=[], run_name="run_name1")
@@ -3239,6 +3299,7 @@ def test_search_traces_filter_request_metadata(store):
         ("run_id ILIKE 'run_%'", r"Invalid comparator 'ILIKE'"),
         ("tag.test_tag LIKE 'tag_%'", r"Invalid comparator 'LIKE'"),
         ("tags.test_tag ILIKE 'tag_%'", r"Invalid comparator 'ILIKE'"),
+        ("span.name = 'retriever'", r"only supported by the SQL tracking store"),
     ],
 )
 def test_search_traces_invalid_filter(generate_trace_infos, filter_string, error):
@@ -338,6 +338,16 @@ def test_requestor():
         _verify_requests(mock_http, creds, "runs/search", "POST", message_to_json(expected_message))
         assert result.token == "67890fghij"
 
+    with mock_http_request() as mock_http:
+        store.search_runs(["0"], None, ViewType.ALL, max_results=10, columns=[])
+        expected_message = SearchRuns(
+            experiment_ids=["0"],
+            run_view_type=ViewType.to_proto(ViewType.ALL),
+            max_results=10,
+            select_columns=True,
+        )
+        _verify_requests(mock_http, creds, "runs/search", "POST", message_to_json(expected_message))
+
     with mock_http_request() as mock_http:
         run_id = "run_id"
         m = Model(artifact_path="model/path", run_id="run_id", flavors={"tf": "flavor body"})
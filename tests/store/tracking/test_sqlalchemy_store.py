@@ -15,6 +15,7 @@ from unittest import mock
 
 import pytest
 import sqlalchemy
+from opentelemetry.sdk.trace import ReadableSpan as OTelReadableSpan
 from packaging.version import Version
 
 import mlflow
@@ -29,6 +30,9 @@ from mlflow.entities import (
     RunStatus,
     RunTag,
     SourceType,
+    Span,
+    SpanStatus,
+    SpanStatusCode,
     ViewType,
     _DatasetSummary,
 )
@@ -40,6 +44,7 @@ from mlflow.entities.trace_info import TraceInfo
 from mlflow.entities.trace_status import TraceStatus
 from mlflow.environment_variables import (
     _MLFLOW_GO_STORE_TESTING,
+    MLFLOW_TRACE_INDEXED_SPAN_ATTRIBUTES,
     MLFLOW_TRACKING_URI,
 )
 from mlflow.exceptions import MlflowException
@@ -75,13 +80,20 @@ from mlflow.store.tracking.dbmodels.models import (
     SqlMetric,
     SqlParam,
     SqlRun,
+    SqlSpan,
+    SqlSpanAttribute,
     SqlTag,
     SqlTraceInfo,
     SqlTraceRequestMetadata,
     SqlTraceTag,
 )
 from mlflow.store.tracking.sqlalchemy_store import SqlAlchemyStore, _get_orderby_clauses
-from mlflow.tracing.constant import MAX_CHARS_IN_TRACE_INFO_TAGS_VALUE, TraceMetadataKey
+from mlflow.tracing.constant import (
+    MAX_CHARS_IN_TRACE_INFO_TAGS_VALUE,
+    SpanAttributeKey,
+    TraceMetadataKey,
+)
+from mlflow.tracing.utils import build_otel_context
 from mlflow.utils import mlflow_tags
 from mlflow.utils.file_utils import TempDir
 from mlflow.utils.mlflow_tags import (
@@ -91,6 +103,7 @@ from mlflow.utils.mlflow_tags import (
 )
 from mlflow.utils.name_utils import _GENERATOR_PREDICATES
 from mlflow.utils.os import is_windows
+from mlflow.utils.search_utils import SearchExperimentsUtils, SearchUtils
 from mlflow.utils.time import get_current_time_millis
 from mlflow.utils.uri import extract_db_type_from_uri
 from mlflow.utils.validation import (
@@ -225,6 +238,8 @@ def _cleanup_database(store: SqlAlchemyStore):
             SqlInput,
             SqlDataset,
             SqlRun,
+            SqlSpanAttribute,
+            SqlSpan,
             SqlTraceTag,
             SqlTraceRequestMetadata,
             SqlTraceInfo,
@@ -686,6 +701,19 @@ def test_search_experiments_pagination(store: SqlAlchemyStore):
     assert experiments.token is None
 
 
+def test_search_experiments_pagination_accepts_offset_tokens(store: SqlAlchemyStore):
+    experiment_names = list(map(str, range(9)))
+    _create_experiments(store, experiment_names)
+    reversed_experiment_names = experiment_names[::-1]
+
+    page_token = SearchExperimentsUtils.create_page_token(4)
+    experiments = store.search_experiments(max_results=4, page_token=page_token)
+    assert [e.name for e in experiments] == reversed_experiment_names[4:8]
+    experiments = store.search_experiments(max_results=4, page_token=experiments.token)
+    assert [e.name for e in experiments] == reversed_experiment_names[8:] + ["Default"]
+    assert experiments.token is None
+
+
 def test_create_experiments(store: SqlAlchemyStore):
     with store.ManagedSessionMaker() as session:
         result = session.query(models.SqlExperiment).all()
@@ -1000,6 +1028,43 @@ def test_hard_delete_run(store: SqlAlchemyStore):
         assert actual_tag is None
 
 
+def test_hard_delete_runs(store: SqlAlchemyStore):
+    experiment_id = _create_experiments(store, "test exp")
+    runs = [_run_factory(store, _get_run_configs(experiment_id)) for _ in range(3)]
+    dataset = entities.Dataset(name="name", digest="digest", source_type="st", source="source")
+    for run in runs:
+        store.log_batch(
+            run.info.run_id,
+            metrics=[entities.Metric("m", 1.0, get_current_time_millis(), 0)],
+            params=[entities.Param("p", "1")],
+            tags=[entities.RunTag("t", "1")],
+        )
+        store.log_inputs(
+            run.info.run_id,
+            [entities.DatasetInput(dataset, [entities.InputTag(MLFLOW_DATASET_CONTEXT, "train")])],
+        )
+    deleted_run_ids = [runs[0].info.run_id, runs[1].info.run_id, "0" * 32]
+
+    store._hard_delete_runs(deleted_run_ids)
+
+    with store.ManagedSessionMaker() as session:
+        for model in [
+            models.SqlRun,
+            models.SqlMetric,
+            models.SqlLatestMetric,
+            models.SqlParam,
+            models.SqlTag,
+        ]:
+            rows = session.query(model).filter(model.run_uuid.in_(deleted_run_ids)).all()
+            assert rows == []
+            assert session.query(model).filter_by(run_uuid=runs[2].info.run_id).all() != []
+        inputs = session.query(models.SqlInput).all()
+        assert [i.destination_id for i in inputs] == [runs[2].info.run_id]
+        input_tags = session.query(models.SqlInputTag).all()
+        assert [t.input_uuid for t in input_tags] == [inputs[0].input_uuid]
+    assert store._get_run_infos(deleted_run_ids + [runs[2].info.run_id]) == [runs[2].info]
+
+
 def test_get_deleted_runs(store: SqlAlchemyStore):
     run = _run_factory(store)
     deleted_run_ids = store._get_deleted_runs()
@@ -2169,6 +2234,112 @@ def test_search_runs_pagination(store: SqlAlchemyStore):
     assert result.token is None
 
 
+def _search_all_runs_by_page(store: SqlAlchemyStore, exp, order_by, max_results):
+    run_ids = []
+    page_token = None
+    while True:
+        result = store.search_runs(
+            [exp], None, ViewType.ALL, max_results, order_by, page_token=page_token
+        )
+        run_ids.extend(r.info.run_id for r in result)
+        if result.token is None:
+            return run_ids
+        page_token = result.token
+
+
+@pytest.mark.parametrize(
+    "order_by",
+    [
+        None,
+        ["metrics.m ASC"],
+        ["metrics.m DESC"],
+        ["tags.t ASC", "attributes.start_time ASC"],
+        ["params.p DESC", "metrics.m ASC"],
+    ],
+)
+def test_search_runs_keyset_pagination(store: SqlAlchemyStore, order_by):
+    exp = _create_experiments(store, "test_search_runs_keyset_pagination")
+    for i in range(12):
+        run_id = _run_factory(store, _get_run_configs(exp, start_time=i % 3)).info.run_id
+        # Leave the sort keys of some runs unset and make others tie
+        if i % 4:
+            store.log_metric(run_id, Metric("m", float("nan") if i == 5 else i % 2, 0, 0))
+            store.set_tag(run_id, RunTag("t", str(i % 3)))
+        if i % 5:
+            store.log_param(run_id, Param("p", str(i % 2)))
+
+    expected = [
+        r.info.run_id for r in store.search_runs([exp], None, ViewType.ALL, order_by=order_by)
+    ]
+    for max_results in [1, 2, 5]:
+        assert _search_all_runs_by_page(store, exp, order_by, max_results) == expected
+
+
+def test_search_runs_pagination_accepts_offset_tokens(store: SqlAlchemyStore):
+    exp = _create_experiments(store, "test_search_runs_pagination_accepts_offset_tokens")
+    runs = sorted(
+        [_run_factory(store, _get_run_configs(exp, start_time=10)).info.run_id for r in range(10)]
+    )
+    page_token = SearchUtils.create_page_token(4)
+    result = store.search_runs([exp], None, ViewType.ALL, max_results=4, page_token=page_token)
+    assert [r.info.run_id for r in result] == runs[4:8]
+    result = store.search_runs([exp], None, ViewType.ALL, max_results=4, page_token=result.token)
+    assert [r.info.run_id for r in result] == runs[8:]
+
+
+def test_search_runs_pagination_rejects_token_of_another_order_by(store: SqlAlchemyStore):
+    exp = _create_experiments(store, "test_search_runs_pagination_rejects_token")
+    for _ in range(3):
+        _run_factory(store, _get_run_configs(exp))
+    result = store.search_runs([exp], None, ViewType.ALL, max_results=1)
+    with pytest.raises(MlflowException, match="does not match the order_by"):
+        store.search_runs(
+            [exp],
+            None,
+            ViewType.ALL,
+            max_results=1,
+            order_by=["metrics.m ASC"],
+            page_token=result.token,
+        )
+
+
+def test_search_runs_columns(store: SqlAlchemyStore):
+    exp = _create_experiments(store, "test_search_runs_columns")
+    run_ids = []
+    for i in range(3):
+        run_id = _run_factory(store, _get_run_configs(exp, start_time=i)).info.run_id
+        store.log_batch(
+            run_id,
+            metrics=[Metric("m1", i, 0, 0), Metric("m2", -i, 0, 0)],
+            params=[Param("p1", str(i)), Param("p 2", "v")],
+            tags=[RunTag("t1", str(i)), RunTag("t2", "v")],
+        )
+        run_ids.append(run_id)
+
+    runs = store.search_runs(
+        [exp],
+        "metrics.m2 <= 0 and params.p1 != '1'",
+        ViewType.ALL,
+        order_by=["metrics.m1 DESC"],
+        columns=["metrics.m1", "params.`p 2`", "tags.t1", "tags.unknown"],
+    )
+    assert [r.info.run_id for r in runs] == [run_ids[2], run_ids[0]]
+    for run, i in zip(runs, [2, 0]):
+        assert run.data.metrics == {"m1": i}
+        assert run.data.params == {"p 2": "v"}
+        assert run.data.tags == {"t1": str(i)}
+        assert run.info.run_name == "name"
+
+    runs = store.search_runs([exp], None, ViewType.ALL, columns=[])
+    assert [r.info.run_id for r in runs] == run_ids[::-1]
+    for run in runs:
+        assert (run.data.metrics, run.data.params, run.data.tags) == ({}, {}, {})
+        assert run.info.run_name == "name"
+
+    with pytest.raises(MlflowException, match="Invalid column 'attributes.status'"):
+        store.search_runs([exp], None, ViewType.ALL, columns=["attributes.status"])
+
+
 def test_search_runs_run_name(store: SqlAlchemyStore):
     exp_id = _create_experiments(store, "test_search_runs_pagination")
     run1 = _run_factory(store, dict(_get_run_configs(exp_id), run_name="run_name1"))
@@ -4399,6 +4570,164 @@ def test_search_traces_with_invalid_filter(store_with_traces, filter_string, err
         )
 
 
+def _create_span(
+    request_id,
+    span_id,
+    parent_id,
+    name,
+    span_type,
+    duration_ms,
+    status=SpanStatusCode.OK,
+    attributes=None,
+):
+    attributes = {
+        SpanAttributeKey.REQUEST_ID: json.dumps(request_id),
+        SpanAttributeKey.SPAN_TYPE: json.dumps(span_type),
+        **{k: json.dumps(v) for k, v in (attributes or {}).items()},
+    }
+    otel_span = OTelReadableSpan(
+        name=name,
+        context=build_otel_context(1, span_id),
+        parent=build_otel_context(1, parent_id) if parent_id else None,
+        start_time=1_000_000_000,
+        end_time=1_000_000_000 + duration_ms * 1_000_000,
+        attributes=attributes,
+        status=SpanStatus(status).to_otel_status(),
+    )
+    return Span(otel_span)
+
+
+@pytest.fixture
+def store_with_spans(store, monkeypatch):
+    monkeypatch.setenv(MLFLOW_TRACE_INDEXED_SPAN_ATTRIBUTES.name, "model, temperature")
+    exp1 = store.create_experiment("exp1")
+    for i in range(3):
+        request_id = f"tr-{i}"
+        _create_trace(store, request_id, exp1, timestamp_ms=i)
+        store.log_spans(
+            request_id,
+            [
+                _create_span(request_id, 1, None, "agent", "AGENT", 5000),
+                _create_span(
+                    request_id,
+                    2,
+                    1,
+                    "retriever",
+                    "RETRIEVER",
+                    1000 * (i + 1),
+                    status=SpanStatusCode.ERROR if i == 0 else SpanStatusCode.OK,
+                    attributes={"model": f"model-{i}", "temperature": 0.5, "other": "x"},
+                ),
+            ],
+        )
+    return store
+
+
+@pytest.mark.parametrize(
+    ("filter_string", "expected_ids"),
+    [
+        ("span.name = 'retriever'", ["tr-2", "tr-1", "tr-0"]),
+        ("span.name = 'retriever' AND span.duration_ms > 1500", ["tr-2", "tr-1"]),
+        ("span.name = 'retriever' AND span.duration > 1500", ["tr-2", "tr-1"]),
+        # All the span clauses must be satisfied by the same span
+        ("span.name = 'agent' AND span.duration_ms < 1500", []),
+        ("span.type IN ('LLM', 'RETRIEVER') AND span.status = 'ERROR'", ["tr-0"]),
+        ("span.status != 'OK'", ["tr-0"]),
+        ("span.end_time_ms >= 4000", ["tr-2", "tr-1", "tr-0"]),
+        ("span.attributes.model = 'model-1'", ["tr-1"]),
+        (
+            "span.attributes.model != 'model-1' AND span.attributes.temperature = '0.5'",
+            ["tr-2", "tr-0"],
+        ),
+        ("span.attributes.model = 'model-1' AND span.name = 'agent'", []),
+        # Only the attributes selected with MLFLOW_TRACE_INDEXED_SPAN_ATTRIBUTES are indexed
+        ("span.attributes.other = 'x'", []),
+        ("span.name = 'retriever' AND timestamp_ms > 0", ["tr-2", "tr-1"]),
+    ],
+)
+def test_search_traces_with_span_filter(store_with_spans, filter_string, expected_ids):
+    exp1 = store_with_spans.get_experiment_by_name("exp1").experiment_id
+    trace_infos, _ = store_with_spans.search_traces(
+        experiment_ids=[exp1],
+        filter_string=filter_string,
+    )
+    assert [trace_info.request_id for trace_info in trace_infos] == expected_ids
+
+
+@pytest.mark.parametrize(
+    ("filter_string", "error"),
+    [
+        ("span.invalid = 'foo'", r"Invalid span key 'invalid'"),
+        ("span.name > 'foo'", r"Invalid comparator '>'"),
+        ("span.duration_ms = 'foo'", r"Expected a numeric value for span key 'duration_ms'"),
+        ("span.attributes.model LIKE 'foo%'", r"Invalid comparator 'LIKE'"),
+    ],
+)
+def test_search_traces_with_invalid_span_filter(store_with_spans, filter_string, error):
+    exp1 = store_with_spans.get_experiment_by_name("exp1").experiment_id
+    with pytest.raises(MlflowException, match=error):
+        store_with_spans.search_traces(experiment_ids=[exp1], filter_string=filter_string)
+
+
+def test_log_spans_replaces_spans_of_trace(store_with_spans):
+    exp1 = store_with_spans.get_experiment_by_name("exp1").experiment_id
+    store_with_spans.log_spans("tr-0", [_create_span("tr-0", 3, None, "chain", "CHAIN", 10)])
+
+    trace_infos, _ = store_with_spans.search_traces([exp1], filter_string="span.name = 'chain'")
+    assert [trace_info.request_id for trace_info in trace_infos] == ["tr-0"]
+    trace_infos, _ = store_with_spans.search_traces([exp1], filter_string="span.status = 'ERROR'")
+    assert trace_infos == []
+
+
+def test_log_spans_indexes_duplicate_attribute_keys_once(store, monkeypatch):
+    long_key = "k" * 300
+    monkeypatch.setenv(
+        MLFLOW_TRACE_INDEXED_SPAN_ATTRIBUTES.name, f"model,model, {long_key},{long_key}x"
+    )
+    exp_id = store.create_experiment("exp")
+    _create_trace(store, "tr-0", exp_id)
+    store.log_spans(
+        "tr-0",
+        [
+            _create_span(
+                "tr-0",
+                1,
+                None,
+                "llm",
+                "LLM",
+                10,
+                attributes={"model": "gpt-4o", long_key: "a", f"{long_key}x": "b"},
+            )
+        ],
+    )
+
+    trace_infos, _ = store.search_traces([exp_id], filter_string="span.attributes.model = 'gpt-4o'")
+    assert [trace_info.request_id for trace_info in trace_infos] == ["tr-0"]
+
+
+def test_spans_are_deleted_with_traces(store_with_spans):
+    exp1 = store_with_spans.get_experiment_by_name("exp1").experiment_id
+    store_with_spans.delete_traces(exp1, request_ids=["tr-0", "tr-1", "tr-2"])
+
+    with store_with_spans.ManagedSessionMaker() as session:
+        assert session.query(SqlSpan).count() == 0
+        assert session.query(SqlSpanAttribute).count() == 0
+
+
+def test_search_traces_by_span_raises_if_spans_are_not_indexed(store):
+    exp_id = store.create_experiment("exp")
+    assert store.search_traces([exp_id], filter_string="span.name = 'agent'") == ([], None)
+
+    # E.g. a trace logged before the span index was added to the database
+    _create_trace(store, "tr-0", exp_id)
+    with pytest.raises(MlflowException, match=r"none of their spans are indexed") as e:
+        store.search_traces([exp_id], filter_string="span.name = 'agent'")
+    assert e.value.error_code == ErrorCode.Name(INVALID_PARAMETER_VALUE)
+
+    store.log_spans("tr-0", [_create_span("tr-0", 1, None, "chain", "CHAIN", 10)])
+    assert store.search_traces([exp_id], filter_string="span.name = 'agent'") == ([], None)
+
+
 def test_search_traces_raise_if_max_results_arg_is_invalid(store):
     with pytest.raises(
         MlflowException,
@@ -4456,6 +4785,37 @@ def test_search_traces_pagination_tie_breaker(store):
     assert [t.request_id for t in traces] == ["tr-4"]
 
 
+@pytest.mark.parametrize(
+    "order_by",
+    [
+        ["tag.t ASC"],
+        ["tag.t DESC", "timestamp_ms ASC"],
+        ["request_metadata.r DESC"],
+    ],
+)
+def test_search_traces_keyset_pagination(store: SqlAlchemyStore, order_by):
+    exp1 = store.create_experiment("exp1")
+    for i in range(10):
+        _create_trace(
+            store,
+            f"tr-{i}",
+            exp1,
+            timestamp_ms=i % 3,
+            tags={"t": str(i % 2)} if i % 3 else {},
+            request_metadata={"r": str(i % 4)} if i % 2 else {},
+        )
+
+    expected, _ = store.search_traces([exp1], order_by=order_by)
+    for max_results in [1, 3]:
+        traces, token = store.search_traces([exp1], max_results=max_results, order_by=order_by)
+        while token:
+            page, token = store.search_traces(
+                [exp1], max_results=max_results, order_by=order_by, page_token=token
+            )
+            traces.extend(page)
+        assert [t.request_id for t in traces] == [t.request_id for t in expected]
+
+
 def test_set_and_delete_tags(store: SqlAlchemyStore):
     exp1 = store.create_experiment("exp1")
     request_id = "tr-123"
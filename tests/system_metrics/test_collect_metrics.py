@@ -2,6 +2,7 @@ from mlflow.system_metrics.metrics.cpu_monitor import CPUMonitor
 from mlflow.system_metrics.metrics.disk_monitor import DiskMonitor
 from mlflow.system_metrics.metrics.gpu_monitor import GPUMonitor
 from mlflow.system_metrics.metrics.network_monitor import NetworkMonitor
+from mlflow.system_metrics.metrics.process_tree_monitor import ProcessTreeMonitor
 
 
 def test_cpu_monitor():
@@ -86,3 +87,19 @@ def test_network_monitor():
 
     network_monitor.clear_metrics()
     assert len(network_monitor.metrics.keys()) == 0
+
+
+def test_process_tree_monitor():
+    process_tree_monitor = ProcessTreeMonitor()
+    process_tree_monitor.collect_metrics()
+    process_tree_monitor.collect_metrics()
+
+    assert isinstance(process_tree_monitor.metrics["process_cpu_utilization_percentage"], list)
+    assert process_tree_monitor.metrics["process_memory_usage_megabytes"][-1] > 0
+
+    aggregated_metrics = process_tree_monitor.aggregate_metrics()
+    assert isinstance(aggregated_metrics["process_cpu_utilization_percentage"], float)
+    assert isinstance(aggregated_metrics["process_memory_usage_percentage"], float)
+
+    process_tree_monitor.clear_metrics()
+    assert process_tree_monitor.metrics == {}
@@ -176,3 +176,81 @@ def test_system_metrics_monitor_with_multi_node():
     for node_id in node_ids:
         expected_metric_name = f"system/{node_id}/cpu_utilization_percentage"
         assert expected_metric_name in metrics.keys()
+
+
+def test_concurrent_runs_share_system_metrics_sampler():
+    metric_test = "system/cpu_utilization_percentage"
+    runs = [mlflow.MlflowClient().create_run("0") for _ in range(3)]
+    monitors = [
+        SystemMetricsMonitor(run.info.run_id, sampling_interval=0.1, samples_before_logging=2)
+        for run in runs
+    ]
+    for monitor in monitors:
+        monitor.start()
+
+    thread_names = [thread.name for thread in threading.enumerate()]
+    assert thread_names.count("SystemMetricsMonitor") == 1
+    assert len({monitor.sampler for monitor in monitors}) == 1
+
+    for run in runs:
+        wait_for_condition(
+            lambda: len(mlflow.MlflowClient().get_metric_history(run.info.run_id, metric_test)) > 1
+        )
+    monitors[0].finish()
+    assert "SystemMetricsMonitor" in [thread.name for thread in threading.enumerate()]
+    for monitor in monitors[1:]:
+        monitor.finish()
+    assert "SystemMetricsMonitor" not in [thread.name for thread in threading.enumerate()]
+
+    for run in runs:
+        metrics_history = mlflow.MlflowClient().get_metric_history(run.info.run_id, metric_test)
+        assert [m.step for m in metrics_history] == list(range(len(metrics_history)))
+
+
+def test_runs_on_different_tracking_uris_log_system_metrics_to_their_own_store(tmp_path):
+    metric_test = "system/cpu_utilization_percentage"
+    clients, monitors = [], []
+    for name in ["store_a", "store_b"]:
+        tracking_uri = tmp_path.joinpath(name).as_uri()
+        # The monitor logs to the tracking URI that is current when it is created
+        mlflow.set_tracking_uri(tracking_uri)
+        client = mlflow.MlflowClient(tracking_uri)
+        run = client.create_run(client.create_experiment("exp"))
+        monitor = SystemMetricsMonitor(
+            run.info.run_id, sampling_interval=0.1, samples_before_logging=2
+        )
+        monitor.start()
+        clients.append(client)
+        monitors.append(monitor)
+
+    assert monitors[0].sampler is not monitors[1].sampler
+    assert [monitor.sampler.tracking_uri for monitor in monitors] == [
+        client.tracking_uri for client in clients
+    ]
+    try:
+        for client, monitor in zip(clients, monitors):
+            wait_for_condition(
+                lambda: len(client.get_metric_history(monitor.run_id, metric_test)) > 1
+            )
+    finally:
+        for monitor in monitors:
+            monitor.finish()
+    assert "SystemMetricsMonitor" not in [thread.name for thread in threading.enumerate()]
+
+
+def test_system_metrics_attributed_to_process_tree(monkeypatch):
+    monkeypatch.setenv("MLFLOW_SYSTEM_METRICS_ATTRIBUTE_TO_PROCESS_TREE", "true")
+    mlflow.enable_system_metrics_logging()
+    mlflow.set_system_metrics_sampling_interval(0.2)
+    with mlflow.start_run() as run:
+        wait_for_condition(
+            lambda: "system/process_memory_usage_megabytes"
+            in mlflow.get_run(run.info.run_id).data.metrics
+        )
+
+    metrics = mlflow.get_run(run.info.run_id).data.metrics
+    assert "system/process_cpu_utilization_percentage" in metrics
+    assert "system/process_memory_usage_percentage" in metrics
+    assert "system/cpu_utilization_percentage" not in metrics
+    assert "system/system_memory_usage_megabytes" not in metrics
+    assert "system/disk_usage_percentage" in metrics
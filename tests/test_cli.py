@@ -282,6 +282,26 @@ def test_mlflow_gc_file_store(file_store, create_artifacts_in_run):
     assert not os.path.exists(artifact_path)
 
 
+def test_mlflow_gc_store_without_search_runs_columns(file_store):
+    class LegacyFileStore(FileStore):
+        # A third-party store implementing `_search_runs` without `columns`
+        def _search_runs(
+            self, experiment_ids, filter_string, run_view_type, max_results, order_by, page_token
+        ):
+            return super()._search_runs(
+                experiment_ids, filter_string, run_view_type, max_results, order_by, page_token
+            )
+
+    store = LegacyFileStore(file_store[0].root_directory)
+    run = _create_run_in_store(store)
+    store.delete_run(run.info.run_id)
+    with mock.patch("mlflow.cli._get_store", return_value=store):
+        result = CliRunner().invoke(gc, ["--backend-store-uri", file_store[1]])
+    assert result.exit_code == 0, result.output
+    with pytest.raises(MlflowException, match=r"Run .+ not found"):
+        store.get_run(run.info.run_id)
+
+
 def test_mlflow_gc_file_store_passing_explicit_run_ids(file_store):
     store = file_store[0]
     run = _create_run_in_store(store)
@@ -428,6 +448,70 @@ def test_mlflow_gc_experiments(get_store_details, request):
     )
 
 
+@pytest.mark.parametrize("get_store_details", ["file_store", "sqlite_store"])
+def test_mlflow_gc_dry_run(get_store_details, request):
+    store, uri = request.getfixturevalue(get_store_details)
+    runs = [_create_run_in_store(store) for _ in range(3)]
+    for run in runs[:2]:
+        store.delete_run(run.info.run_id)
+    exp_id = store.create_experiment("deleted")
+    store.delete_experiment(exp_id)
+
+    result = CliRunner().invoke(
+        gc, ["--backend-store-uri", uri, "--dry-run"], catch_exceptions=False
+    )
+
+    for run in runs[:2]:
+        assert (
+            f"Run with ID {run.info.run_id} and artifacts at {run.info.artifact_uri} would be "
+            "permanently deleted." in result.output
+        )
+        assert store.get_run(run.info.run_id).info.lifecycle_stage == "deleted"
+        assert os.path.exists(url2pathname(unquote(urlparse(run.info.artifact_uri).path)))
+    assert runs[2].info.run_id not in result.output
+    assert f"Experiment with ID {exp_id} would be permanently deleted." in result.output
+    assert "Dry run: 2 run(s) and 1 experiment(s) would be permanently deleted." in result.output
+    assert store.get_experiment(exp_id).lifecycle_stage == "deleted"
+
+
+@pytest.mark.parametrize("get_store_details", ["file_store", "sqlite_store"])
+def test_mlflow_gc_batches_and_checkpoint(get_store_details, request, tmp_path):
+    store, uri = request.getfixturevalue(get_store_details)
+    runs = [_create_run_in_store(store) for _ in range(5)]
+    run_ids = [run.info.run_id for run in runs]
+    for run_id in run_ids:
+        store.delete_run(run_id)
+    checkpoint_file = tmp_path / "gc_checkpoint"
+    args = [
+        "--backend-store-uri",
+        uri,
+        "--run-ids",
+        ",".join(run_ids[:3]),
+        "--batch-size",
+        "2",
+        "--max-workers",
+        "2",
+        "--checkpoint-file",
+        str(checkpoint_file),
+    ]
+
+    CliRunner().invoke(gc, args, catch_exceptions=False)
+    assert checkpoint_file.read_text().splitlines() == [f"run {run_id}" for run_id in run_ids[:3]]
+    for run in runs[:3]:
+        with pytest.raises(MlflowException, match=r"Run .+ not found"):
+            store.get_run(run.info.run_id)
+        assert not os.path.exists(url2pathname(unquote(urlparse(run.info.artifact_uri).path)))
+
+    # Resuming skips the runs recorded in the checkpoint file, which no longer exist
+    args[3] = ",".join(run_ids)
+    CliRunner().invoke(gc, args, catch_exceptions=False)
+    assert checkpoint_file.read_text().splitlines() == [f"run {run_id}" for run_id in run_ids]
+    remaining = store.search_runs(
+        experiment_ids=["0"], filter_string="", run_view_type=ViewType.ALL
+    )
+    assert remaining == []
+
+
 @pytest.fixture
 def sqlite_store_with_s3_artifact_repository():
     fd, temp_dbfile = tempfile.mkstemp()
@@ -0,0 +1,126 @@
+import time
+from unittest import mock
+
+import pytest
+
+import mlflow
+from mlflow.entities.trace_info import TraceInfo
+from mlflow.entities.trace_status import TraceStatus
+from mlflow.exceptions import MlflowException
+from mlflow.tracing.processor.mlflow import MlflowSpanProcessor
+from mlflow.tracing.sampling import TailSampler, _counters, get_sampling_counts
+
+from tests.tracing.helper import get_traces
+
+
+@pytest.fixture(autouse=True)
+def reset_sampling_counters():
+    _counters.reset()
+    yield
+    _counters.reset()
+
+
+@mlflow.trace
+def child(x):
+    return x + 1
+
+
+@mlflow.trace
+def predict(x):
+    return child(x) * 2
+
+
+@mlflow.trace
+def failing_predict(x):
+    raise ValueError("error")
+
+
+@mlflow.trace
+def slow_predict(x):
+    time.sleep(0.05)
+    return x
+
+
+def test_head_sampling_skips_unsampled_traces(monkeypatch):
+    monkeypatch.setenv("MLFLOW_TRACE_SAMPLING_RATIO", "0")
+
+    with mock.patch.object(MlflowSpanProcessor, "on_start") as mock_on_start:
+        assert predict(1) == 4
+        with mlflow.start_span("manual") as span:
+            span.set_inputs({"x": 1})
+            assert mlflow.get_current_active_span() is None
+            assert child(1) == 2
+
+    mock_on_start.assert_not_called()
+    assert get_traces() == []
+    assert get_sampling_counts() == {
+        "head_sampled": 0,
+        "head_dropped": 2,
+        "tail_sampled": 0,
+        "tail_dropped": 0,
+    }
+
+
+def test_head_sampling_records_complete_sampled_traces(monkeypatch):
+    monkeypatch.setenv("MLFLOW_TRACE_SAMPLING_RATIO", "0.5")
+
+    for x in range(40):
+        predict(x)
+
+    traces = get_traces()
+    counts = get_sampling_counts()
+    assert 0 < len(traces) < 40
+    assert counts["head_sampled"] == counts["tail_sampled"] == len(traces)
+    assert counts["head_dropped"] == 40 - len(traces)
+    assert all(len(trace.data.spans) == 2 for trace in traces)
+
+
+def test_tail_sampling_keeps_errors_and_slow_traces(monkeypatch):
+    monkeypatch.setenv("MLFLOW_TRACE_TAIL_SAMPLING_RATIO", "0")
+    monkeypatch.setenv("MLFLOW_TRACE_TAIL_SAMPLING_RATIOS_BY_NAME", '{"slow_predict": 0.0}')
+    monkeypatch.setenv("MLFLOW_TRACE_TAIL_SAMPLING_LATENCY_THRESHOLD_MS", "40")
+
+    predict(1)
+    with pytest.raises(ValueError, match="error"):
+        failing_predict(1)
+    slow_predict(1)
+
+    traces = get_traces()
+    assert sorted(trace.info.tags["mlflow.traceName"] for trace in traces) == [
+        "failing_predict",
+        "slow_predict",
+    ]
+    # The trace dropped by tail sampling is deleted from the backend
+    assert len(mlflow.search_traces(filter_string="trace.status = 'OK'")) == 1
+    assert get_sampling_counts()["tail_sampled"] == 2
+    assert get_sampling_counts()["tail_dropped"] == 1
+
+
+def test_tail_sampler_ratios_by_name():
+    sampler = TailSampler(ratio=1.0, ratios_by_name={"health": 0.0})
+    trace_info = TraceInfo(
+        request_id="tr-1",
+        experiment_id="0",
+        timestamp_ms=0,
+        execution_time_ms=1,
+        status=TraceStatus.OK,
+    )
+
+    assert sampler.should_export(trace_info, "predict")
+    assert not sampler.should_export(trace_info, "health")
+    trace_info.status = TraceStatus.ERROR
+    assert sampler.should_export(trace_info, "health")
+
+
+@pytest.mark.parametrize(
+    ("env_var", "value"),
+    [
+        ("MLFLOW_TRACE_TAIL_SAMPLING_RATIO", "1.5"),
+        ("MLFLOW_TRACE_TAIL_SAMPLING_RATIOS_BY_NAME", "[0.1]"),
+        ("MLFLOW_TRACE_TAIL_SAMPLING_RATIOS_BY_NAME", '{"predict": -1}'),
+    ],
+)
+def test_tail_sampler_rejects_invalid_configuration(monkeypatch, env_var, value):
+    monkeypatch.setenv(env_var, value)
+    with pytest.raises(MlflowException, match="ratio"):
+        TailSampler.from_env()
@@ -1,10 +1,16 @@
+import json
 import time
 from threading import Thread
 from typing import Optional
 
-from mlflow.entities import LiveSpan, Span, Trace
+import pytest
+
+import mlflow
+from mlflow.entities import LiveSpan, Span, SpanType, Trace
 from mlflow.entities.span_status import SpanStatusCode
-from mlflow.tracing.trace_manager import InMemoryTraceManager
+from mlflow.exceptions import MlflowException
+from mlflow.tracing.constant import TraceMetadataKey
+from mlflow.tracing.trace_manager import InMemoryTraceManager, _TraceLimits
 
 from tests.tracing.helper import create_mock_otel_span, create_test_trace_info
 
@@ -214,6 +220,46 @@ def test_get_root_span_id():
     assert trace_manager.get_root_span_id("tr-2") is None
 
 
+def test_get_trace_does_not_block_other_traces():
+    trace_manager = InMemoryTraceManager.get_instance()
+    trace_manager.register_trace(1, create_test_trace_info("tr-1", "test"))
+    trace_manager.register_trace(2, create_test_trace_info("tr-2", "test"))
+
+    def access_other_trace():
+        trace_manager.set_request_metadata("tr-2", "key", "value")
+        with trace_manager.get_trace("tr-2") as trace:
+            trace.info.tags["key"] = "value"
+        trace_manager.pop_trace(2)
+
+    with trace_manager.get_trace("tr-1"):
+        thread = Thread(target=access_other_trace)
+        thread.start()
+        thread.join(timeout=5)
+        assert not thread.is_alive()
+
+    assert "tr-2" not in trace_manager._traces
+
+
+def test_pop_trace_waits_for_get_trace():
+    trace_manager = InMemoryTraceManager.get_instance()
+    trace_manager.register_trace(1, create_test_trace_info("tr-1", "test"))
+    popped = []
+
+    with trace_manager.get_trace("tr-1") as trace:
+        thread = Thread(target=lambda: popped.append(trace_manager.pop_trace(1)))
+        thread.start()
+        thread.join(timeout=0.5)
+        # The trace is popped from the registry, but not exported until it is released
+        assert "tr-1" not in trace_manager._traces
+        assert popped == []
+        trace.info.tags["key"] = "value"
+
+    thread.join()
+    assert popped[0].info.tags["key"] == "value"
+    with trace_manager.get_trace("tr-1") as trace:
+        assert trace is None
+
+
 def _create_test_span(
     request_id="tr-12345",
     trace_id: int = 12345,
@@ -233,3 +279,106 @@ def _create_test_span(
     span = LiveSpan(mock_otel_span, request_id)
     span.set_status("OK")
     return span
+
+
+def test_spans_beyond_max_spans_are_dropped(monkeypatch):
+    monkeypatch.setenv("MLFLOW_TRACE_MAX_SPANS", "3")
+
+    with mlflow.start_span("root"):
+        for i in range(5):
+            with mlflow.start_span(f"child_{i}") as child:
+                with mlflow.start_span(f"grandchild_{i}"):
+                    child.set_outputs(i)
+
+    trace = mlflow.get_trace(mlflow.get_last_active_trace_id())
+    assert [span.name for span in trace.data.spans] == ["root", "child_0", "grandchild_0"]
+    assert trace.info.request_metadata[TraceMetadataKey.NUM_DROPPED_SPANS] == "8"
+
+
+def test_span_attributes_are_truncated_to_max_size(monkeypatch):
+    monkeypatch.setenv("MLFLOW_TRACE_MAX_SPAN_ATTRIBUTE_SIZE_BYTES", "100")
+
+    with mlflow.start_span("root") as span:
+        span.set_inputs({"prompt": "a" * 1000})
+        span.set_outputs("small")
+
+    trace = mlflow.get_trace(mlflow.get_last_active_trace_id())
+    span = trace.data.spans[0]
+    assert span.inputs.startswith('{"prompt": "aaa')
+    assert span.inputs.endswith("...[truncated from 1014 bytes]")
+    assert len(json.dumps(span.inputs).encode("utf-8")) <= 100
+    assert span.outputs == "small"
+    assert span.span_type == SpanType.UNKNOWN
+    metadata = trace.info.request_metadata
+    assert metadata[TraceMetadataKey.NUM_TRUNCATED_SPAN_ATTRIBUTES] == "1"
+    assert int(metadata[TraceMetadataKey.TRUNCATED_SPAN_ATTRIBUTE_BYTES]) > 900
+
+
+def test_span_attributes_are_truncated_to_max_trace_size(monkeypatch):
+    monkeypatch.setenv("MLFLOW_TRACE_MAX_SIZE_BYTES", "3000")
+
+    with mlflow.start_span("root"):
+        for i in range(10):
+            with mlflow.start_span(f"child_{i}") as span:
+                span.set_inputs("é" * 250)
+
+    trace = mlflow.get_trace(mlflow.get_last_active_trace_id())
+    spans = trace.data.spans[1:]
+    assert [span.inputs for span in spans[:5]] == ["é" * 250] * 5
+    assert all(span.inputs.endswith("...[truncated from 502 bytes]") for span in spans[5:])
+    size = sum(
+        len(value.encode("utf-8"))
+        for span in trace.data.spans
+        for value in span._span.attributes.values()
+        if isinstance(value, str)
+    )
+    # The reserved attributes of the spans are never truncated
+    assert size <= 3000 + 10 * 100
+    assert trace.info.request_metadata[TraceMetadataKey.NUM_TRUNCATED_SPAN_ATTRIBUTES] == "5"
+
+
+def test_size_of_dropped_spans_is_not_counted(monkeypatch):
+    monkeypatch.setenv("MLFLOW_TRACE_MAX_SPANS", "2")
+    monkeypatch.setenv("MLFLOW_TRACE_MAX_SIZE_BYTES", "5000")
+
+    with mlflow.start_span("root"):
+        for i in range(5):
+            with mlflow.start_span(f"child_{i}", attributes={"document": "x" * 1000}):
+                pass
+
+    trace = mlflow.get_trace(mlflow.get_last_active_trace_id())
+    assert len(trace.data.spans) == 2
+    assert TraceMetadataKey.NUM_TRUNCATED_SPAN_ATTRIBUTES not in trace.info.request_metadata
+    assert trace.info.request_metadata[TraceMetadataKey.NUM_DROPPED_SPANS] == "4"
+
+
+@pytest.mark.parametrize(
+    "env_var",
+    [
+        "MLFLOW_TRACE_MAX_SPANS",
+        "MLFLOW_TRACE_MAX_SPAN_ATTRIBUTE_SIZE_BYTES",
+        "MLFLOW_TRACE_MAX_SIZE_BYTES",
+    ],
+)
+@pytest.mark.parametrize("value", ["0", "-1"])
+def test_trace_limits_must_be_positive(monkeypatch, env_var, value):
+    monkeypatch.setenv(env_var, value)
+    with pytest.raises(MlflowException, match=rf"{env_var} must be a positive integer"):
+        _TraceLimits.from_env()
+
+
+def test_attributes_set_on_otel_span_are_not_counted(monkeypatch):
+    monkeypatch.setenv("MLFLOW_TRACE_MAX_SIZE_BYTES", "5000")
+    trace_manager = InMemoryTraceManager.get_instance()
+
+    with mlflow.start_span("root") as span:
+        with trace_manager.get_trace(span.request_id) as trace:
+            size_bytes = trace.size_bytes
+        # Attributes set directly on the OpenTelemetry span are not accounted against the trace
+        span._span.set_attribute("document", "x" * 1000)
+        span._span.set_attribute("otel.key", "y" * 100)
+        span.set_attribute("document", "small")
+
+        with trace_manager.get_trace(span.request_id) as trace:
+            assert trace.size_bytes == size_bytes + len('"small"')
+        assert span._attributes.detach_from_trace() == size_bytes + len('"small"')
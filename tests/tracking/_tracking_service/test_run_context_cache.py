@@ -0,0 +1,83 @@
+from unittest import mock
+
+from mlflow.entities import (
+    Dataset,
+    DatasetInput,
+    LoggedModelInput,
+    LoggedModelOutput,
+    Run,
+    RunData,
+    RunInfo,
+    RunInputs,
+    RunOutputs,
+)
+from mlflow.tracking._tracking_service.run_context_cache import RunContextCache
+
+
+def _run(run_id, dataset_inputs=(), model_inputs=(), model_outputs=()):
+    info = RunInfo(
+        run_id=run_id,
+        experiment_id="0",
+        user_id="user",
+        status="RUNNING",
+        start_time=0,
+        end_time=None,
+        lifecycle_stage="active",
+    )
+    return Run(
+        info,
+        RunData(),
+        RunInputs(dataset_inputs=list(dataset_inputs), model_inputs=list(model_inputs)),
+        RunOutputs(model_outputs=list(model_outputs)),
+    )
+
+
+def _dataset_input(name, digest):
+    return DatasetInput(Dataset(name=name, digest=digest, source_type="local", source="/tmp"))
+
+
+def test_run_context_is_fetched_once_and_updated_by_logged_inputs_and_outputs():
+    cache = RunContextCache()
+    get_run = mock.Mock(
+        return_value=_run(
+            "run",
+            dataset_inputs=[_dataset_input("train", "abc")],
+            model_outputs=[LoggedModelOutput("m1", step=0)],
+        )
+    )
+
+    context = cache.get("run", get_run)
+    assert context.dataset_inputs == {("train", "abc")}
+    assert context.get_output_model_ids(0) == ["m1"]
+
+    cache.add_inputs(
+        "run", datasets=[_dataset_input("eval", "def")], models=[LoggedModelInput("m2")]
+    )
+    cache.add_outputs("run", [LoggedModelOutput("m3", step=1), LoggedModelOutput("m1", step=0)])
+
+    context = cache.get("run", get_run)
+    get_run.assert_called_once()
+    assert context.dataset_inputs == {("train", "abc"), ("eval", "def")}
+    assert context.has_model("m1")
+    assert context.has_model("m2")
+    assert not context.has_model("m4")
+    assert context.get_output_model_ids(0) == ["m1"]
+    assert context.get_output_model_ids(1) == ["m3"]
+
+
+def test_run_context_cache_ignores_updates_of_uncached_runs_and_evicts_least_recent_runs():
+    cache = RunContextCache(max_size=2)
+    cache.add_outputs("run1", [LoggedModelOutput("m1", step=0)])
+
+    for run_id in ["run1", "run2", "run1", "run3"]:
+        cache.get(run_id, lambda run_id=run_id: _run(run_id))
+
+    assert cache.get("run1", mock.Mock()).get_output_model_ids(0) == []
+    get_run = mock.Mock(return_value=_run("run2"))
+    cache.get("run2", get_run)
+    get_run.assert_called_once()
+
+    cache.invalidate("run1")
+    get_run = mock.Mock(return_value=_run("run1"))
+    cache.get("run1", get_run)
+    get_run.assert_called_once()
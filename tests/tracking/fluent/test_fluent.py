@@ -23,6 +23,7 @@ from mlflow.data.http_dataset_source import HTTPDatasetSource
 from mlflow.data.pandas_dataset import from_pandas
 from mlflow.entities import (
     LifecycleStage,
+    LoggedModelOutput,
     Metric,
     Param,
     Run,
@@ -994,6 +995,19 @@ def test_search_runs_data():
         validate_search_runs(pdf, data, "pandas")
 
 
+def test_search_runs_columns():
+    with mlflow.start_run() as run:
+        mlflow.log_metrics({"m1": 1, "m2": 2})
+        mlflow.log_params({"p1": "a", "p2": "b"})
+
+    pdf = search_runs([run.info.experiment_id], columns=["metrics.m1", "params.p2"])
+    assert list(pdf["run_id"]) == [run.info.run_id]
+    assert [c for c in pdf.columns if c.startswith(("metrics.", "params.", "tags."))] == [
+        "metrics.m1",
+        "params.p2",
+    ]
+
+
 def test_search_runs_no_arguments(search_runs_output_format):
     """
     When no experiment ID is specified, it should try to get the implicit one.
@@ -1403,6 +1417,43 @@ def test_log_metric_async():
         assert parent_run.data.metrics[f"async batch metric {num}"] == num
 
 
+def test_log_metric_fetches_run_only_once():
+    with mlflow.start_run():
+        with mock.patch.object(
+            MlflowClient, "get_run", wraps=MlflowClient().get_run
+        ) as mock_get_run:
+            for step in range(5):
+                mlflow.log_metric("loss", 1.0 / (step + 1), step=step)
+                mlflow.log_metrics({"accuracy": step / 5}, step=step)
+
+    mock_get_run.assert_called_once()
+
+
+def test_log_metric_links_model_outputs_logged_after_the_run_was_fetched():
+    with mlflow.start_run():
+        mlflow.log_metric("loss", 1.0, step=0)
+        model = mlflow.create_external_model(name="model")
+        mlflow.log_outputs(models=[LoggedModelOutput(model.model_id, step=1)])
+        mlflow.log_metric("loss", 0.5, step=1)
+
+    metrics = mlflow.get_logged_model(model.model_id).metrics
+    assert [(m.key, m.value, m.step) for m in metrics] == [("loss", 0.5, 1)]
+
+
+def test_log_metric_logs_dataset_input_only_once():
+    dataset = from_pandas(pd.DataFrame({"a": [1, 2]}), name="dataset")
+    with mlflow.start_run() as run:
+        with mock.patch.object(
+            MlflowClient, "log_inputs", wraps=MlflowClient().log_inputs
+        ) as mock_log_inputs:
+            for step in range(3):
+                mlflow.log_metric("loss", step, step=step, dataset=dataset)
+
+    mock_log_inputs.assert_called_once()
+    dataset_inputs = mlflow.get_run(run.info.run_id).inputs.dataset_inputs
+    assert [d.dataset.name for d in dataset_inputs] == ["dataset"]
+
+
 def test_log_metric_async_throws():
     with mlflow.start_run():
         with pytest.raises(MlflowException, match="Please specify value as a valid double"):
@@ -525,6 +525,26 @@ def test_start_and_end_trace_capture_falsy_input_and_output(tracking_uri):
     assert trace.data.spans[1].outputs is False
 
 
+def test_end_trace_logs_trace_when_indexing_spans_fails(tracking_uri):
+    client = MlflowClient(tracking_uri)
+    experiment_id = client.create_experiment("test_experiment")
+
+    with (
+        mock.patch.object(
+            client._tracing_client.store, "log_spans", side_effect=Exception("index error")
+        ),
+        mock.patch("mlflow.tracing.client._logger.warning") as mock_warning,
+    ):
+        root = client.start_trace(name="root", experiment_id=experiment_id)
+        client.end_trace(trace_id=root.trace_id)
+
+    trace = client.get_trace(root.trace_id)
+    assert trace.info.status == "OK"
+    assert [span.name for span in trace.data.spans] == ["root"]
+    mock_warning.assert_called_once()
+    assert "Failed to index the spans" in mock_warning.call_args[0][0]
+
+
 @pytest.mark.usefixtures("reset_active_experiment")
 def test_start_and_end_trace_before_all_span_end(async_logging_enabled):
     # This test is to verify that the trace is still exported even if some spans are not ended
@@ -1058,6 +1078,19 @@ def test_client_search_runs_page_token(mock_store):
     )
 
 
+def test_client_search_runs_columns(mock_store):
+    MlflowClient().search_runs([5], columns=["metrics.m"])
+    mock_store.search_runs.assert_called_once_with(
+        experiment_ids=[5],
+        filter_string="",
+        run_view_type=ViewType.ACTIVE_ONLY,
+        max_results=SEARCH_MAX_RESULTS_DEFAULT,
+        order_by=None,
+        page_token=None,
+        columns=["metrics.m"],
+    )
+
+
 def test_update_registered_model(mock_registry_store):
     """
     Update registered model no longer supports name change.
@@ -821,6 +821,26 @@ def test_search_validation(mlflow_client):
         mlflow_client.search_runs([experiment_id], max_results=123456789)
 
 
+def test_search_runs_columns(mlflow_client):
+    experiment_id = mlflow_client.create_experiment("search_runs_columns")
+    run_id = mlflow_client.create_run(experiment_id).info.run_id
+    mlflow_client.log_batch(
+        run_id,
+        metrics=[Metric("m1", 1, 0, 0), Metric("m2", 2, 0, 0)],
+        params=[Param("p1", "a"), Param("p2", "b")],
+        tags=[RunTag("t1", "c")],
+    )
+
+    (run,) = mlflow_client.search_runs([experiment_id], columns=["metrics.m1", "params.p2"])
+    assert run.info.run_id == run_id
+    assert run.data.metrics == {"m1": 1}
+    assert run.data.params == {"p2": "b"}
+    assert run.data.tags == {}
+
+    (run,) = mlflow_client.search_runs([experiment_id], columns=[])
+    assert (run.data.metrics, run.data.params, run.data.tags) == ({}, {}, {})
+
+
 def test_get_experiment_by_name(mlflow_client):
     name = "test_get_experiment_by_name"
     experiment_id = mlflow_client.create_experiment(name)
@@ -2293,6 +2313,26 @@ def test_get_trace_artifact_handler(mlflow_client):
     assert trace_data.spans[0].to_dict() == span.to_dict()
 
 
+def test_search_traces_by_span(tmp_path):
+    path = path_to_local_file_uri(str(tmp_path.joinpath("sqlalchemy.db")))
+    uri = ("sqlite://" if sys.platform == "win32" else "sqlite:////") + path[len("file://") :]
+    with _init_server(uri, root_artifact_uri=tmp_path.as_uri()) as url:
+        mlflow.set_tracking_uri(url)
+        client = MlflowClient(url)
+        experiment_id = client.create_experiment("search traces by span")
+
+        for name in ["retriever", "llm"]:
+            root = client.start_trace(name="agent", experiment_id=experiment_id)
+            span = client.start_span(name, trace_id=root.trace_id, parent_id=root.span_id)
+            client.end_span(root.trace_id, span.span_id)
+            client.end_trace(root.trace_id)
+
+        # The server indexes the spans of the traces when they are ended
+        traces = client.search_traces([experiment_id], filter_string="span.name = 'retriever'")
+        assert [span.name for span in traces[0].data.spans] == ["agent", "retriever"]
+        assert len(traces) == 1
+
+
 def test_get_metric_history_bulk_interval_graphql(mlflow_client):
     name = "GraphqlTest"
     mlflow_client.create_registered_model(name)
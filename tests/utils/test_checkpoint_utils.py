@@ -0,0 +1,144 @@
+import json
+import os
+import threading
+import time
+
+import pytest
+
+import mlflow
+from mlflow.exceptions import MlflowException
+from mlflow.utils.checkpoint_utils import MlflowModelCheckpointCallbackBase
+from mlflow.utils.mlflow_tags import LATEST_CHECKPOINT_ARTIFACT_TAG_KEY
+
+
+class Callback(MlflowModelCheckpointCallbackBase):
+    def __init__(self, **kwargs):
+        kwargs = {
+            "checkpoint_file_suffix": ".pth",
+            "monitor": "val_loss",
+            "mode": "min",
+            "save_best_only": False,
+            "save_weights_only": False,
+            "save_freq": "epoch",
+            **kwargs,
+        }
+        super().__init__(**kwargs)
+        self.epoch = 0
+
+    def save_checkpoint(self, filepath):
+        with open(filepath, "w") as f:
+            f.write(f"epoch {self.epoch}")
+
+    def train(self, losses):
+        for epoch, loss in enumerate(losses):
+            self.epoch = epoch
+            self.check_and_save_checkpoint_if_needed(
+                current_epoch=epoch, global_step=epoch * 10, metric_dict={"val_loss": loss}
+            )
+
+
+def _list_checkpoint_dirs(run_id):
+    client = mlflow.MlflowClient()
+    return sorted(f.path for f in client.list_artifacts(run_id, "checkpoints"))
+
+
+@pytest.mark.parametrize("async_upload", [False, True])
+def test_checkpoints_are_uploaded(async_upload, tmp_path):
+    callback = Callback(async_upload=async_upload)
+    with mlflow.start_run() as run:
+        callback.train([0.5, 0.4])
+        callback.wait_for_pending_uploads()
+
+    assert _list_checkpoint_dirs(run.info.run_id) == ["checkpoints/epoch_0", "checkpoints/epoch_1"]
+    run = mlflow.get_run(run.info.run_id)
+    assert run.data.tags[LATEST_CHECKPOINT_ARTIFACT_TAG_KEY] == "checkpoints/epoch_1/checkpoint.pth"
+    path = mlflow.artifacts.download_artifacts(
+        run_id=run.info.run_id, artifact_path="checkpoints/epoch_1", dst_path=tmp_path
+    )
+    with open(f"{path}/checkpoint.pth") as f:
+        assert f.read() == "epoch 1"
+    with open(f"{path}/checkpoint_metrics.json") as f:
+        assert json.load(f) == {"val_loss": 0.4, "epoch": 1, "global_step": 10}
+
+
+def test_async_upload_bounds_pending_checkpoints(monkeypatch):
+    release = threading.Event()
+    upload_checkpoint = Callback._upload_checkpoint
+    save_checkpoint = Callback.save_checkpoint
+    released_before_save = []
+
+    def blocked_upload_checkpoint(self, *args, **kwargs):
+        release.wait()
+        return upload_checkpoint(self, *args, **kwargs)
+
+    def recording_save_checkpoint(self, filepath):
+        released_before_save.append(release.is_set())
+        return save_checkpoint(self, filepath)
+
+    monkeypatch.setattr(Callback, "_upload_checkpoint", blocked_upload_checkpoint)
+    monkeypatch.setattr(Callback, "save_checkpoint", recording_save_checkpoint)
+    callback = Callback(async_upload=True, max_pending_uploads=2)
+    timer = threading.Timer(1, release.set)
+    timer.start()
+    with mlflow.start_run() as run:
+        callback.train([0.5, 0.4, 0.3])
+        callback.wait_for_pending_uploads()
+    timer.join()
+
+    # The third checkpoint is only saved once the upload of the first one has completed
+    assert released_before_save == [False, False, True]
+    assert len(_list_checkpoint_dirs(run.info.run_id)) == 3
+
+
+def test_async_upload_keeps_best_checkpoint_when_uploads_finish_out_of_order(monkeypatch, tmp_path):
+    log_artifacts = mlflow.MlflowClient.log_artifacts
+
+    def slow_first_log_artifacts(self, run_id, local_dir, artifact_path=None):
+        with open(os.path.join(local_dir, "latest_checkpoint.pth")) as f:
+            if f.read() == "epoch 0":
+                # Without serialization, the upload of the first checkpoint finishes last
+                time.sleep(1)
+        return log_artifacts(self, run_id, local_dir, artifact_path)
+
+    monkeypatch.setattr(mlflow.MlflowClient, "log_artifacts", slow_first_log_artifacts)
+    callback = Callback(async_upload=True, max_pending_uploads=2, save_best_only=True)
+    with mlflow.start_run() as run:
+        callback.train([0.5, 0.4])
+        callback.wait_for_pending_uploads()
+
+    run = mlflow.get_run(run.info.run_id)
+    assert run.data.tags[LATEST_CHECKPOINT_ARTIFACT_TAG_KEY] == "checkpoints/latest_checkpoint.pth"
+    path = mlflow.artifacts.download_artifacts(
+        run_id=run.info.run_id, artifact_path="checkpoints", dst_path=tmp_path
+    )
+    with open(f"{path}/latest_checkpoint.pth") as f:
+        assert f.read() == "epoch 1"
+    with open(f"{path}/latest_checkpoint_metrics.json") as f:
+        assert json.load(f)["val_loss"] == 0.4
+
+
+@pytest.mark.parametrize("async_upload", [False, True])
+@pytest.mark.parametrize(
+    ("retention", "expected_epochs"),
+    [
+        ({"keep_last_n": 2}, [3, 4]),
+        ({"keep_top_k": 2}, [1, 2, 4]),
+        ({"keep_top_k": 1, "keep_last_n": 2}, [1, 3, 4]),
+    ],
+)
+def test_superseded_checkpoints_are_deleted(async_upload, retention, expected_epochs):
+    callback = Callback(async_upload=async_upload, **retention)
+    with mlflow.start_run() as run:
+        callback.train([0.5, 0.1, 0.2, 0.4, 0.3])
+        callback.wait_for_pending_uploads()
+
+    assert _list_checkpoint_dirs(run.info.run_id) == [
+        f"checkpoints/epoch_{epoch}" for epoch in expected_epochs
+    ]
+    run = mlflow.get_run(run.info.run_id)
+    assert run.data.tags[LATEST_CHECKPOINT_ARTIFACT_TAG_KEY] == "checkpoints/epoch_4/checkpoint.pth"
+
+
+def test_keep_top_k_requires_monitor():
+    with pytest.raises(MlflowException, match="'keep_top_k' config is set"):
+        Callback(monitor=None, keep_top_k=2)
@@ -5,6 +5,7 @@ import json
 import numpy as np
 import pandas as pd
 import pytest
+from google.protobuf.json_format import ParseError
 from google.protobuf.text_format import Parse as ParseTextIntoProto
 
 from mlflow.entities import Experiment, Metric
@@ -13,6 +14,7 @@ from mlflow.exceptions import MlflowException
 from mlflow.protos.model_registry_pb2 import RegisteredModel as ProtoRegisteredModel
 from mlflow.protos.service_pb2 import Experiment as ProtoExperiment
 from mlflow.protos.service_pb2 import Metric as ProtoMetric
+from mlflow.protos.service_pb2 import SearchRuns, TraceInfoV3, ViewType
 from mlflow.types import ColSpec, DataType, Schema, TensorSpec
 from mlflow.types.schema import Array, Map, Object, Property
 from mlflow.types.utils import _infer_schema
@@ -217,6 +219,70 @@ def test_parse_dict_int_as_string_backcompat():
     assert experiment.timestamp == 123
 
 
+def test_message_to_json_is_compact():
+    json_out = message_to_json(ProtoMetric(key="m", value=0.5, timestamp=123, step=1))
+    assert json_out == '{"key":"m","value":0.5,"timestamp":123,"step":1}'
+
+
+def test_message_to_json_well_known_types():
+    trace_info = TraceInfoV3(trace_id="tr-123", state=TraceInfoV3.State.OK)
+    trace_info.request_time.FromMilliseconds(1700000000123)
+    trace_info.execution_duration.FromMilliseconds(1500)
+    trace_info.trace_metadata["key"] = "value"
+    assert json.loads(message_to_json(trace_info)) == {
+        "trace_id": "tr-123",
+        "request_time": "2023-11-14T22:13:20.123Z",
+        "execution_duration": "1.500s",
+        "state": "OK",
+        "trace_metadata": {"key": "value"},
+    }
+
+
+@pytest.mark.parametrize(
+    ("in_json", "expected"),
+    [
+        ({"key": "m", "value": 1, "timestamp": 123, "step": 2}, "m 1.0 123 2"),
+        # Values that are left to `ParseDict`
+        ({"key": "m", "value": "NaN", "timestamp": "123", "step": 2.0}, "m nan 123 2"),
+        ({"key": "m", "value": None, "timestamp": 123}, "m 0.0 123 0"),
+    ],
+)
+def test_parse_dict_scalar_values(in_json, expected):
+    message = ProtoMetric()
+    parse_dict(in_json, message)
+    assert f"{message.key} {message.value} {message.timestamp} {message.step}" == expected
+
+
+def test_parse_dict_camel_case_and_nested_fields():
+    in_json = {
+        "experimentIds": ["1"],
+        "max_results": 5,
+        "run_view_type": "ALL",
+        "order_by": ["metrics.m DESC"],
+    }
+    message = SearchRuns()
+    parse_dict(in_json, message)
+    assert message == SearchRuns(
+        experiment_ids=["1"], max_results=5, run_view_type=ViewType.ALL, order_by=["metrics.m DESC"]
+    )
+
+    in_json = {"runs": [{"info": {"run_id": "123", "start_time": 1}, "data": {"tags": []}}]}
+    message = SearchRuns.Response()
+    parse_dict(in_json, message)
+    assert message.runs[0].info.run_id == "123"
+    assert message.runs[0].info.start_time == 1
+    assert message.runs[0].HasField("data")
+
+
+@pytest.mark.parametrize(
+    "in_json",
+    [{"max_results": "five"}, {"max_results": True}, {"max_results": 2**40}, {"filter": 1}],
+)
+def test_parse_dict_invalid_values(in_json):
+    with pytest.raises(ParseError, match="max_results|filter"):
+        parse_dict(in_json, SearchRuns())
+
+
 def test_parse_legacy_experiment():
     in_json = {"experiment_id": 123, "name": "name", "unknown": "field"}
     message = ProtoExperiment()
@@ -1,8 +1,10 @@
 import base64
 import json
 import re
+from unittest import mock
 
 import pytest
+import sqlparse
 
 from mlflow.entities import (
     Dataset,
@@ -20,7 +22,7 @@ from mlflow.entities import (
 )
 from mlflow.exceptions import MlflowException
 from mlflow.utils.mlflow_tags import MLFLOW_DATASET_CONTEXT
-from mlflow.utils.search_utils import SearchUtils
+from mlflow.utils.search_utils import SearchModelVersionUtils, SearchUtils
 
 
 @pytest.mark.parametrize(
@@ -264,6 +266,10 @@ def test_bad_comparators(entity_type, bad_comparators, key, entity_value):
         ("datasets.name = 'name1' AND datasets.digest = 'digest2'", []),
         ("datasets.context = 'train'", [0]),
         ("datasets.name = 'name1' AND datasets.context = 'train'", [0]),
+        ("params.my_param LIKE 'A%'", [0, 1]),
+        ("tags.tag1 ILIKE 'd'", [2]),
+        ("attributes.run_id IN ('hi', 'hi3')", [0, 2]),
+        ("attributes.run_id NOT IN ('hi', 'hi3')", [1]),
     ],
 )
 def test_correct_filtering(filter_string, matching_runs):
@@ -358,6 +364,43 @@ def test_correct_filtering(filter_string, matching_runs):
     assert set(filtered_runs) == {runs[i] for i in matching_runs}
 
 
+def test_parse_search_filter_caches_parsed_filters_by_search_type():
+    filter_string = "tags.cached_tag = 'A'"
+    expected = [{"type": "tag", "key": "cached_tag", "comparator": "=", "value": "A"}]
+    with mock.patch("mlflow.utils.search_utils.sqlparse.parse", wraps=sqlparse.parse) as parse:
+        parsed = SearchUtils.parse_search_filter(filter_string)
+        assert parsed == expected
+        # Modifying the returned clauses does not affect the cached ones
+        parsed[0]["key"] = "modified"
+        assert SearchUtils.parse_search_filter(filter_string) == expected
+        assert SearchModelVersionUtils.parse_search_filter(filter_string) == expected
+        assert SearchModelVersionUtils.parse_search_filter(filter_string) == expected
+
+    assert parse.call_count == 2
+
+
+def test_parse_columns_for_search_runs():
+    assert SearchUtils.parse_columns_for_search_runs(None) is None
+    assert SearchUtils.parse_columns_for_search_runs([]) == {
+        "metrics": set(),
+        "params": set(),
+        "tags": set(),
+    }
+    assert SearchUtils.parse_columns_for_search_runs(
+        ["metrics.m", "metric.`m 2`", "param.p", 'params."p.2"', "tags.mlflow.runName"]
+    ) == {"metrics": {"m", "m 2"}, "params": {"p", "p.2"}, "tags": {"mlflow.runName"}}
+    for column in ["attributes.status", "datasets.name", "m"]:
+        with pytest.raises(MlflowException, match="Invalid"):
+            SearchUtils.parse_columns_for_search_runs([column])
+
+
+def test_get_referenced_run_data_keys():
+    assert SearchUtils.get_referenced_run_data_keys(
+        "metrics.m > 0 and params.p = 'a' and attributes.status = 'FINISHED'",
+        ["tags.t DESC", "start_time"],
+    ) == {"metrics": {"m"}, "params": {"p"}, "tags": {"t"}}
+
+
 def test_filter_runs_by_start_time():
     runs = [
         Run(
@@ -0,0 +1,112 @@
+import subprocess
+import venv
+from pathlib import Path
+from unittest import mock
+
+import pytest
+
+import mlflow
+from mlflow.environment_variables import MLFLOW_ENV_ARCHIVE_CACHE_URI
+from mlflow.utils.os import is_windows
+from mlflow.utils.virtualenv import (
+    _get_or_create_virtualenv,
+    _get_virtualenv_activate_cmd,
+)
+
+pytestmark = pytest.mark.skipif(is_windows(), reason="Environment archives are not supported")
+
+
+class Model(mlflow.pyfunc.PythonModel):
+    def predict(self, context, model_input, params=None):
+        return model_input
+
+
+@pytest.fixture
+def model_path(tmp_path):
+    path = tmp_path / "model"
+    mlflow.pyfunc.save_model(path, python_model=Model(), pip_requirements=["numpy"])
+    return path
+
+
+@pytest.fixture
+def env_archive_cache(tmp_path, monkeypatch):
+    cache_dir = tmp_path / "cache"
+    monkeypatch.setenv(MLFLOW_ENV_ARCHIVE_CACHE_URI.name, str(cache_dir))
+    return cache_dir
+
+
+def _create_virtualenv(env_dir, base_python_dir=None, **kwargs):
+    # Stand-in for installing the requirements, which creates a console script with a shebang
+    venv.create(env_dir, symlinks=True)
+    env_dir.joinpath("bin", "tool").write_text(f"#!{env_dir}/bin/python\nprint('tool')\n")
+    if base_python_dir:
+        pyvenv_cfg = env_dir / "pyvenv.cfg"
+        lines = pyvenv_cfg.read_text().splitlines()
+        pyvenv_cfg.write_text(
+            "\n".join(
+                f"home = {base_python_dir}" if line.startswith("home") else line for line in lines
+            )
+        )
+    return _get_virtualenv_activate_cmd(env_dir)
+
+
+def _get_env_dir(env_root_dir):
+    (env_dir,) = Path(env_root_dir, "virtualenv_envs").iterdir()
+    return env_dir
+
+
+def test_environment_is_restored_from_archive_cache(model_path, env_archive_cache, tmp_path):
+    with mock.patch(
+        "mlflow.utils.virtualenv._create_virtualenv", side_effect=_create_virtualenv
+    ) as mock_create:
+        _get_or_create_virtualenv(model_path, env_root_dir=tmp_path / "host1")
+        mock_create.assert_called_once()
+        (archive,) = env_archive_cache.iterdir()
+        env_name = _get_env_dir(tmp_path / "host1").name
+        assert archive.name.startswith(f"{env_name}-uv-")
+        assert archive.name.endswith(".tar.gz")
+
+        activate_cmd = _get_or_create_virtualenv(model_path, env_root_dir=tmp_path / "host2")
+        mock_create.assert_called_once()
+
+    env_dir = _get_env_dir(tmp_path / "host2")
+    assert env_dir.name == env_name
+    assert activate_cmd == _get_virtualenv_activate_cmd(env_dir)
+    assert str(env_dir) in env_dir.joinpath("bin", "activate").read_text()
+    assert str(tmp_path / "host1") not in env_dir.joinpath("bin", "activate").read_text()
+    assert env_dir.joinpath("bin", "tool").read_text().startswith(f"#!{env_dir}/bin/python\n")
+    prefix = subprocess.check_output(
+        [env_dir / "bin" / "python", "-c", "import sys; print(sys.prefix)"], text=True
+    )
+    assert prefix.strip() == str(env_dir)
+
+
+def test_environment_is_built_if_base_interpreter_is_missing(
+    model_path, env_archive_cache, tmp_path
+):
+    with mock.patch(
+        "mlflow.utils.virtualenv._create_virtualenv",
+        side_effect=lambda env_dir, **kwargs: _create_virtualenv(
+            env_dir, base_python_dir=tmp_path / "missing"
+        ),
+    ) as mock_create:
+        _get_or_create_virtualenv(model_path, env_root_dir=tmp_path / "host1")
+        _get_or_create_virtualenv(model_path, env_root_dir=tmp_path / "host2")
+        assert mock_create.call_count == 2
+
+    assert [p.name for p in (tmp_path / "host2" / "virtualenv_envs").iterdir()] == [
+        _get_env_dir(tmp_path / "host1").name
+    ]
+
+
+def test_archive_cache_is_not_used_with_pip_requirements_override(
+    model_path, env_archive_cache, tmp_path
+):
+    with mock.patch(
+        "mlflow.utils.virtualenv._create_virtualenv", side_effect=_create_virtualenv
+    ) as mock_create:
+        _get_or_create_virtualenv(
+            model_path, env_root_dir=tmp_path / "host1", pip_requirements_override=["pandas"]
+        )
+        mock_create.assert_called_once()
+    assert not env_archive_cache.exists()